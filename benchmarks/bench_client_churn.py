@@ -0,0 +1,126 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Cost of the client session and churn analysis as the client file grows
+
+A client file is written where each of a pool of clients is connected at
+each sample with a fixed probability, so clients keep disconnecting and
+reconnecting. The file is tailed into a ``ClientTimeline`` as the client
+view does: once for the whole file, then once per new sample.
+
+Run with ``python -m benchmarks.bench_client_churn --samples 1000,100000``.
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import tempfile
+import time
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from smartdashboard.utils.clients import ClientTimeline
+from smartdashboard.utils.TelemetryReader import TelemetryTailer
+
+DTYPES = {"timestamp": "int64", "client_id": "int64"}
+
+
+def _write_samples(
+    path: pathlib.Path, first: int, samples: int, clients: int, seed: int
+) -> None:
+    rng = np.random.default_rng(seed)
+    present = rng.random((samples, clients)) < 0.8
+    sample, client = np.nonzero(present)
+    pd.DataFrame(
+        {
+            "timestamp": (first + sample) * 1000,
+            "client_id": client,
+            "address": [f"10.150.0.3:{40000 + value}" for value in client],
+        }
+    ).to_csv(path, mode="a", header=not path.exists(), index=False)
+
+
+def measure(samples: int, clients: int, ticks: int) -> t.Dict[str, t.Any]:
+    """Tail a client file into a ClientTimeline and time it
+
+    :param samples: Number of samples in the file before it is first read
+    :type samples: int
+    :param clients: Number of clients that may be connected
+    :type clients: int
+    :param ticks: Number of samples appended and read one at a time
+    :type ticks: int
+    :return: File size, time of the first read and of each tick
+    :rtype: Dict[str, Any]
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        client_file = pathlib.Path(tmp) / "client.csv"
+        _write_samples(client_file, 0, samples, clients, seed=0)
+        tailer = TelemetryTailer(str(client_file), DTYPES, columns=list(DTYPES))
+        timeline = ClientTimeline()
+
+        start = time.perf_counter()
+        rows = tailer.read()
+        read = time.perf_counter() - start
+        timeline.update(rows)
+        first = time.perf_counter() - start
+
+        elapsed = []
+        for tick in range(ticks):
+            _write_samples(client_file, samples + tick, 1, clients, seed=tick + 1)
+            start = time.perf_counter()
+            timeline.update(tailer.read())
+            timeline.sessions()
+            elapsed.append(time.perf_counter() - start)
+
+        return {
+            "samples": samples,
+            "clients": clients,
+            "file_mb": round(os.path.getsize(client_file) / 1024**2, 1),
+            "sessions": timeline.closed_sessions,
+            "first_read_ms": round(read * 1000, 1),
+            "first_analysis_ms": round((first - read) * 1000, 1),
+            "tick_mean_ms": round(float(np.mean(elapsed)) * 1000, 2),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", default="1000,10000,100000")
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--ticks", type=int, default=20)
+    args = parser.parse_args()
+
+    results = [
+        measure(int(samples), args.clients, args.ticks)
+        for samples in args.samples.split(",")
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Time to read the latest client snapshot as the client file grows
+
+A client telemetry file is written with each number of samples and the
+rows of its latest timestamp are read, once by parsing the whole file and
+keeping the newest rows, as the client table used to, and once by reading
+backward from the end of the file with ``read_latest_snapshot``.
+
+Run with ``python -m benchmarks.bench_client_snapshot --samples 1000,100000``.
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import tempfile
+import time
+import typing as t
+
+from benchmarks.generator import write_client_csvs
+from smartdashboard.utils.TelemetryReader import (
+    get_telemetry_dtypes,
+    read_latest_snapshot,
+    read_telemetry,
+)
+
+
+def _best_ms(func: t.Callable[[], t.Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 2)
+
+
+def measure(samples: int, clients: int, repeat: int) -> t.Dict[str, t.Any]:
+    """Time both ways of reading the latest snapshot of a client file
+
+    :param samples: Number of samples in the file
+    :type samples: int
+    :param clients: Clients connected at every sample
+    :type clients: int
+    :param repeat: Number of reads to take the best time of
+    :type repeat: int
+    :return: File size and read times
+    :rtype: Dict[str, Any]
+    """
+    dtypes = get_telemetry_dtypes("clients")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        client_file = str(root / "client.csv")
+        write_client_csvs(root / "client.csv", root / "count.csv", samples, clients, 0)
+
+        def full_read() -> None:
+            dframe = read_telemetry(client_file, dtypes=dtypes)
+            dframe.loc[dframe["timestamp"] == dframe["timestamp"].max()]
+
+        return {
+            "samples": samples,
+            "clients": clients,
+            "file_mb": round(os.path.getsize(client_file) / 1024**2, 1),
+            "full_read_ms": _best_ms(full_read, repeat),
+            "reverse_seek_ms": _best_ms(
+                lambda: read_latest_snapshot(client_file, dtypes=dtypes), repeat
+            ),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", default="1000,10000,100000")
+    parser.add_argument("--clients", default="8,1000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = [
+        measure(int(samples), int(clients), args.repeat)
+        for clients in args.clients.split(",")
+        for samples in args.samples.split(",")
+        if int(samples) * int(clients) <= 10**8
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Load time of compressed manifests split into decompression and decoding
+
+Run with ``python -m benchmarks.bench_compressed_manifest --scale 20000``.
+"""
+
+import argparse
+import gzip
+import json
+import pathlib
+import tempfile
+import typing as t
+
+from benchmarks.bench_json_codec import best_of, write_scaled_manifest
+from smartdashboard.utils.ManifestReader import ManifestFileReader, open_manifest
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def read_decompressed(path: pathlib.Path) -> bytes:
+    """Decompress a manifest without decoding it
+
+    :param path: Path to the manifest
+    :type path: pathlib.Path
+    :return: Uncompressed manifest
+    :rtype: bytes
+    """
+    with open_manifest(path) as stream:
+        return stream.read()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = pathlib.Path(tmp)
+        manifest_path = write_scaled_manifest(directory, args.scale)
+        data = manifest_path.read_bytes()
+
+        paths = {"json": manifest_path}
+        paths["gzip"] = directory / "manifest.json.gz"
+        paths["gzip"].write_bytes(gzip.compress(data, compresslevel=6))
+        if zstandard is not None:
+            paths["zstandard"] = directory / "manifest.json.zst"
+            paths["zstandard"].write_bytes(zstandard.ZstdCompressor().compress(data))
+
+        results: t.Dict[str, t.Any] = {"manifest_bytes": len(data)}
+        for name, path in paths.items():
+            results[name] = {
+                "file_bytes": path.stat().st_size,
+                "decompress_seconds": best_of(
+                    args.repeat, lambda: read_decompressed(path)
+                ),
+                "load_seconds": best_of(
+                    args.repeat, lambda: ManifestFileReader.from_file(path)
+                ),
+            }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Time to get the configuration tables of an ensemble member when they are
+built on every script run versus served from the cache
+
+Run with ``python -m benchmarks.bench_config_tables``.
+"""
+
+import argparse
+import json
+import typing as t
+
+from benchmarks.bench_entity_table import member_rows
+from benchmarks.bench_json_codec import best_of
+from smartdashboard.schemas.table import ApplicationTable
+from smartdashboard.utils.config_tables import (
+    build_application_tables,
+    get_application_tables,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    members = ApplicationTable(member_rows(args.members))
+
+    def switch_uncached() -> None:
+        for member in members:
+            build_application_tables(member)
+
+    def switch_cached() -> None:
+        for member in members:
+            get_application_tables("bench", "0", member.name, member)
+
+    switch_cached()
+    results: t.Dict[str, t.Any] = {
+        "members": args.members,
+        "uncached_seconds_per_switch": best_of(args.repeat, switch_uncached)
+        / args.members,
+        "cached_seconds_per_switch": best_of(args.repeat, switch_cached) / args.members,
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Index build, search and status filter times of the entity picker for a
+large ensemble
+
+Run with ``python -m benchmarks.bench_entity_picker --members 20000``.
+"""
+
+import argparse
+import json
+import pathlib
+import tempfile
+import typing as t
+
+from benchmarks.bench_entity_table import member_rows
+from benchmarks.bench_json_codec import best_of, write_status_dirs
+from smartdashboard.schemas.table import ApplicationTable
+from smartdashboard.utils.picker import PAGE_SIZE, EntityIndex
+from smartdashboard.utils.status import StatusEnum
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        status_dirs = write_status_dirs(pathlib.Path(tmp), args.members)
+        rows = list(member_rows(args.members))
+        for row, status_dir in zip(rows, status_dirs):
+            row["telemetry_metadata"]["status_dir"] = status_dir
+        members = ApplicationTable(rows)
+
+        index = EntityIndex.for_entities(members)
+        results: t.Dict[str, t.Any] = {
+            "members": args.members,
+            "options_sent_before": args.members,
+            "options_sent": min(PAGE_SIZE, args.members),
+            "build_seconds": best_of(
+                args.repeat, lambda: EntityIndex.for_entities(members)
+            ),
+            "search_seconds": best_of(args.repeat, lambda: index.search("ble_19")),
+            "status_filter_seconds": best_of(
+                args.repeat,
+                lambda: index.filter_status(range(len(index)), StatusEnum.FAILED),
+            ),
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Memory footprint of ensemble members stored as model instances versus
+the compact ``ApplicationTable``
+
+Run with ``python -m benchmarks.bench_entity_table --members 100000``.
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+import typing as t
+
+from smartdashboard.schemas.application import Application
+from smartdashboard.schemas.table import ApplicationTable
+
+
+def member_rows(count: int) -> t.Iterator[t.Dict[str, t.Any]]:
+    """Generate raw ensemble member dicts as they appear in a manifest
+
+    :param count: Number of members
+    :type count: int
+    :return: Raw member dicts
+    :rtype: Iterator[Dict[str, Any]]
+    """
+    for i in range(count):
+        path = f"/lus/scratch/user/exp/ensemble/ensemble_{i}"
+        yield {
+            "name": f"ensemble_{i}",
+            "path": path,
+            "exe_args": ["--steps", "100"],
+            "batch_settings": {},
+            "run_settings": {
+                "exe": ["/usr/bin/python"],
+                "run_command": "srun",
+                "run_args": {"nodes": 1, "ntasks": 4},
+            },
+            "params": {"tau": str(i % 8), "beta": str(i % 3)},
+            "files": {"Symlink": [], "Configure": ["in.cfg"], "Copy": []},
+            "colocated_db": {},
+            "telemetry_metadata": {
+                "status_dir": f"/lus/scratch/user/exp/.smartsim/telemetry/ens/{i}",
+                "step_id": f"1234.{i}",
+                "task_id": str(4000 + i),
+                "managed": True,
+            },
+            "out_file": f"{path}/ensemble_{i}.out",
+            "err_file": f"{path}/ensemble_{i}.err",
+        }
+
+
+def measure(
+    build: t.Callable[[], t.Sequence[Application]],
+) -> t.Tuple[t.Sequence[Application], int, float]:
+    """Measure the retained memory and build time of a member collection
+
+    :param build: Function building the collection
+    :type build: Callable[[], Sequence[Application]]
+    :return: The collection, retained bytes and build seconds
+    :rtype: Tuple[Sequence[Application], int, float]
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    members = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return members, retained, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=100_000)
+    args = parser.parse_args()
+
+    results: t.Dict[str, t.Any] = {"members": args.members}
+    for label, build in (
+        ("models", lambda: [Application(**row) for row in member_rows(args.members)]),
+        ("table", lambda: ApplicationTable(member_rows(args.members))),
+    ):
+        members, retained, elapsed = measure(build)
+        start = time.perf_counter()
+        for index in range(0, len(members), max(len(members) // 1000, 1)):
+            _ = members[index].telemetry_metadata["status_dir"]
+        access = (time.perf_counter() - start) / min(len(members), 1000)
+        results[label] = {
+            "retained_bytes": retained,
+            "bytes_per_member": retained / max(args.members, 1),
+            "build_seconds": elapsed,
+            "access_seconds": access,
+        }
+        del members
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
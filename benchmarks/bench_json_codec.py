@@ -0,0 +1,169 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Manifest and status file decode times for each available JSON codec
+
+The test manifest is scaled up by replicating its ensemble members, and a
+directory of ``stop.json`` files stands in for the status files read on every
+dashboard tick.
+
+Run with ``python -m benchmarks.bench_json_codec --scale 20000``.
+"""
+
+import argparse
+import copy
+import json
+import pathlib
+import tempfile
+import time
+import typing as t
+
+from smartdashboard.utils import codec
+from smartdashboard.utils.ManifestReader import ManifestFileReader
+from smartdashboard.utils.StatusReader import get_status
+
+MANIFEST = pathlib.Path("tests/utils/manifest_files/manifesttest.json")
+
+
+def write_scaled_manifest(directory: pathlib.Path, scale: int) -> pathlib.Path:
+    """Write the test manifest with every ensemble scaled to `scale` members
+
+    :param directory: Directory to write the manifest into
+    :type directory: pathlib.Path
+    :param scale: Number of members per ensemble
+    :type scale: int
+    :return: Path to the scaled manifest
+    :rtype: pathlib.Path
+    """
+    data = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    for run in data["runs"]:
+        for ensemble in run["ensemble"]:
+            template = ensemble["models"][0] if ensemble["models"] else None
+            if template is None:
+                continue
+            members = []
+            for i in range(scale):
+                member = copy.deepcopy(template)
+                member["name"] = f"{ensemble['name']}_{i}"
+                member["telemetry_metadata"]["status_dir"] += f"/{i}"
+                members.append(member)
+            ensemble["models"] = members
+
+    path = directory / "manifest.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def write_status_dirs(directory: pathlib.Path, count: int) -> t.List[str]:
+    """Write `count` completed status directories
+
+    :param directory: Directory to write the status directories into
+    :type directory: pathlib.Path
+    :param count: Number of status directories
+    :type count: int
+    :return: Status directory paths
+    :rtype: List[str]
+    """
+    status_dirs = []
+    for i in range(count):
+        status_dir = directory / "status" / str(i)
+        status_dir.mkdir(parents=True)
+        (status_dir / "start.json").write_text('{"timestamp": 1}', encoding="utf-8")
+        (status_dir / "stop.json").write_text(
+            json.dumps({"timestamp": 2, "return_code": i % 2}), encoding="utf-8"
+        )
+        status_dirs.append(str(status_dir))
+    return status_dirs
+
+
+def read_text_manifest(path: pathlib.Path) -> t.Any:
+    """Decode a manifest the way it was read before the codec was added
+
+    :param path: Path to the manifest
+    :type path: pathlib.Path
+    :return: Decoded manifest
+    :rtype: Any
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.loads(file.read())
+
+
+def best_of(repeat: int, func: t.Callable[[], t.Any]) -> float:
+    """Get the fastest of `repeat` timings of `func`
+
+    :param repeat: Number of timings
+    :type repeat: int
+    :param func: Function to time
+    :type func: Callable[[], Any]
+    :return: Fastest time in seconds
+    :rtype: float
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=int, default=20_000)
+    parser.add_argument("--status-files", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = pathlib.Path(tmp)
+        manifest_path = write_scaled_manifest(directory, args.scale)
+        status_dirs = write_status_dirs(directory, args.status_files)
+
+        results: t.Dict[str, t.Any] = {
+            "manifest_bytes": manifest_path.stat().st_size,
+            "status_files": len(status_dirs),
+            "text_json": {
+                "manifest_seconds": best_of(
+                    args.repeat, lambda: read_text_manifest(manifest_path)
+                ),
+            },
+        }
+        for name in codec.available_codecs():
+            codec.set_codec(name)
+            results[name] = {
+                "manifest_seconds": best_of(
+                    args.repeat, lambda: ManifestFileReader.from_file(manifest_path)
+                ),
+                "status_seconds": best_of(
+                    args.repeat,
+                    lambda: [get_status(status_dir) for status_dir in status_dirs],
+                ),
+            }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
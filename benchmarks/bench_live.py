@@ -0,0 +1,127 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Steady-state CPU cost of a dashboard tick while an experiment is running
+
+``benchmarks.simulator`` replays a generated experiment on a background
+thread, appending telemetry rows and log lines, starting and stopping
+entities and injecting partial lines. After a warmup, the CPU time the
+dashboard thread spends in ``OverviewView.update`` and
+``DatabaseTelemetryView.update`` is sampled once per simulator tick.
+``time.thread_time`` is used so the simulator's own writes are not counted.
+
+Run with ``python -m benchmarks.bench_live --members 10000 --ticks 30``.
+"""
+
+import argparse
+import json
+import pathlib
+import statistics
+import tempfile
+import time
+import typing as t
+from dataclasses import asdict
+
+from benchmarks.bench_overview_tabs import build_all_tabs
+from benchmarks.generator import ExperimentSpec
+from benchmarks.simulator import LiveSpec, create_live_experiment
+from smartdashboard import view_builders
+from smartdashboard.utils.ManifestReader import create_filereader
+
+
+def summarize(samples: t.Sequence[float]) -> t.Dict[str, float]:
+    """Summarize CPU samples in milliseconds
+
+    :param samples: CPU seconds per tick
+    :type samples: Sequence[float]
+    :return: Mean, median, 95th percentile and maximum
+    :rtype: Dict[str, float]
+    """
+    ordered = sorted(samples)
+    return {
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(
+            ordered[min(len(ordered) - 1, len(ordered) * 95 // 100)] * 1000, 3
+        ),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--shards", type=int, default=3)
+    parser.add_argument("--telemetry-rows", type=int, default=10_000)
+    parser.add_argument("--rate", type=float, default=4.0)
+    parser.add_argument("--rows-per-tick", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--ticks", type=int, default=30)
+    args = parser.parse_args()
+
+    spec = ExperimentSpec(
+        members=args.members,
+        shards=args.shards,
+        telemetry_rows=args.telemetry_rows,
+    )
+    live = LiveSpec(rows_per_tick=args.rows_per_tick)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        experiment = create_live_experiment(pathlib.Path(tmp), spec, live)
+        manifest = create_filereader(str(experiment.manifest_path)).get_manifest()
+        views = {
+            "OverviewView.update": build_all_tabs(manifest),
+            "DatabaseTelemetryView.update": view_builders.db_telem_builder(manifest),
+        }
+        samples: t.Dict[str, t.List[float]] = {label: [] for label in views}
+
+        stop_event = experiment.start(args.rate)
+        try:
+            seen = experiment.ticks
+            for sample in range(args.warmup + args.ticks):
+                while experiment.ticks == seen:
+                    time.sleep(0.001)
+                seen = experiment.ticks
+                for label, view in views.items():
+                    start = time.thread_time()
+                    view.update()
+                    if sample >= args.warmup:
+                        samples[label].append(time.thread_time() - start)
+        finally:
+            stop_event.set()
+
+    results: t.Dict[str, t.Any] = {
+        "spec": asdict(spec),
+        "live": asdict(live),
+        "rate": args.rate,
+        "ticks": args.ticks,
+    }
+    results.update((label, summarize(cpu)) for label, cpu in samples.items())
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
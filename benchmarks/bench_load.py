@@ -0,0 +1,343 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Load test of the dashboard server with many concurrent viewers
+
+For each session count, a ``smart-dash`` server is started on a live
+experiment replayed by ``benchmarks.simulator`` and that many headless
+sessions are opened over Streamlit's websocket protocol, alternating
+between the Experiment Overview and Database Telemetry pages. After a
+warmup, the server's CPU use, resident memory and read system calls are
+sampled from ``/proc``, and each session records when its page updates
+arrive.
+
+Every page polls its files once per second, so the interval between the
+updates a session receives is one second plus the time the server took to
+run that session's update. The interval growing past one second is where
+per-session polling stops scaling.
+
+Linux only. Run with
+``python -m benchmarks.bench_load --sessions 1,4,16,32 --members 1000``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import pathlib
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import typing as t
+import urllib.error
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+from benchmarks.bench_live import summarize
+from benchmarks.generator import ExperimentSpec
+from benchmarks.simulator import LiveExperiment, LiveSpec, create_live_experiment
+
+PAGES = ("", "Database_Telemetry")
+"""Page names the sessions open in turn, the empty name is the main page"""
+
+BURST_GAP = 0.25
+"""Seconds without a delta after which the next delta starts a new update"""
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def free_port() -> int:
+    """Get a free local port
+
+    :return: Port number
+    :rtype: int
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def process_stats(pid: int) -> t.Dict[str, float]:
+    """Read the resource use of a process from /proc
+
+    :param pid: Process id
+    :type pid: int
+    :return: CPU seconds, resident bytes, read system calls and bytes read
+    :rtype: Dict[str, float]
+    """
+    with open(f"/proc/{pid}/stat", encoding="utf-8") as file:
+        # the fields after the command name, which may contain spaces
+        fields = file.read().rpartition(")")[2].split()
+    with open(f"/proc/{pid}/status", encoding="utf-8") as file:
+        rss_kb = next(
+            int(line.split()[1]) for line in file if line.startswith("VmRSS:")
+        )
+    with open(f"/proc/{pid}/io", encoding="utf-8") as file:
+        io_counts = dict(line.split(": ") for line in file.read().splitlines())
+
+    return {
+        "cpu_seconds": (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS,
+        "rss_bytes": rss_kb * 1024,
+        "read_syscalls": int(io_counts["syscr"]),
+        "read_bytes": int(io_counts["rchar"]),
+    }
+
+
+class Server:
+    """``smart-dash`` server process serving an experiment"""
+
+    def __init__(self, experiment_dir: pathlib.Path, port: int) -> None:
+        """Initialize a Server
+
+        :param experiment_dir: Experiment to serve
+        :type experiment_dir: pathlib.Path
+        :param port: Port to serve on
+        :type port: int
+        """
+        self.experiment_dir = experiment_dir
+        self.port = port
+        self.process: t.Optional["subprocess.Popen[bytes]"] = None
+
+    def __enter__(self) -> "Server":
+        env = dict(
+            os.environ,
+            STREAMLIT_SERVER_HEADLESS="true",
+            STREAMLIT_BROWSER_GATHER_USAGE_STATS="false",
+        )
+        self.process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "smartdashboard",
+                "-d",
+                str(self.experiment_dir),
+                "-p",
+                str(self.port),
+            ],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            try:
+                url = f"http://127.0.0.1:{self.port}/_stcore/health"
+                with urllib.request.urlopen(url, timeout=1):
+                    return self
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.05)
+        self.__exit__()
+        raise TimeoutError("smart-dash did not start within 60 seconds")
+
+    def __exit__(self, *_: t.Any) -> None:
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait()
+
+    @property
+    def pid(self) -> int:
+        """Get the process id of the server
+
+        :return: Process id
+        :rtype: int
+        """
+        assert self.process is not None
+        return self.process.pid
+
+
+class Session:
+    """Headless dashboard session that records when page updates arrive"""
+
+    def __init__(self, port: int, page_name: str) -> None:
+        """Initialize a Session
+
+        :param port: Port of the server
+        :type port: int
+        :param page_name: Name of the page to open, empty for the main page
+        :type page_name: str
+        """
+        self.url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        self.page_name = page_name
+        self.opened = 0.0
+        self.deltas: t.List[float] = []
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Open the page and record deltas until `stop` is set
+
+        :param stop: Event that closes the session when set
+        :type stop: asyncio.Event
+        """
+        connection = await websocket_connect(self.url, max_message_size=2**30)
+        back_msg = BackMsg()
+        back_msg.rerun_script.query_string = ""
+        back_msg.rerun_script.page_name = self.page_name
+        self.opened = time.monotonic()
+        await connection.write_message(back_msg.SerializeToString(), binary=True)
+
+        stopping = asyncio.ensure_future(stop.wait())
+        try:
+            while not stop.is_set():
+                reading = asyncio.ensure_future(connection.read_message())
+                await asyncio.wait(
+                    (reading, stopping), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not reading.done():
+                    reading.cancel()
+                    break
+                payload = reading.result()
+                if payload is None:
+                    break
+                msg = ForwardMsg()
+                msg.ParseFromString(payload)
+                if msg.HasField("delta"):
+                    self.deltas.append(time.monotonic())
+        finally:
+            stopping.cancel()
+            connection.close()
+
+    def intervals(self, since: float) -> t.List[float]:
+        """Get the seconds between the updates received after `since`
+
+        Deltas sent within BURST_GAP of each other belong to one update.
+
+        :param since: Monotonic time to start from
+        :type since: float
+        :return: Seconds between the starts of consecutive updates
+        :rtype: List[float]
+        """
+        starts: t.List[float] = []
+        previous = None
+        for arrival in self.deltas:
+            if previous is None or arrival - previous > BURST_GAP:
+                if arrival >= since:
+                    starts.append(arrival)
+            previous = arrival
+        return [second - first for first, second in zip(starts, starts[1:])]
+
+
+async def _load(
+    port: int, sessions: int, warmup: float, duration: float, pid: int
+) -> t.Dict[str, t.Any]:
+    stop = asyncio.Event()
+    clients = [Session(port, PAGES[index % len(PAGES)]) for index in range(sessions)]
+    tasks = [asyncio.ensure_future(client.run(stop)) for client in clients]
+
+    await asyncio.sleep(warmup)
+    before = process_stats(pid)
+    since = time.monotonic()
+    await asyncio.sleep(duration)
+    after = process_stats(pid)
+    elapsed = time.monotonic() - since
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    intervals = [value for client in clients for value in client.intervals(since)]
+    first_updates = [
+        client.deltas[0] - client.opened for client in clients if client.deltas
+    ]
+    return {
+        "sessions": sessions,
+        "cpu_percent": round(
+            100 * (after["cpu_seconds"] - before["cpu_seconds"]) / elapsed, 1
+        ),
+        "rss_mb": round(after["rss_bytes"] / 1024**2, 1),
+        "read_syscalls_per_second": round(
+            (after["read_syscalls"] - before["read_syscalls"]) / elapsed
+        ),
+        "read_mb_per_second": round(
+            (after["read_bytes"] - before["read_bytes"]) / elapsed / 1024**2, 2
+        ),
+        "first_delta": summarize(first_updates) if first_updates else None,
+        "update_interval": summarize(intervals) if intervals else None,
+        "updates_per_session_second": round(len(intervals) / elapsed / sessions, 2),
+    }
+
+
+def run_level(
+    experiment: LiveExperiment,
+    sessions: int,
+    warmup: float,
+    duration: float,
+) -> t.Dict[str, t.Any]:
+    """Load a fresh server with a number of sessions
+
+    :param experiment: Live experiment to serve
+    :type experiment: LiveExperiment
+    :param sessions: Number of concurrent sessions
+    :type sessions: int
+    :param warmup: Seconds to wait after opening the sessions
+    :type warmup: float
+    :param duration: Seconds to measure for
+    :type duration: float
+    :return: Server resource use and per-session update timings
+    :rtype: Dict[str, Any]
+    """
+    experiment_dir = experiment.manifest_path.parents[2]
+    with Server(experiment_dir, free_port()) as server:
+        return asyncio.run(_load(server.port, sessions, warmup, duration, server.pid))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", default="1,4,16,32")
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--shards", type=int, default=3)
+    parser.add_argument("--telemetry-rows", type=int, default=10_000)
+    parser.add_argument("--log-bytes", type=int, default=1024**2)
+    parser.add_argument("--rate", type=float, default=1.0)
+    parser.add_argument("--warmup", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=20.0)
+    args = parser.parse_args()
+
+    spec = ExperimentSpec(
+        members=args.members,
+        shards=args.shards,
+        telemetry_rows=args.telemetry_rows,
+        log_bytes=args.log_bytes,
+    )
+    results: t.Dict[str, t.Any] = {"spec": spec.__dict__, "levels": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        experiment = create_live_experiment(pathlib.Path(tmp), spec, LiveSpec())
+        stop_event = experiment.start(args.rate)
+        try:
+            for sessions in (int(value) for value in args.sessions.split(",")):
+                level = run_level(experiment, sessions, args.warmup, args.duration)
+                results["levels"].append(level)
+                print(json.dumps(level), file=sys.stderr)
+        finally:
+            stop_event.set()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
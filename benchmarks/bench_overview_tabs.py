@@ -0,0 +1,112 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Build and update times of the Experiment Overview page when every tab is
+built versus only the selected tab
+
+Streamlit runs in bare mode, so the timings cover reading logs, statuses and
+building DataFrames but not sending elements to a browser.
+
+Run with ``python -m benchmarks.bench_overview_tabs --scale 20000``.
+"""
+
+import argparse
+import json
+import pathlib
+import tempfile
+import typing as t
+
+import streamlit as st
+
+from benchmarks.bench_json_codec import best_of, write_scaled_manifest
+from smartdashboard import view_builders
+from smartdashboard.utils.ManifestReader import ManifestFileReader
+from smartdashboard.views import OverviewView
+
+
+def build_all_tabs(manifest: t.Any) -> OverviewView:
+    """Build every tab of the overview, as the page did before tabs were lazy
+
+    :param manifest: Manifest to build the page from
+    :type manifest: Manifest
+    :return: View with every tab built
+    :rtype: OverviewView
+    """
+    return OverviewView(
+        view_builders.exp_builder(manifest),
+        view_builders.app_builder(manifest),
+        view_builders.orc_builder(manifest),
+        view_builders.ens_builder(manifest),
+    )
+
+
+def build_tab(manifest: t.Any, tab: str) -> OverviewView:
+    """Build the overview with `tab` selected
+
+    :param manifest: Manifest to build the page from
+    :type manifest: Manifest
+    :param tab: Name of the selected tab
+    :type tab: str
+    :return: View with the selected tab built
+    :rtype: OverviewView
+    """
+    radio = st.radio
+    setattr(st, "radio", lambda *args, **kwargs: tab)
+    try:
+        return view_builders.overview_builder(manifest)
+    finally:
+        setattr(st, "radio", radio)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_scaled_manifest(pathlib.Path(tmp), args.scale)
+        manifest = ManifestFileReader(str(path)).get_manifest()
+
+    results: t.Dict[str, t.Any] = {"members_per_ensemble": args.scale}
+    builds: t.Dict[str, t.Callable[[], OverviewView]] = {
+        "all tabs": lambda: build_all_tabs(manifest)
+    }
+    for tab in view_builders.OVERVIEW_TABS:
+        builds[tab] = lambda tab=tab: build_tab(manifest, tab)
+
+    for label, build in builds.items():
+        view = build()
+        results[label] = {
+            "build_seconds": best_of(args.repeat, build),
+            "update_seconds": best_of(args.repeat, view.update),
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Update latency of the dashboard as file system metadata latency grows
+
+Files are read through ``tests.utils.slow_storage.SlowStorage``, which
+delays every ``exists``, ``getmtime`` and ``open`` call by a fixed latency
+with optional jitter, as a parallel file system under load does. For each
+latency the Experiment Overview (every tab) and Database Telemetry pages
+are built with empty caches and then updated, and the status summary of an
+ensemble is taken cold and warm.
+
+Run with ``python -m benchmarks.bench_slow_fs --latencies 0,0.0005,0.002``.
+"""
+
+import argparse
+import json
+import pathlib
+import tempfile
+import time
+import typing as t
+
+from benchmarks.bench_overview_tabs import build_all_tabs
+from benchmarks.bench_suite import clear_caches
+from benchmarks.generator import ExperimentSpec, generate_experiment
+from smartdashboard import view_builders
+from smartdashboard.utils.ManifestReader import create_filereader
+from smartdashboard.utils.StatusReader import get_ensemble_status_summary
+from tests.utils.slow_storage import uniform_latencies, use_slow_storage
+
+
+def elapsed(func: t.Callable[[], t.Any]) -> t.Tuple[float, t.Any]:
+    """Time one call of `func`
+
+    :param func: Function to time
+    :type func: Callable[[], Any]
+    :return: Seconds the call took and its result
+    :rtype: Tuple[float, Any]
+    """
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latencies", default="0,0.0002,0.001,0.005")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--shards", type=int, default=3)
+    parser.add_argument("--telemetry-rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    spec = ExperimentSpec(
+        members=args.members,
+        shards=args.shards,
+        telemetry_rows=args.telemetry_rows,
+        log_bytes=1024**2,
+    )
+    results: t.Dict[str, t.Any] = {"spec": spec.__dict__, "latencies": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest_path = generate_experiment(pathlib.Path(tmp), spec)
+        manifest = create_filereader(manifest_path).get_manifest()
+        ensemble = manifest.runs[0].ensemble[0]
+
+        for latency in (float(value) for value in args.latencies.split(",")):
+            clear_caches()
+            latencies = uniform_latencies(latency, jitter=args.jitter)
+            with use_slow_storage(latencies) as slow:
+                timings: t.Dict[str, float] = {}
+                timings["ensemble_status_cold"], _ = elapsed(
+                    lambda: get_ensemble_status_summary(ensemble)
+                )
+                time.sleep(0.5)  # let the status scanner rescan
+                timings["ensemble_status_warm"], _ = elapsed(
+                    lambda: get_ensemble_status_summary(ensemble)
+                )
+                timings["overview_build"], overview = elapsed(
+                    lambda: build_all_tabs(manifest)
+                )
+                timings["overview_update"], _ = elapsed(overview.update)
+                timings["telemetry_build"], telemetry = elapsed(
+                    lambda: view_builders.db_telem_builder(manifest)
+                )
+                timings["telemetry_update"], _ = elapsed(telemetry.update)
+
+            results["latencies"][str(latency)] = {
+                **{key: round(value, 4) for key, value in timings.items()},
+                "calls": dict(slow.calls),
+                "delayed_seconds": round(slow.delayed, 3),
+            }
+
+    clear_caches()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
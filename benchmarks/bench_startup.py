@@ -0,0 +1,156 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Startup times of the dashboard: launching the server, importing the CLI
+and page modules in a fresh interpreter, and building the first render of
+each page
+
+Every measurement runs in a new interpreter so module caches do not carry
+over. Streamlit runs in bare mode, so first render covers importing the
+page, reading the manifest and building the elements, but not sending them
+to a browser.
+
+Run with ``python -m benchmarks.bench_startup``.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import typing as t
+import urllib.error
+import urllib.request
+
+EXP_DIR = "tests/utils/manifest_files/fauxexp"
+
+HEAVY_MODULES = ("streamlit", "pandas", "altair", "pyarrow")
+
+SNIPPETS = {
+    "cli": "import smartdashboard.__main__",
+    "experiment_overview_import": "import smartdashboard.Experiment_Overview",
+    "experiment_overview_first_render": f"""
+import pathlib
+import smartdashboard.Experiment_Overview
+from smartdashboard.utils.ManifestReader import create_filereader, get_manifest_path
+from smartdashboard.view_builders import overview_builder
+path = get_manifest_path(pathlib.Path("{EXP_DIR}"))
+overview_builder(create_filereader(path).get_manifest())
+""",
+    "database_telemetry_first_render": f"""
+import pathlib
+from smartdashboard.utils.ManifestReader import create_filereader, get_manifest_path
+from smartdashboard.view_builders import db_telem_builder
+path = get_manifest_path(pathlib.Path("{EXP_DIR}"))
+db_telem_builder(create_filereader(path).get_manifest())
+""",
+}
+
+_TEMPLATE = """
+import json, sys, time
+start = time.perf_counter()
+{snippet}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [name for name in {modules!r} if name in sys.modules]]))
+"""
+
+
+def time_snippet(snippet: str) -> t.Tuple[float, t.List[str]]:
+    """Time a snippet in a new interpreter
+
+    :param snippet: Python code to run
+    :type snippet: str
+    :return: Seconds the snippet took and the heavy modules it imported
+    :rtype: Tuple[float, List[str]]
+    """
+    code = _TEMPLATE.format(snippet=snippet.strip(), modules=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, modules = json.loads(result.stdout.strip().splitlines()[-1])
+    return float(elapsed), list(modules)
+
+
+def time_server_ready(port: int, timeout: float = 60.0) -> float:
+    """Time ``smart-dash`` from launch until its server answers health checks
+
+    :param port: Port to launch the dashboard on
+    :type port: int
+    :param timeout: Seconds to wait for the server
+    :type timeout: float
+    :return: Seconds until the server was ready
+    :rtype: float
+    :raises TimeoutError: If the server is not ready within `timeout`
+    """
+    env = dict(os.environ, STREAMLIT_SERVER_HEADLESS="true")
+    start = time.perf_counter()
+    with subprocess.Popen(
+        [sys.executable, "-m", "smartdashboard", "-d", EXP_DIR, "-p", str(port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    ) as process:
+        try:
+            while time.perf_counter() - start < timeout:
+                try:
+                    url = f"http://localhost:{port}/_stcore/health"
+                    with urllib.request.urlopen(url, timeout=1):
+                        return time.perf_counter() - start
+                except (urllib.error.URLError, ConnectionError):
+                    time.sleep(0.02)
+            raise TimeoutError(f"smart-dash did not start within {timeout} seconds")
+        finally:
+            os.killpg(process.pid, 15)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    results: t.Dict[str, t.Any] = {
+        "server_ready_seconds": min(
+            time_server_ready(args.port) for _ in range(args.repeat)
+        )
+    }
+    for label, snippet in SNIPPETS.items():
+        runs = [time_snippet(snippet) for _ in range(args.repeat)]
+        results[label] = {
+            "seconds": min(elapsed for elapsed, _ in runs),
+            "heavy_modules": runs[0][1],
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Scan and render times of the ensemble status heatmap
+
+Run with ``python -m benchmarks.bench_status_heatmap --members 50000``.
+"""
+
+import argparse
+import json
+import pathlib
+import tempfile
+import typing as t
+
+import numpy as np
+from streamlit.elements.image import image_to_url
+
+from benchmarks.bench_json_codec import best_of, write_status_dirs
+from smartdashboard.utils.helpers import status_heatmap
+from smartdashboard.utils.StatusReader import StatusScanner
+
+
+def render(codes: "np.ndarray[t.Any, t.Any]") -> str:
+    """Render the heatmap and encode it the way st.image does
+
+    :param codes: Status codes of the members
+    :type codes: numpy.ndarray
+    :return: Media URL of the encoded image
+    :rtype: str
+    """
+    return image_to_url(status_heatmap(codes), -1, False, "RGB", "auto", "heatmap")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        status_dirs = write_status_dirs(pathlib.Path(tmp), args.members)
+
+        def first_scan() -> None:
+            StatusScanner(status_dirs).scan()
+
+        scanner = StatusScanner(status_dirs, min_interval=0)
+        scanner.scan()
+        results: t.Dict[str, t.Any] = {
+            "members": args.members,
+            "image_shape": list(status_heatmap(scanner.codes).shape),
+            "first_scan_seconds": best_of(args.repeat, first_scan),
+            "rescan_seconds": best_of(args.repeat, scanner.scan),
+            "render_seconds": best_of(args.repeat, lambda: render(scanner.codes)),
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Benchmark suite timing the manifest, status, log, telemetry and page
+building paths on synthetic experiments of several sizes
+
+Each scale generates an experiment with ``benchmarks.generator`` where the
+scale is the number of members per ensemble. Cold timings clear the
+dashboard caches first; warm timings reuse them, as every dashboard tick
+after the first does. Streamlit runs in bare mode, so page timings cover
+reading files and building elements but not sending them to a browser.
+
+Results are printed as JSON, and also written to ``--output`` when given,
+so runs can be compared for regressions.
+
+Run with ``python -m benchmarks.bench_suite --scales 100,1000,10000``.
+"""
+
+import argparse
+import json
+import pathlib
+import platform
+import sys
+import tempfile
+import typing as t
+from dataclasses import asdict
+
+import streamlit as st
+
+from benchmarks.bench_json_codec import best_of
+from benchmarks.bench_overview_tabs import build_tab
+from benchmarks.generator import ExperimentSpec, generate_experiment
+from smartdashboard import view_builders
+from smartdashboard.utils import LogReader, StatusReader, config_tables, picker
+from smartdashboard.utils.LogReader import get_logs
+from smartdashboard.utils.ManifestReader import Manifest, create_filereader
+from smartdashboard.utils.StatusReader import (
+    get_ensemble_status_summary,
+    get_experiment_status_summary,
+    get_orchestrator_status_summary,
+)
+from smartdashboard.views import MemoryView
+
+
+def clear_caches() -> None:
+    """Clear every cache the dashboard keeps between ticks"""
+    StatusReader._finished_statuses.clear()
+    StatusReader._scanners.clear()
+    LogReader._log_cache.clear()
+    config_tables._tables.clear()
+    picker._indexes.clear()
+
+
+def cold(func: t.Callable[[], t.Any]) -> t.Callable[[], t.Any]:
+    """Wrap `func` to run with empty caches
+
+    :param func: Function to wrap
+    :type func: Callable[[], Any]
+    :return: Function clearing the caches before calling `func`
+    :rtype: Callable[[], Any]
+    """
+
+    def run() -> t.Any:
+        clear_caches()
+        return func()
+
+    return run
+
+
+def time_telemetry(manifest: Manifest, repeat: int) -> t.Dict[str, float]:
+    """Time loading the memory telemetry of a shard and updating it after
+    new rows were written
+
+    :param manifest: Manifest of the experiment
+    :type manifest: Manifest
+    :param repeat: Number of timings
+    :type repeat: int
+    :return: Load and update timings in seconds
+    :rtype: Dict[str, float]
+    """
+    shard = manifest.runs[0].orchestrator[0].shards[0]
+
+    def load() -> MemoryView:
+        return MemoryView(shard, st.empty(), st.empty(), st.empty())
+
+    view = load()
+    with open(shard.memory_file, encoding="utf-8") as file:
+        new_rows = "".join(file.readlines()[-100:])
+
+    def update() -> None:
+        with open(shard.memory_file, "a", encoding="utf-8") as file:
+            file.write(new_rows)
+        view.update()
+
+    return {
+        "memory_view_load": best_of(repeat, load),
+        "memory_view_update_100_rows": best_of(repeat, update),
+    }
+
+
+def run_scale(spec: ExperimentSpec, repeat: int) -> t.Dict[str, float]:
+    """Generate an experiment and time every benchmarked path on it
+
+    :param spec: Shape of the experiment
+    :type spec: ExperimentSpec
+    :param repeat: Number of timings of each path
+    :type repeat: int
+    :return: Best timing of each path in seconds
+    :rtype: Dict[str, float]
+    """
+    results: t.Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest_path = generate_experiment(pathlib.Path(tmp) / "experiment", spec)
+        reader = create_filereader(manifest_path)
+        manifest = reader.get_manifest()
+        ensemble = manifest.runs[0].ensemble[0]
+        orchestrator = manifest.runs[0].orchestrator[0]
+
+        timings: t.Dict[str, t.Callable[[], t.Any]] = {
+            "create_filereader": lambda: create_filereader(manifest_path),
+            "get_manifest": reader.get_manifest,
+            "experiment_status_summary_cold": cold(
+                lambda: get_experiment_status_summary(manifest.runs)
+            ),
+            "experiment_status_summary_warm": lambda: get_experiment_status_summary(
+                manifest.runs
+            ),
+            "ensemble_status_summary_cold": cold(
+                lambda: get_ensemble_status_summary(ensemble)
+            ),
+            "ensemble_status_summary_warm": lambda: get_ensemble_status_summary(
+                ensemble
+            ),
+            "orchestrator_status_summary": lambda: get_orchestrator_status_summary(
+                orchestrator
+            ),
+            "get_logs_cold": cold(lambda: get_logs(manifest.experiment.out_file)),
+            "get_logs_warm": lambda: get_logs(manifest.experiment.out_file),
+        }
+        for tab in view_builders.OVERVIEW_TABS:
+            key = f"overview_{tab.lower()}_build_cold"
+            timings[key] = cold(lambda tab=tab: build_tab(manifest, tab))
+        timings["database_telemetry_build"] = cold(
+            lambda: view_builders.db_telem_builder(manifest)
+        )
+
+        for label, func in timings.items():
+            func()
+            results[label] = best_of(repeat, func)
+        results.update(time_telemetry(manifest, repeat))
+
+    clear_caches()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=str, default="100,1000,10000")
+    parser.add_argument("--runs", type=int, default=2)
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--telemetry-rows", type=int, default=100_000)
+    parser.add_argument("--log-bytes", type=int, default=64 * 1024**2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=str, default=None)
+    args = parser.parse_args()
+
+    report: t.Dict[str, t.Any] = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "scales": {},
+    }
+    for scale in (int(value) for value in args.scales.split(",")):
+        spec = ExperimentSpec(
+            runs=args.runs,
+            members=scale,
+            shards=args.shards,
+            telemetry_rows=args.telemetry_rows,
+            log_bytes=args.log_bytes,
+        )
+        report["scales"][str(scale)] = {
+            "spec": asdict(spec),
+            "seconds": run_scale(spec, args.repeat),
+        }
+
+    output = json.dumps(report, indent=2)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Memory and parse time of telemetry read with inferred and compact dtypes
+
+Memory, client and client count telemetry files are written with each row
+count and read with the dtypes pandas infers, with the compact dtypes of
+``get_telemetry_dtypes`` and with their Arrow-backed variants. Memory is the
+deep memory usage of the parsed frame; time is the best of a few parses.
+
+Run with ``python -m benchmarks.bench_telemetry_dtypes --rows 10000,100000``.
+"""
+
+import argparse
+import json
+import pathlib
+import tempfile
+import time
+import typing as t
+
+from benchmarks.generator import write_client_csvs, write_memory_csv
+from smartdashboard.utils.TelemetryReader import get_telemetry_dtypes, read_telemetry
+
+SCHEMAS: t.Dict[str, t.Dict[str, t.Any]] = {
+    "inferred": {},
+    "compact": {"arrow": False},
+    "arrow": {"arrow": True},
+}
+
+
+def measure(path: pathlib.Path, kind: str, repeat: int) -> t.Dict[str, t.Any]:
+    """Parse one telemetry file with every schema
+
+    :param path: Path of the telemetry file
+    :type path: pathlib.Path
+    :param kind: Kind of telemetry in the file
+    :type kind: str
+    :param repeat: Number of parses to take the best time of
+    :type repeat: int
+    :return: Bytes per row and parse time of each schema
+    :rtype: Dict[str, Any]
+    """
+    results: t.Dict[str, t.Any] = {}
+    for schema, kwargs in SCHEMAS.items():
+        dtypes = get_telemetry_dtypes(kind, **kwargs) if kwargs else None
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            dframe = read_telemetry(str(path), dtypes=dtypes)
+            best = min(best, time.perf_counter() - start)
+        results[schema] = {
+            "bytes_per_row": round(
+                int(dframe.memory_usage(deep=True).sum()) / len(dframe), 1
+            ),
+            "parse_ms": round(best * 1000, 1),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", default="10000,100000,1000000")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        for rows in map(int, args.rows.split(",")):
+            write_memory_csv(root / "memory.csv", rows, 0)
+            write_client_csvs(
+                root / "client.csv", root / "client_count.csv", rows, args.clients, 0
+            )
+            for kind, name in (
+                ("memory", "memory.csv"),
+                ("clients", "client.csv"),
+                ("client_count", "client_count.csv"),
+            ):
+                results.append(
+                    {
+                        "rows": rows,
+                        "kind": kind,
+                        **measure(root / name, kind, args.repeat),
+                    }
+                )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
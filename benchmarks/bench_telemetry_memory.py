@@ -0,0 +1,127 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Memory footprint of the telemetry views per telemetry row
+
+A memory telemetry file with each row count is loaded into a
+``MemoryView`` while ``tracemalloc`` traces allocations, then rows are
+appended and the view is updated. Retained bytes are what the view keeps
+after loading, including its chart; peak bytes are the most allocated at
+once while loading or updating.
+
+Run with ``python -m benchmarks.bench_telemetry_memory --rows 10000,100000``.
+"""
+
+import argparse
+import json
+import pathlib
+import tempfile
+import tracemalloc
+import typing as t
+
+import streamlit as st
+
+from benchmarks.generator import ExperimentSpec, generate_experiment
+from smartdashboard.utils.ManifestReader import create_filereader
+from smartdashboard.utils.TelemetryReader import TELEMETRY_BUDGET
+from smartdashboard.views import MemoryView
+
+
+def measure(
+    rows: int, updates: int, rows_per_update: int, budget: int
+) -> t.Dict[str, t.Any]:
+    """Trace the allocations of loading and updating a MemoryView
+
+    :param rows: Rows in the telemetry file when the view is loaded
+    :type rows: int
+    :param updates: Number of updates after loading
+    :type updates: int
+    :param rows_per_update: Rows appended before each update
+    :type rows_per_update: int
+    :param budget: Memory budget of the view in bytes
+    :type budget: int
+    :return: Bytes per row retained and at peak while loading and updating
+    :rtype: Dict[str, Any]
+    """
+    spec = ExperimentSpec(runs=1, members=1, shards=1, telemetry_rows=rows, log_bytes=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest_path = generate_experiment(pathlib.Path(tmp), spec)
+        manifest = create_filereader(manifest_path).get_manifest()
+        shard = manifest.runs[0].orchestrator[0].shards[0]
+        with open(shard.memory_file, encoding="utf-8") as file:
+            new_rows = "".join(file.readlines()[-rows_per_update:])
+
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            view = MemoryView(
+                shard, st.empty(), st.empty(), st.empty(), memory_budget=budget
+            )
+            retained, peak = tracemalloc.get_traced_memory()
+            load = {"retained": retained - base, "peak": peak - base}
+
+            tracemalloc.reset_peak()
+            for _ in range(updates):
+                with open(shard.memory_file, "a", encoding="utf-8") as file:
+                    file.write(new_rows)
+                view.update()
+            retained, peak = tracemalloc.get_traced_memory()
+            update = {"retained": retained - base, "peak": peak - base}
+        finally:
+            tracemalloc.stop()
+
+    total_rows = rows + updates * rows_per_update
+    return {
+        "rows": rows,
+        "rollup_rows": view.store.rollup_rows,
+        "load_retained_bytes_per_row": round(load["retained"] / rows, 1),
+        "load_peak_bytes_per_row": round(load["peak"] / rows, 1),
+        "update_retained_bytes_per_row": round(update["retained"] / total_rows, 1),
+        "update_peak_bytes_per_row": round(update["peak"] / total_rows, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", default="10000,100000,1000000")
+    parser.add_argument("--updates", type=int, default=10)
+    parser.add_argument("--rows-per-update", type=int, default=100)
+    parser.add_argument("--budget", type=int, default=TELEMETRY_BUDGET)
+    args = parser.parse_args()
+
+    # the chart library is imported on first use, keep it out of the traces
+    # pylint: disable-next=import-outside-toplevel,unused-import
+    import altair  # noqa: F401
+
+    results = [
+        measure(int(rows), args.updates, args.rows_per_update, args.budget)
+        for rows in args.rows.split(",")
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Cost of appending to a TelemetryStore and charting it as a run grows
+
+Memory telemetry rows are appended to a store a hundred at a time, as a
+view does while tailing a live run. At each checkpoint the mean and
+longest append since the previous checkpoint are reported, along with the
+time to select the rows to chart, either downsampled over the whole run or
+with the last minutes in full.
+
+Run with ``python -m benchmarks.bench_telemetry_store --rows 1000000``.
+"""
+
+import argparse
+import json
+import time
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from smartdashboard.utils.TelemetryReader import TELEMETRY_BUDGET, TelemetryStore
+
+COLUMNS = ["timestamp", "used_memory", "used_memory_peak", "total_system_memory"]
+
+
+def _rows(start: int, count: int) -> pd.DataFrame:
+    index = np.arange(start, start + count)
+    return pd.DataFrame(
+        {
+            "timestamp": index * 1000,
+            "used_memory": (4e6 + (index % 5000) * 64).astype(np.float32),
+            "used_memory_peak": (4.32e6 + (index % 5000) * 64).astype(np.float32),
+            "total_system_memory": np.full(count, 5.4e11, dtype=np.float32),
+        }
+    )
+
+
+def _best_ms(func: t.Callable[[], t.Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 3)
+
+
+def measure(
+    rows: int, checkpoints: int, rows_per_append: int, budget: int, minutes: float
+) -> t.List[t.Dict[str, t.Any]]:
+    """Append rows to a store and time it at evenly spaced checkpoints
+
+    :param rows: Rows appended in total
+    :type rows: int
+    :param checkpoints: Number of checkpoints to time
+    :type checkpoints: int
+    :param rows_per_append: Rows in each append
+    :type rows_per_append: int
+    :param budget: Memory budget of the store in bytes
+    :type budget: int
+    :param minutes: Minutes charted in full in window mode
+    :type minutes: float
+    :return: Append and chart selection times at each checkpoint
+    :rtype: List[Dict[str, Any]]
+    """
+    store = TelemetryStore(COLUMNS, budget)
+    batch = _rows(0, rows_per_append)
+    every = max(1, rows // checkpoints // rows_per_append)
+    results = []
+    elapsed: t.List[float] = []
+    for appends in range(1, rows // rows_per_append + 1):
+        timestamps = batch["timestamp"] + appends * rows_per_append * 1000
+        start = time.perf_counter()
+        store.append(batch.assign(timestamp=timestamps))
+        elapsed.append(time.perf_counter() - start)
+        if appends % every == 0:
+            results.append(
+                {
+                    "rows": appends * rows_per_append,
+                    "stored_rows": len(store),
+                    "stored_mb": round(store.nbytes / 1024**2, 1),
+                    "append_mean_ms": round(float(np.mean(elapsed)) * 1000, 3),
+                    "append_max_ms": round(max(elapsed) * 1000, 1),
+                    "downsample_ms": _best_ms(lambda: store.downsample(10_000), 3),
+                    "window_ms": _best_ms(
+                        lambda: store.window(minutes * 60_000, 10_000, 1000), 3
+                    ),
+                }
+            )
+            elapsed = []
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--checkpoints", type=int, default=5)
+    parser.add_argument("--rows-per-append", type=int, default=100)
+    parser.add_argument("--budget", type=int, default=TELEMETRY_BUDGET)
+    parser.add_argument("--minutes", type=float, default=15)
+    args = parser.parse_args()
+
+    results = measure(
+        args.rows, args.checkpoints, args.rows_per_append, args.budget, args.minutes
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
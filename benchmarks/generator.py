@@ -0,0 +1,403 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Generator of synthetic SmartSim experiments for benchmarks
+
+Writes a realistic experiment tree: a manifest with N runs, ensembles of M
+members and orchestrators of K shards, status directories in a mix of
+running, completed, failed and unknown states, out and err logs for every
+entity and memory and client telemetry CSVs for every shard. Large logs and
+telemetry files are written in chunks, so multi-GB trees can be generated
+without holding them in memory.
+
+Run with ``python -m benchmarks.generator OUTPUT_DIR --members 10000``.
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import random
+import typing as t
+from dataclasses import asdict, dataclass, field
+
+_CHUNK_LINES = 100_000
+
+_LOG_LINE = "Step {step}: converged in {iterations} iterations, residual {residual}\n"
+
+STATUS_MIX: t.Dict[str, float] = {
+    "running": 0.25,
+    "completed": 0.5,
+    "failed": 0.15,
+    "unknown": 0.1,
+}
+"""Default share of entities in each state"""
+
+
+@dataclass
+class ExperimentSpec:
+    """Data class describing the shape of a synthetic experiment
+
+    :param runs: Number of runs
+    :type runs: int
+    :param applications: Applications per run
+    :type applications: int
+    :param ensembles: Ensembles per run
+    :type ensembles: int
+    :param members: Members per ensemble
+    :type members: int
+    :param orchestrators: Orchestrators per run
+    :type orchestrators: int
+    :param shards: Shards per orchestrator
+    :type shards: int
+    :param log_bytes: Size of the experiment and application logs
+    :type log_bytes: int
+    :param member_log_bytes: Size of the member and shard logs
+    :type member_log_bytes: int
+    :param telemetry_rows: Samples in each shard telemetry file
+    :type telemetry_rows: int
+    :param clients: Clients connected to each shard at every sample
+    :type clients: int
+    :param status_mix: Share of entities in each state
+    :type status_mix: Dict[str, float]
+    :param seed: Seed deciding which entities are in which state
+    :type seed: int
+    """
+
+    runs: int = 1
+    applications: int = 2
+    ensembles: int = 1
+    members: int = 100
+    orchestrators: int = 1
+    shards: int = 4
+    log_bytes: int = 1024**2
+    member_log_bytes: int = 1024
+    telemetry_rows: int = 10_000
+    clients: int = 4
+    status_mix: t.Dict[str, float] = field(default_factory=STATUS_MIX.copy)
+    seed: int = 0
+
+
+def write_log(path: pathlib.Path, size: int) -> None:
+    """Write a log file of about `size` bytes
+
+    :param path: Path of the log file
+    :type path: pathlib.Path
+    :param size: Size of the log in bytes
+    :type size: int
+    """
+    lines = [
+        _LOG_LINE.format(step=i, iterations=i % 97, residual=1.0 / (i + 1))
+        for i in range(1000)
+    ]
+    block = "".join(lines).encode()
+    with open(path, "wb") as file:
+        written = 0
+        while written < size:
+            chunk = block[: size - written]
+            file.write(chunk)
+            written += len(chunk)
+
+
+def write_memory_csv(path: pathlib.Path, rows: int, start_ms: int) -> None:
+    """Write a memory telemetry CSV with one sample per second
+
+    :param path: Path of the CSV
+    :type path: pathlib.Path
+    :param rows: Number of samples
+    :type rows: int
+    :param start_ms: Timestamp of the first sample in milliseconds
+    :type start_ms: int
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("timestamp,used_memory,used_memory_peak,total_system_memory\n")
+        for chunk_start in range(0, rows, _CHUNK_LINES):
+            file.write(
+                "".join(
+                    f"{start_ms + i * 1000},{4_000_000.0 + (i % 5000) * 64},"
+                    f"{4_320_000.0 + (i % 5000) * 64},539376840704.0\n"
+                    for i in range(chunk_start, min(chunk_start + _CHUNK_LINES, rows))
+                )
+            )
+
+
+def write_client_csvs(
+    client_path: pathlib.Path,
+    count_path: pathlib.Path,
+    rows: int,
+    clients: int,
+    start_ms: int,
+) -> None:
+    """Write client and client count telemetry CSVs with one sample per second
+
+    :param client_path: Path of the client CSV
+    :type client_path: pathlib.Path
+    :param count_path: Path of the client count CSV
+    :type count_path: pathlib.Path
+    :param rows: Number of samples
+    :type rows: int
+    :param clients: Clients connected at every sample
+    :type clients: int
+    :param start_ms: Timestamp of the first sample in milliseconds
+    :type start_ms: int
+    """
+    with (
+        open(client_path, "w", encoding="utf-8") as client_file,
+        open(count_path, "w", encoding="utf-8") as count_file,
+    ):
+        client_file.write("timestamp,client_id,address\n")
+        count_file.write("timestamp,num_clients\n")
+        samples_per_chunk = max(1, _CHUNK_LINES // max(clients, 1))
+        for chunk_start in range(0, rows, samples_per_chunk):
+            samples = range(chunk_start, min(chunk_start + samples_per_chunk, rows))
+            client_file.write(
+                "".join(
+                    f"{start_ms + i * 1000},{client},10.150.0.3:{40000 + client}\n"
+                    for i in samples
+                    for client in range(clients)
+                )
+            )
+            count_file.write(
+                "".join(f"{start_ms + i * 1000},{clients}\n" for i in samples)
+            )
+
+
+def write_status_dir(path: pathlib.Path, state: str) -> None:
+    """Write the status files of an entity in `state`
+
+    :param path: Status directory of the entity
+    :type path: pathlib.Path
+    :param state: One of running, completed, failed or unknown
+    :type state: str
+    """
+    if state == "unknown":
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "start.json").write_text('{"timestamp": 1}', encoding="utf-8")
+    if state in ("completed", "failed"):
+        return_code = 0 if state == "completed" else 1
+        (path / "stop.json").write_text(
+            json.dumps({"timestamp": 2, "return_code": return_code}),
+            encoding="utf-8",
+        )
+
+
+class ExperimentWriter:
+    """Writes the files of one experiment and builds its manifest"""
+
+    def __init__(self, root: pathlib.Path, spec: ExperimentSpec) -> None:
+        """Initialize an ExperimentWriter
+
+        :param root: Experiment directory
+        :type root: pathlib.Path
+        :param spec: Shape of the experiment
+        :type spec: ExperimentSpec
+        """
+        self.root = root
+        self.spec = spec
+        self.telemetry = root / ".smartsim" / "telemetry"
+        self.logs = root / "logs"
+        self.random = random.Random(spec.seed)
+        self.states = list(spec.status_mix)
+        self.weights = list(spec.status_mix.values())
+        self.start_ms = 1_712_602_403_000
+
+    def state(self) -> str:
+        return self.random.choices(self.states, self.weights)[0]
+
+    def log_files(self, name: str, size: int) -> t.Dict[str, str]:
+        out_file = self.logs / f"{name}.out"
+        err_file = self.logs / f"{name}.err"
+        write_log(out_file, size)
+        write_log(err_file, min(size, 1024))
+        return {"out_file": str(out_file), "err_file": str(err_file)}
+
+    def metadata(self, run_id: str, kind: str, name: str) -> t.Dict[str, str]:
+        status_dir = self.telemetry / run_id / kind / name
+        write_status_dir(status_dir, self.state())
+        return {"status_dir": str(status_dir), "job_id": name, "step_id": name}
+
+    def application(self, run_id: str, name: str, log_bytes: int) -> t.Dict[str, t.Any]:
+        return {
+            "name": name,
+            "path": str(self.root / name),
+            "exe_args": ["--steps", "1000"],
+            "run_settings": {
+                "exe": "/usr/bin/python",
+                "run_command": "srun",
+                "run_args": {"nodes": 1, "ntasks": 4},
+            },
+            "batch_settings": {},
+            "params": {"learning_rate": "0.01", "name": name},
+            "files": {"Symlink": [], "Configure": ["params.yaml"], "Copy": []},
+            "colocated_db": {},
+            "telemetry_metadata": self.metadata(run_id, "model", name),
+            **self.log_files(f"{run_id}_{name}", log_bytes),
+        }
+
+    def shard(self, run_id: str, orchestrator: str, index: int) -> t.Dict[str, t.Any]:
+        name = f"{orchestrator}_{index}"
+        prefix = self.telemetry / run_id / "database" / orchestrator / name
+        prefix.mkdir(parents=True, exist_ok=True)
+        memory_file = prefix / "memory.csv"
+        client_file = prefix / "client.csv"
+        count_file = prefix / "client_count.csv"
+        write_memory_csv(memory_file, self.spec.telemetry_rows, self.start_ms)
+        write_client_csvs(
+            client_file,
+            count_file,
+            self.spec.telemetry_rows,
+            self.spec.clients,
+            self.start_ms,
+        )
+        return {
+            "name": name,
+            "hostname": f"nid{index:05d}",
+            "port": 6780,
+            "conf_file": None,
+            "telemetry_metadata": self.metadata(run_id, "database", name),
+            "memory_file": str(memory_file),
+            "client_file": str(client_file),
+            "client_count_file": str(count_file),
+            **self.log_files(f"{run_id}_{name}", self.spec.member_log_bytes),
+        }
+
+    def run(self, run_index: int) -> t.Dict[str, t.Any]:
+        """Write the files of a run
+
+        :param run_index: Index of the run, used as its run ID
+        :type run_index: int
+        :return: Manifest entry of the run
+        :rtype: Dict[str, Any]
+        """
+        run_id = str(run_index)
+        spec = self.spec
+        applications = [
+            self.application(run_id, f"app_{i}", spec.log_bytes)
+            for i in range(spec.applications)
+        ]
+        ensembles = [
+            {
+                "name": f"ensemble_{i}",
+                "perm_strat": "all_perm",
+                "batch_settings": {},
+                "params": {"learning_rate": ["0.01", "0.001"]},
+                "models": [
+                    self.application(run_id, f"ensemble_{i}_{j}", spec.member_log_bytes)
+                    for j in range(spec.members)
+                ],
+            }
+            for i in range(spec.ensembles)
+        ]
+        orchestrators = [
+            {
+                "name": f"orchestrator_{i}",
+                "type": "redis",
+                "interface": ["hsn0"],
+                "shards": [
+                    self.shard(run_id, f"orchestrator_{i}", j)
+                    for j in range(spec.shards)
+                ],
+            }
+            for i in range(spec.orchestrators)
+        ]
+        return {
+            "run_id": run_id,
+            "timestamp": self.start_ms,
+            "model": applications,
+            "orchestrator": orchestrators,
+            "ensemble": ensembles,
+        }
+
+    def write(self) -> pathlib.Path:
+        """Write every file of the experiment and its manifest
+
+        :return: Path to the manifest
+        :rtype: pathlib.Path
+        """
+        self.telemetry.mkdir(parents=True, exist_ok=True)
+        self.logs.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "schema info": {"schema_name": "entity manifest", "version": "0.0.4"},
+            "experiment": {
+                "name": self.root.name,
+                "path": str(self.root),
+                "launcher": "Slurm",
+                **self.log_files("experiment", self.spec.log_bytes),
+            },
+            "runs": [self.run(i) for i in range(self.spec.runs)],
+        }
+        path = self.telemetry / "manifest.json"
+        path.write_text(json.dumps(manifest), encoding="utf-8")
+        return path
+
+
+def generate_experiment(root: pathlib.Path, spec: ExperimentSpec) -> pathlib.Path:
+    """Write a synthetic experiment
+
+    Every written file gets a modification time in the past, as it would
+    for an experiment that was written a while ago.
+
+    :param root: Experiment directory, created if it does not exist
+    :type root: pathlib.Path
+    :param spec: Shape of the experiment
+    :type spec: ExperimentSpec
+    :return: Path to the manifest of the experiment
+    :rtype: pathlib.Path
+    """
+    root = root.resolve()
+    root.mkdir(parents=True, exist_ok=True)
+    manifest_path = ExperimentWriter(root, spec).write()
+
+    settled = manifest_path.stat().st_mtime - 60
+    for dir_path, _, file_names in os.walk(root):
+        for file_name in file_names:
+            os.utime(os.path.join(dir_path, file_name), (settled, settled))
+    return manifest_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", type=pathlib.Path)
+    defaults = ExperimentSpec()
+    for name, value in asdict(defaults).items():
+        if isinstance(value, int):
+            parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=value)
+    args = parser.parse_args()
+
+    spec = ExperimentSpec(
+        **{
+            name: getattr(args, name)
+            for name, value in asdict(defaults).items()
+            if isinstance(value, int)
+        }
+    )
+    manifest_path = generate_experiment(args.output, spec)
+    print(json.dumps({"manifest": str(manifest_path), "spec": asdict(spec)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Simulator of a running SmartSim experiment for benchmarking the tail and
+refresh paths
+
+Starts from an experiment written by ``benchmarks.generator`` in which no
+entity has started, then replays it tick by tick: telemetry rows are
+appended to every shard's memory, client and client count files, log lines
+are appended, entities are started and stopped by writing ``start.json``
+and ``stop.json``, and new runs are appended to ``manifest.json``. Partial
+lines and truncated telemetry files can be injected to exercise the
+incremental readers.
+
+Run with ``python -m benchmarks.simulator OUTPUT_DIR --members 1000 --rate 2``.
+"""
+
+import argparse
+import json
+import pathlib
+import random
+import threading
+import time
+import typing as t
+from dataclasses import asdict, dataclass
+
+from benchmarks.generator import ExperimentSpec, ExperimentWriter, generate_experiment
+
+_MEMORY_HEADER = "timestamp,used_memory,used_memory_peak,total_system_memory\n"
+
+
+@dataclass
+class LiveSpec:
+    """Data class describing what changes on every tick of a simulation
+
+    :param rows_per_tick: Telemetry samples appended to each shard
+    :type rows_per_tick: int
+    :param log_lines_per_tick: Lines appended to each written log
+    :type log_lines_per_tick: int
+    :param member_logs_per_tick: Member and shard logs written, in turn
+    :type member_logs_per_tick: int
+    :param starts_per_tick: Entities started
+    :type starts_per_tick: int
+    :param stops_per_tick: Running entities stopped
+    :type stops_per_tick: int
+    :param failure_rate: Share of stopped entities that fail
+    :type failure_rate: float
+    :param partial_every: Leave the last telemetry row of a shard without
+                          its newline every this many ticks, 0 to never do so
+    :type partial_every: int
+    :param truncate_every: Truncate a shard memory file every this many
+                           ticks, 0 to never do so
+    :type truncate_every: int
+    :param manifest_every: Append a run to the manifest every this many
+                           ticks, 0 to never do so
+    :type manifest_every: int
+    :param seed: Seed deciding which entities fail
+    :type seed: int
+    """
+
+    rows_per_tick: int = 1
+    log_lines_per_tick: int = 10
+    member_logs_per_tick: int = 100
+    starts_per_tick: int = 50
+    stops_per_tick: int = 25
+    failure_rate: float = 0.1
+    partial_every: int = 5
+    truncate_every: int = 0
+    manifest_every: int = 0
+    seed: int = 0
+
+
+def not_started(spec: ExperimentSpec) -> ExperimentSpec:
+    """Get a copy of an experiment shape in which no entity has started
+
+    :param spec: Shape of the experiment
+    :type spec: ExperimentSpec
+    :return: Shape with every entity in the unknown state
+    :rtype: ExperimentSpec
+    """
+    values = asdict(spec)
+    values["status_mix"] = {"unknown": 1.0}
+    return ExperimentSpec(**values)
+
+
+class LiveExperiment:
+    """Replays a generated experiment as if it were running"""
+
+    def __init__(
+        self, manifest_path: pathlib.Path, spec: ExperimentSpec, live: LiveSpec
+    ) -> None:
+        """Initialize a LiveExperiment
+
+        :param manifest_path: Manifest written by the generator
+        :type manifest_path: pathlib.Path
+        :param spec: Shape the experiment was generated with, used for
+                     the runs appended to the manifest
+        :type spec: ExperimentSpec
+        :param live: What changes on every tick
+        :type live: LiveSpec
+        """
+        self.manifest_path = manifest_path
+        self.manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        self.live = live
+        self.writer = ExperimentWriter(manifest_path.parents[2], not_started(spec))
+        self.random = random.Random(live.seed)
+        self.ticks = 0
+        self.timestamp_ms = self.writer.start_ms + spec.telemetry_rows * 1000
+        self.clients = spec.clients
+
+        self.pending: t.List[pathlib.Path] = []
+        self.running: t.List[pathlib.Path] = []
+        self.logs: t.List[str] = []
+        self.member_logs: t.List[str] = []
+        self.shards: t.List[t.Dict[str, t.Any]] = []
+        self._partial: t.Dict[str, str] = {}
+        self._next_member_log = 0
+
+        self.logs.append(self.manifest["experiment"]["out_file"])
+        for run in self.manifest["runs"]:
+            self._add_run(run)
+
+    def _add_run(self, run: t.Dict[str, t.Any]) -> None:
+        for app in run["model"]:
+            self.pending.append(pathlib.Path(app["telemetry_metadata"]["status_dir"]))
+            self.logs.append(app["out_file"])
+        for ensemble in run["ensemble"]:
+            for member in ensemble["models"]:
+                self.pending.append(
+                    pathlib.Path(member["telemetry_metadata"]["status_dir"])
+                )
+                self.member_logs.append(member["out_file"])
+        for orchestrator in run["orchestrator"]:
+            for shard in orchestrator["shards"]:
+                self.pending.append(
+                    pathlib.Path(shard["telemetry_metadata"]["status_dir"])
+                )
+                self.member_logs.append(shard["out_file"])
+                self.shards.append(shard)
+
+    def _append(self, path: str, text: str, partial: bool = False) -> None:
+        text = self._partial.pop(path, "") + text
+        if partial and text:
+            # the newline of the last row is written on the next tick
+            self._partial[path] = "\n"
+            text = text[:-1]
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(text)
+
+    def _write_telemetry(self) -> None:
+        partial = bool(self.live.partial_every) and (
+            self.ticks % self.live.partial_every == 0
+        )
+        timestamps = [
+            self.timestamp_ms + i * 1000 for i in range(self.live.rows_per_tick)
+        ]
+        memory_rows = "".join(
+            f"{ts},{4_000_000.0 + (ts // 1000 % 5000) * 64},"
+            f"{4_320_000.0 + (ts // 1000 % 5000) * 64},539376840704.0\n"
+            for ts in timestamps
+        )
+        count_rows = "".join(f"{ts},{self.clients}\n" for ts in timestamps)
+        client_rows = "".join(
+            f"{ts},{client},10.150.0.3:{40000 + client}\n"
+            for ts in timestamps
+            for client in range(self.clients)
+        )
+        for shard in self.shards:
+            self._append(shard["memory_file"], memory_rows, partial)
+            self._append(shard["client_count_file"], count_rows, partial)
+            self._append(shard["client_file"], client_rows, partial)
+        self.timestamp_ms += self.live.rows_per_tick * 1000
+
+        if (
+            self.live.truncate_every
+            and self.ticks % self.live.truncate_every == 0
+            and self.shards
+        ):
+            memory_file = self.shards[0]["memory_file"]
+            self._partial.pop(memory_file, None)
+            with open(memory_file, "w", encoding="utf-8") as file:
+                file.write(_MEMORY_HEADER)
+
+    def _write_logs(self) -> None:
+        lines = "".join(
+            f"Tick {self.ticks}: step {i} converged\n"
+            for i in range(self.live.log_lines_per_tick)
+        )
+        for path in self.logs:
+            self._append(path, lines)
+        if not self.member_logs:
+            return
+        for _ in range(min(self.live.member_logs_per_tick, len(self.member_logs))):
+            self._append(self.member_logs[self._next_member_log], lines)
+            self._next_member_log = (self._next_member_log + 1) % len(self.member_logs)
+
+    def _write_statuses(self) -> None:
+        stopping = self.running[: self.live.stops_per_tick]
+        del self.running[: self.live.stops_per_tick]
+        for status_dir in stopping:
+            return_code = int(self.random.random() < self.live.failure_rate)
+            (status_dir / "stop.json").write_text(
+                json.dumps(
+                    {"timestamp": self.timestamp_ms, "return_code": return_code}
+                ),
+                encoding="utf-8",
+            )
+
+        starting = self.pending[: self.live.starts_per_tick]
+        del self.pending[: self.live.starts_per_tick]
+        for status_dir in starting:
+            status_dir.mkdir(parents=True, exist_ok=True)
+            (status_dir / "start.json").write_text(
+                json.dumps({"timestamp": self.timestamp_ms}), encoding="utf-8"
+            )
+        self.running.extend(starting)
+
+    def _write_manifest(self) -> None:
+        run = self.writer.run(len(self.manifest["runs"]))
+        self.manifest["runs"].append(run)
+        self._add_run(run)
+        self.manifest_path.write_text(json.dumps(self.manifest), encoding="utf-8")
+
+    def tick(self) -> None:
+        """Advance the experiment by one tick"""
+        self.ticks += 1
+        self._write_telemetry()
+        self._write_logs()
+        self._write_statuses()
+        if self.live.manifest_every and self.ticks % self.live.manifest_every == 0:
+            self._write_manifest()
+
+    def run(
+        self,
+        rate: float,
+        ticks: int = 0,
+        stop_event: t.Optional[threading.Event] = None,
+    ) -> None:
+        """Tick at a fixed rate
+
+        :param rate: Ticks per second
+        :type rate: float
+        :param ticks: Number of ticks, 0 to tick until stopped
+        :type ticks: int
+        :param stop_event: Event that stops the simulation when set
+        :type stop_event: Optional[threading.Event]
+        """
+        stop_event = stop_event if stop_event is not None else threading.Event()
+        interval = 1.0 / rate
+        deadline = time.monotonic()
+        while not stop_event.is_set() and (not ticks or self.ticks < ticks):
+            self.tick()
+            deadline += interval
+            stop_event.wait(max(0.0, deadline - time.monotonic()))
+
+    def start(self, rate: float) -> threading.Event:
+        """Tick at a fixed rate on a daemon thread
+
+        :param rate: Ticks per second
+        :type rate: float
+        :return: Event that stops the simulation when set
+        :rtype: threading.Event
+        """
+        stop_event = threading.Event()
+        threading.Thread(
+            target=self.run,
+            args=(rate, 0, stop_event),
+            name="smartdashboard-simulator",
+            daemon=True,
+        ).start()
+        return stop_event
+
+
+def create_live_experiment(
+    root: pathlib.Path, spec: ExperimentSpec, live: LiveSpec
+) -> LiveExperiment:
+    """Generate an experiment in which no entity has started and prepare
+    to replay it
+
+    :param root: Experiment directory
+    :type root: pathlib.Path
+    :param spec: Shape of the experiment
+    :type spec: ExperimentSpec
+    :param live: What changes on every tick
+    :type live: LiveSpec
+    :return: Experiment ready to tick
+    :rtype: LiveExperiment
+    """
+    manifest_path = generate_experiment(root, not_started(spec))
+    return LiveExperiment(manifest_path, spec, live)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", type=pathlib.Path)
+    parser.add_argument("--rate", type=float, default=1.0)
+    parser.add_argument("--ticks", type=int, default=0)
+    specs = {"spec": ExperimentSpec(telemetry_rows=100), "live": LiveSpec()}
+    for spec in specs.values():
+        for name, value in asdict(spec).items():
+            if isinstance(value, (int, float)) and name != "seed":
+                parser.add_argument(
+                    f"--{name.replace('_', '-')}", type=type(value), default=value
+                )
+    args = parser.parse_args()
+
+    spec = ExperimentSpec(
+        **{
+            name: getattr(args, name)
+            for name in asdict(specs["spec"])
+            if hasattr(args, name)
+        }
+    )
+    live = LiveSpec(
+        **{
+            name: getattr(args, name)
+            for name in asdict(specs["live"])
+            if hasattr(args, name)
+        }
+    )
+    experiment = create_live_experiment(args.output, spec, live)
+    print(f"Simulating {experiment.manifest_path} at {args.rate} ticks per second")
+    try:
+        experiment.run(args.rate, args.ticks)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
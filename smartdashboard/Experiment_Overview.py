@@ -28,15 +28,19 @@ import os
 import pathlib
 import sys
 import time
-from subprocess import run
 
 import streamlit as st
 
-from smartdashboard.utils.argparser import get_parser
+from smartdashboard.utils.argparser import get_parser, run_command
 from smartdashboard.utils.errors import SSDashboardError
-from smartdashboard.utils.ManifestReader import create_filereader, get_manifest_path
-from smartdashboard.utils.pageSetup import local_css, set_streamlit_page_config
-from smartdashboard.view_builders import error_builder, overview_builder
+from smartdashboard.utils.ManifestReader import get_manifest_path
+from smartdashboard.utils.pageSetup import (
+    get_manifest_loader,
+    local_css,
+    set_streamlit_page_config,
+)
+from smartdashboard.utils.storage import use_experiment_storage
+from smartdashboard.utils.timing import get_timings
 
 
 def build_app(manifest_path: pathlib.Path) -> None:
@@ -45,52 +49,70 @@ def build_app(manifest_path: pathlib.Path) -> None:
     :param manifest_path: Path to build Manifest with
     :type manifest_path: pathlib.Path
     """
+    # the views pull in pandas, so they are imported once the page is built
+    # rather than when the CLI starts
+    # pylint: disable-next=import-outside-toplevel
+    from smartdashboard.view_builders import (
+        error_builder,
+        overview_builder,
+        reload_error_builder,
+    )
+
     set_streamlit_page_config()
 
     curr_path = pathlib.Path(os.path.abspath(__file__)).parent
     local_css(str(curr_path / "static/style.css"))
 
     try:
-        manifest_reader = create_filereader(manifest_path)
-        manifest = manifest_reader.get_manifest()
-        st.session_state["manifest"] = manifest
+        manifest_loader = get_manifest_loader(manifest_path)
     except SSDashboardError as ex:
         error_builder(ex)
     else:
-        views = overview_builder(manifest)
+        snapshot = manifest_loader.snapshot
+        error = manifest_loader.error
+        st.session_state["manifest"] = snapshot.manifest
+        reload_error_builder(error)
+        views = overview_builder(snapshot.manifest)
 
         while True:
-            if manifest_reader.has_changed:
+            # the new manifest is parsed and validated by the loader thread,
+            # so rebuilding the page only swaps in the published snapshot
+            if (
+                manifest_loader.snapshot is not snapshot
+                or manifest_loader.error is not error
+            ):
                 st.rerun()
             views.update()
             time.sleep(1)
 
 
-def run_dash_app(exp_path: str, app_port: int) -> None:
-    """Execute the dashboard app by invoking streamlit
+def run_dash_app(exp_path: str, app_port: int, diagnostics: bool = False) -> None:
+    """Execute the dashboard app by bootstrapping streamlit in this process
 
     :param exp_path: Path to experiment directory
     :type exp_path: str
     :param app_port: Port that the application is launched on
     :type app_port: int
+    :param diagnostics: Record timings for the Diagnostics page
+    :type diagnostics: bool
     """
-    app_cmd = [
-        "streamlit",
-        "run",
-        os.path.abspath(__file__),
-        "--server.port",
-        str(app_port),
-        "--server.enableStaticServing",
-        "1",
-        "--theme.base",
-        "dark",
-        "--theme.primaryColor",
-        "#17eba0",
-        "--",
-        "-d",
-        exp_path,
-    ]
-    run(app_cmd, check=False)
+    # pylint: disable-next=import-outside-toplevel
+    from streamlit.web import bootstrap
+
+    flag_options = {
+        "server.port": app_port,
+        "server.enableStaticServing": True,
+        "theme.base": "dark",
+        "theme.primaryColor": "#17eba0",
+    }
+    bootstrap.load_config_options(flag_options=flag_options)
+    args = ["-d", exp_path] + (["--diagnostics"] if diagnostics else [])
+    bootstrap.run(
+        main_script_path=os.path.abspath(__file__),
+        is_hello=False,
+        args=args,
+        flag_options=flag_options,
+    )
     sys.exit(0)
 
 
@@ -99,6 +121,10 @@ def cli() -> None:
     arg_parser = get_parser()
     args = arg_parser.parse_args(sys.argv[1:])
 
+    code = run_command(args)
+    if code is not None:
+        sys.exit(code)
+
     exp_path = pathlib.Path(os.getcwd())
 
     if args.directory is not None:
@@ -106,7 +132,7 @@ def cli() -> None:
 
     app_port: int = args.port
 
-    run_dash_app(str(exp_path), app_port)
+    run_dash_app(str(exp_path), app_port, args.diagnostics)
 
 
 if __name__ == "__main__":
@@ -117,5 +143,8 @@ if __name__ == "__main__":
     directory = (
         pathlib.Path(cli_args.directory) if cli_args.directory is not None else None
     )
+    use_experiment_storage(directory)
+    if cli_args.diagnostics:
+        get_timings().enabled = True
     PATH = get_manifest_path(directory)
     build_app(PATH)
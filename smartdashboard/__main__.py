@@ -24,10 +24,20 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import smartdashboard.Experiment_Overview
+import sys
+
+from smartdashboard.utils.argparser import get_parser, run_command
 
 
 def main() -> int:
+    args = get_parser().parse_args(sys.argv[1:])
+    code = run_command(args)
+    if code is not None:
+        return code
+
+    # pylint: disable-next=import-outside-toplevel
+    import smartdashboard.Experiment_Overview
+
     smartdashboard.Experiment_Overview.cli()
     return 0
 
@@ -34,13 +34,20 @@ import streamlit as st
 
 from smartdashboard.utils.argparser import get_parser
 from smartdashboard.utils.errors import SSDashboardError
-from smartdashboard.utils.ManifestReader import (
-    Manifest,
-    create_filereader,
-    get_manifest_path,
+from smartdashboard.utils.ManifestLoader import ManifestLoader
+from smartdashboard.utils.ManifestReader import get_manifest_path
+from smartdashboard.utils.pageSetup import (
+    get_manifest_loader,
+    local_css,
+    set_streamlit_page_config,
+)
+from smartdashboard.utils.storage import use_experiment_storage
+from smartdashboard.utils.timing import get_timings
+from smartdashboard.view_builders import (
+    db_telem_builder,
+    error_builder,
+    reload_error_builder,
 )
-from smartdashboard.utils.pageSetup import local_css, set_streamlit_page_config
-from smartdashboard.view_builders import db_telem_builder, error_builder
 
 
 def build_telemetry_page() -> None:
@@ -52,26 +59,35 @@ def build_telemetry_page() -> None:
     curr_path = pathlib.Path(os.path.abspath(__file__)).parent.parent
     local_css(str(curr_path / "static/style.css"))
 
-    if "manifest" not in st.session_state:
-        args = get_parser().parse_args(sys.argv[1:])
-        directory = pathlib.Path(args.directory) if args.directory is not None else None
-        manifest_path = get_manifest_path(directory)
-        try:
-            manifest_reader = create_filereader(manifest_path)
-            manifest = manifest_reader.get_manifest()
-            st.session_state["manifest"] = manifest
-        except SSDashboardError as ex:
-            error_builder(ex)
-            return
+    args = get_parser().parse_args(sys.argv[1:])
+    directory = pathlib.Path(args.directory) if args.directory is not None else None
+    use_experiment_storage(directory)
+    if args.diagnostics:
+        get_timings().enabled = True
+    manifest_path = get_manifest_path(directory)
+    try:
+        manifest_loader = get_manifest_loader(manifest_path)
+    except SSDashboardError as ex:
+        error_builder(ex)
+        return
 
-    update_telemetry_page(st.session_state["manifest"])
+    update_telemetry_page(manifest_loader)
 
 
-def update_telemetry_page(manifest: Manifest) -> t.NoReturn:
+def update_telemetry_page(manifest_loader: ManifestLoader) -> t.NoReturn:
     """Update the components for the Database Telemetry page"""
-    views = db_telem_builder(manifest)
+    snapshot = manifest_loader.snapshot
+    error = manifest_loader.error
+    st.session_state["manifest"] = snapshot.manifest
+    reload_error_builder(error)
+    views = db_telem_builder(snapshot.manifest)
 
     while True:
+        if (
+            manifest_loader.snapshot is not snapshot
+            or manifest_loader.error is not error
+        ):
+            st.rerun()
         views.update()
         time.sleep(1)
 
@@ -26,11 +26,11 @@
 
 import typing as t
 
-from smartdashboard.schemas.application import Application
 from smartdashboard.schemas.base import HasName
+from smartdashboard.schemas.table import ApplicationTable, HasEntityTables
 
 
-class Ensemble(HasName):
+class Ensemble(HasName, HasEntityTables):
     params: t.Dict[str, t.Any]
     batch_settings: t.Dict[str, t.Any]
-    models: t.List[Application]
+    models: ApplicationTable
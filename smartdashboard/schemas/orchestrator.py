@@ -29,13 +29,13 @@ import typing as t
 from pydantic import validator
 
 from smartdashboard.schemas.base import HasName
-from smartdashboard.schemas.shard import Shard
+from smartdashboard.schemas.table import HasEntityTables, ShardTable
 
 
-class Orchestrator(HasName):
+class Orchestrator(HasName, HasEntityTables):
     type: str
     interface: t.List[str] = []
-    shards: t.List[Shard] = []
+    shards: ShardTable = ShardTable()
 
     @validator("interface", pre=True)
     @classmethod
@@ -47,8 +47,8 @@ class Orchestrator(HasName):
 
     @property
     def ports(self) -> t.Sequence[int]:
-        return tuple({shard.port for shard in self.shards})
+        return tuple(set(self.shards.column("port")))
 
     @property
     def db_hosts(self) -> t.Sequence[str]:
-        return tuple(sorted({shard.hostname for shard in self.shards}))
+        return tuple(sorted(set(self.shards.column("hostname"))))
@@ -0,0 +1,262 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+import typing as t
+from array import array
+
+from pydantic import BaseModel
+
+from smartdashboard.schemas.application import Application
+from smartdashboard.schemas.shard import Shard
+
+_M = t.TypeVar("_M", bound=BaseModel)
+
+
+def _freeze(value: t.Any) -> t.Hashable:
+    """Build a hashable key that identifies a validated field value
+
+    :param value: Validated field value
+    :type value: Any
+    :return: Hashable representation of the value
+    :rtype: Hashable
+    """
+    if isinstance(value, BaseModel):
+        return (type(value), _freeze(value.dict()))
+    if isinstance(value, dict):
+        return tuple((key, _freeze(val)) for key, val in sorted(value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(val) for val in value))
+    return t.cast(t.Hashable, value)
+
+
+def _intern(value: t.Any) -> t.Any:
+    """Intern every string within a validated field value
+
+    :param value: Validated field value
+    :type value: Any
+    :return: The value with its strings interned
+    :rtype: Any
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {_intern(key): _intern(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_intern(val) for val in value]
+    return value
+
+
+class EntityTable(t.Sequence[_M]):
+    """Columnar, read-only collection of homogeneous entities
+
+    Large ensembles and orchestrators hold many entities that only differ by
+    a handful of fields. Rather than keeping one model instance per entity,
+    string fields are stored as columns of interned strings and every other
+    field is stored as an index into a pool of unique values, so members that
+    share settings dicts share a single copy of them.
+
+    Entities are only materialized when they are accessed. Materialized
+    entities share their pooled values with the table and must be treated as
+    read-only.
+    """
+
+    model: t.ClassVar[t.Type[BaseModel]]
+
+    __slots__ = ("_length", "_strings", "_indices", "_pools")
+
+    def __init__(self, entities: t.Iterable[t.Any] = ()) -> None:
+        """Initialize an EntityTable
+
+        :param entities: Entities or raw entity dicts to store
+        :type entities: Iterable[Any]
+        """
+        fields = self.model.__fields__
+        string_fields = [
+            name for name, field in fields.items() if field.outer_type_ is str
+        ]
+
+        self._length = 0
+        self._strings: t.Dict[str, t.List[t.Optional[str]]] = {
+            name: [] for name in string_fields
+        }
+        self._indices: t.Dict[str, "array[int]"] = {
+            name: array("I") for name in fields if name not in self._strings
+        }
+        self._pools: t.Dict[str, t.List[t.Any]] = {name: [] for name in self._indices}
+
+        lookups: t.Dict[str, t.Dict[t.Hashable, int]] = {
+            name: {} for name in self._indices
+        }
+        for entity in entities:
+            if not isinstance(entity, self.model):
+                entity = self.model.parse_obj(entity)
+
+            for name, column in self._strings.items():
+                value = getattr(entity, name)
+                column.append(sys.intern(value) if value is not None else None)
+
+            for name, indices in self._indices.items():
+                value = getattr(entity, name)
+                key = _freeze(value)
+                index = lookups[name].get(key)
+                if index is None:
+                    index = lookups[name][key] = len(self._pools[name])
+                    self._pools[name].append(_intern(value))
+                indices.append(index)
+
+            self._length += 1
+
+    @classmethod
+    def __get_validators__(
+        cls,
+    ) -> t.Iterator[t.Callable[[t.Any], "EntityTable[_M]"]]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: t.Any) -> "EntityTable[_M]":
+        """Validate a manifest value into an EntityTable
+
+        :param value: Existing table or sequence of entities
+        :type value: Any
+        :return: EntityTable holding the entities
+        :rtype: EntityTable
+        :raises TypeError: If the value is not a sequence of entities
+        """
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, (list, tuple)):
+            raise TypeError("value is not a valid list")
+        return cls(value)
+
+    def column(self, name: str) -> t.Sequence[t.Any]:
+        """Get the values of one field for every entity without
+        materializing the entities
+
+        :param name: Name of the field
+        :type name: str
+        :return: Value of the field for each entity
+        :rtype: Sequence[Any]
+        """
+        if name in self._strings:
+            return self._strings[name]
+
+        pool = self._pools[name]
+        return [pool[index] for index in self._indices[name]]
+
+    @property
+    def names(self) -> t.Sequence[str]:
+        """Get the names of every entity
+
+        :return: Entity names
+        :rtype: Sequence[str]
+        """
+        return t.cast(t.Sequence[str], self.column("name"))
+
+    def _materialize(self, index: int) -> _M:
+        values: t.Dict[str, t.Any] = {
+            name: column[index] for name, column in self._strings.items()
+        }
+        values.update(
+            (name, self._pools[name][indices[index]])
+            for name, indices in self._indices.items()
+        )
+        return t.cast(_M, self.model.construct(**values))
+
+    @t.overload
+    def __getitem__(self, index: int) -> _M: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.List[_M]: ...
+
+    def __getitem__(self, index: t.Union[int, slice]) -> t.Union[_M, t.List[_M]]:
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._materialize(index)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, t.Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other)
+        )
+
+    # tables compare by value but are mutable-looking sequences
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> "EntityTable[_M]":
+        return self
+
+    def __deepcopy__(self, memo: t.Dict[int, t.Any]) -> "EntityTable[_M]":
+        return self
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={self._length})"
+
+
+_SERIALIZE_FLAGS = ("by_alias", "exclude_unset", "exclude_defaults", "exclude_none")
+
+
+class HasEntityTables(BaseModel):
+    """Model with entity table fields, which serialize as lists of entities"""
+
+    class Config:
+        json_encoders = {EntityTable: lambda table: [entity.dict() for entity in table]}
+
+    def dict(self, **kwargs: t.Any) -> t.Dict[str, t.Any]:
+        """Generate a dictionary representation of the model, with each
+        entity table as a list of entity dictionaries
+
+        :return: Dictionary representation of the model
+        :rtype: Dict[str, Any]
+        """
+        data = super().dict(**kwargs)
+        flags = {flag: kwargs[flag] for flag in _SERIALIZE_FLAGS if flag in kwargs}
+        for name, value in data.items():
+            if isinstance(value, EntityTable):
+                data[name] = [entity.dict(**flags) for entity in value]
+        return data
+
+
+class ApplicationTable(EntityTable[Application]):
+    """Compact table of ensemble members"""
+
+    model = Application
+    __slots__ = ()
+
+
+class ShardTable(EntityTable[Shard]):
+    """Compact table of orchestrator shards"""
+
+    model = Shard
+    __slots__ = ()
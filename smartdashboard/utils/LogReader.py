@@ -24,7 +24,102 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import collections
+import io
+import threading
+import time
+import typing as t
 
+from smartdashboard.utils.storage import get_storage
+from smartdashboard.utils.timing import add_io, timed_function
+
+LOG_CACHE_CHARS = 64 * 1024**2
+"""Budget of the log cache, in characters of cached text"""
+
+TAIL_BLOCK = 64 * 1024
+"""Bytes read from the end of a log before reading further back"""
+
+SETTLE_SECONDS = 2.0
+"""Logs modified more recently than this are read without caching, so
+appends within the file system's timestamp resolution are not missed"""
+
+
+class LogCache:
+    """Least recently used cache of log contents within a byte budget
+
+    Cached logs are revalidated against the modification time of the
+    log file, which is cheaper than reading the file again.
+    """
+
+    def __init__(self, max_chars: int = LOG_CACHE_CHARS) -> None:
+        """Initialize a LogCache
+
+        :param max_chars: Budget of the cache in characters of cached text
+        :type max_chars: int
+        """
+        self.max_chars = max_chars
+        self.size = 0
+        self._lock = threading.Lock()
+        self._logs: (
+            "collections.OrderedDict[t.Tuple[object, str], t.Tuple[float, str]]"
+        ) = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._logs)
+
+    def read(self, file: str) -> str:
+        """Read a log file through the cache
+
+        :param file: Log file path
+        :type file: str
+        :return: Contents of the log file
+        :rtype: str
+        :raises FileNotFoundError: If the log file does not exist
+        """
+        storage = get_storage()
+        key = (storage, file)
+        modified = storage.getmtime(file)
+        with self._lock:
+            cached = self._logs.get(key)
+            if cached is not None and cached[0] == modified:
+                self._logs.move_to_end(key)
+                add_io()
+                return cached[1]
+
+        with io.TextIOWrapper(storage.open_binary(file), encoding="utf-8") as log_file:
+            logs = log_file.read()
+        add_io(len(logs), 2)
+
+        if time.time() - modified >= SETTLE_SECONDS:
+            self._store(key, modified, logs)
+        return logs
+
+    def _store(self, key: t.Tuple[object, str], modified: float, logs: str) -> None:
+        size = len(logs)
+        if size > self.max_chars:
+            return
+
+        with self._lock:
+            previous = self._logs.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[1])
+            self._logs[key] = (modified, logs)
+            self.size += size
+            while self.size > self.max_chars:
+                _, (_, evicted) = self._logs.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self) -> None:
+        """Remove every cached log"""
+        with self._lock:
+            self._logs.clear()
+            self.size = 0
+
+
+_log_cache = LogCache()
+
+
+@timed_function()
 def get_logs(file: str) -> str:
     """Get the logs of an entity
 
@@ -34,7 +129,50 @@ def get_logs(file: str) -> str:
     :rtype: str
     """
     try:
-        with open(file, "r", encoding="utf-8") as log_file:
-            return log_file.read()
+        return _log_cache.read(file)
     except FileNotFoundError:
         return ""
+
+
+def _read_tail(log_file: t.BinaryIO, lines: int, block_size: int) -> bytes:
+    end = log_file.seek(0, io.SEEK_END)
+    data = b""
+    # one more line break than lines guarantees the first kept line
+    # starts within the data
+    while end > 0 and data.count(b"\n") <= lines:
+        start = max(0, end - block_size)
+        log_file.seek(start)
+        data = log_file.read(end - start) + data
+        end = start
+        block_size *= 2
+    return data
+
+
+@timed_function()
+def get_log_tail(file: str, lines: int, block_size: int = TAIL_BLOCK) -> t.List[str]:
+    """Get the last lines of the logs of an entity
+
+    The file is read backward from its end, in blocks that double in size,
+    until it holds the requested lines, so tailing a long log costs the size
+    of the tail rather than of the whole log.
+
+    :param file: Log file path of the entity
+    :type file: str
+    :param lines: Number of lines to get
+    :type lines: int
+    :param block_size: Bytes of the first block read from the end
+    :type block_size: int
+    :return: Last lines of the logs, without line breaks
+    :rtype: List[str]
+    """
+    if lines <= 0:
+        return []
+
+    try:
+        with get_storage().open_binary(file) as log_file:
+            data = _read_tail(log_file, lines, block_size)
+    except FileNotFoundError:
+        return []
+    add_io(len(data), 2)
+
+    return [line.decode("utf-8", "replace") for line in data.splitlines()[-lines:]]
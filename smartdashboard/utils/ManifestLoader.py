@@ -0,0 +1,149 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import pathlib
+import threading
+import typing as t
+from dataclasses import dataclass
+
+from smartdashboard.utils.errors import ManifestError, SSDashboardError
+from smartdashboard.utils.ManifestReader import Manifest, create_filereader
+from smartdashboard.utils.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ManifestSnapshot:
+    """Data class representing a successfully loaded manifest
+
+    :param manifest: Parsed and validated manifest
+    :type manifest: Manifest
+    :param version: Number of reloads that preceded this snapshot
+    :type version: int
+    """
+
+    manifest: Manifest
+    version: int
+
+
+class ManifestLoader:
+    """Loads manifest changes on a background thread
+
+    The manifest is parsed and validated off the render path. Each successful
+    load is published by replacing the current snapshot reference, so readers
+    always see a complete manifest. When a reload fails, the last good
+    snapshot stays published and the error is kept until the next change.
+    """
+
+    def __init__(self, file_path: pathlib.Path, interval: float = 1.0) -> None:
+        """Initialize a ManifestLoader
+
+        The initial load happens synchronously so that errors in the
+        manifest are raised to the caller.
+
+        :param file_path: Path to the manifest file
+        :type file_path: pathlib.Path
+        :param interval: Seconds between checks for manifest changes
+        :type interval: float
+        """
+        self._file_path = file_path
+        self._interval = interval
+        reader = create_filereader(file_path)
+        self._last_modified = reader.last_modified
+        self._snapshot = ManifestSnapshot(reader.get_manifest(), version=0)
+        self.error: t.Optional[SSDashboardError] = None
+        self._stop_event = threading.Event()
+        self._thread: t.Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> ManifestSnapshot:
+        """Get the most recent successfully loaded manifest
+
+        :return: Latest manifest snapshot
+        :rtype: ManifestSnapshot
+        """
+        return self._snapshot
+
+    def poll(self) -> bool:
+        """Reload the manifest if the file has been modified
+
+        :return: If a new snapshot was published
+        :rtype: bool
+        """
+        try:
+            last_modified = get_storage().getmtime(str(self._file_path))
+        except OSError:
+            return False
+
+        if last_modified == self._last_modified:
+            return False
+
+        try:
+            reader = create_filereader(self._file_path)
+            manifest = reader.get_manifest()
+        except SSDashboardError as ex:
+            self._last_modified = last_modified
+            self.error = ex
+            return False
+
+        self._last_modified = reader.last_modified
+
+        self.error = None
+        self._snapshot = ManifestSnapshot(manifest, self._snapshot.version + 1)
+        return True
+
+    def start(self) -> None:
+        """Start polling for manifest changes on a daemon thread"""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._run, name="smartdashboard-manifest-loader", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling for manifest changes"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            # the loader is shared by every session, so an unexpected error
+            # must not end the thread
+            try:
+                self.poll()
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                logger.exception("Reloading the manifest failed")
+                self.error = ManifestError(
+                    title="Manifest file could not be reloaded.",
+                    file=str(self._file_path),
+                    exception=ex,
+                )
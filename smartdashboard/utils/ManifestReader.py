@@ -24,28 +24,78 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import io
+import contextlib
+import gzip
 import itertools
-import json
-import os
 import pathlib
 import typing as t
+import zlib
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 from pydantic import ValidationError
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
 from smartdashboard.schemas.application import Application
 from smartdashboard.schemas.ensemble import Ensemble
 from smartdashboard.schemas.experiment import Experiment
 from smartdashboard.schemas.orchestrator import Orchestrator
 from smartdashboard.schemas.run import Run, RunContext
+from smartdashboard.utils import codec
 from smartdashboard.utils.errors import (
     MalformedManifestError,
     ManifestError,
     VersionIncompatibilityError,
 )
+from smartdashboard.utils.storage import get_storage
+from smartdashboard.utils.timing import add_io, timed_function
+
+# Uncompressed manifests take precedence over compressed ones
+MANIFEST_FILE_NAMES = ("manifest.json", "manifest.json.gz", "manifest.json.zst")
+
+_DECOMPRESSION_ERRORS: t.Tuple[t.Type[Exception], ...] = (
+    EOFError,
+    gzip.BadGzipFile,
+    zlib.error,
+) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+
+@contextlib.contextmanager
+def open_manifest(file_path: pathlib.Path) -> t.Iterator[t.IO[bytes]]:
+    """Open a manifest file as a binary stream
+
+    Manifests compressed with gzip (.gz) or zstandard (.zst) are
+    decompressed as the stream is read, without an intermediate file.
+
+    :param file_path: Path to the manifest file
+    :type file_path: pathlib.Path
+    :return: Binary stream of the uncompressed manifest
+    :rtype: Iterator[IO[bytes]]
+    """
+    suffix = pathlib.Path(file_path).suffix
+    if suffix == ".zst" and zstandard is None:
+        raise ManifestError(
+            title="Manifest file is compressed with zstandard.",
+            file=str(file_path),
+            exception=ImportError(
+                "Install the zstandard package to read .zst manifests."
+            ),
+        )
+
+    with get_storage().open_binary(str(file_path)) as file:
+        if suffix == ".gz":
+            with gzip.GzipFile(fileobj=file, mode="rb") as stream:
+                yield t.cast(t.IO[bytes], stream)
+        elif suffix == ".zst":
+            with zstandard.ZstdDecompressor().stream_reader(file) as stream:
+                yield t.cast(t.IO[bytes], stream)
+        else:
+            yield file
 
 
 @dataclass
@@ -56,10 +106,14 @@ class Manifest:
     :type experiment: Experiment
     :param runs: Runs of an experiment
     :type runs: List[Run]
+    :param version: Identifies the manifest file and its modification
+                    time, empty if the manifest was not read from a file
+    :type version: str
     """
 
     experiment: Experiment
     runs: List[Run]
+    version: str = field(default="", compare=False)
 
     @property
     def apps_with_run_ctx(self) -> t.Iterable[RunContext[Application]]:
@@ -92,7 +146,7 @@ class ManifestFileReader(ManifestReader):
         :type file_path: pathlib.Path
         """
         self._file_path = file_path
-        self._last_modified = os.path.getmtime(self._file_path)
+        self._last_modified = get_storage().getmtime(str(self._file_path))
         self._data = self.from_file(self._file_path)
 
         try:
@@ -113,6 +167,15 @@ class ManifestFileReader(ManifestReader):
                 exception=version_exception,
             )
 
+    @property
+    def last_modified(self) -> float:
+        """Get the modification time of the manifest file when it was read
+
+        :return: Modification time of the file
+        :rtype: float
+        """
+        return self._last_modified
+
     @property
     def has_changed(self) -> bool:
         """Check if the manifest file has been modified
@@ -120,8 +183,9 @@ class ManifestFileReader(ManifestReader):
         :return: If the file has been modified
         :rtype: bool
         """
-        return self._last_modified != os.path.getmtime(self._file_path)
+        return self._last_modified != get_storage().getmtime(str(self._file_path))
 
+    @timed_function("ManifestFileReader.get_manifest")
     def get_manifest(self) -> Manifest:
         """Get the Manifest from self._data
 
@@ -137,6 +201,7 @@ class ManifestFileReader(ManifestReader):
             return Manifest(
                 experiment=experiment,
                 runs=runs,
+                version=f"{self._file_path}@{self._last_modified}",
             )
         except ValidationError as val:
             raise MalformedManifestError(
@@ -146,6 +211,7 @@ class ManifestFileReader(ManifestReader):
             ) from val
 
     @classmethod
+    @timed_function("ManifestFileReader.from_file")
     def from_file(cls, file_path: pathlib.Path) -> Dict[str, Any]:
         """Initialize self._data
 
@@ -154,19 +220,26 @@ class ManifestFileReader(ManifestReader):
         :return: self._data
         :rtype: Dict[str, Any]
         """
-        with open(file_path, encoding="utf-8") as file:
-            return cls.from_io_stream(file)
+        with open_manifest(file_path) as file:
+            data = cls.from_io_stream(file)
+            add_io(file.tell())
+        return data
 
     @classmethod
-    def from_io_stream(cls, stream: io.TextIOBase) -> Dict[str, Any]:
+    def from_io_stream(cls, stream: t.IO[t.Any]) -> Dict[str, Any]:
         """Continue initializing self._data
 
-        :param stream: io.TextIOBase to be decoded
-        :type stream: io.TextIOBase
+        Binary streams are decoded without an intermediate text decode.
+
+        :param stream: Binary or text stream to be decoded
+        :type stream: IO[Any]
         :return: self._data
         :rtype: Dict[str, Any]
         """
-        data: Dict[str, Any] = json.loads(stream.read())
+        # the manifest is the only document large enough to be worth pausing
+        # the garbage collector for
+        with codec.gc_paused():
+            data: Dict[str, Any] = codec.load(stream)
         return data
 
 
@@ -188,10 +261,16 @@ def create_filereader(path: pathlib.Path) -> ManifestFileReader:
         raise ManifestError(
             title="Manifest file does not exist.", file=str(path), exception=fnf
         ) from fnf
-    except json.decoder.JSONDecodeError as jde:
+    except codec.JSONDecodeError as jde:
         raise ManifestError(
             title="Manifest file could not be decoded.", file=str(path), exception=jde
         ) from jde
+    except _DECOMPRESSION_ERRORS as dce:
+        raise ManifestError(
+            title="Manifest file could not be decompressed.",
+            file=str(path),
+            exception=dce,
+        ) from dce
     return manifest_file_reader
 
 
@@ -199,6 +278,9 @@ def get_manifest_path(directory: t.Optional[pathlib.Path]) -> pathlib.Path:
     """Get the manifest path using the directory
     path passed in from the command line arguments.
 
+    Compressed manifests are used when the experiment has no
+    uncompressed manifest.
+
     :param directory: An experiment directory
     :type directory: t.Optional[pathlib.Path]
     :return: Manifest path
@@ -206,7 +288,13 @@ def get_manifest_path(directory: t.Optional[pathlib.Path]) -> pathlib.Path:
     """
 
     if directory is not None:
-        manifest_path = directory / ".smartsim/telemetry/manifest.json"
+        telemetry_dir = directory / ".smartsim/telemetry"
     else:
-        manifest_path = pathlib.Path() / ".smartsim/telemetry/manifest.json"
-    return manifest_path.resolve()
+        telemetry_dir = pathlib.Path() / ".smartsim/telemetry"
+
+    for file_name in MANIFEST_FILE_NAMES:
+        manifest_path = telemetry_dir / file_name
+        if get_storage().exists(str(manifest_path)):
+            return manifest_path.resolve()
+
+    return (telemetry_dir / MANIFEST_FILE_NAMES[0]).resolve()
@@ -24,19 +24,26 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import itertools
-import json
 import os
+import threading
+import time
 import typing as t
 from dataclasses import dataclass
 
+import numpy as np
+
 from smartdashboard.schemas.application import Application
 from smartdashboard.schemas.ensemble import Ensemble
 from smartdashboard.schemas.orchestrator import Orchestrator
 from smartdashboard.schemas.run import Run
 from smartdashboard.schemas.shard import Shard
+from smartdashboard.schemas.table import EntityTable
 
+from . import codec
+from .cache import LRUCache, SourceCache
 from .status import GREEN_COMPLETED, GREEN_RUNNING, RED_FAILED, RED_UNSTABLE, StatusEnum
+from .storage import get_storage
+from .timing import add_io, timed, timed_function
 
 
 @dataclass(frozen=True)
@@ -53,6 +60,19 @@ class StatusData:
     return_code: t.Optional[int]
 
 
+ENTITY_STATUSES: t.Tuple[StatusEnum, ...] = (
+    StatusEnum.RUNNING,
+    StatusEnum.COMPLETED,
+    StatusEnum.FAILED,
+    StatusEnum.UNKNOWN,
+    StatusEnum.MALFORMED,
+)
+"""Statuses an application, ensemble member or shard can have, in the
+order used by status_mapping"""
+
+_finished_statuses: LRUCache[StatusData] = LRUCache(maxsize=100_000)
+
+
 def get_status(dir_path: str) -> StatusData:
     """Get the status of an application or shard
 
@@ -66,15 +86,23 @@ def get_status(dir_path: str) -> StatusData:
     :return: Status enum and return code
     :rtype: StatusData
     """
+    storage = get_storage()
+    finished = _finished_statuses.lookup((storage, dir_path))
+    if finished is not None:
+        return finished
+
     start_json_path = os.path.join(dir_path, "start.json")
     stop_json_path = os.path.join(dir_path, "stop.json")
 
-    if os.path.exists(start_json_path):
-        if os.path.exists(stop_json_path):
+    add_io()
+    if storage.exists(start_json_path):
+        add_io()
+        if storage.exists(stop_json_path):
             try:
-                with open(stop_json_path, "r", encoding="utf-8") as stop_json_file:
-                    stop_data = json.load(stop_json_file)
-            except json.JSONDecodeError:
+                stop_bytes = storage.read_bytes(stop_json_path)
+                add_io(len(stop_bytes))
+                stop_data = codec.loads(stop_bytes)
+            except codec.JSONDecodeError:
                 return StatusData(StatusEnum.MALFORMED, None)
 
             try:
@@ -85,8 +113,10 @@ def get_status(dir_path: str) -> StatusData:
                 )
 
             except KeyError:
-                status = StatusData(StatusEnum.MALFORMED, None)
+                return StatusData(StatusEnum.MALFORMED, None)
 
+            # completed and failed entities do not change status again
+            _finished_statuses.store((storage, dir_path), status)
             return status
 
         return StatusData(StatusEnum.RUNNING, None)
@@ -94,6 +124,22 @@ def get_status(dir_path: str) -> StatusData:
     return StatusData(StatusEnum.UNKNOWN, None)
 
 
+def get_entity_status(entity: t.Union[Application, Shard]) -> StatusData:
+    """Get the status of an application, ensemble member or shard
+
+    :param entity: Entity to get the status of
+    :type entity: Union[Application, Shard]
+    :return: Status enum and return code, MALFORMED if the
+             entity does not record a status directory
+    :rtype: StatusData
+    """
+    try:
+        return get_status(entity.telemetry_metadata["status_dir"])
+    except KeyError:
+        return StatusData(StatusEnum.MALFORMED, None)
+
+
+@timed_function()
 def get_ensemble_status_summary(ensemble: t.Optional[Ensemble]) -> str:
     """Get the status summary of an ensemble
 
@@ -108,19 +154,26 @@ def get_ensemble_status_summary(ensemble: t.Optional[Ensemble]) -> str:
     status_str = "Status: "
 
     if ensemble:
-        status_counts = status_mapping(ensemble.models)
+        return format_status_counts(status_mapping(ensemble.models))
 
-        formatted_counts = [
-            f"{count} {status.value}" for status, count in status_counts.items()
-        ]
+    return status_str
 
-        status_description = f"{status_str}{', '.join(formatted_counts)}"
 
-        return status_description
+def format_status_counts(status_counts: t.Dict[StatusEnum, int]) -> str:
+    """Format a status map as a status summary
 
-    return status_str
+    :param status_counts: Number of entities with each status
+    :type status_counts: Dict[StatusEnum, int]
+    :return: Status summary
+    :rtype: str
+    """
+    formatted_counts = [
+        f"{count} {status.value}" for status, count in status_counts.items()
+    ]
+    return f"Status: {', '.join(formatted_counts)}"
 
 
+@timed_function()
 def get_orchestrator_status_summary(orchestrator: t.Optional[Orchestrator]) -> str:
     """Get the status summary of an orchestrator
 
@@ -136,17 +189,18 @@ def get_orchestrator_status_summary(orchestrator: t.Optional[Orchestrator]) -> s
 
     if orchestrator:
         status_counts = status_mapping(orchestrator.shards)
+        status = get_orchestrator_status(status_counts)
 
-        if status_counts[StatusEnum.COMPLETED] == sum(status_counts.values()):
+        if status == StatusEnum.INACTIVE:
             return f"{status_str}{StatusEnum.INACTIVE.value} (all shards completed)"
 
-        if status_counts[StatusEnum.UNKNOWN] == sum(status_counts.values()):
+        if status == StatusEnum.UNKNOWN:
             return f"{status_str}{StatusEnum.UNKNOWN.value}"
 
-        if status_counts[StatusEnum.MALFORMED] > 0:
+        if status == StatusEnum.MALFORMED:
             return f"{status_str}{StatusEnum.MALFORMED.value} status found."
 
-        if status_counts[StatusEnum.FAILED] > 0:
+        if status == StatusEnum.UNSTABLE:
             return (
                 f"{status_str}{RED_UNSTABLE} "
                 f"({status_counts[StatusEnum.FAILED]} shard(s) failed)"
@@ -157,6 +211,88 @@ def get_orchestrator_status_summary(orchestrator: t.Optional[Orchestrator]) -> s
     return status_str
 
 
+def get_orchestrator_status(status_counts: t.Dict[StatusEnum, int]) -> StatusEnum:
+    """Get the overall status of an orchestrator from the statuses of its shards
+
+    :param status_counts: Number of shards with each status
+    :type status_counts: Dict[StatusEnum, int]
+    :return: INACTIVE if every shard completed, UNKNOWN if no shard
+             status is known, MALFORMED if any shard status is malformed,
+             UNSTABLE if any shard failed and RUNNING otherwise
+    :rtype: StatusEnum
+    """
+    total = sum(status_counts.values())
+
+    if status_counts[StatusEnum.COMPLETED] == total:
+        return StatusEnum.INACTIVE
+    if status_counts[StatusEnum.UNKNOWN] == total:
+        return StatusEnum.UNKNOWN
+    if status_counts[StatusEnum.MALFORMED] > 0:
+        return StatusEnum.MALFORMED
+    if status_counts[StatusEnum.FAILED] > 0:
+        return StatusEnum.UNSTABLE
+    return StatusEnum.RUNNING
+
+
+def get_experiment_status(runs: t.Sequence[Run]) -> StatusEnum:
+    """Get the overall status of an experiment from the statuses of its
+    applications, ensemble members and shards
+
+    Applications are checked first, then ensemble members and then shards.
+    The first entity that does not record a status directory makes the
+    experiment MALFORMED and the first running entity makes it RUNNING.
+
+    :param runs: Runs of an experiment
+    :type runs: Sequence[Run]
+    :return: MALFORMED or RUNNING as described above, UNKNOWN if no entity
+             status is known and INACTIVE otherwise
+    :rtype: StatusEnum
+    """
+    running = STATUS_CODES.index(StatusEnum.RUNNING)
+    unknown = STATUS_CODES.index(StatusEnum.UNKNOWN)
+    unknown_counter = total = 0
+
+    for entities in _experiment_groups(runs):
+        # ensemble and orchestrator tables are read by column, so their
+        # entities are not materialized
+        scanner = get_status_scanner(entities)
+        scanner.scan()
+        found = np.flatnonzero(scanner.unrecorded | (scanner.codes == running))
+        if found.size > 0:
+            if scanner.unrecorded[found[0]]:
+                return StatusEnum.MALFORMED
+            return StatusEnum.RUNNING
+
+        unknown_counter += int(np.count_nonzero(scanner.codes == unknown))
+        total += len(scanner)
+
+    # if every single entity status is UNKNOWN, it's likely that experiment
+    # telemetry was disabled
+    if unknown_counter == total:
+        return StatusEnum.UNKNOWN
+    return StatusEnum.INACTIVE
+
+
+def get_experiment_status_counts(
+    group_counts: t.Iterable[t.Dict[StatusEnum, int]],
+) -> t.Dict[StatusEnum, int]:
+    """Tally the statuses of every entity of an experiment
+
+    :param group_counts: Status map of each group of entities, such as
+                         the applications of a run or the shards of
+                         an orchestrator
+    :type group_counts: Iterable[Dict[StatusEnum, int]]
+    :return: The status map, in the order used by status_mapping
+    :rtype: Dict[StatusEnum, int]
+    """
+    totals = dict.fromkeys(ENTITY_STATUSES, 0)
+    for counts in group_counts:
+        for status, count in counts.items():
+            totals[status] += count
+    return totals
+
+
+@timed_function()
 def get_experiment_status_summary(runs: t.Optional[t.List[Run]]) -> str:
     """Get the status summary of an experiment
 
@@ -171,33 +307,17 @@ def get_experiment_status_summary(runs: t.Optional[t.List[Run]]) -> str:
     status_str = "Status: "
 
     if runs:
-        apps = [app for run in runs for app in run.model]
-        ensembles = [ensemble for run in runs for ensemble in run.ensemble]
-        ens_members = [member for ensemble in ensembles for member in ensemble.models]
-        orcs = [orch for run in runs for orch in run.orchestrator]
-        shards = [shard for orc in orcs for shard in orc.shards]
-
-        unknown_counter = 0
-        for entity in itertools.chain(apps, ens_members, shards):
-            try:
-                entity_status = get_status(entity.telemetry_metadata["status_dir"])
-            except KeyError:
-                return f"{status_str}{StatusEnum.MALFORMED.value} status found."
+        status = get_experiment_status(runs)
 
-            if entity_status == StatusData(StatusEnum.RUNNING, None):
-                return f"{status_str}{GREEN_RUNNING}"
-
-            if entity_status == StatusData(StatusEnum.UNKNOWN, None):
-                unknown_counter += 1
-
-        # if every single entity status is UNKNOWN, it's likely that experiment
-        # telemetry was disabled
-        if unknown_counter == len(list(itertools.chain(apps, ens_members, shards))):
+        if status == StatusEnum.RUNNING:
+            return f"{status_str}{GREEN_RUNNING}"
+        if status == StatusEnum.MALFORMED:
+            return f"{status_str}{StatusEnum.MALFORMED.value} status found."
+        if status == StatusEnum.UNKNOWN:
             return (
                 f"{status_str}{StatusEnum.UNKNOWN.value}. "
                 + "Experiment telemetry may have been disabled."
             )
-
         return f"{status_str}{StatusEnum.INACTIVE.value}"
 
     return status_str
@@ -226,12 +346,12 @@ def format_status(status: StatusData) -> str:
 
 
 def status_mapping(
-    entities: t.Union[t.List[Application], t.List[Shard]]
+    entities: t.Union[t.Sequence[Application], t.Sequence[Shard]],
 ) -> t.Dict[StatusEnum, int]:
     """Map statuses for formatting
 
-    :param entities: List of entities to map
-    :type entities: Union[List[Application], List[Shard]]
+    :param entities: Sequence of entities to map
+    :type entities: Union[Sequence[Application], Sequence[Shard]]
     :return: The status map
     :rtype: Dict[StatusEnum, int]
     """
@@ -244,11 +364,161 @@ def status_mapping(
     }
 
     for e in entities:
-        try:
-            entity_status = get_status(e.telemetry_metadata["status_dir"])
-        except KeyError:
-            entity_status = StatusData(StatusEnum.MALFORMED, None)
-
-        status_counts[entity_status.status] += 1
+        status_counts[get_entity_status(e).status] += 1
 
     return status_counts
+
+
+def get_status_dirs(
+    entities: t.Union[t.Sequence[Application], t.Sequence[Shard]],
+) -> t.List[t.Optional[str]]:
+    """Get the status directory of each entity
+
+    Ensemble and orchestrator tables are read by column, so their
+    entities are not materialized.
+
+    :param entities: Sequence of entities
+    :type entities: Union[Sequence[Application], Sequence[Shard]]
+    :return: Status directory of each entity, None where the
+             entity does not record one
+    :rtype: List[Optional[str]]
+    """
+    if isinstance(entities, EntityTable):
+        metadata = entities.column("telemetry_metadata")
+    else:
+        metadata = [entity.telemetry_metadata for entity in entities]
+    return [meta.get("status_dir") for meta in metadata]
+
+
+STATUS_CODES: t.Tuple[StatusEnum, ...] = tuple(StatusEnum)
+"""Statuses in the order of their codes in a StatusScanner"""
+
+_TERMINAL_STATUSES = (StatusEnum.COMPLETED, StatusEnum.FAILED)
+
+
+class StatusScanner:
+    """Batched status scanner for the members of an ensemble or
+    the shards of an orchestrator
+
+    Statuses and return codes are kept in columnar arrays, with each
+    status stored as its position in STATUS_CODES. Entities that do not
+    record a status directory are MALFORMED and flagged in unrecorded.
+    Completed and failed entities cannot change status, so they are only
+    read until they reach one of those statuses and later scans skip them.
+    """
+
+    def __init__(
+        self,
+        status_dirs: t.Sequence[t.Optional[str]],
+        min_interval: float = 0.5,
+    ) -> None:
+        """Initialize a StatusScanner
+
+        :param status_dirs: Status directory of each entity, None where
+                            the entity does not record one
+        :type status_dirs: Sequence[Optional[str]]
+        :param min_interval: Seconds within which repeated scans reuse
+                             the statuses of the last scan
+        :type min_interval: float
+        """
+        self.status_dirs = status_dirs
+        self.min_interval = min_interval
+        self.codes = np.full(
+            len(status_dirs), STATUS_CODES.index(StatusEnum.UNKNOWN), dtype=np.uint8
+        )
+        self.return_codes = np.zeros(len(status_dirs), dtype=np.int32)
+        self.unrecorded = np.zeros(len(status_dirs), dtype=bool)
+        self._pending: t.List[int] = []
+        for position, status_dir in enumerate(status_dirs):
+            if status_dir is None:
+                self.codes[position] = STATUS_CODES.index(StatusEnum.MALFORMED)
+                self.unrecorded[position] = True
+            else:
+                self._pending.append(position)
+        self._lock = threading.Lock()
+        self._last_scan: t.Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self.status_dirs)
+
+    def scan(self) -> None:
+        """Read the statuses of every entity that has not finished"""
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._last_scan is not None
+                and now - self._last_scan < self.min_interval
+            ):
+                return
+
+            codes = {status: code for code, status in enumerate(STATUS_CODES)}
+            pending = []
+            with timed("StatusScanner.scan"):
+                for position in self._pending:
+                    status_dir = t.cast(str, self.status_dirs[position])
+                    status = get_status(status_dir)
+                    self.codes[position] = codes[status.status]
+                    self.return_codes[position] = status.return_code or 0
+                    if status.status not in _TERMINAL_STATUSES:
+                        pending.append(position)
+
+            self._pending = pending
+            self._last_scan = time.monotonic()
+
+    def status(self, position: int) -> StatusData:
+        """Get the last scanned status of an entity
+
+        :param position: Position of the entity
+        :type position: int
+        :return: Status enum and return code
+        :rtype: StatusData
+        """
+        status = STATUS_CODES[self.codes[position]]
+        return_code = (
+            int(self.return_codes[position]) if status in _TERMINAL_STATUSES else None
+        )
+        return StatusData(status, return_code)
+
+    def counts(self) -> t.Dict[StatusEnum, int]:
+        """Count the entities with each status
+
+        :return: The status map, in the order used by status_mapping
+        :rtype: Dict[StatusEnum, int]
+        """
+        totals = np.bincount(self.codes, minlength=len(STATUS_CODES))
+        return {
+            status: int(totals[STATUS_CODES.index(status)])
+            for status in ENTITY_STATUSES
+        }
+
+
+_scanners: SourceCache[StatusScanner] = SourceCache()
+
+
+def get_status_scanner(
+    entities: t.Union[t.Sequence[Application], t.Sequence[Shard]],
+) -> StatusScanner:
+    """Get the status scanner shared by every view of a group of entities
+
+    :param entities: Members of an ensemble or shards of an orchestrator
+    :type entities: Union[Sequence[Application], Sequence[Shard]]
+    :return: Status scanner of the entities
+    :rtype: StatusScanner
+    """
+    return _scanners.get(
+        "status", entities, lambda: StatusScanner(get_status_dirs(entities))
+    )
+
+
+def _experiment_groups(
+    runs: t.Sequence[Run],
+) -> t.List[t.Union[t.Sequence[Application], t.Sequence[Shard]]]:
+    groups: t.List[t.Union[t.Sequence[Application], t.Sequence[Shard]]] = [
+        run.model for run in runs
+    ]
+    groups.extend(ensemble.models for run in runs for ensemble in run.ensemble)
+    groups.extend(orc.shards for run in runs for orc in run.orchestrator)
+    # every group is scanned on each update, so evicting a scanner
+    # would read its finished entities again
+    _scanners.reserve(len(groups))
+    return groups
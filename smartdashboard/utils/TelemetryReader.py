@@ -0,0 +1,693 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import io
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from smartdashboard.schemas.shard import Shard
+
+from .storage import get_storage
+from .timing import add_io, timed_function
+
+TELEMETRY_FILES: t.Dict[str, str] = {
+    "memory": "memory_file",
+    "clients": "client_file",
+    "client_count": "client_count_file",
+}
+"""Shard attribute holding the CSV file of each kind of telemetry"""
+
+TELEMETRY_DTYPES: t.Dict[str, t.Dict[str, str]] = {
+    "memory": {
+        "timestamp": "int64",
+        "used_memory": "float32",
+        "used_memory_peak": "float32",
+        "total_system_memory": "float32",
+    },
+    "clients": {"timestamp": "int64", "client_id": "int64", "address": "category"},
+    "client_count": {"timestamp": "int64", "num_clients": "int32"},
+}
+"""Compact dtypes of the columns of each kind of telemetry. Timestamps are
+epoch milliseconds, and memory is in bytes, which float32 holds to within
+a millionth."""
+
+_ARROW_DTYPES = {
+    "int64": "int64[pyarrow]",
+    "int32": "int32[pyarrow]",
+    "float32": "float[pyarrow]",
+    "category": "string[pyarrow]",
+}
+
+SNAPSHOT_BLOCK = 64 * 1024
+"""Bytes read from the end of a telemetry file before reading further back"""
+
+TELEMETRY_BUDGET = 64 * 1024**2
+"""Bytes of telemetry a TelemetryStore keeps before rolling up its oldest rows"""
+
+ROLLUP_MS = 60_000
+"""Initial width of the rollup buckets of a TelemetryStore, in milliseconds"""
+
+
+def get_telemetry_file(shard: Shard, kind: str) -> str:
+    """Get the CSV file holding one kind of telemetry of a shard
+
+    :param shard: Shard that collected the telemetry
+    :type shard: Shard
+    :param kind: Kind of telemetry, one of TELEMETRY_FILES
+    :type kind: str
+    :return: Path to the telemetry file, empty if the shard does not record one
+    :rtype: str
+    :raises KeyError: If the kind of telemetry is unknown
+    """
+    return str(getattr(shard, TELEMETRY_FILES[kind]))
+
+
+def get_telemetry_dtypes(kind: str, arrow: bool = False) -> t.Dict[str, str]:
+    """Get the compact dtypes of one kind of telemetry
+
+    :param kind: Kind of telemetry, one of TELEMETRY_DTYPES
+    :type kind: str
+    :param arrow: Use Arrow-backed dtypes, which requires pyarrow
+    :type arrow: bool
+    :return: Dtype of each column
+    :rtype: Dict[str, str]
+    :raises KeyError: If the kind of telemetry is unknown
+    """
+    dtypes = TELEMETRY_DTYPES[kind]
+    if arrow:
+        return {column: _ARROW_DTYPES[dtype] for column, dtype in dtypes.items()}
+    return dict(dtypes)
+
+
+def _read_csv(
+    file: t.IO[bytes], dtypes: t.Optional[t.Dict[str, str]], **kwargs: t.Any
+) -> pd.DataFrame:
+    """Parse telemetry and convert it to its dtypes, keeping the inferred
+    dtypes of files that do not fit, such as files with missing values
+
+    Converting after parsing allocates less at once than passing the
+    dtypes to the parser, which converts every chunk it parses.
+
+    :param file: Binary stream positioned at the header
+    :type file: IO[bytes]
+    :param dtypes: Dtype of each column, None to infer them
+    :type dtypes: Optional[Dict[str, str]]
+    :return: Telemetry data
+    :rtype: pandas.DataFrame
+    """
+    dframe: pd.DataFrame = pd.read_csv(file, **kwargs)
+    if dtypes is not None:
+        try:
+            return dframe.astype(
+                {column: dtype for column, dtype in dtypes.items() if column in dframe}
+            )
+        except (ValueError, TypeError):
+            pass
+    return dframe
+
+
+@timed_function()
+def read_telemetry(
+    file_path: str, skiprows: int = 0, dtypes: t.Optional[t.Dict[str, str]] = None
+) -> pd.DataFrame:
+    """Read a telemetry CSV file
+
+    :param file_path: Path to the telemetry file
+    :type file_path: str
+    :param skiprows: Number of data rows to skip, the header is always read
+    :type skiprows: int
+    :param dtypes: Dtype of each column, see get_telemetry_dtypes, None to
+                   infer them
+    :type dtypes: Optional[Dict[str, str]]
+    :return: Telemetry data
+    :rtype: pandas.DataFrame
+    :raises FileNotFoundError: If the telemetry file does not exist
+    """
+    with get_storage().open_binary(file_path) as file:
+        dframe = _read_csv(file, dtypes, skiprows=range(1, skiprows))
+        add_io(file.tell())
+    return dframe
+
+
+def _last_block(lines: t.List[bytes], complete: bool) -> t.Optional[int]:
+    """Find the first of the trailing lines that share a timestamp
+
+    :param lines: Lines read from the end of a file, the first of which is
+                  partial unless complete is set
+    :type lines: List[bytes]
+    :param complete: Whether the lines begin right after the header
+    :type complete: bool
+    :return: Index of the first line of the block, None if it may begin
+             before the lines
+    :rtype: Optional[int]
+    """
+    timestamp = lines[-1].split(b",", 1)[0] + b","
+    for index in range(len(lines) - 2, -1 if complete else 0, -1):
+        if not lines[index].startswith(timestamp):
+            return index + 1
+    return 0 if complete else None
+
+
+@timed_function()
+def read_latest_snapshot(
+    file_path: str,
+    dtypes: t.Optional[t.Dict[str, str]] = None,
+    block_size: int = SNAPSHOT_BLOCK,
+) -> pd.DataFrame:
+    """Read the rows of a telemetry CSV file that share its latest timestamp
+
+    Files such as the client file hold a snapshot of many rows per sample.
+    The file is read backward from its end, in blocks that double in size,
+    until the start of the last snapshot is found, so reading it costs the
+    size of the snapshot rather than of the whole file. A trailing line
+    without a newline is still being written and is left out.
+
+    :param file_path: Path to the telemetry file
+    :type file_path: str
+    :param dtypes: Dtype of each column, see get_telemetry_dtypes, None to
+                   infer them
+    :type dtypes: Optional[Dict[str, str]]
+    :param block_size: Bytes of the first block read from the end
+    :type block_size: int
+    :return: Rows of the latest snapshot
+    :rtype: pandas.DataFrame
+    :raises FileNotFoundError: If the telemetry file does not exist
+    """
+    with get_storage().open_binary(file_path) as file:
+        header = file.readline()
+        end = file.seek(0, io.SEEK_END)
+        data = b""
+        snapshot: t.List[bytes] = []
+        while end > len(header):
+            start = max(len(header), end - block_size)
+            file.seek(start)
+            data = file.read(end - start) + data
+            end = start
+            block_size *= 2
+
+            lines = data[: data.rfind(b"\n") + 1].split(b"\n")[:-1]
+            if not lines:
+                continue
+            first = _last_block(lines, complete=end == len(header))
+            if first is not None:
+                snapshot = lines[first:]
+                break
+        add_io(len(header) + len(data))
+
+    body = b"".join(line + b"\n" for line in snapshot)
+    return _read_csv(io.BytesIO(header + body), dtypes)
+
+
+class TelemetryTailer:
+    """Incremental reader of a telemetry CSV file that is being appended to
+
+    Only the bytes written since the previous read are read and parsed. A
+    trailing line without a newline is still being written, so it is left
+    for the next read. When the file shrinks or its header changes, the file
+    was truncated or replaced and it is read again from the start.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        dtypes: t.Optional[t.Dict[str, str]] = None,
+        columns: t.Optional[t.Sequence[str]] = None,
+    ) -> None:
+        """Initialize a TelemetryTailer
+
+        :param file_path: Path to the telemetry file
+        :type file_path: str
+        :param dtypes: Dtype of each column, see get_telemetry_dtypes, None to
+                       infer them. Categorical columns are not shared between
+                       reads, so they are best avoided when tailing.
+        :type dtypes: Optional[Dict[str, str]]
+        :param columns: Columns to parse, None to parse every column
+        :type columns: Optional[Sequence[str]]
+        """
+        self.file_path = file_path
+        self.dtypes = dtypes
+        self.columns = list(columns) if columns is not None else None
+        self.offset = 0
+        self.header = b""
+        self.truncated = False
+        self._names: t.List[str] = []
+
+    @timed_function("TelemetryTailer.read")
+    def read(self) -> pd.DataFrame:
+        """Read the rows appended since the previous read
+
+        Rows are parsed straight from the file, so the new bytes are not
+        copied before they are parsed.
+
+        :return: New telemetry rows, all rows when the file was truncated
+        :rtype: pandas.DataFrame
+        :raises FileNotFoundError: If the telemetry file does not exist
+        """
+        with get_storage().open_binary(self.file_path) as file:
+            size = file.seek(0, io.SEEK_END)
+            self.truncated = False
+            if self.header:
+                file.seek(0)
+                if size < self.offset or file.read(len(self.header)) != self.header:
+                    self.offset = 0
+                    self.header = b""
+                    self.truncated = True
+
+            if not self.header and not self._read_header(file):
+                return pd.DataFrame()
+
+            end = _last_line_end(file, self.offset, size)
+            count = end - self.offset
+            file.seek(self.offset)
+            dframe = _read_csv(
+                io.BufferedReader(_BoundedReader(file, count)),
+                self.dtypes,
+                header=None,
+                names=self._names,
+                usecols=self.columns,
+            )
+        add_io(count)
+
+        self.offset = end
+        return dframe
+
+    def skip(self) -> bool:
+        """Skip the rows written so far, so the next read only returns the
+        rows appended after them
+
+        :return: False if the header is still being written, in which case
+                 nothing is skipped
+        :rtype: bool
+        :raises FileNotFoundError: If the telemetry file does not exist
+        """
+        with get_storage().open_binary(self.file_path) as file:
+            size = file.seek(0, io.SEEK_END)
+            self.truncated = False
+            if not self._read_header(file):
+                return False
+            self.offset = _last_line_end(file, self.offset, size)
+        return True
+
+    def _read_header(self, file: t.BinaryIO) -> bool:
+        file.seek(0)
+        header = file.readline()
+        add_io(len(header))
+        if not header.endswith(b"\n"):
+            return False
+        self.header = header
+        self.offset = len(header)
+        self._names = list(pd.read_csv(io.BytesIO(header), nrows=0).columns)
+        return True
+
+
+class _BoundedReader(io.RawIOBase):
+    """Read-only window over the next bytes of a binary stream"""
+
+    def __init__(self, file: t.BinaryIO, size: int) -> None:
+        super().__init__()
+        self._file = file
+        self._remaining = size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: t.Any) -> int:
+        count = min(len(buffer), self._remaining)
+        if count <= 0:
+            return 0
+        data = self._file.read(count)
+        buffer[: len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+
+def _last_line_end(
+    file: t.BinaryIO, start: int, end: int, block_size: int = SNAPSHOT_BLOCK
+) -> int:
+    """Find the end of the last complete line of a range of a file
+
+    :param file: Binary stream of the file
+    :type file: BinaryIO
+    :param start: Offset where the range begins
+    :type start: int
+    :param end: Offset where the range ends
+    :type end: int
+    :param block_size: Bytes of the first block read from the end
+    :type block_size: int
+    :return: Offset right after the last line break of the range, start
+             if the range holds no line break
+    :rtype: int
+    """
+    while end > start:
+        block_start = max(start, end - block_size)
+        file.seek(block_start)
+        found = file.read(end - block_start).rfind(b"\n")
+        if found >= 0:
+            return block_start + found + 1
+        end = block_start
+        block_size *= 2
+    return start
+
+
+def slice_telemetry(
+    dframe: pd.DataFrame,
+    start: t.Optional[float] = None,
+    end: t.Optional[float] = None,
+    max_points: t.Optional[int] = None,
+) -> pd.DataFrame:
+    """Select a time range of telemetry data and downsample it
+
+    Downsampling keeps evenly spaced rows, along with the last row,
+    so repeated requests for unchanged data return the same rows.
+
+    :param dframe: Telemetry data with a timestamp column
+    :type dframe: pandas.DataFrame
+    :param start: Earliest timestamp to include
+    :type start: Optional[float]
+    :param end: Latest timestamp to include
+    :type end: Optional[float]
+    :param max_points: Maximum number of rows to return
+    :type max_points: Optional[int]
+    :return: Selected rows
+    :rtype: pandas.DataFrame
+    """
+    if start is not None:
+        dframe = dframe.loc[dframe["timestamp"] >= start]
+    if end is not None:
+        dframe = dframe.loc[dframe["timestamp"] <= end]
+
+    if max_points is not None and 0 < max_points < dframe.shape[0]:
+        stride = -(-dframe.shape[0] // max_points)
+        rows = list(range(0, dframe.shape[0], stride))
+        if rows[-1] != dframe.shape[0] - 1:
+            rows[-1] = dframe.shape[0] - 1
+        dframe = dframe.iloc[rows]
+
+    return dframe
+
+
+def _nbytes(dframe: pd.DataFrame) -> int:
+    return int(dframe.memory_usage(index=True, deep=True).sum())
+
+
+class TelemetryStore:
+    """Telemetry rows of one file, kept within a memory budget
+
+    Raw rows are kept in a NumPy ring buffer with one array per column. The
+    buffer doubles in size as rows arrive, up to the number of rows that
+    fit in the budget, so appends copy each row a constant number of times
+    on average. When the buffer is full, the oldest rows are rolled up into
+    the mean of every column over buckets of time, until the raw rows fit in
+    half the budget. Rollups are kept within a quarter of the budget by
+    doubling the width of their buckets.
+    """
+
+    def __init__(
+        self,
+        columns: t.Sequence[str],
+        budget: int = TELEMETRY_BUDGET,
+        rollup_ms: int = ROLLUP_MS,
+    ) -> None:
+        """Initialize a TelemetryStore
+
+        :param columns: Columns of the telemetry rows, including timestamp
+        :type columns: Sequence[str]
+        :param budget: Bytes of rows to keep before rolling rows up
+        :type budget: int
+        :param rollup_ms: Initial width of the rollup buckets in milliseconds
+        :type rollup_ms: int
+        """
+        self.columns = list(columns)
+        self.budget = budget
+        self.initial_rollup_ms = rollup_ms
+        self.reset()
+
+    def reset(self) -> None:
+        """Remove every stored row"""
+        self.rollup_ms = self.initial_rollup_ms
+        self.raw_rows = 0
+        self._start = 0
+        self._ring: t.Dict[str, "np.ndarray[t.Any, t.Any]"] = {}
+        self._rollups = pd.DataFrame(columns=self.columns)
+        self._rollup_counts = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._rollups) + self.raw_rows
+
+    @property
+    def capacity(self) -> int:
+        """Get the number of rows the ring buffer holds before it grows
+
+        :return: Allocated rows
+        :rtype: int
+        """
+        return len(self._ring[self.columns[0]]) if self._ring else 0
+
+    @property
+    def max_rows(self) -> int:
+        """Get the number of raw rows that fit in the budget
+
+        :return: Raw rows kept before the oldest are rolled up
+        :rtype: int
+        """
+        row_bytes = sum(array.itemsize for array in self._ring.values())
+        return max(1, self.budget // row_bytes) if row_bytes else 0
+
+    @property
+    def raw_bytes(self) -> int:
+        """Get the bytes held by the raw rows
+
+        :return: Bytes of the raw rows
+        :rtype: int
+        """
+        return sum(array.itemsize for array in self._ring.values()) * self.raw_rows
+
+    @property
+    def rollup_rows(self) -> int:
+        """Get the number of rollup rows
+
+        :return: Number of rows holding rolled up raw rows
+        :rtype: int
+        """
+        return len(self._rollups)
+
+    @property
+    def nbytes(self) -> int:
+        """Get the bytes held by the stored rows
+
+        :return: Bytes of the raw and rollup rows
+        :rtype: int
+        """
+        return self.raw_bytes + _nbytes(self._rollups)
+
+    def append(self, rows: pd.DataFrame) -> None:
+        """Store new rows, rolling up the oldest rows when over budget
+
+        :param rows: Rows in timestamp order, newer than the stored rows
+        :type rows: pandas.DataFrame
+        """
+        if rows.empty:
+            return
+
+        arrays = {column: rows[column].to_numpy() for column in self.columns}
+        self._fit_dtypes(arrays)
+
+        count = len(rows)
+        if self.raw_rows + count > self.max_rows:
+            excess = self.raw_rows + count - self.max_rows // 2
+            rolled = min(excess, self.raw_rows)
+            if rolled:
+                self._roll_up(self._take(np.arange(rolled)), np.ones(rolled, np.int64))
+                self._start = (self._start + rolled) % self.capacity
+                self.raw_rows -= rolled
+            if excess > rolled:
+                rolled = excess - rolled
+                self._roll_up(
+                    rows[self.columns].iloc[:rolled], np.ones(rolled, np.int64)
+                )
+                arrays = {column: array[rolled:] for column, array in arrays.items()}
+                count -= rolled
+
+        self._reserve(self.raw_rows + count)
+        end = (self._start + self.raw_rows) % self.capacity
+        head = min(count, self.capacity - end)
+        for column, array in arrays.items():
+            self._ring[column][end : end + head] = array[:head]
+            self._ring[column][: count - head] = array[head:]
+        self.raw_rows += count
+
+    def _fit_dtypes(self, arrays: t.Dict[str, "np.ndarray[t.Any, t.Any]"]) -> None:
+        if not self._ring:
+            self._ring = {
+                column: np.empty(0, dtype=array.dtype)
+                for column, array in arrays.items()
+            }
+            return
+
+        # rows parsed with inferred dtypes widen the buffer rather than being
+        # truncated to it
+        for column, array in arrays.items():
+            dtype = np.result_type(self._ring[column].dtype, array.dtype)
+            if dtype != self._ring[column].dtype:
+                self._ring[column] = self._ring[column].astype(dtype)
+
+    def _reserve(self, rows: int) -> None:
+        if rows <= self.capacity:
+            return
+
+        capacity = min(max(rows, 2 * self.capacity, 64), max(self.max_rows, rows))
+        positions = (self._start + np.arange(self.raw_rows)) % max(self.capacity, 1)
+        for column, array in self._ring.items():
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[: self.raw_rows] = array[positions]
+            self._ring[column] = grown
+        self._start = 0
+
+    def _take(self, positions: "np.ndarray[t.Any, t.Any]") -> pd.DataFrame:
+        indices = (self._start + positions) % max(self.capacity, 1)
+        return pd.DataFrame(
+            {column: array[indices] for column, array in self._ring.items()},
+            columns=self.columns,
+        )
+
+    def _roll_up(self, rows: pd.DataFrame, counts: "np.ndarray[t.Any, t.Any]") -> None:
+        # keep the dtypes of the raw rows where a mean still fits them
+        dtypes = {
+            column: dtype
+            for column, dtype in rows.dtypes.items()
+            if column == "timestamp" or dtype.kind == "f"
+        }
+        if len(self._rollups):
+            rows = pd.concat((self._rollups, rows), ignore_index=True)
+            counts = np.concatenate((self._rollup_counts, counts))
+
+        while True:
+            buckets = (rows["timestamp"] // self.rollup_ms).to_numpy()
+            weights = pd.Series(counts, index=rows.index)
+            totals = weights.groupby(buckets).sum()
+            means = rows.mul(weights, axis=0).groupby(buckets).sum()
+            rows = means.div(totals, axis=0).reset_index(drop=True)
+            counts = totals.to_numpy()
+            if _nbytes(rows) <= self.budget // 4 or len(rows) <= 1:
+                break
+            self.rollup_ms *= 2
+
+        self._rollups = rows[self.columns].astype(dtypes)
+        self._rollup_counts = counts
+
+    def _select(self, positions: "np.ndarray[t.Any, t.Any]") -> pd.DataFrame:
+        """Get the rows at sorted positions, counting rollups first"""
+        split = np.searchsorted(positions, len(self._rollups))
+        parts = []
+        if split:
+            parts.append(self._rollups.iloc[positions[:split]])
+        if split < len(positions):
+            parts.append(self._take(positions[split:] - len(self._rollups)))
+        if not parts:
+            return pd.DataFrame(columns=self.columns)
+        if len(parts) == 1:
+            return parts[0].reset_index(drop=True)
+        return pd.concat(parts, ignore_index=True)
+
+    def _sample(self, max_points: int, start: int, stop: int) -> pd.DataFrame:
+        """Get evenly spaced rows between two positions, along with the
+        last of them"""
+        if stop - start <= max_points:
+            return self._select(np.arange(start, stop))
+        return self._select(np.linspace(start, stop - 1, max_points).astype(np.int64))
+
+    def _search(self, timestamp: float) -> int:
+        """Get the position of the first row at or after a timestamp"""
+        position = int(np.searchsorted(self._rollups["timestamp"], timestamp))
+        if position < len(self._rollups) or not self.raw_rows:
+            return position
+
+        timestamps = self._ring["timestamp"]
+        head = min(self.raw_rows, self.capacity - self._start)
+        found = int(
+            np.searchsorted(timestamps[self._start : self._start + head], timestamp)
+        )
+        if found == head:
+            found += int(np.searchsorted(timestamps[: self.raw_rows - head], timestamp))
+        return position + found
+
+    def frame(self) -> pd.DataFrame:
+        """Get every stored row, rollups first
+
+        :return: Stored rows
+        :rtype: pandas.DataFrame
+        """
+        return self._select(np.arange(len(self)))
+
+    def tail(self, rows: int = 1) -> pd.DataFrame:
+        """Get the newest rows
+
+        :param rows: Number of rows
+        :type rows: int
+        :return: Newest rows
+        :rtype: pandas.DataFrame
+        """
+        return self._select(np.arange(max(0, len(self) - rows), len(self)))
+
+    def downsample(self, max_points: int) -> pd.DataFrame:
+        """Get evenly spaced rows, along with the newest row, without
+        concatenating every stored row
+
+        :param max_points: Maximum number of rows to return
+        :type max_points: int
+        :return: Selected rows
+        :rtype: pandas.DataFrame
+        """
+        return self._sample(max_points, 0, len(self))
+
+    def window(
+        self, span_ms: float, max_points: int, history_points: int
+    ) -> pd.DataFrame:
+        """Get the rows of a recent span of time, preceded by the rest of
+        the history at a lower resolution
+
+        :param span_ms: Span of time before the newest row, in milliseconds
+        :type span_ms: float
+        :param max_points: Maximum number of rows to return from the span
+        :type max_points: int
+        :param history_points: Maximum number of rows to return from before
+                               the span
+        :type history_points: int
+        :return: Selected rows, oldest first
+        :rtype: pandas.DataFrame
+        """
+        if len(self) == 0:
+            return self.frame()
+
+        newest = self.tail()["timestamp"].iloc[0]
+        start = self._search(newest - span_ms)
+        history = self._sample(history_points, 0, start)
+        recent = self._sample(max_points, start, len(self))
+        if history.empty:
+            return recent
+        return pd.concat((history, recent), ignore_index=True)
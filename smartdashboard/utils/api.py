@@ -0,0 +1,535 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import logging
+import pathlib
+import re
+import sys
+import typing as t
+import urllib.parse
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from smartdashboard.schemas.base import HasOutErrFiles
+from smartdashboard.schemas.ensemble import Ensemble
+from smartdashboard.schemas.orchestrator import Orchestrator
+from smartdashboard.schemas.run import Run
+from smartdashboard.schemas.table import EntityTable
+
+from .cache import LRUCache
+from .deltas import payload_digest
+from .errors import SSDashboardError
+from .LogReader import get_log_tail
+from .ManifestLoader import ManifestLoader
+from .ManifestReader import Manifest, get_manifest_path
+from .StatusReader import get_status_scanner
+from .storage import get_storage, use_experiment_storage
+from .summary import summarize_manifest
+from .TelemetryReader import (
+    TELEMETRY_FILES,
+    get_telemetry_file,
+    read_telemetry,
+    slice_telemetry,
+)
+
+logger = logging.getLogger(__name__)
+
+LOG_LINES = 200
+"""Number of log lines returned when a request does not set lines"""
+
+PAGE_LIMIT = 1000
+"""Number of member or shard statuses returned when a request does not
+set limit"""
+
+_SEGMENT = "([^/]+)"
+
+
+class ApiError(Exception):
+    """Exception raised for requests the API cannot answer"""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        """Initialize an ApiError
+
+        :param status: HTTP status of the response
+        :type status: HTTPStatus
+        :param message: Error message returned to the client
+        :type message: str
+        """
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass(frozen=True)
+class ApiResponse:
+    """Data class representing an API response
+
+    :param status: HTTP status of the response
+    :type status: HTTPStatus
+    :param body: JSON body, empty for Not Modified responses
+    :type body: bytes
+    :param etag: Entity tag of the body
+    :type etag: str
+    """
+
+    status: HTTPStatus
+    body: bytes
+    etag: str = ""
+
+
+@dataclass(frozen=True)
+class _Payload:
+    """Payload of a route along with the key that validates it
+
+    When the validator is set, it changes whenever the payload does,
+    so an unchanged validator is answered without rebuilding the payload.
+    """
+
+    build: t.Callable[[], t.Any]
+    validator: t.Optional[t.Hashable] = None
+
+
+def _json_default(value: t.Any) -> t.Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    return str(value)
+
+
+def encode(payload: t.Any) -> bytes:
+    """Encode an API payload as JSON
+
+    :param payload: JSON serializable payload, numpy scalars are converted
+    :type payload: Any
+    :return: Encoded payload
+    :rtype: bytes
+    """
+    return json.dumps(payload, default=_json_default, separators=(",", ":")).encode()
+
+
+def _etag(body: bytes) -> str:
+    return f'"{payload_digest(body).hex()}"'
+
+
+def _etag_matches(etag: str, if_none_match: t.Optional[str]) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
+def _int_param(
+    query: t.Dict[str, t.List[str]], name: str, default: t.Optional[int] = None
+) -> t.Optional[int]:
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError as ex:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer") from ex
+    if value < 0:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must not be negative")
+    return value
+
+
+def _float_param(query: t.Dict[str, t.List[str]], name: str) -> t.Optional[float]:
+    values = query.get(name)
+    if not values:
+        return None
+    try:
+        return float(values[-1])
+    except ValueError as ex:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be a number") from ex
+
+
+def _getmtime(file_path: str) -> float:
+    try:
+        return get_storage().getmtime(file_path)
+    except (FileNotFoundError, KeyError) as ex:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"{file_path} does not exist") from ex
+
+
+def _find(entities: t.Iterable[t.Any], name: str, kind: str) -> t.Any:
+    for entity in entities:
+        if entity.name == name:
+            return entity
+    raise ApiError(HTTPStatus.NOT_FOUND, f"{kind} {name} does not exist")
+
+
+def _find_member(entities: t.Sequence[t.Any], name: str, kind: str) -> t.Any:
+    if isinstance(entities, EntityTable):
+        try:
+            return entities[list(entities.names).index(name)]
+        except ValueError as ex:
+            raise ApiError(
+                HTTPStatus.NOT_FOUND, f"{kind} {name} does not exist"
+            ) from ex
+    return _find(entities, name, kind)
+
+
+class DashboardApi:
+    """Read-only JSON API over the manifest, statuses, logs and telemetry
+    of an experiment
+
+    Every response carries an ETag. Manifest, log and telemetry responses
+    are cached under a validator built from the version of the files they
+    are read from, so polling an unchanged file neither reads nor encodes it.
+    """
+
+    def __init__(self, loader: ManifestLoader) -> None:
+        """Initialize a DashboardApi
+
+        :param loader: Loader publishing the manifest of the experiment
+        :type loader: ManifestLoader
+        """
+        self.loader = loader
+        self._responses: LRUCache[t.Tuple[bytes, str]] = LRUCache(maxsize=256)
+        self._routes: t.List[t.Tuple["re.Pattern[str]", t.Callable[..., _Payload]]] = [
+            (re.compile(r"/api/manifest"), self._manifest),
+            (re.compile(r"/api/status"), self._status),
+            (
+                re.compile(
+                    rf"/api/(ensembles|orchestrators)/{_SEGMENT}/{_SEGMENT}/status"
+                ),
+                self._group_status,
+            ),
+            (
+                re.compile(
+                    r"/api/(applications|ensembles|orchestrators)"
+                    rf"/{_SEGMENT}/{_SEGMENT}"
+                ),
+                self._entity,
+            ),
+            (re.compile(r"/api/logs/experiment"), self._experiment_logs),
+            (
+                re.compile(rf"/api/logs/applications/{_SEGMENT}/{_SEGMENT}"),
+                self._application_logs,
+            ),
+            (
+                re.compile(
+                    r"/api/logs/(ensembles|orchestrators)"
+                    rf"/{_SEGMENT}/{_SEGMENT}/{_SEGMENT}"
+                ),
+                self._member_logs,
+            ),
+            (
+                re.compile(
+                    rf"/api/telemetry/{_SEGMENT}/{_SEGMENT}/{_SEGMENT}"
+                    rf"/({'|'.join(TELEMETRY_FILES)})"
+                ),
+                self._telemetry,
+            ),
+        ]
+
+    @property
+    def manifest(self) -> Manifest:
+        """Get the most recently loaded manifest
+
+        :return: Manifest of the experiment
+        :rtype: Manifest
+        """
+        return self.loader.snapshot.manifest
+
+    def get(self, url: str, if_none_match: t.Optional[str] = None) -> ApiResponse:
+        """Answer a GET request
+
+        :param url: Requested path and query string
+        :type url: str
+        :param if_none_match: If-None-Match header of the request
+        :type if_none_match: Optional[str]
+        :return: JSON response, Not Modified if the ETag matches
+        :rtype: ApiResponse
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path.rstrip("/")
+        query = urllib.parse.parse_qs(parts.query)
+
+        try:
+            for pattern, route in self._routes:
+                match = pattern.fullmatch(path)
+                if match is not None:
+                    args = [urllib.parse.unquote(group) for group in match.groups()]
+                    body, etag = self._respond(route(*args, query))
+                    break
+            else:
+                raise ApiError(HTTPStatus.NOT_FOUND, f"{path} is not an API route")
+        except ApiError as ex:
+            return ApiResponse(ex.status, encode({"error": ex.message}))
+
+        if _etag_matches(etag, if_none_match):
+            return ApiResponse(HTTPStatus.NOT_MODIFIED, b"", etag)
+        return ApiResponse(HTTPStatus.OK, body, etag)
+
+    def _respond(self, payload: _Payload) -> t.Tuple[bytes, str]:
+        if payload.validator is not None:
+            cached = self._responses.lookup(payload.validator)
+            if cached is not None:
+                return cached
+
+        body = encode(payload.build())
+        response = (body, _etag(body))
+        if payload.validator is not None:
+            self._responses.store(payload.validator, response)
+        return response
+
+    def _run(self, run_id: str) -> Run:
+        for run in self.manifest.runs:
+            if run.run_id == run_id:
+                return run
+        raise ApiError(HTTPStatus.NOT_FOUND, f"run {run_id} does not exist")
+
+    def _group(self, kind: str, run_id: str, name: str) -> t.Any:
+        run = self._run(run_id)
+        if kind == "applications":
+            return _find(run.model, name, "application")
+        if kind == "ensembles":
+            return _find(run.ensemble, name, "ensemble")
+        return _find(run.orchestrator, name, "orchestrator")
+
+    def _manifest(self, _query: t.Dict[str, t.List[str]]) -> _Payload:
+        manifest = self.manifest
+
+        def build() -> t.Dict[str, t.Any]:
+            return {
+                "version": manifest.version,
+                "experiment": manifest.experiment.dict(),
+                "runs": [
+                    {
+                        "run_id": run.run_id,
+                        "applications": [app.name for app in run.model],
+                        "ensembles": [
+                            {"name": ens.name, "members": len(ens.models)}
+                            for ens in run.ensemble
+                        ],
+                        "orchestrators": [
+                            {"name": orc.name, "shards": len(orc.shards)}
+                            for orc in run.orchestrator
+                        ],
+                    }
+                    for run in manifest.runs
+                ],
+            }
+
+        return _Payload(
+            build, ("manifest", manifest.version) if manifest.version else None
+        )
+
+    def _status(self, _query: t.Dict[str, t.List[str]]) -> _Payload:
+        manifest = self.manifest
+        return _Payload(lambda: summarize_manifest(manifest))
+
+    def _entity(
+        self, kind: str, run_id: str, name: str, _query: t.Dict[str, t.List[str]]
+    ) -> _Payload:
+        manifest = self.manifest
+        entity = self._group(kind, run_id, name)
+
+        def build() -> t.Dict[str, t.Any]:
+            if isinstance(entity, Ensemble):
+                config = entity.dict(exclude={"models"})
+                config["members"] = list(entity.models.names)
+                return config
+            if isinstance(entity, Orchestrator):
+                config = entity.dict(exclude={"shards"})
+                config["shards"] = list(entity.shards.names)
+                return config
+            return t.cast(t.Dict[str, t.Any], entity.dict())
+
+        validator = ("entity", manifest.version, kind, run_id, name)
+        return _Payload(build, validator if manifest.version else None)
+
+    def _group_status(
+        self, kind: str, run_id: str, name: str, query: t.Dict[str, t.List[str]]
+    ) -> _Payload:
+        group = self._group(kind, run_id, name)
+        entities = group.models if isinstance(group, Ensemble) else group.shards
+        offset = t.cast(int, _int_param(query, "offset", 0))
+        limit = t.cast(int, _int_param(query, "limit", PAGE_LIMIT))
+
+        def build() -> t.Dict[str, t.Any]:
+            scanner = get_status_scanner(entities)
+            scanner.scan()
+            names = entities.names
+            positions = range(offset, min(offset + limit, len(entities)))
+            statuses = [scanner.status(position) for position in positions]
+            return {
+                "total": len(entities),
+                "counts": {
+                    status.value: count for status, count in scanner.counts().items()
+                },
+                "offset": offset,
+                "entities": [
+                    {
+                        "name": names[position],
+                        "status": status.status.value,
+                        "return_code": status.return_code,
+                    }
+                    for position, status in zip(positions, statuses)
+                ],
+            }
+
+        return _Payload(build)
+
+    @staticmethod
+    def _logs(entity: HasOutErrFiles, query: t.Dict[str, t.List[str]]) -> _Payload:
+        stream = (query.get("stream") or ["out"])[-1]
+        if stream not in ("out", "err"):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "stream must be out or err")
+        lines = t.cast(int, _int_param(query, "lines", LOG_LINES))
+        file_path = entity.out_file if stream == "out" else entity.err_file
+        mtime = _getmtime(file_path)
+
+        def build() -> t.Dict[str, t.Any]:
+            return {"file": file_path, "lines": get_log_tail(file_path, lines)}
+
+        return _Payload(build, ("logs", file_path, mtime, lines))
+
+    def _experiment_logs(self, query: t.Dict[str, t.List[str]]) -> _Payload:
+        return self._logs(self.manifest.experiment, query)
+
+    def _application_logs(
+        self, run_id: str, name: str, query: t.Dict[str, t.List[str]]
+    ) -> _Payload:
+        return self._logs(self._group("applications", run_id, name), query)
+
+    def _member_logs(
+        self,
+        kind: str,
+        run_id: str,
+        name: str,
+        member: str,
+        query: t.Dict[str, t.List[str]],
+    ) -> _Payload:
+        group = self._group(kind, run_id, name)
+        if isinstance(group, Ensemble):
+            return self._logs(_find_member(group.models, member, "member"), query)
+        return self._logs(_find_member(group.shards, member, "shard"), query)
+
+    def _telemetry(
+        self,
+        run_id: str,
+        name: str,
+        shard_name: str,
+        kind: str,
+        query: t.Dict[str, t.List[str]],
+    ) -> _Payload:
+        orchestrator = self._group("orchestrators", run_id, name)
+        shard = _find_member(orchestrator.shards, shard_name, "shard")
+        file_path = get_telemetry_file(shard, kind)
+        if not file_path:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"{kind} telemetry is not collected")
+        start = _float_param(query, "start")
+        end = _float_param(query, "end")
+        max_points = _int_param(query, "max_points")
+        mtime = _getmtime(file_path)
+
+        def build() -> t.Dict[str, t.Any]:
+            dframe = slice_telemetry(read_telemetry(file_path), start, end, max_points)
+            dframe = dframe.astype(object).where(dframe.notna(), None)
+            return {
+                "columns": list(dframe.columns),
+                "rows": dframe.to_numpy().tolist(),
+            }
+
+        return _Payload(build, ("telemetry", file_path, mtime, start, end, max_points))
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: "ApiServer"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        response = self.server.api.get(self.path, self.headers.get("If-None-Match"))
+        self.send_response(response.status)
+        if response.etag:
+            self.send_header("ETag", response.etag)
+            self.send_header("Cache-Control", "no-cache")
+        if response.status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        if response.status != HTTPStatus.NOT_MODIFIED:
+            self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args: t.Any) -> None:
+        # pylint: disable-next=redefined-builtin
+        logger.debug(format, *args)
+
+
+class ApiServer(ThreadingHTTPServer):
+    """HTTP server answering API requests on a thread per connection"""
+
+    daemon_threads = True
+
+    def __init__(self, address: t.Tuple[str, int], api: DashboardApi) -> None:
+        """Initialize an ApiServer
+
+        :param address: Host and port to listen on
+        :type address: Tuple[str, int]
+        :param api: API answering the requests
+        :type api: DashboardApi
+        """
+        super().__init__(address, _RequestHandler)
+        self.api = api
+
+
+def run_api(directory: t.Optional[str], host: str, port: int) -> int:
+    """Serve the API of an experiment until interrupted
+
+    :param directory: Experiment directory or archive, the current
+                      directory if None
+    :type directory: Optional[str]
+    :param host: Host to listen on
+    :type host: str
+    :param port: Port to listen on
+    :type port: int
+    :return: Exit code, 1 if the manifest could not be loaded
+    :rtype: int
+    """
+    exp_path = pathlib.Path(directory) if directory is not None else None
+    use_experiment_storage(exp_path)
+    try:
+        loader = ManifestLoader(get_manifest_path(exp_path))
+    except SSDashboardError as ex:
+        print(f"{ex} ({ex.file})", file=sys.stderr)
+        return 1
+
+    loader.start()
+    server = ApiServer((host, port), DashboardApi(loader))
+    print(f"Serving the SmartDashboard API on http://{host}:{port}/api")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        loader.stop()
+    return 0
@@ -25,6 +25,10 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import argparse
+import typing as t
+
+API_PORT = 8502
+METRICS_PORT = 9108
 
 
 def get_parser() -> argparse.ArgumentParser:
@@ -48,4 +52,113 @@ def get_parser() -> argparse.ArgumentParser:
         type=int,
         default=8501,
     )
+    parser.add_argument(
+        "--diagnostics",
+        help="Record timings of the dashboard for the Diagnostics page",
+        action="store_true",
+    )
+
+    commands = parser.add_subparsers(dest="command", title="commands")
+    status_parser = commands.add_parser(
+        "status",
+        help="Print a summary of the experiment status without starting the "
+        "dashboard",
+    )
+    status_parser.add_argument(
+        "-d",
+        "--directory",
+        help="The path to an experiment to load. Default to current directory",
+        type=str,
+        default=argparse.SUPPRESS,
+    )
+    status_parser.add_argument(
+        "--json",
+        help="Print the summary as JSON",
+        action="store_true",
+    )
+
+    api_parser = commands.add_parser(
+        "api", help="Serve a read-only JSON API instead of the dashboard"
+    )
+    api_parser.add_argument(
+        "-d",
+        "--directory",
+        help="The path to an experiment to load. Default to current directory",
+        type=str,
+        default=argparse.SUPPRESS,
+    )
+    api_parser.add_argument(
+        "-p",
+        "--port",
+        help=f"The port to expose the API on. Default to {API_PORT}",
+        type=int,
+        default=API_PORT,
+    )
+    api_parser.add_argument(
+        "--host",
+        help="The address to expose the API on. Default to localhost",
+        type=str,
+        default="127.0.0.1",
+    )
+
+    metrics_parser = commands.add_parser(
+        "metrics",
+        help="Serve Prometheus metrics instead of the dashboard",
+    )
+    metrics_parser.add_argument(
+        "-d",
+        "--directory",
+        help="The path to an experiment to load. Default to current directory",
+        type=str,
+        default=argparse.SUPPRESS,
+    )
+    metrics_parser.add_argument(
+        "-p",
+        "--port",
+        help=f"The port to expose the metrics on. Default to {METRICS_PORT}",
+        type=int,
+        default=METRICS_PORT,
+    )
+    metrics_parser.add_argument(
+        "--host",
+        help="The address to expose the metrics on. Default to localhost",
+        type=str,
+        default="127.0.0.1",
+    )
+    metrics_parser.add_argument(
+        "--interval",
+        help="Seconds between metric collections",
+        type=float,
+        default=5.0,
+    )
     return parser
+
+
+def run_command(args: argparse.Namespace) -> t.Optional[int]:
+    """Run the headless command selected on the command line
+
+    Commands are imported when they run, so they do not pay for importing
+    streamlit or each other.
+
+    :param args: Parsed CLI arguments
+    :type args: argparse.Namespace
+    :return: Exit code of the command, or None if no command was selected
+             and the dashboard should be started
+    :rtype: Optional[int]
+    """
+    if args.command == "status":
+        # pylint: disable-next=import-outside-toplevel
+        from smartdashboard.utils.summary import run_status
+
+        return run_status(args.directory, args.json)
+    if args.command == "api":
+        # pylint: disable-next=import-outside-toplevel
+        from smartdashboard.utils.api import run_api
+
+        return run_api(args.directory, args.host, args.port)
+    if args.command == "metrics":
+        # pylint: disable-next=import-outside-toplevel
+        from smartdashboard.utils.metrics import run_metrics
+
+        return run_metrics(args.directory, args.host, args.port, args.interval)
+    return None
@@ -0,0 +1,160 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import collections
+import threading
+import typing as t
+
+_V = t.TypeVar("_V")
+
+
+class LRUCache(t.Generic[_V]):
+    """Thread-safe cache that keeps the most recently used values"""
+
+    def __init__(self, maxsize: int = 32) -> None:
+        """Initialize an LRUCache
+
+        :param maxsize: Number of values to keep
+        :type maxsize: int
+        """
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._values: "collections.OrderedDict[t.Hashable, _V]" = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def lookup(self, key: t.Hashable) -> t.Optional[_V]:
+        """Get a cached value and mark it as recently used
+
+        :param key: Key of the value
+        :type key: Hashable
+        :return: Cached value or None if the key is not cached
+        :rtype: Optional[_V]
+        """
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+            return value
+
+    def store(self, key: t.Hashable, value: _V) -> None:
+        """Cache a value, evicting the least recently used values
+        when the cache is full
+
+        :param key: Key of the value
+        :type key: Hashable
+        :param value: Value to cache
+        :type value: _V
+        """
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+    def get(self, key: t.Hashable, build: t.Callable[[], _V]) -> _V:
+        """Get a cached value, building it on first use
+
+        :param key: Key of the value
+        :type key: Hashable
+        :param build: Function building the value
+        :type build: Callable[[], _V]
+        :return: Cached or newly built value
+        :rtype: _V
+        """
+        value = self.lookup(key)
+        if value is None:
+            value = build()
+            self.store(key, value)
+        return value
+
+    def reserve(self, size: int) -> None:
+        """Grow the cache to keep at least a number of values
+
+        :param size: Number of values to keep
+        :type size: int
+        """
+        with self._lock:
+            self.maxsize = max(self.maxsize, size)
+
+    def clear(self) -> None:
+        """Remove every cached value"""
+        with self._lock:
+            self._values.clear()
+
+
+class SourceCache(t.Generic[_V]):
+    """Thread-safe LRU cache of values derived from an object
+
+    Values are looked up by a key and the identity of the object they were
+    derived from, such as an ensemble of the current manifest. The object is
+    kept alongside the value, so an identity is never reused while the value
+    is cached, and values derived from a replaced manifest are rebuilt.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        """Initialize a SourceCache
+
+        :param maxsize: Number of values to keep
+        :type maxsize: int
+        """
+        self._cache: LRUCache[t.Tuple[object, _V]] = LRUCache(maxsize)
+
+    def get(self, key: t.Hashable, source: object, build: t.Callable[[], _V]) -> _V:
+        """Get the value derived from a source, building it on first use
+
+        :param key: Name of the value
+        :type key: Hashable
+        :param source: Object the value is derived from
+        :type source: object
+        :param build: Function building the value
+        :type build: Callable[[], _V]
+        :return: Cached or newly built value
+        :rtype: _V
+        """
+        cache_key = (key, id(source))
+        cached = self._cache.lookup(cache_key)
+        if cached is not None and cached[0] is source:
+            return cached[1]
+
+        value = build()
+        self._cache.store(cache_key, (source, value))
+        return value
+
+    def reserve(self, size: int) -> None:
+        """Grow the cache to keep at least a number of values
+
+        :param size: Number of values to keep
+        :type size: int
+        """
+        self._cache.reserve(size)
+
+    def clear(self) -> None:
+        """Remove every cached value"""
+        self._cache.clear()
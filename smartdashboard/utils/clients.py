@@ -0,0 +1,228 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from .TelemetryReader import TELEMETRY_BUDGET, TelemetryStore
+from .timing import timed_method
+
+SESSION_LIMIT = 1000
+"""Number of the newest closed sessions a ClientTimeline keeps"""
+
+CHURN_COLUMNS = ["timestamp", "connects", "disconnects", "clients"]
+"""Columns of the churn series of a ClientTimeline"""
+
+SESSION_COLUMNS = ["client_id", "connected", "disconnected", "open"]
+"""Columns of the sessions of a ClientTimeline"""
+
+
+class ClientTimeline:
+    """Connection sessions and churn of the clients of one shard
+
+    The client file holds one row for each client connected at each sample.
+    Rows are run-length encoded per client over the sequence of samples, so
+    each run of consecutive samples a client is present in is one session.
+    A session is connected at its first sample and disconnected at the
+    first sample the client is missing from.
+
+    Rows are added as they are tailed from the file. The rows of the newest
+    sample may not all have been written yet, so that sample is held back
+    until a newer one arrives. Samples without any connected client have no
+    rows, so a client that reconnects across them is seen as connected
+    throughout.
+    """
+
+    def __init__(
+        self, max_sessions: int = SESSION_LIMIT, budget: int = TELEMETRY_BUDGET
+    ) -> None:
+        """Initialize a ClientTimeline
+
+        :param max_sessions: Number of the newest closed sessions to keep
+        :type max_sessions: int
+        :param budget: Bytes of the churn series to keep before its oldest
+                       samples are rolled up
+        :type budget: int
+        """
+        self.max_sessions = max_sessions
+        self.churn = TelemetryStore(CHURN_COLUMNS, budget)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every sample"""
+        self.samples = 0
+        self.last_timestamp: t.Optional[int] = None
+        self.closed_sessions = 0
+        self.closed_duration_ms = 0
+        self.churn.reset()
+        self._pending = pd.DataFrame(columns=["timestamp", "client_id"])
+        self._open_ids = np.zeros(0, dtype=np.int64)
+        self._open_starts = np.zeros(0, dtype=np.int64)
+        self._closed: t.List[pd.DataFrame] = []
+        self._closed_rows = 0
+
+    @property
+    def mean_duration_ms(self) -> t.Optional[float]:
+        """Get the mean duration of every closed session
+
+        :return: Mean duration in milliseconds, None before any session closed
+        :rtype: Optional[float]
+        """
+        if not self.closed_sessions:
+            return None
+        return self.closed_duration_ms / self.closed_sessions
+
+    @timed_method
+    def update(self, rows: pd.DataFrame) -> bool:
+        """Add the rows tailed from the client file
+
+        :param rows: Client rows in timestamp order, newer than the rows
+                     already added
+        :type rows: pandas.DataFrame
+        :return: True if any sample was completed by the rows
+        :rtype: bool
+        """
+        if rows.empty:
+            return False
+
+        rows = rows[["timestamp", "client_id"]]
+        if not self._pending.empty:
+            rows = pd.concat((self._pending, rows), ignore_index=True)
+
+        timestamps = rows["timestamp"].to_numpy(dtype=np.int64)
+        newest = np.searchsorted(timestamps, timestamps[-1])
+        self._pending = rows.iloc[newest:]
+        if not newest:
+            return False
+
+        self._encode(
+            timestamps[:newest], rows["client_id"].to_numpy(dtype=np.int64)[:newest]
+        )
+        return True
+
+    def _encode(
+        self,
+        timestamps: "np.ndarray[t.Any, t.Any]",
+        client_ids: "np.ndarray[t.Any, t.Any]",
+    ) -> None:
+        times, samples = np.unique(timestamps, return_inverse=True)
+
+        # sessions still open at the previous sample continue from sample -1
+        open_count = len(self._open_ids)
+        ids = np.concatenate((self._open_ids, client_ids))
+        sample = np.concatenate((np.full(open_count, -1), samples))
+        starts = np.concatenate((self._open_starts, timestamps))
+
+        order = np.lexsort((sample, ids))
+        ids, sample, starts = ids[order], sample[order], starts[order]
+        unique = np.ones(len(ids), dtype=bool)
+        unique[1:] = (ids[1:] != ids[:-1]) | (sample[1:] != sample[:-1])
+        ids, sample, starts = ids[unique], sample[unique], starts[unique]
+
+        run_start = np.ones(len(ids), dtype=bool)
+        run_start[1:] = (ids[1:] != ids[:-1]) | (sample[1:] != sample[:-1] + 1)
+        first = np.flatnonzero(run_start)
+        last = np.append(first[1:], len(ids)) - 1
+        still_open = sample[last] == len(times) - 1
+
+        closed_first, closed_last = first[~still_open], last[~still_open]
+        disconnected = times[sample[closed_last] + 1]
+        self._add_closed(ids[closed_first], starts[closed_first], disconnected)
+        self._open_ids = ids[first[still_open]]
+        self._open_starts = starts[first[still_open]]
+
+        connected = sample[first]
+        self.churn.append(
+            pd.DataFrame(
+                {
+                    "timestamp": times,
+                    "connects": np.bincount(
+                        connected[connected >= 0], minlength=len(times)
+                    ),
+                    "disconnects": np.bincount(
+                        sample[closed_last] + 1, minlength=len(times)
+                    ),
+                    "clients": np.bincount(sample[sample >= 0], minlength=len(times)),
+                }
+            )
+        )
+        self.samples += len(times)
+        self.last_timestamp = int(times[-1])
+
+    def _add_closed(
+        self,
+        client_ids: "np.ndarray[t.Any, t.Any]",
+        connected: "np.ndarray[t.Any, t.Any]",
+        disconnected: "np.ndarray[t.Any, t.Any]",
+    ) -> None:
+        if client_ids.size == 0:
+            return
+
+        self.closed_sessions += len(client_ids)
+        self.closed_duration_ms += int((disconnected - connected).sum())
+        order = np.argsort(disconnected, kind="stable")
+        self._closed.append(
+            pd.DataFrame(
+                {
+                    "client_id": client_ids[order],
+                    "connected": connected[order],
+                    "disconnected": disconnected[order],
+                }
+            )
+        )
+        self._closed_rows += len(client_ids)
+        if self._closed_rows > 2 * self.max_sessions:
+            kept = pd.concat(self._closed, ignore_index=True).tail(self.max_sessions)
+            self._closed = [kept.reset_index(drop=True)]
+            self._closed_rows = len(kept)
+
+    def sessions(self) -> pd.DataFrame:
+        """Get the newest closed sessions followed by the open sessions,
+        which end at the latest sample
+
+        :return: Sessions with the client, the connect and disconnect
+                 timestamps, and whether the session is still open
+        :rtype: pandas.DataFrame
+        """
+        closed = (
+            pd.concat(self._closed, ignore_index=True).tail(self.max_sessions)
+            if self._closed
+            else pd.DataFrame(columns=SESSION_COLUMNS[:-1], dtype=np.int64)
+        )
+        current = pd.DataFrame(
+            {
+                "client_id": self._open_ids,
+                "connected": self._open_starts,
+                "disconnected": np.full(
+                    len(self._open_ids), self.last_timestamp or 0, dtype=np.int64
+                ),
+            }
+        )
+        return pd.concat(
+            (closed.assign(open=False), current.assign(open=True)), ignore_index=True
+        )[SESSION_COLUMNS]
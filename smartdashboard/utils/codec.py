@@ -0,0 +1,187 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import contextlib
+import gc
+import json
+import threading
+import typing as t
+from abc import ABC, abstractmethod
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# Both backends raise a subclass of json.JSONDecodeError on malformed input
+JSONDecodeError = json.JSONDecodeError
+
+
+class JSONCodec(ABC):
+    """Base class for the JSON parsers used to read SmartSim files"""
+
+    name: t.ClassVar[str]
+
+    @abstractmethod
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        """Abstract method to decode a JSON document
+
+        :param data: Encoded JSON document
+        :type data: Union[bytes, str]
+        :return: Decoded document
+        :rtype: Any
+        """
+
+
+class StdlibJSONCodec(JSONCodec):
+    """JSONCodec backed by the standard library json module"""
+
+    name = "json"
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        """Decode a JSON document with the json module
+
+        :param data: Encoded JSON document
+        :type data: Union[bytes, str]
+        :return: Decoded document
+        :rtype: Any
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSONCodec backed by the optional orjson package"""
+
+    name = "orjson"
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        """Decode a JSON document with orjson
+
+        :param data: Encoded JSON document
+        :type data: Union[bytes, str]
+        :return: Decoded document
+        :rtype: Any
+        """
+        return orjson.loads(data)  # pylint: disable=no-member
+
+
+def available_codecs() -> t.Dict[str, t.Type[JSONCodec]]:
+    """Get the JSON codecs that can be used in this environment
+
+    :return: Codec classes keyed by name, fastest first
+    :rtype: Dict[str, Type[JSONCodec]]
+    """
+    codecs: t.Dict[str, t.Type[JSONCodec]] = {}
+    if orjson is not None:
+        codecs[OrjsonCodec.name] = OrjsonCodec
+    codecs[StdlibJSONCodec.name] = StdlibJSONCodec
+    return codecs
+
+
+_codec: JSONCodec = next(iter(available_codecs().values()))()
+
+
+def get_codec() -> JSONCodec:
+    """Get the JSON codec used to read manifest and status files
+
+    :return: Active codec
+    :rtype: JSONCodec
+    """
+    return _codec
+
+
+def set_codec(name: str) -> None:
+    """Select the JSON codec used to read manifest and status files
+
+    :param name: Name of an available codec
+    :type name: str
+    :raises ValueError: If the codec is not available
+    """
+    global _codec  # pylint: disable=global-statement
+    try:
+        _codec = available_codecs()[name]()
+    except KeyError as key:
+        raise ValueError(f"JSON codec {name} is not available") from key
+
+
+class _GCPause:
+    """Count of the overlapping garbage collector pauses of every thread"""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.pauses = 0
+        self.was_enabled = False
+
+
+_gc_pause = _GCPause()
+
+
+@contextlib.contextmanager
+def gc_paused() -> t.Iterator[None]:
+    """Pause the cyclic garbage collector while a large document is decoded
+
+    Decoding a large document allocates millions of containers, which
+    repeatedly triggers collections that cannot free anything. Decoded JSON
+    never contains reference cycles, so collection can safely wait until
+    decoding is done. Pauses from several threads overlap, and the
+    collector is only resumed when the last of them ends.
+    """
+    with _gc_pause.lock:
+        if _gc_pause.pauses == 0:
+            _gc_pause.was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause.pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_pause.lock:
+            _gc_pause.pauses -= 1
+            if _gc_pause.pauses == 0 and _gc_pause.was_enabled:
+                gc.enable()
+
+
+def loads(data: t.Union[bytes, str]) -> t.Any:
+    """Decode a JSON document with the active codec
+
+    :param data: Encoded JSON document
+    :type data: Union[bytes, str]
+    :return: Decoded document
+    :rtype: Any
+    """
+    return _codec.loads(data)
+
+
+def load(stream: t.IO[t.Any]) -> t.Any:
+    """Decode a JSON document from a stream with the active codec
+
+    Binary streams are handed to the codec without text decoding.
+
+    :param stream: Stream to read the document from
+    :type stream: IO[Any]
+    :return: Decoded document
+    :rtype: Any
+    """
+    return loads(stream.read())
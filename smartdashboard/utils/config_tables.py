@@ -0,0 +1,190 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import typing as t
+from dataclasses import dataclass
+
+import pandas as pd
+
+from smartdashboard.schemas.application import Application
+from smartdashboard.schemas.ensemble import Ensemble
+from smartdashboard.utils.cache import LRUCache
+from smartdashboard.utils.helpers import (
+    flatten_nested_keyvalue_containers,
+    format_ensemble_params,
+)
+
+
+@dataclass(frozen=True)
+class ApplicationTables:
+    """Data class holding the configuration tables of an application
+    or ensemble member
+
+    The tables are shared between sessions and must not be modified.
+    """
+
+    exe_args: pd.DataFrame
+    batch_settings: pd.DataFrame
+    run_settings: pd.DataFrame
+    params: pd.DataFrame
+    files: pd.DataFrame
+    colocated_db: pd.DataFrame
+    loaded_entities: pd.DataFrame
+
+
+@dataclass(frozen=True)
+class EnsembleTables:
+    """Data class holding the configuration tables of an ensemble
+
+    The tables are shared between sessions and must not be modified.
+    """
+
+    batch_settings: pd.DataFrame
+    params: pd.DataFrame
+
+
+_tables: LRUCache[t.Union[ApplicationTables, EnsembleTables]] = LRUCache(maxsize=256)
+
+
+def build_application_tables(application: t.Optional[Application]) -> ApplicationTables:
+    """Build the configuration tables of an application or ensemble member
+
+    :param application: Application or ensemble member
+    :type application: Optional[Application]
+    :return: Configuration tables
+    :rtype: ApplicationTables
+    """
+    entity = application.dict() if application is not None else {}
+    return ApplicationTables(
+        exe_args=pd.DataFrame(
+            application.exe_args if application is not None else [],
+            columns=["All Arguments"],
+        ),
+        batch_settings=pd.DataFrame(
+            flatten_nested_keyvalue_containers("batch_settings", entity),
+            columns=["Name", "Value"],
+        ),
+        run_settings=pd.DataFrame(
+            flatten_nested_keyvalue_containers("run_settings", entity),
+            columns=["Name", "Value"],
+        ),
+        params=pd.DataFrame(
+            flatten_nested_keyvalue_containers("params", entity),
+            columns=["Name", "Value"],
+        ),
+        files=pd.DataFrame(
+            flatten_nested_keyvalue_containers("files", entity),
+            columns=["Type", "File"],
+        ),
+        colocated_db=pd.DataFrame(
+            flatten_nested_keyvalue_containers(
+                "settings", entity.get("colocated_db", {})
+            ),
+            columns=["Name", "Value"],
+        ),
+        loaded_entities=pd.DataFrame(
+            application.loaded_entities
+            if application is not None
+            else {"Name": [], "Type": [], "Backend": [], "Device": []}
+        ),
+    )
+
+
+def build_ensemble_tables(ensemble: t.Optional[Ensemble]) -> EnsembleTables:
+    """Build the configuration tables of an ensemble
+
+    :param ensemble: Ensemble
+    :type ensemble: Optional[Ensemble]
+    :return: Configuration tables
+    :rtype: EnsembleTables
+    """
+    batch = flatten_nested_keyvalue_containers(
+        "batch_settings", ensemble.dict(exclude={"models"}) if ensemble else {}
+    )
+    return EnsembleTables(
+        batch_settings=pd.DataFrame(batch, columns=["Name", "Value"]),
+        params=pd.DataFrame(
+            format_ensemble_params(ensemble), columns=["Name", "Value"]
+        ),
+    )
+
+
+def get_application_tables(
+    version: str, run_id: str, name: str, application: t.Optional[Application]
+) -> ApplicationTables:
+    """Get the configuration tables of an application or ensemble member
+
+    Tables are cached by manifest version, run and entity name, so they
+    are only rebuilt when the manifest changes. Entities of manifests
+    that were not read from a file are not cached.
+
+    :param version: Version of the manifest the entity belongs to
+    :type version: str
+    :param run_id: Id of the run the entity belongs to
+    :type run_id: str
+    :param name: Name of the entity, qualified by its ensemble for members
+    :type name: str
+    :param application: Application or ensemble member
+    :type application: Optional[Application]
+    :return: Configuration tables
+    :rtype: ApplicationTables
+    """
+    if not version or application is None:
+        return build_application_tables(application)
+
+    return t.cast(
+        ApplicationTables,
+        _tables.get(
+            ("application", version, run_id, name),
+            lambda: build_application_tables(application),
+        ),
+    )
+
+
+def get_ensemble_tables(
+    version: str, run_id: str, ensemble: t.Optional[Ensemble]
+) -> EnsembleTables:
+    """Get the configuration tables of an ensemble
+
+    :param version: Version of the manifest the ensemble belongs to
+    :type version: str
+    :param run_id: Id of the run the ensemble belongs to
+    :type run_id: str
+    :param ensemble: Ensemble
+    :type ensemble: Optional[Ensemble]
+    :return: Configuration tables
+    :rtype: EnsembleTables
+    """
+    if not version or ensemble is None:
+        return build_ensemble_tables(ensemble)
+
+    return t.cast(
+        EnsembleTables,
+        _tables.get(
+            ("ensemble", version, run_id, ensemble.name),
+            lambda: build_ensemble_tables(ensemble),
+        ),
+    )
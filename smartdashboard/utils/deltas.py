@@ -0,0 +1,146 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import collections
+import hashlib
+import threading
+import typing as t
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class DeltaCounters:
+    """Data class representing how many element updates were sent
+    to the frontend and how many were skipped as redundant
+
+    :param emitted: Updates sent, by element slot
+    :type emitted: Dict[str, int]
+    :param suppressed: Updates skipped, by element slot
+    :type suppressed: Dict[str, int]
+    """
+
+    emitted: t.Dict[str, int]
+    suppressed: t.Dict[str, int]
+
+    @property
+    def total_emitted(self) -> int:
+        return sum(self.emitted.values())
+
+    @property
+    def total_suppressed(self) -> int:
+        return sum(self.suppressed.values())
+
+
+_counters_lock = threading.Lock()
+_emitted: t.Counter[str] = collections.Counter()
+_suppressed: t.Counter[str] = collections.Counter()
+
+
+def get_delta_counters() -> DeltaCounters:
+    """Get the update counters of every view in this process
+
+    :return: Emitted and suppressed update counts
+    :rtype: DeltaCounters
+    """
+    with _counters_lock:
+        return DeltaCounters(dict(_emitted), dict(_suppressed))
+
+
+def reset_delta_counters() -> None:
+    """Reset the update counters of every view in this process"""
+    with _counters_lock:
+        _emitted.clear()
+        _suppressed.clear()
+
+
+def payload_digest(payload: t.Any) -> bytes:
+    """Hash the payload of an element update
+
+    :param payload: Text, DataFrame, numpy array or other
+                    value rendered by an element
+    :type payload: Any
+    :return: Digest of the payload
+    :rtype: bytes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(payload, str):
+        digest.update(payload.encode("utf-8", "surrogatepass"))
+    elif isinstance(payload, bytes):
+        digest.update(payload)
+    elif isinstance(payload, pd.DataFrame):
+        digest.update(repr((list(payload.columns), payload.shape)).encode())
+        digest.update(
+            pd.util.hash_pandas_object(payload, index=True).to_numpy().tobytes()
+        )
+    elif isinstance(payload, np.ndarray):
+        digest.update(repr((payload.shape, payload.dtype.str)).encode())
+        digest.update(np.ascontiguousarray(payload).data)
+    else:
+        digest.update(repr(payload).encode())
+    return digest.digest()
+
+
+class DeltaFilter:
+    """Skips element updates whose payload did not change
+
+    A view keeps one filter for its elements. The digest of the payload
+    last sent to each element slot is remembered, and an update is only
+    sent when the digest differs.
+    """
+
+    def __init__(self) -> None:
+        self._digests: t.Dict[str, bytes] = {}
+
+    def changed(self, slot: str, payload: t.Any) -> bool:
+        """Check if an update has to be sent to an element slot
+
+        :param slot: Name of the element slot
+        :type slot: str
+        :param payload: Payload about to be rendered in the slot
+        :type payload: Any
+        :return: True if the payload differs from the last payload
+                 sent to the slot
+        :rtype: bool
+        """
+        digest = payload_digest(payload)
+        changed = self._digests.get(slot) != digest
+        if changed:
+            self._digests[slot] = digest
+
+        with _counters_lock:
+            (_emitted if changed else _suppressed)[slot] += 1
+        return changed
+
+    def forget(self, slot: str) -> None:
+        """Forget the last payload of a slot, so its next update is sent
+
+        :param slot: Name of the element slot
+        :type slot: str
+        """
+        self._digests.pop(slot, None)
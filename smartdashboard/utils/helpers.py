@@ -24,15 +24,54 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import math
 import typing as t
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-from streamlit.delta_generator import DeltaGenerator
 
-from smartdashboard.schemas.application import Application
 from smartdashboard.schemas.ensemble import Ensemble
 from smartdashboard.schemas.orchestrator import Orchestrator
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import STATUS_CODES
+
+_T = t.TypeVar("_T")
+
+STATUS_COLORS = {
+    StatusEnum.RUNNING: "green",
+    StatusEnum.COMPLETED: "blue",
+    StatusEnum.FAILED: "red",
+    StatusEnum.MALFORMED: "violet",
+    StatusEnum.INACTIVE: "gray",
+    StatusEnum.UNSTABLE: "orange",
+    StatusEnum.UNKNOWN: "gray",
+}
+"""Markdown color of each status in the status heatmap legend
+
+Markdown offers six solid colors, so inactive and unknown share gray.
+"""
+
+_MARKDOWN_RGB = {
+    "green": (33, 195, 84),
+    "blue": (28, 131, 225),
+    "red": (255, 75, 75),
+    "orange": (255, 164, 33),
+    "violet": (128, 61, 245),
+    "gray": (128, 132, 149),
+}
+_HEATMAP_BACKGROUND = (14, 17, 23)
+
+# one row per status code, followed by the padding color of the last row
+_HEATMAP_PALETTE = np.array(
+    [_MARKDOWN_RGB[STATUS_COLORS[status]] for status in STATUS_CODES]
+    + [_HEATMAP_BACKGROUND],
+    dtype=np.uint8,
+)
+HEATMAP_WIDTH = 800
+
+CHART_WINDOWS: t.Tuple[t.Optional[int], ...] = (None, 5, 15, 60)
+"""Minutes of the newest telemetry that can be charted in full"""
 
 
 def get_port(orc: t.Optional[Orchestrator]) -> str:
@@ -132,63 +171,6 @@ def format_ensemble_params(entity: t.Optional[Ensemble]) -> t.List[t.Tuple[str,
     return list(zip(keys, values))
 
 
-def build_dataframe_generic(
-    column: DeltaGenerator,
-    title: str,
-    dict_name: str,
-    entity: t.Optional[t.Dict[str, t.Any]],
-    df_columns: t.List[str],
-) -> None:
-    """Renders dataframe within a column
-
-    :param column: Column the dataframe will be rendered in
-    :type column: DeltaGenerator
-    :param title: Title of the dataframe
-    :type title: str
-    :param dict_name: Name of the dictionary
-    :type dict_name: str
-    :param entity: Entity or dictionary being rendered
-    :type entity: Optional[Dict[str, Any]]
-    :param df_columns: Dataframe column names
-    :type df_columns: List[str]
-    """
-    with column:
-        render_dataframe(
-            title=title,
-            dataframe=pd.DataFrame(
-                flatten_nested_keyvalue_containers(dict_name, entity),
-                columns=df_columns,
-            ),
-        )
-
-
-def build_dataframe_loaded_entities(
-    column: DeltaGenerator, title: str, entity: t.Optional[Application]
-) -> None:
-    """Renders dataframe within a column
-
-    Loaded entity information is collected
-    differently, which is why there are two
-    building functions.
-
-    :param column: Column the dataframe will be rendered in
-    :type column: DeltaGenerator
-    :param title: Title of the dataframe
-    :type title: str
-    :param entity: Application to get loaded entities from
-    :type entity: Application
-    """
-    with column:
-        render_dataframe(
-            title=title,
-            dataframe=pd.DataFrame(
-                entity.loaded_entities
-                if entity is not None
-                else {"Name": [], "Type": [], "Backend": [], "Device": []}
-            ),
-        )
-
-
 def render_dataframe(dataframe: pd.DataFrame, title: t.Optional[str] = None) -> None:
     """Renders dataframe with optional titles
 
@@ -216,3 +198,112 @@ def shard_log_spacing() -> None:
     st.write("")
     st.write("")
     st.write("")
+
+
+def remembered_selectbox(
+    label: str,
+    options: t.Iterable[_T],
+    format_func: t.Callable[[_T], str],
+    key: str,
+) -> t.Optional[_T]:
+    """Renders a selectbox that keeps its selection across manifest reloads
+
+    Streamlit resets a selectbox when its options change, so the label of
+    the selected option is kept in the session state and used to select
+    the same option again after the manifest has been reloaded.
+
+    :param label: Label of the selectbox
+    :type label: str
+    :param options: Options to select from
+    :type options: Iterable[_T]
+    :param format_func: Function to get the label of an option
+    :type format_func: Callable[[_T], str]
+    :param key: Session state key the selection is remembered under
+    :type key: str
+    :return: Selected option
+    :rtype: Optional[_T]
+    """
+    options = list(options)
+    labels = [format_func(option) for option in options]
+    remembered = st.session_state.get(f"{key}_selection")
+    index = labels.index(remembered) if remembered in labels else 0
+
+    selected: t.Optional[_T] = st.selectbox(
+        label, options, index=index, format_func=format_func
+    )
+    if selected is not None:
+        st.session_state[f"{key}_selection"] = format_func(selected)
+
+    return selected
+
+
+def window_picker(key: str) -> t.Optional[int]:
+    """Renders a selectbox of how many minutes of the newest telemetry to
+    chart in full, with the rest of the run downsampled
+
+    :param key: Widget key of the selectbox
+    :type key: str
+    :return: Selected minutes, None to chart the whole run alike
+    :rtype: Optional[int]
+    """
+    minutes: t.Optional[int] = st.selectbox(
+        "Chart in full:",
+        CHART_WINDOWS,
+        format_func=lambda value: "Whole run" if value is None else f"Last {value} min",
+        key=key,
+    )
+    return minutes
+
+
+def heatmap_columns(count: int) -> int:
+    """Get the number of cells in each row of a status heatmap
+
+    Rows hold at least 50 cells and grow with the number of entities
+    so that large heatmaps stay about twice as wide as they are tall.
+
+    :param count: Number of entities in the heatmap
+    :type count: int
+    :return: Cells per row
+    :rtype: int
+    """
+    return max(1, min(count, max(50, math.ceil(math.sqrt(2 * count)))))
+
+
+def status_heatmap(codes: "np.ndarray[t.Any, t.Any]") -> "np.ndarray[t.Any, t.Any]":
+    """Render entity statuses as an RGB image with one cell per entity
+
+    Cells are laid out in entity order, heatmap_columns(len(codes)) per
+    row, and colored by a palette lookup of the status codes of a
+    StatusScanner.
+
+    :param codes: Status codes of the entities
+    :type codes: numpy.ndarray
+    :return: RGB image of shape (height, width, 3)
+    :rtype: numpy.ndarray
+    """
+    columns = heatmap_columns(len(codes))
+    rows = max(1, math.ceil(len(codes) / columns))
+    cells = np.full(rows * columns, len(STATUS_CODES), dtype=np.uint8)
+    cells[: len(codes)] = codes
+    image = _HEATMAP_PALETTE[cells].reshape(rows, columns, 3)
+
+    cell_size = max(1, min(16, HEATMAP_WIDTH // columns))
+    return np.repeat(np.repeat(image, cell_size, axis=0), cell_size, axis=1)
+
+
+def status_legend() -> str:
+    """Get the markdown legend of the status heatmap colors
+
+    :return: Legend
+    :rtype: str
+    """
+    return "  ".join(
+        f":{STATUS_COLORS[status]}[\u25a0 {status.value}]"
+        for status in (
+            StatusEnum.RUNNING,
+            StatusEnum.COMPLETED,
+            StatusEnum.FAILED,
+            StatusEnum.UNKNOWN,
+            StatusEnum.MALFORMED,
+        )
+    )
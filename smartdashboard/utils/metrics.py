@@ -0,0 +1,422 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import math
+import pathlib
+import sys
+import threading
+import time
+import typing as t
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from smartdashboard.schemas.shard import Shard
+
+from .errors import SSDashboardError
+from .ManifestLoader import ManifestLoader
+from .ManifestReader import Manifest, get_manifest_path
+from .status import StatusEnum
+from .StatusReader import get_orchestrator_status, get_status_scanner, status_mapping
+from .storage import use_experiment_storage
+from .TelemetryReader import TelemetryTailer, read_latest_snapshot
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the Prometheus text exposition format"""
+
+_SHARD_METRICS = (
+    (
+        "memory_file",
+        "used_memory",
+        "smartdashboard_shard_used_memory_bytes",
+        "Memory used by the shard",
+    ),
+    (
+        "memory_file",
+        "used_memory_peak",
+        "smartdashboard_shard_used_memory_peak_bytes",
+        "Peak memory used by the shard",
+    ),
+    (
+        "memory_file",
+        "total_system_memory",
+        "smartdashboard_shard_total_system_memory_bytes",
+        "Memory of the system hosting the shard",
+    ),
+    (
+        "client_count_file",
+        "num_clients",
+        "smartdashboard_shard_clients",
+        "Clients connected to the shard",
+    ),
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class MetricFamily:
+    """Samples of one metric in the Prometheus text exposition format"""
+
+    def __init__(self, name: str, description: str, kind: str = "gauge") -> None:
+        """Initialize a MetricFamily
+
+        :param name: Name of the metric
+        :type name: str
+        :param description: Help text of the metric
+        :type description: str
+        :param kind: Prometheus type of the metric
+        :type kind: str
+        """
+        self.name = name
+        self.description = description
+        self.kind = kind
+        self.samples: t.List[t.Tuple[t.Dict[str, str], float]] = []
+
+    def add(self, value: float, **labels: str) -> None:
+        """Add a sample to the metric
+
+        :param value: Value of the sample
+        :type value: float
+        :param labels: Labels of the sample
+        :type labels: str
+        """
+        self.samples.append((labels, value))
+
+    def render(self) -> str:
+        """Render the metric in the text exposition format
+
+        :return: HELP and TYPE lines followed by one line per sample
+        :rtype: str
+        """
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for labels, value in self.samples:
+            label_str = ",".join(
+                f'{key}="{_escape(val)}"' for key, val in labels.items()
+            )
+            label_str = f"{{{label_str}}}" if label_str else ""
+            lines.append(f"{self.name}{label_str} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsPoller:
+    """Collects the metrics of an experiment on a background thread
+
+    Telemetry files are tailed so each poll only parses the rows written
+    since the previous one, and the first poll of a file only parses its
+    latest row. Each poll renders the exposition once and
+    publishes it by replacing a reference, so scrapes only copy the last
+    rendering and their cost does not depend on how often they happen.
+    """
+
+    def __init__(self, loader: ManifestLoader, interval: float = 5.0) -> None:
+        """Initialize a MetricsPoller
+
+        :param loader: Loader publishing the manifest of the experiment
+        :type loader: ManifestLoader
+        :param interval: Seconds between polls
+        :type interval: float
+        """
+        self.loader = loader
+        self.interval = interval
+        self.polls = 0
+        self._tailers: t.Dict[str, TelemetryTailer] = {}
+        self._latest: t.Dict[str, t.Dict[str, float]] = {}
+        self._body = b""
+        self._stop_event = threading.Event()
+        self._thread: t.Optional[threading.Thread] = None
+
+    @property
+    def body(self) -> bytes:
+        """Get the metrics collected by the last poll
+
+        :return: Metrics in the Prometheus text exposition format
+        :rtype: bytes
+        """
+        return self._body
+
+    def _latest_row(self, file_path: str) -> t.Optional[t.Dict[str, float]]:
+        tailer = self._tailers.get(file_path)
+        try:
+            rows = tailer.read() if tailer is not None else self._start(file_path)
+        except FileNotFoundError:
+            return self._latest.get(file_path)
+
+        if rows is not None and not rows.empty:
+            self._latest[file_path] = {
+                str(column): float(value) for column, value in rows.iloc[-1].items()
+            }
+        return self._latest.get(file_path)
+
+    def _start(self, file_path: str) -> t.Optional[pd.DataFrame]:
+        # a long run holds many rows, so the first poll only parses the
+        # latest one and later polls tail the file from its end. Rows
+        # appended after the tailer skips are read again by the next poll.
+        tailer = TelemetryTailer(file_path)
+        if not tailer.skip():
+            return None
+        rows = read_latest_snapshot(file_path)
+        self._tailers[file_path] = tailer
+        return rows
+
+    def _collect_shard(
+        self,
+        families: t.Dict[str, MetricFamily],
+        shard: Shard,
+        labels: t.Dict[str, str],
+    ) -> t.Set[str]:
+        files = set()
+        for attr, column, name, _ in _SHARD_METRICS:
+            file_path = getattr(shard, attr)
+            if not file_path:
+                continue
+            files.add(file_path)
+            row = self._latest_row(file_path)
+            if row is None or column not in row:
+                continue
+            families[name].add(row[column], **labels)
+            if attr == "memory_file" and column == "used_memory":
+                families["smartdashboard_shard_telemetry_timestamp_seconds"].add(
+                    row["timestamp"] / 1000, **labels
+                )
+        return files
+
+    def collect(self, manifest: Manifest) -> t.List[MetricFamily]:
+        """Collect the status counts and shard telemetry of an experiment
+
+        :param manifest: Manifest of the experiment
+        :type manifest: Manifest
+        :return: Collected metrics
+        :rtype: List[MetricFamily]
+        """
+        entities = MetricFamily(
+            "smartdashboard_entities", "Entities of the experiment by status"
+        )
+        orchestrators = MetricFamily(
+            "smartdashboard_orchestrator_status",
+            "Overall orchestrator status, 1 for the current status",
+        )
+        families = {
+            name: MetricFamily(name, description)
+            for _, _, name, description in _SHARD_METRICS
+        }
+        families["smartdashboard_shard_telemetry_timestamp_seconds"] = MetricFamily(
+            "smartdashboard_shard_telemetry_timestamp_seconds",
+            "Time of the latest memory sample of the shard",
+        )
+
+        def add_counts(
+            counts: t.Dict[StatusEnum, int], kind: str, run_id: str, name: str
+        ) -> None:
+            for status, count in counts.items():
+                entities.add(
+                    count, kind=kind, run_id=run_id, name=name, status=status.value
+                )
+
+        for run in manifest.runs:
+            add_counts(status_mapping(run.model), "application", run.run_id, "")
+
+        for ens_ctx in manifest.ensemble_with_run_ctx:
+            scanner = get_status_scanner(ens_ctx.entity.models)
+            scanner.scan()
+            add_counts(
+                scanner.counts(), "ensemble_member", ens_ctx.run_id, ens_ctx.entity.name
+            )
+
+        tailed: t.Set[str] = set()
+        for orc_ctx in manifest.orcs_with_run_ctx:
+            orc = orc_ctx.entity
+            scanner = get_status_scanner(orc.shards)
+            scanner.scan()
+            counts = scanner.counts()
+            add_counts(counts, "shard", orc_ctx.run_id, orc.name)
+
+            current = get_orchestrator_status(counts)
+            for status in (
+                StatusEnum.RUNNING,
+                StatusEnum.UNSTABLE,
+                StatusEnum.INACTIVE,
+                StatusEnum.UNKNOWN,
+                StatusEnum.MALFORMED,
+            ):
+                orchestrators.add(
+                    float(status == current),
+                    run_id=orc_ctx.run_id,
+                    name=orc.name,
+                    status=status.value,
+                )
+
+            for shard in orc.shards:
+                labels = {
+                    "run_id": orc_ctx.run_id,
+                    "orchestrator": orc.name,
+                    "shard": shard.name,
+                }
+                tailed |= self._collect_shard(families, shard, labels)
+
+        # files that left the manifest are no longer tailed
+        for file_path in set(self._tailers) - tailed:
+            del self._tailers[file_path]
+            self._latest.pop(file_path, None)
+
+        return [entities, orchestrators, *families.values()]
+
+    def poll(self) -> None:
+        """Collect the metrics and publish their rendering"""
+        start = time.perf_counter()
+        families = self.collect(self.loader.snapshot.manifest)
+        self.polls += 1
+
+        duration = MetricFamily(
+            "smartdashboard_poll_duration_seconds", "Duration of the last poll"
+        )
+        duration.add(time.perf_counter() - start)
+        polls = MetricFamily(
+            "smartdashboard_polls_total", "Number of completed polls", "counter"
+        )
+        polls.add(self.polls)
+
+        rendered = "".join(family.render() for family in (*families, duration, polls))
+        self._body = rendered.encode()
+
+    def start(self) -> None:
+        """Poll once, then keep polling on a daemon thread"""
+        if self._thread is not None:
+            return
+
+        self.poll()
+        self._thread = threading.Thread(
+            target=self._run, name="smartdashboard-metrics-poller", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.warning("Collecting metrics failed", exc_info=True)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    server: "MetricsServer"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        if self.path.split("?", 1)[0].rstrip("/") != "/metrics":
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        body = self.server.poller.body
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: t.Any) -> None:
+        # pylint: disable-next=redefined-builtin
+        logger.debug(format, *args)
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """HTTP server exposing the metrics published by a poller"""
+
+    daemon_threads = True
+
+    def __init__(self, address: t.Tuple[str, int], poller: MetricsPoller) -> None:
+        """Initialize a MetricsServer
+
+        :param address: Host and port to listen on
+        :type address: Tuple[str, int]
+        :param poller: Poller publishing the metrics
+        :type poller: MetricsPoller
+        """
+        super().__init__(address, _MetricsRequestHandler)
+        self.poller = poller
+
+
+def run_metrics(
+    directory: t.Optional[str], host: str, port: int, interval: float
+) -> int:
+    """Serve the metrics of an experiment until interrupted
+
+    :param directory: Experiment directory or archive, the current
+                      directory if None
+    :type directory: Optional[str]
+    :param host: Host to listen on
+    :type host: str
+    :param port: Port to listen on
+    :type port: int
+    :param interval: Seconds between polls
+    :type interval: float
+    :return: Exit code, 1 if the manifest could not be loaded
+    :rtype: int
+    """
+    exp_path = pathlib.Path(directory) if directory is not None else None
+    use_experiment_storage(exp_path)
+    try:
+        loader = ManifestLoader(get_manifest_path(exp_path))
+    except SSDashboardError as ex:
+        print(f"{ex} ({ex.file})", file=sys.stderr)
+        return 1
+
+    loader.start()
+    poller = MetricsPoller(loader, interval)
+    poller.start()
+    server = MetricsServer((host, port), poller)
+    print(f"Serving SmartDashboard metrics on http://{host}:{port}/metrics")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        poller.stop()
+        loader.stop()
+    return 0
@@ -24,8 +24,12 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import pathlib
+
 import streamlit as st
 
+from smartdashboard.utils.ManifestLoader import ManifestLoader
+
 
 def local_css(file_name: str) -> None:
     """Add CSS to the dashboard
@@ -54,3 +58,20 @@ def set_streamlit_page_config() -> None:
         page_title="SmartSim Dashboard",
         page_icon="/app/static/SmartSim.png",
     )
+
+
+@st.cache_resource(show_spinner=False)
+def get_manifest_loader(manifest_path: pathlib.Path) -> ManifestLoader:
+    """Get the background manifest loader for a manifest file
+
+    One loader is shared by every session and page of the dashboard,
+    so the manifest is parsed once per change rather than once per session.
+
+    :param manifest_path: Path to the manifest file
+    :type manifest_path: pathlib.Path
+    :return: Started manifest loader
+    :rtype: ManifestLoader
+    """
+    loader = ManifestLoader(manifest_path)
+    loader.start()
+    return loader
@@ -0,0 +1,363 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import math
+import typing as t
+
+import numpy as np
+import streamlit as st
+
+from smartdashboard.schemas.run import RunContext
+from smartdashboard.schemas.table import EntityTable
+from smartdashboard.utils.cache import SourceCache
+from smartdashboard.utils.helpers import heatmap_columns, remembered_selectbox
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import (
+    ENTITY_STATUSES,
+    STATUS_CODES,
+    StatusData,
+    StatusScanner,
+    get_status_scanner,
+)
+
+_T = t.TypeVar("_T")
+
+PAGE_SIZE = 50
+ALL_STATUSES = "All"
+
+
+class EntityIndex(t.Generic[_T]):
+    """Prebuilt name index of the entities offered by a picker
+
+    Labels are case folded once when the index is built, so searching
+    only scans the folded labels and never touches the entities. Statuses
+    are read by a StatusScanner, so filtering compares status codes and
+    finished entities are not read again. Indexes of ensemble members and
+    shards use the scanner shared with the views of those entities.
+    """
+
+    def __init__(
+        self,
+        options: t.Sequence[_T],
+        labels: t.Sequence[str],
+        scanner: t.Optional[StatusScanner] = None,
+    ) -> None:
+        """Initialize an EntityIndex
+
+        :param options: Entities that can be picked
+        :type options: Sequence[_T]
+        :param labels: Label of each entity
+        :type labels: Sequence[str]
+        :param scanner: Scanner of the entity statuses, None to not
+                        filter the entities by status
+        :type scanner: Optional[StatusScanner]
+        """
+        self.options = options
+        self.labels = labels
+        self.scanner = scanner
+        self._folded = [label.casefold() for label in labels]
+        self._positions = {label: position for position, label in enumerate(labels)}
+
+    @staticmethod
+    def for_entities(entities: t.Sequence[t.Any]) -> "EntityIndex[t.Any]":
+        """Build an index of applications, ensemble members or shards
+        labelled by their names
+
+        :param entities: Entities to index
+        :type entities: Sequence[Any]
+        :return: Index of the entities
+        :rtype: EntityIndex
+        """
+        names = (
+            entities.names
+            if isinstance(entities, EntityTable)
+            else [entity.name for entity in entities]
+        )
+        return EntityIndex(entities, names, get_status_scanner(entities))
+
+    @staticmethod
+    def for_run_contexts(
+        contexts: t.Iterable[RunContext[t.Any]],
+    ) -> "EntityIndex[RunContext[t.Any]]":
+        """Build an index of entities within their runs labelled
+        by their names and run ids
+
+        :param contexts: Entities with their run contexts
+        :type contexts: Iterable[RunContext]
+        :return: Index of the entities
+        :rtype: EntityIndex[RunContext]
+        """
+        options = tuple(contexts)
+        labels = [f"{context.entity.name}: Run {context.run_id}" for context in options]
+        status_dirs = [
+            getattr(context.entity, "telemetry_metadata", {}).get("status_dir")
+            for context in options
+        ]
+        return EntityIndex(options, labels, StatusScanner(status_dirs))
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def position(self, label: t.Optional[str]) -> t.Optional[int]:
+        """Get the position of the entity with a label
+
+        :param label: Label of the entity
+        :type label: Optional[str]
+        :return: Position of the entity or None if no entity has the label
+        :rtype: Optional[int]
+        """
+        return self._positions.get(label) if label is not None else None
+
+    def search(self, query: str) -> t.List[int]:
+        """Get the positions of the entities whose labels contain a query
+
+        Exact matches are ranked first, followed by labels starting with
+        the query and then labels containing it. Entities keep their
+        manifest order within each rank.
+
+        :param query: Text to search for, ignoring case
+        :type query: str
+        :return: Positions of the matching entities
+        :rtype: List[int]
+        """
+        query = query.strip().casefold()
+        if not query:
+            return list(range(len(self)))
+
+        exact: t.List[int] = []
+        prefix: t.List[int] = []
+        contains: t.List[int] = []
+        for position, label in enumerate(self._folded):
+            found = label.find(query)
+            if found < 0:
+                continue
+            if found == 0:
+                (exact if len(label) == len(query) else prefix).append(position)
+            else:
+                contains.append(position)
+        return exact + prefix + contains
+
+    def status(self, position: int) -> StatusData:
+        """Get the status of an indexed entity
+
+        :param position: Position of the entity
+        :type position: int
+        :return: Status enum and return code, MALFORMED if the
+                 entity does not record a status directory
+        :rtype: StatusData
+        """
+        if self.scanner is None:
+            return StatusData(StatusEnum.MALFORMED, None)
+        self.scanner.scan()
+        return self.scanner.status(position)
+
+    def filter_status(
+        self, positions: t.Iterable[int], status: StatusEnum
+    ) -> t.List[int]:
+        """Keep the entities that have a status
+
+        :param positions: Positions of the entities to filter
+        :type positions: Iterable[int]
+        :param status: Status to keep
+        :type status: StatusEnum
+        :return: Positions of the entities with the status
+        :rtype: List[int]
+        """
+        if self.scanner is None:
+            return list(positions) if status == StatusEnum.MALFORMED else []
+
+        selected = np.fromiter(positions, dtype=np.intp)
+        self.scanner.scan()
+        codes = self.scanner.codes[selected]
+        return t.cast(
+            t.List[int], selected[codes == STATUS_CODES.index(status)].tolist()
+        )
+
+
+_indexes: SourceCache[EntityIndex[t.Any]] = SourceCache()
+
+
+def cached_index(
+    key: str, source: object, build: t.Callable[[], EntityIndex[_T]]
+) -> EntityIndex[_T]:
+    """Get the index built for a picker and source, building it on first use
+
+    Indexes are shared by every session and kept for the most recently
+    used sources. The source is the object the indexed entities come
+    from, so an index is rebuilt when a new manifest is loaded.
+
+    :param key: Key of the picker the index is built for
+    :type key: str
+    :param source: Object the indexed entities come from
+    :type source: object
+    :param build: Function building the index
+    :type build: Callable[[], EntityIndex[_T]]
+    :return: Index of the entities
+    :rtype: EntityIndex[_T]
+    """
+    return t.cast(EntityIndex[_T], _indexes.get(key, source, build))
+
+
+def entity_picker(
+    label: str,
+    index: EntityIndex[_T],
+    key: str,
+    page_size: int = PAGE_SIZE,
+) -> t.Optional[_T]:
+    """Renders a searchable, paginated picker of indexed entities
+
+    Short lists are rendered as a plain selectbox. Longer lists get a
+    search box and a status filter, and only one page of the matching
+    entities is sent to the browser.
+
+    :param label: Label of the picker
+    :type label: str
+    :param index: Index of the entities to pick from
+    :type index: EntityIndex[_T]
+    :param key: Session state key the picker state is kept under
+    :type key: str
+    :param page_size: Number of entities offered at once
+    :type page_size: int
+    :return: Selected entity
+    :rtype: Optional[_T]
+    """
+    labels = index.labels
+    if len(index) <= page_size:
+        position = remembered_selectbox(
+            label, range(len(index)), format_func=labels.__getitem__, key=key
+        )
+        return index.options[position] if position is not None else None
+
+    search_col, status_col = st.columns([3, 2])
+    with search_col:
+        query = st.text_input(
+            "Search:", key=f"{key}_query", placeholder=f"{len(index)} entities"
+        )
+    matches = index.search(query)
+
+    if index.scanner is not None:
+        with status_col:
+            status = st.selectbox(
+                "Status:",
+                [ALL_STATUSES] + [status.value for status in ENTITY_STATUSES],
+                key=f"{key}_status",
+            )
+        if status is not None and status != ALL_STATUSES:
+            matches = index.filter_status(matches, StatusEnum(status))
+
+    if not matches:
+        st.caption("No matches found.")
+        return None
+
+    page_count = math.ceil(len(matches) / page_size)
+    selected = index.position(st.session_state.get(f"{key}_selection"))
+    page = selected_page = (
+        matches.index(selected) // page_size + 1
+        if selected is not None and selected in matches
+        else 1
+    )
+    if page_count > 1:
+        page = int(
+            st.number_input(
+                f"Page (of {page_count}):",
+                min_value=1,
+                max_value=page_count,
+                value=selected_page,
+                step=1,
+            )
+        )
+
+    start = (page - 1) * page_size
+    page_matches = matches[start : start + page_size]
+    st.caption(
+        f"Showing {start + 1}-{start + len(page_matches)} of {len(matches)} matches"
+    )
+
+    position = remembered_selectbox(
+        label, page_matches, format_func=labels.__getitem__, key=key
+    )
+    return index.options[position] if position is not None else None
+
+
+def heatmap_cell_selector(
+    labels: t.Sequence[str],
+    key: str,
+    scanner: t.Optional[StatusScanner] = None,
+) -> None:
+    """Renders inputs that select the entity of a status heatmap cell
+
+    The selection is stored as the remembered selection of the picker
+    with the same key, which must be rendered after the selector. The
+    status and return code of the chosen cell are shown below the inputs.
+
+    :param labels: Picker labels of the entities in the heatmap
+    :type labels: Sequence[str]
+    :param key: Session state key of the picker
+    :type key: str
+    :param scanner: Status scanner of the entities in the heatmap
+    :type scanner: Optional[StatusScanner]
+    """
+    if not labels:
+        return
+
+    columns = heatmap_columns(len(labels))
+    rows = math.ceil(len(labels) / columns)
+    col1, col2, col3 = st.columns([3, 3, 2])
+    with col1:
+        row = st.number_input(
+            f"Row (0-{rows - 1}):",
+            min_value=0,
+            max_value=rows - 1,
+            step=1,
+            key=f"{key}_heatmap_row",
+        )
+    with col2:
+        column = st.number_input(
+            f"Column (0-{columns - 1}):",
+            min_value=0,
+            max_value=columns - 1,
+            step=1,
+            key=f"{key}_heatmap_column",
+        )
+    with col3:
+        st.write("")
+        st.write("")
+        selected = st.button("Select cell", key=f"{key}_heatmap_select")
+
+    position = int(row) * columns + int(column)
+    if scanner is not None and position < len(scanner):
+        scanner.scan()
+        status = scanner.status(position)
+        return_code = "-" if status.return_code is None else status.return_code
+        st.caption(
+            f"{labels[position]}: {status.status.value}, return code {return_code}"
+        )
+
+    if selected and position < len(labels):
+        st.session_state[f"{key}_selection"] = labels[position]
+        # make sure the picker offers the selected entity
+        st.session_state[f"{key}_query"] = ""
+        st.session_state[f"{key}_status"] = ALL_STATUSES
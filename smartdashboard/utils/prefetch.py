@@ -0,0 +1,222 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import queue
+import threading
+import typing as t
+
+from smartdashboard.schemas.application import Application
+from smartdashboard.schemas.shard import Shard
+from smartdashboard.utils.config_tables import get_application_tables
+from smartdashboard.utils.LogReader import get_logs
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import get_entity_status
+
+logger = logging.getLogger(__name__)
+
+MAX_PENDING = 64
+"""Number of prefetch tasks that can wait before new ones are dropped"""
+
+
+class Prefetcher:
+    """Runs cache warming tasks on a background thread
+
+    Tasks are identified by a key, so an entity that is already waiting
+    to be prefetched is not queued again. Tasks are best effort: when
+    the queue is full new tasks are dropped, and failures are logged
+    and otherwise ignored.
+    """
+
+    def __init__(self, max_pending: int = MAX_PENDING) -> None:
+        """Initialize a Prefetcher
+
+        :param max_pending: Number of tasks that can wait to run
+        :type max_pending: int
+        """
+        self.max_pending = max_pending
+        self._queue: "queue.Queue[t.Tuple[t.Hashable, t.Callable[[], None]]]" = (
+            queue.Queue()
+        )
+        self._pending: t.Set[t.Hashable] = set()
+        self._lock = threading.Lock()
+        self._thread: t.Optional[threading.Thread] = None
+
+    def submit(self, key: t.Hashable, task: t.Callable[[], None]) -> bool:
+        """Queue a task unless a task with the same key is waiting
+
+        :param key: Key identifying the task
+        :type key: Hashable
+        :param task: Task warming the caches
+        :type task: Callable[[], None]
+        :return: True if the task was queued
+        :rtype: bool
+        """
+        with self._lock:
+            if key in self._pending or len(self._pending) >= self.max_pending:
+                return False
+            self._pending.add(key)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="smartdashboard-prefetch", daemon=True
+                )
+                self._thread.start()
+
+        self._queue.put((key, task))
+        return True
+
+    def join(self) -> None:
+        """Wait for every queued task to finish"""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            key, task = self._queue.get()
+            try:
+                task()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.debug(f"Prefetching {key} failed", exc_info=True)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                self._queue.task_done()
+
+
+_prefetcher = Prefetcher()
+
+
+def get_prefetcher() -> Prefetcher:
+    """Get the prefetcher shared by every session
+
+    :return: Prefetcher
+    :rtype: Prefetcher
+    """
+    return _prefetcher
+
+
+def neighbors(position: int, count: int, radius: int) -> t.List[int]:
+    """Get the positions around a position, nearest first
+
+    :param position: Position of the selected entity
+    :type position: int
+    :param count: Number of entities
+    :type count: int
+    :param radius: Number of positions to take on each side
+    :type radius: int
+    :return: Positions of the neighboring entities
+    :rtype: List[int]
+    """
+    found = []
+    for distance in range(1, radius + 1):
+        for neighbor in (position + distance, position - distance):
+            if 0 <= neighbor < count:
+                found.append(neighbor)
+    return found
+
+
+def warm_entity(entity: t.Union[Application, Shard]) -> None:
+    """Read the status and logs of a finished entity into their caches
+
+    Only finished statuses and settled logs are cached, so the logs of
+    an entity that has not finished are not read ahead of time.
+
+    :param entity: Application, ensemble member or shard
+    :type entity: Union[Application, Shard]
+    """
+    if get_entity_status(entity).status not in (
+        StatusEnum.COMPLETED,
+        StatusEnum.FAILED,
+    ):
+        return
+    get_logs(entity.out_file)
+    get_logs(entity.err_file)
+
+
+def prefetch_members(
+    version: str,
+    run_id: str,
+    ensemble_name: str,
+    members: t.Sequence[Application],
+    position: int,
+    *,
+    radius: int = 1,
+) -> None:
+    """Prefetch the ensemble members next to the selected member
+
+    The configuration tables of every neighbor are cached until the
+    manifest changes, while logs are only prefetched for finished members.
+
+    :param version: Version of the manifest of the ensemble
+    :type version: str
+    :param run_id: Id of the run of the ensemble
+    :type run_id: str
+    :param ensemble_name: Name of the ensemble
+    :type ensemble_name: str
+    :param members: Members of the ensemble
+    :type members: Sequence[Application]
+    :param position: Position of the selected member
+    :type position: int
+    :param radius: Number of members to prefetch on each side
+    :type radius: int
+    """
+    for neighbor in neighbors(position, len(members), radius):
+
+        def warm_member(neighbor: int = neighbor) -> None:
+            member = members[neighbor]
+            warm_entity(member)
+            get_application_tables(
+                version, run_id, f"{ensemble_name}/{member.name}", member
+            )
+
+        get_prefetcher().submit(
+            ("member", version, run_id, ensemble_name, neighbor), warm_member
+        )
+
+
+def prefetch_shards(
+    shards: t.Sequence[Shard],
+    position: int,
+    *,
+    radius: int = 8,
+) -> None:
+    """Prefetch the shards of an orchestrator next to the selected shard
+
+    Only the logs of finished shards are prefetched, see warm_entity.
+
+    :param shards: Shards of the orchestrator
+    :type shards: Sequence[Shard]
+    :param position: Position of the selected shard
+    :type position: int
+    :param radius: Number of shards to prefetch on each side
+    :type radius: int
+    """
+    for neighbor in neighbors(position, len(shards), radius):
+        shard = shards[neighbor]
+
+        def warm_shard(shard: Shard = shard) -> None:
+            warm_entity(shard)
+
+        get_prefetcher().submit(("shard", shard.out_file, shard.err_file), warm_shard)
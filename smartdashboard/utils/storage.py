@@ -0,0 +1,431 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import functools
+import io
+import os
+import pathlib
+import tarfile
+import threading
+import time
+import typing as t
+import zipfile
+from abc import ABC, abstractmethod
+
+from smartdashboard.utils.cache import LRUCache
+
+ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".zip")
+RESOLVED_PATHS = 4096
+
+
+class Storage(ABC):
+    """Base class for the file systems that experiment files are read from"""
+
+    @abstractmethod
+    def exists(self, path: str) -> bool:
+        """Abstract method to check if a file exists
+
+        :param path: Path of the file
+        :type path: str
+        :return: If the file exists
+        :rtype: bool
+        """
+
+    @abstractmethod
+    def getmtime(self, path: str) -> float:
+        """Abstract method to get the modification time of a file
+
+        :param path: Path of the file
+        :type path: str
+        :return: Modification time in seconds since the epoch
+        :rtype: float
+        :raises FileNotFoundError: If the file does not exist
+        """
+
+    @abstractmethod
+    def open_binary(self, path: str) -> t.BinaryIO:
+        """Abstract method to open a file for binary reading
+
+        :param path: Path of the file
+        :type path: str
+        :return: Binary stream of the file contents
+        :rtype: BinaryIO
+        :raises FileNotFoundError: If the file does not exist
+        """
+
+    def read_bytes(self, path: str) -> bytes:
+        """Read the contents of a file
+
+        :param path: Path of the file
+        :type path: str
+        :return: File contents
+        :rtype: bytes
+        :raises FileNotFoundError: If the file does not exist
+        """
+        with self.open_binary(path) as file:
+            return file.read()
+
+
+class LocalStorage(Storage):
+    """Storage backed by the local file system"""
+
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def getmtime(self, path: str) -> float:
+        return os.path.getmtime(path)
+
+    def open_binary(self, path: str) -> t.BinaryIO:
+        return open(path, "rb")
+
+
+class _MemberReader(io.RawIOBase):
+    """Seekable, read-only window over one member of an uncompressed archive
+
+    Reads use positioned reads on the shared archive file descriptor, so any
+    number of members can be read concurrently without seeking a shared file
+    object.
+    """
+
+    def __init__(self, fileno: int, offset: int, size: int) -> None:
+        super().__init__()
+        self._fileno = fileno
+        self._offset = offset
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._position = min(max(offset, 0), self._size)
+        return self._position
+
+    def readinto(self, buffer: t.Any) -> int:
+        count = min(len(buffer), self._size - self._position)
+        if count <= 0:
+            return 0
+        data = os.pread(self._fileno, count, self._offset + self._position)
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+class _CompressedMemberReader(io.BufferedReader):
+    """Streaming reader over one member of a compressed tar archive
+
+    Each reader decompresses through its own handle on the archive, so
+    members are never held in memory and readers do not share a stream.
+    """
+
+    def __init__(self, archive_path: pathlib.Path, info: tarfile.TarInfo) -> None:
+        # the handle lives as long as the reader and is closed with it
+        # pylint: disable-next=consider-using-with
+        self._tar = tarfile.open(archive_path, "r:*")
+        extracted = self._tar.extractfile(info)
+        if extracted is None:
+            self._tar.close()
+            raise FileNotFoundError(info.name)
+        # the tarfile reader closes its raw stream when it is collected
+        self._extracted = t.cast(io.BufferedReader, extracted)
+        super().__init__(self._extracted.raw)
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._tar.close()
+
+
+class ArchiveStorage(Storage):
+    """Base class for Storage backed by an experiment archive
+
+    Paths recorded in the manifest are absolute paths on the system that ran
+    the experiment. They are matched to archive members by their longest
+    suffix that starts at an experiment directory, so an archive of the
+    experiment directory can be read wherever it is copied. Archives holding
+    the contents of the experiment directory rather than the directory are
+    expected to be named after it. Paths below the archive path itself are
+    relative to the experiment directory within the archive. Other paths that
+    do not name a member are read from the local file system.
+    """
+
+    def __init__(self, archive_path: pathlib.Path) -> None:
+        """Initialize an ArchiveStorage
+
+        :param archive_path: Path to the archive
+        :type archive_path: pathlib.Path
+        """
+        self.archive_path = archive_path.resolve()
+        self._local = LocalStorage()
+        self._resolved: LRUCache[t.Tuple[bool, t.Optional[str]]] = LRUCache(
+            RESOLVED_PATHS
+        )
+
+    @property
+    @abstractmethod
+    def members(self) -> t.Collection[str]:
+        """Abstract property with the normalized names of the archive members"""
+
+    @abstractmethod
+    def _member_mtime(self, member: str) -> float:
+        """Abstract method to get the modification time of a member"""
+
+    @abstractmethod
+    def _open_member(self, member: str) -> t.BinaryIO:
+        """Abstract method to open a member for binary reading"""
+
+    @functools.cached_property
+    def experiment_roots(self) -> t.List[str]:
+        """Get the directories within the archive that hold an experiment
+
+        :return: Experiment directories, shortest first
+        :rtype: List[str]
+        """
+        roots = {
+            member.partition(".smartsim/")[0].rstrip("/")
+            for member in self.members
+            if member.startswith(".smartsim/") or "/.smartsim/" in member
+        }
+        return sorted(roots, key=len)
+
+    def _resolve(self, path: str) -> t.Tuple[bool, t.Optional[str]]:
+        """Get the archive member that a path refers to
+
+        :param path: Path of the file
+        :type path: str
+        :return: If the path is below the archive path, and the name of
+                 the member or None if no member matches the path
+        :rtype: Tuple[bool, Optional[str]]
+        """
+        return self._resolved.get(path, lambda: self._match(path))
+
+    def _match(self, path: str) -> t.Tuple[bool, t.Optional[str]]:
+        parts = pathlib.PurePath(os.path.normpath(path)).parts if path else ()
+        archive_parts = self.archive_path.parts
+        in_archive = parts[: len(archive_parts)] == archive_parts
+
+        candidates: t.List[str] = []
+        if in_archive:
+            relative = "/".join(parts[len(archive_parts) :])
+            candidates.append(relative)
+            candidates.extend(
+                f"{root}/{relative}" for root in self.experiment_roots if root
+            )
+        else:
+            # the suffix must cover the whole path below an experiment
+            # directory, never just the trailing names
+            for start in range(1, len(parts)):
+                relative = "/".join(parts[start:])
+                for root, root_parts in self._root_parts:
+                    if parts[max(start - len(root_parts), 0) : start] == root_parts:
+                        candidates.append(f"{root}/{relative}" if root else relative)
+
+        member = next((name for name in candidates if name in self.members), None)
+        return in_archive, member
+
+    @functools.cached_property
+    def _root_parts(self) -> t.List[t.Tuple[str, t.Tuple[str, ...]]]:
+        """Get the experiment directories with the trailing path components
+        that name them on the system that ran the experiment
+        """
+        stem = self.archive_path.name
+        for suffix in ARCHIVE_SUFFIXES:
+            stem = stem.removesuffix(suffix)
+        return [
+            (root, tuple(root.split("/")) if root else (stem,))
+            for root in self.experiment_roots
+        ]
+
+    def exists(self, path: str) -> bool:
+        in_archive, member = self._resolve(path)
+        if member is not None:
+            return True
+        return not in_archive and self._local.exists(path)
+
+    def getmtime(self, path: str) -> float:
+        in_archive, member = self._resolve(path)
+        if member is not None:
+            return self._member_mtime(member)
+        if in_archive:
+            raise FileNotFoundError(path)
+        return self._local.getmtime(path)
+
+    def open_binary(self, path: str) -> t.BinaryIO:
+        in_archive, member = self._resolve(path)
+        if member is not None:
+            return self._open_member(member)
+        if in_archive:
+            raise FileNotFoundError(path)
+        return self._local.open_binary(path)
+
+
+def _normalize_member(name: str) -> str:
+    return "/".join(part for part in name.split("/") if part not in ("", "."))
+
+
+class TarStorage(ArchiveStorage):
+    """Storage backed by a tar archive
+
+    The member index is built from the tar headers alone. Members of
+    uncompressed archives are read in place with positioned reads; members
+    of compressed archives are streamed through their own decompressor.
+    """
+
+    def __init__(self, archive_path: pathlib.Path) -> None:
+        super().__init__(archive_path)
+        # the index is read once and the archive stays open with the storage
+        # pylint: disable-next=consider-using-with
+        self._tar = tarfile.open(self.archive_path, "r:*")
+        self._index = {
+            _normalize_member(info.name): info
+            for info in self._tar
+            if info.isfile() and not info.sparse
+        }
+        # release the header list, the index keeps what is needed
+        setattr(self._tar, "members", [])
+        self._fileobj = t.cast(t.BinaryIO, getattr(self._tar, "fileobj"))
+        self._uncompressed = isinstance(self._fileobj, io.BufferedReader)
+
+    @property
+    def members(self) -> t.Collection[str]:
+        return self._index.keys()
+
+    def _member_mtime(self, member: str) -> float:
+        return float(self._index[member].mtime)
+
+    def _open_member(self, member: str) -> t.BinaryIO:
+        info = self._index[member]
+        if self._uncompressed:
+            reader = _MemberReader(self._fileobj.fileno(), info.offset_data, info.size)
+            return t.cast(t.BinaryIO, io.BufferedReader(reader))
+
+        return _CompressedMemberReader(self.archive_path, info)
+
+
+class ZipStorage(ArchiveStorage):
+    """Storage backed by a zip archive
+
+    The member index is read from the central directory at the end of the
+    archive, so opening does not scan the member data.
+    """
+
+    def __init__(self, archive_path: pathlib.Path) -> None:
+        super().__init__(archive_path)
+        # the central directory is read once and the archive stays open with
+        # the storage
+        # pylint: disable-next=consider-using-with
+        self._zip = zipfile.ZipFile(self.archive_path)
+        self._index = {
+            _normalize_member(info.filename): info
+            for info in self._zip.infolist()
+            if not info.is_dir()
+        }
+
+    @property
+    def members(self) -> t.Collection[str]:
+        return self._index.keys()
+
+    def _member_mtime(self, member: str) -> float:
+        return time.mktime(self._index[member].date_time + (0, 0, -1))
+
+    def _open_member(self, member: str) -> t.BinaryIO:
+        return t.cast(t.BinaryIO, self._zip.open(self._index[member]))
+
+
+_storage: Storage = LocalStorage()
+_archives: t.Dict[pathlib.Path, ArchiveStorage] = {}
+_archives_lock = threading.Lock()
+
+
+def get_storage() -> Storage:
+    """Get the storage that experiment files are read from
+
+    :return: Active storage
+    :rtype: Storage
+    """
+    return _storage
+
+
+def set_storage(storage: Storage) -> None:
+    """Set the storage that experiment files are read from
+
+    :param storage: Storage to read experiment files from
+    :type storage: Storage
+    """
+    global _storage  # pylint: disable=global-statement
+    _storage = storage
+
+
+def is_archive(path: pathlib.Path) -> bool:
+    """Check if a path is an experiment archive
+
+    :param path: Path to check
+    :type path: pathlib.Path
+    :return: If the path is a tar or zip archive
+    :rtype: bool
+    """
+    return path.is_file() and path.name.endswith(ARCHIVE_SUFFIXES)
+
+
+def open_archive(archive_path: pathlib.Path) -> ArchiveStorage:
+    """Open an experiment archive
+
+    Archives are indexed once per process and reused afterwards.
+
+    :param archive_path: Path to the archive
+    :type archive_path: pathlib.Path
+    :return: Storage serving the archive members
+    :rtype: ArchiveStorage
+    """
+    archive_path = archive_path.resolve()
+    with _archives_lock:
+        if archive_path not in _archives:
+            if archive_path.name.endswith(".zip"):
+                _archives[archive_path] = ZipStorage(archive_path)
+            else:
+                _archives[archive_path] = TarStorage(archive_path)
+        return _archives[archive_path]
+
+
+def use_experiment_storage(directory: t.Optional[pathlib.Path]) -> None:
+    """Read experiment files from an archive if the experiment is archived
+
+    :param directory: Experiment directory or archive passed on the command line
+    :type directory: Optional[pathlib.Path]
+    """
+    if directory is not None and is_archive(directory):
+        set_storage(open_archive(directory))
@@ -0,0 +1,219 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import pathlib
+import sys
+import typing as t
+
+from smartdashboard.schemas.application import Application
+from smartdashboard.schemas.shard import Shard
+from smartdashboard.utils.errors import SSDashboardError
+from smartdashboard.utils.ManifestReader import (
+    Manifest,
+    create_filereader,
+    get_manifest_path,
+)
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import (
+    StatusScanner,
+    get_experiment_status,
+    get_experiment_status_counts,
+    get_orchestrator_status,
+    get_status_scanner,
+)
+from smartdashboard.utils.storage import use_experiment_storage
+
+# The status command runs on login nodes and in cron jobs, so this module
+# must not import streamlit, altair or pandas.
+
+
+def _scan(
+    entities: t.Union[t.Sequence[Application], t.Sequence[Shard]],
+) -> StatusScanner:
+    # the scanners are shared with the dashboard views and every API
+    # request, so finished entities are only read once
+    scanner = get_status_scanner(entities)
+    scanner.scan()
+    return scanner
+
+
+def _count_values(status_counts: t.Dict[StatusEnum, int]) -> t.Dict[str, int]:
+    return {status.value: count for status, count in status_counts.items()}
+
+
+def summarize_manifest(manifest: Manifest) -> t.Dict[str, t.Any]:
+    """Summarize the status of every entity of an experiment
+
+    :param manifest: Manifest of the experiment
+    :type manifest: Manifest
+    :return: JSON serializable summary of the experiment, its applications,
+             ensembles and orchestrators
+    :rtype: Dict[str, Any]
+    """
+    experiment_status = get_experiment_status(manifest.runs)
+    group_counts: t.List[t.Dict[StatusEnum, int]] = []
+
+    applications = []
+    for run in manifest.runs:
+        scanner = _scan(run.model)
+        group_counts.append(scanner.counts())
+        for position, app in enumerate(run.model):
+            status = scanner.status(position)
+            applications.append(
+                {
+                    "run_id": run.run_id,
+                    "name": app.name,
+                    "status": status.status.value,
+                    "return_code": status.return_code,
+                }
+            )
+
+    ensembles = []
+    for ens_ctx in manifest.ensemble_with_run_ctx:
+        counts = _scan(ens_ctx.entity.models).counts()
+        group_counts.append(counts)
+        ensembles.append(
+            {
+                "run_id": ens_ctx.run_id,
+                "name": ens_ctx.entity.name,
+                "members": len(ens_ctx.entity.models),
+                "counts": _count_values(counts),
+            }
+        )
+
+    orchestrators = []
+    for orc_ctx in manifest.orcs_with_run_ctx:
+        counts = _scan(orc_ctx.entity.shards).counts()
+        group_counts.append(counts)
+        orchestrators.append(
+            {
+                "run_id": orc_ctx.run_id,
+                "name": orc_ctx.entity.name,
+                "status": get_orchestrator_status(counts).value,
+                "shards": len(orc_ctx.entity.shards),
+                "counts": _count_values(counts),
+            }
+        )
+
+    totals = get_experiment_status_counts(group_counts)
+    return {
+        "experiment": {
+            "name": manifest.experiment.name,
+            "path": manifest.experiment.path,
+            "launcher": manifest.experiment.launcher,
+            "status": experiment_status.value,
+            "counts": _count_values(totals),
+        },
+        "applications": applications,
+        "ensembles": ensembles,
+        "orchestrators": orchestrators,
+    }
+
+
+def _format_counts(counts: t.Dict[str, int]) -> str:
+    formatted = [f"{count} {status}" for status, count in counts.items() if count]
+    return ", ".join(formatted) or "no entities"
+
+
+def format_summary(summary: t.Dict[str, t.Any]) -> str:
+    """Format an experiment summary as text
+
+    :param summary: Summary built by summarize_manifest
+    :type summary: Dict[str, Any]
+    :return: Human readable summary
+    :rtype: str
+    """
+    experiment = summary["experiment"]
+    lines = [
+        f"Experiment: {experiment['name']}",
+        f"  Path: {experiment['path']}",
+        f"  Status: {experiment['status']} ({_format_counts(experiment['counts'])})",
+    ]
+
+    lines.append("Applications:")
+    for app in summary["applications"]:
+        return_code = app["return_code"]
+        suffix = f" (return code {return_code})" if return_code is not None else ""
+        lines.append(f"  [run {app['run_id']}] {app['name']}: {app['status']}{suffix}")
+    if not summary["applications"]:
+        lines.append("  None")
+
+    lines.append("Ensembles:")
+    for ensemble in summary["ensembles"]:
+        lines.append(
+            f"  [run {ensemble['run_id']}] {ensemble['name']} "
+            f"({ensemble['members']} members): {_format_counts(ensemble['counts'])}"
+        )
+    if not summary["ensembles"]:
+        lines.append("  None")
+
+    lines.append("Orchestrators:")
+    for orc in summary["orchestrators"]:
+        lines.append(
+            f"  [run {orc['run_id']}] {orc['name']} ({orc['shards']} shards): "
+            f"{orc['status']} ({_format_counts(orc['counts'])})"
+        )
+    if not summary["orchestrators"]:
+        lines.append("  None")
+
+    return "\n".join(lines)
+
+
+def run_status(
+    directory: t.Optional[str],
+    as_json: bool = False,
+    stream: t.Optional[t.TextIO] = None,
+) -> int:
+    """Print the status summary of an experiment
+
+    :param directory: Experiment directory or archive, the current
+                      directory if None
+    :type directory: Optional[str]
+    :param as_json: Whether to print the summary as JSON
+    :type as_json: bool
+    :param stream: Stream to print the summary to, stdout if None
+    :type stream: Optional[TextIO]
+    :return: Exit code, 1 if the manifest could not be loaded
+    :rtype: int
+    """
+    stream = stream if stream is not None else sys.stdout
+    exp_path = pathlib.Path(directory) if directory is not None else None
+
+    use_experiment_storage(exp_path)
+    manifest_path = get_manifest_path(exp_path)
+    try:
+        manifest = create_filereader(manifest_path).get_manifest()
+    except SSDashboardError as ex:
+        print(f"{ex} ({ex.file})", file=sys.stderr)
+        return 1
+
+    summary = summarize_manifest(manifest)
+    if as_json:
+        print(json.dumps(summary, indent=2), file=stream)
+    else:
+        print(format_summary(summary), file=stream)
+    return 0
@@ -0,0 +1,327 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import collections
+import functools
+import json
+import os
+import threading
+import time
+import typing as t
+
+_F = t.TypeVar("_F", bound=t.Callable[..., t.Any])
+
+RING_SIZE = 10_000
+"""Number of timed spans kept in the ring buffer"""
+
+
+class Span:
+    """Timed section of a dashboard tick, with the bytes read and file
+    operations performed while it ran, including those of nested spans
+    """
+
+    __slots__ = ("name", "start", "duration", "bytes_read", "file_ops", "thread")
+
+    def __init__(self, name: str, start: float, thread: int) -> None:
+        """Initialize a Span
+
+        :param name: Name of the timed component
+        :type name: str
+        :param start: Start time from time.perf_counter, in seconds
+        :type start: float
+        :param thread: Identifier of the thread running the span
+        :type thread: int
+        """
+        self.name = name
+        self.start = start
+        self.duration = 0.0
+        self.bytes_read = 0
+        self.file_ops = 0
+        self.thread = thread
+
+
+class _Timer:
+    """Context manager timing one span"""
+
+    __slots__ = ("_timings", "_name", "_span")
+
+    def __init__(self, timings: "Timings", name: str) -> None:
+        self._timings = timings
+        self._name = name
+        self._span: t.Optional[Span] = None
+
+    def __enter__(self) -> None:
+        self._span = self._timings._push(self._name)
+
+    def __exit__(self, *_: t.Any) -> None:
+        if self._span is not None:
+            self._timings._pop(self._span)
+
+
+class _NullTimer:
+    """Context manager used while timings are disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_: t.Any) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Timings:
+    """Thread-safe ring buffer of timed spans
+
+    Timings are disabled by default, in which case timing a section only
+    costs a flag check. Spans nest per thread, and the bytes read and file
+    operations of a span are added to its parent when it ends.
+    """
+
+    def __init__(self, maxlen: int = RING_SIZE) -> None:
+        """Initialize a Timings buffer
+
+        :param maxlen: Number of spans to keep
+        :type maxlen: int
+        """
+        self.enabled = False
+        self.maxlen = maxlen
+        self._lock = threading.Lock()
+        self._spans: "collections.deque[Span]" = collections.deque(maxlen=maxlen)
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def _stack(self) -> t.List[Span]:
+        stack: t.Optional[t.List[Span]] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _push(self, name: str) -> t.Optional[Span]:
+        if not self.enabled:
+            return None
+        span = Span(name, time.perf_counter(), threading.get_ident())
+        self._stack().append(span)
+        return span
+
+    def _pop(self, span: Span) -> None:
+        span.duration = time.perf_counter() - span.start
+        stack = self._stack()
+        stack.pop()
+        if stack:
+            stack[-1].bytes_read += span.bytes_read
+            stack[-1].file_ops += span.file_ops
+        with self._lock:
+            self._spans.append(span)
+
+    def timed(self, name: str) -> t.ContextManager[None]:
+        """Time a section of code
+
+        :param name: Name of the timed component
+        :type name: str
+        :return: Context manager timing the section
+        :rtype: ContextManager[None]
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def add_io(self, bytes_read: int = 0, file_ops: int = 1) -> None:
+        """Count reads against the innermost span of this thread
+
+        :param bytes_read: Number of bytes read
+        :type bytes_read: int
+        :param file_ops: Number of file operations
+        :type file_ops: int
+        """
+        if not self.enabled:
+            return
+        stack = self._stack()
+        if stack:
+            stack[-1].bytes_read += bytes_read
+            stack[-1].file_ops += file_ops
+
+    def spans(self) -> t.List[Span]:
+        """Get the recorded spans, oldest first
+
+        :return: Recorded spans
+        :rtype: List[Span]
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Remove every recorded span"""
+        with self._lock:
+            self._spans.clear()
+
+    def summarize(self) -> t.List[t.Dict[str, t.Any]]:
+        """Summarize the recorded spans of each component
+
+        :return: Calls, median, 95th percentile and maximum duration in
+                 milliseconds, and the mean bytes read and file operations
+                 per call of each component, slowest 95th percentile first
+        :rtype: List[Dict[str, Any]]
+        """
+        grouped: t.Dict[str, t.List[Span]] = collections.defaultdict(list)
+        for span in self.spans():
+            grouped[span.name].append(span)
+
+        rows = []
+        for name, spans in grouped.items():
+            durations = sorted(span.duration for span in spans)
+            calls = len(spans)
+            rows.append(
+                {
+                    "component": name,
+                    "calls": calls,
+                    "p50_ms": durations[calls // 2] * 1000,
+                    "p95_ms": durations[min(calls - 1, calls * 95 // 100)] * 1000,
+                    "max_ms": durations[-1] * 1000,
+                    "bytes_per_call": sum(span.bytes_read for span in spans) / calls,
+                    "file_ops_per_call": sum(span.file_ops for span in spans) / calls,
+                }
+            )
+        rows.sort(key=lambda row: t.cast(float, row["p95_ms"]), reverse=True)
+        return rows
+
+    def chrome_trace(self) -> t.Dict[str, t.Any]:
+        """Build a Chrome trace of the recorded spans
+
+        The trace can be opened in chrome://tracing or Perfetto.
+
+        :return: Trace in the Chrome trace event format
+        :rtype: Dict[str, Any]
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": "smartdashboard",
+                "ph": "X",
+                "ts": span.start * 1_000_000,
+                "dur": span.duration * 1_000_000,
+                "pid": pid,
+                "tid": span.thread,
+                "args": {"bytes_read": span.bytes_read, "file_ops": span.file_ops},
+            }
+            for span in self.spans()
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_chrome_trace(self, file_path: str) -> None:
+        """Write a Chrome trace of the recorded spans
+
+        :param file_path: Path of the trace file
+        :type file_path: str
+        """
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.chrome_trace(), file)
+
+
+_timings = Timings()
+
+
+def get_timings() -> Timings:
+    """Get the timings recorded by this process
+
+    :return: Process-wide timings
+    :rtype: Timings
+    """
+    return _timings
+
+
+def timed(name: str) -> t.ContextManager[None]:
+    """Time a section of code in the process-wide timings
+
+    :param name: Name of the timed component
+    :type name: str
+    :return: Context manager timing the section
+    :rtype: ContextManager[None]
+    """
+    return _timings.timed(name)
+
+
+def timed_function(name: t.Optional[str] = None) -> t.Callable[[_F], _F]:
+    """Decorate a function to time each of its calls
+
+    :param name: Name of the timed component, the name of the function
+                 by default
+    :type name: Optional[str]
+    :return: Decorator timing the function
+    :rtype: Callable[[_F], _F]
+    """
+
+    def decorator(func: _F) -> _F:
+        component = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            if not _timings.enabled:
+                return func(*args, **kwargs)
+            with _Timer(_timings, component):
+                return func(*args, **kwargs)
+
+        return t.cast(_F, wrapper)
+
+    return decorator
+
+
+def timed_method(method: _F) -> _F:
+    """Decorate a method to time each of its calls, named after the class
+    of the instance it is called on
+
+    :param method: Method to time
+    :type method: Callable[..., Any]
+    :return: Timed method
+    :rtype: Callable[..., Any]
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Any:
+        if not _timings.enabled:
+            return method(self, *args, **kwargs)
+        with _Timer(_timings, f"{type(self).__name__}.{method.__name__}"):
+            return method(self, *args, **kwargs)
+
+    return t.cast(_F, wrapper)
+
+
+def add_io(bytes_read: int = 0, file_ops: int = 1) -> None:
+    """Count reads against the innermost span of this thread
+
+    :param bytes_read: Number of bytes read
+    :type bytes_read: int
+    :param file_ops: Number of file operations
+    :type file_ops: int
+    """
+    if _timings.enabled:
+        _timings.add_io(bytes_read, file_ops)
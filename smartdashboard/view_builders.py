@@ -24,6 +24,7 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
 import traceback
 import typing as t
 
@@ -32,22 +33,37 @@ import streamlit as st
 
 from smartdashboard.schemas.orchestrator import Orchestrator
 from smartdashboard.schemas.shard import Shard
+from smartdashboard.utils.config_tables import (
+    ApplicationTables,
+    build_application_tables,
+    get_application_tables,
+    get_ensemble_tables,
+)
 from smartdashboard.utils.errors import SSDashboardError
 from smartdashboard.utils.helpers import (
-    build_dataframe_generic,
-    build_dataframe_loaded_entities,
-    flatten_nested_keyvalue_containers,
-    format_ensemble_params,
     format_interfaces,
     get_port,
+    remembered_selectbox,
     render_dataframe,
     shard_log_spacing,
+    status_legend,
+    window_picker,
 )
 from smartdashboard.utils.ManifestReader import Manifest
+from smartdashboard.utils.picker import (
+    EntityIndex,
+    cached_index,
+    entity_picker,
+    heatmap_cell_selector,
+)
+from smartdashboard.utils.prefetch import prefetch_members, prefetch_shards
+from smartdashboard.utils.timing import Timings, timed_function
 from smartdashboard.views import (
     ApplicationView,
+    ClientTimelineView,
     ClientView,
     DatabaseTelemetryView,
+    DiagnosticsView,
     EnsembleView,
     ErrorView,
     ExperimentView,
@@ -57,6 +73,8 @@ from smartdashboard.views import (
     OverviewView,
 )
 
+OVERVIEW_TABS = ("Experiment", "Applications", "Orchestrators", "Ensembles")
+
 
 def error_builder(error: SSDashboardError) -> ErrorView:
     """Error view displayed when errors are caught
@@ -81,6 +99,26 @@ def error_builder(error: SSDashboardError) -> ErrorView:
     return view
 
 
+def reload_error_builder(error: t.Optional[SSDashboardError]) -> None:
+    """Warning displayed above the last loaded manifest when reloading
+    the manifest failed
+
+    :param error: Error of the last reload, None if it succeeded
+    :type error: Optional[SSDashboardError]
+    """
+    if error is None:
+        return
+
+    # fmt: off
+    st.warning(
+        f"""{error.title} Showing the last loaded manifest.  
+             Error found in file: {error.file}  
+             Error Message: {error.exception}"""
+    )
+    # fmt: on
+
+
+@timed_function()
 def exp_builder(manifest: Manifest) -> ExperimentView:
     """Experiment view to be rendered
 
@@ -109,6 +147,7 @@ def exp_builder(manifest: Manifest) -> ExperimentView:
     return view
 
 
+@timed_function()
 def app_builder(manifest: Manifest) -> ApplicationView:
     """Application view to be rendered
 
@@ -120,16 +159,27 @@ def app_builder(manifest: Manifest) -> ApplicationView:
     st.subheader("Application Configuration")
     col1, col2 = st.columns([4, 4])
     with col1:
-        selected_application_context = st.selectbox(
+        selected_application_context = entity_picker(
             "Select an application:",
-            manifest.apps_with_run_ctx,
-            format_func=lambda context: f"{context.entity.name}: Run {context.run_id}",
+            cached_index(
+                "application",
+                manifest.runs,
+                lambda: EntityIndex.for_run_contexts(manifest.apps_with_run_ctx),
+            ),
+            key="application",
         )
 
     if selected_application_context is not None:
         selected_application = selected_application_context.entity
+        tables = get_application_tables(
+            manifest.version,
+            selected_application_context.run_id,
+            selected_application.name,
+            selected_application,
+        )
     else:
         selected_application = None
+        tables = build_application_tables(None)
 
     view = ApplicationView(selected_application)
 
@@ -137,86 +187,62 @@ def app_builder(manifest: Manifest) -> ApplicationView:
     view.status_element = st.empty()
     st.write("Path: " + (view.application.path if view.application is not None else ""))
 
+    render_application_tables(tables)
+
+    st.write("")
+    with st.expander(label="Logs"):
+        with st.container():
+            col1, col2 = st.columns([6, 6])
+            with col1:
+                st.write("Output")
+                view.out_logs_element = st.code(view.out_logs, language="log")
+
+            with col2:
+                st.write("Error")
+                view.err_logs_element = st.code(view.err_logs, language="log")
+
+    return view
+
+
+def render_application_tables(tables: ApplicationTables) -> None:
+    """Renders the configuration tables of an application or ensemble member
+
+    :param tables: Configuration tables
+    :type tables: ApplicationTables
+    """
     st.write("")
     with st.expander(label="Executable Arguments"):
-        arguments = (
-            selected_application.exe_args if selected_application is not None else []
-        )
-        render_dataframe(pd.DataFrame(arguments, columns=["All Arguments"]))
+        render_dataframe(tables.exe_args)
 
     st.write("")
     with st.expander(label="Batch and Run Settings"):
         col1, col2 = st.columns([4, 4])
-        build_dataframe_generic(
-            column=col1,
-            title="Batch Settings",
-            dict_name="batch_settings",
-            entity=selected_application.dict() if selected_application else {},
-            df_columns=["Name", "Value"],
-        )
-        build_dataframe_generic(
-            column=col2,
-            title="Run Settings",
-            dict_name="run_settings",
-            entity=selected_application.dict() if selected_application else {},
-            df_columns=["Name", "Value"],
-        )
+        with col1:
+            render_dataframe(tables.batch_settings, title="Batch Settings")
+        with col2:
+            render_dataframe(tables.run_settings, title="Run Settings")
 
     st.write("")
     with st.expander(label="Parameters and Generator Files"):
         col1, col2 = st.columns([4, 4])
-        build_dataframe_generic(
-            column=col1,
-            title="Parameters",
-            dict_name="params",
-            entity=selected_application.dict() if selected_application else {},
-            df_columns=["Name", "Value"],
-        )
-        build_dataframe_generic(
-            column=col2,
-            title="Files",
-            dict_name="files",
-            entity=selected_application.dict() if selected_application else {},
-            df_columns=["Type", "File"],
-        )
+        with col1:
+            render_dataframe(tables.params, title="Parameters")
+        with col2:
+            render_dataframe(tables.files, title="Files")
 
     st.write("")
     with st.expander(label="Colocated Database"):
-        with st.container():
-            col1, col2 = st.columns([6, 6])
-            app_colocated_db: t.Optional[t.Dict[str, t.Any]] = (
-                selected_application.colocated_db
-                if selected_application is not None
-                else {}
-            )
-            build_dataframe_generic(
-                column=col1,
-                title="Summary",
-                dict_name="settings",
-                entity=app_colocated_db,
-                df_columns=["Name", "Value"],
-            )
-            build_dataframe_loaded_entities(
-                column=col2,
-                title="Loaded Scripts and Models",
-                entity=selected_application,
-            )
-
-    st.write("")
-    with st.expander(label="Logs"):
         with st.container():
             col1, col2 = st.columns([6, 6])
             with col1:
-                st.write("Output")
-                view.out_logs_element = st.code(view.out_logs, language="log")
-
+                render_dataframe(tables.colocated_db, title="Summary")
             with col2:
-                st.write("Error")
-                view.err_logs_element = st.code(view.err_logs, language="log")
-
-    return view
+                render_dataframe(
+                    tables.loaded_entities, title="Loaded Scripts and Models"
+                )
 
 
+@timed_function()
 def orc_builder(manifest: Manifest) -> OrchestratorView:
     """Orchestrator view to be rendered
 
@@ -228,10 +254,11 @@ def orc_builder(manifest: Manifest) -> OrchestratorView:
     st.subheader("Orchestrator Configuration")
     col1, col2 = st.columns([4, 4])
     with col1:
-        selected_orchestrator_context = st.selectbox(
+        selected_orchestrator_context = remembered_selectbox(
             "Select an orchestrator:",
             manifest.orcs_with_run_ctx,
             format_func=lambda context: f"{context.entity.name}: Run {context.run_id}",
+            key="orchestrator",
         )
 
     if selected_orchestrator_context is not None:
@@ -260,11 +287,16 @@ def orc_builder(manifest: Manifest) -> OrchestratorView:
     with st.expander(label="Logs"):
         col1, col2 = st.columns([6, 6])
         with col1:
-            shard = st.selectbox(
-                "Select a shard:", shards, format_func=lambda shard: shard.name
+            shard_index = cached_index(
+                "orchestrator_shard", shards, lambda: EntityIndex.for_entities(shards)
+            )
+            shard = entity_picker(
+                "Select a shard:", shard_index, key="orchestrator_shard"
             )
 
             view.update_view_model(shard)
+            if shard is not None:
+                prefetch_shards(shards, shard_index.position(shard.name) or 0)
 
             st.write("")
             st.write("Output")
@@ -278,6 +310,7 @@ def orc_builder(manifest: Manifest) -> OrchestratorView:
     return view
 
 
+@timed_function()
 def ens_builder(manifest: Manifest) -> EnsembleView:
     """Ensemble view to be rendered
 
@@ -289,16 +322,19 @@ def ens_builder(manifest: Manifest) -> EnsembleView:
     st.subheader("Ensemble Configuration")
     col1, col2 = st.columns([4, 4])
     with col1:
-        selected_ensemble_context = st.selectbox(
+        selected_ensemble_context = remembered_selectbox(
             "Select an ensemble:",
             manifest.ensemble_with_run_ctx,
             format_func=lambda context: f"{context.entity.name}: Run {context.run_id}",
+            key="ensemble",
         )
 
     if selected_ensemble_context is not None:
         selected_ensemble = selected_ensemble_context.entity
+        run_id = selected_ensemble_context.run_id
     else:
         selected_ensemble = None
+        run_id = ""
 
     members = selected_ensemble.models if selected_ensemble else []
 
@@ -307,18 +343,27 @@ def ens_builder(manifest: Manifest) -> EnsembleView:
     st.write("")
     view.status_element = st.empty()
 
+    ensemble_tables = get_ensemble_tables(manifest.version, run_id, selected_ensemble)
+
     st.write("")
     with st.expander(label="Batch Settings"):
-        batch = flatten_nested_keyvalue_containers(
-            "batch_settings",
-            selected_ensemble.dict() if selected_ensemble else {},
-        )
-        render_dataframe(pd.DataFrame(batch, columns=["Name", "Value"]))
+        render_dataframe(ensemble_tables.batch_settings)
 
     st.write("")
     with st.expander(label="Parameters"):
-        params = format_ensemble_params(selected_ensemble)
-        render_dataframe(pd.DataFrame(params, columns=["Name", "Value"]))
+        render_dataframe(ensemble_tables.params)
+
+    member_index = cached_index(
+        "ensemble_member", members, lambda: EntityIndex.for_entities(members)
+    )
+
+    st.write("")
+    with st.expander(label="Member Status Map", expanded=True):
+        view.heatmap_element = st.empty()
+        st.caption(status_legend())
+        heatmap_cell_selector(
+            member_index.labels, key="ensemble_member", scanner=view.scanner
+        )
 
     st.write("#")
     if selected_ensemble is not None:
@@ -328,75 +373,31 @@ def ens_builder(manifest: Manifest) -> EnsembleView:
 
     col1, col2 = st.columns([4, 4])
     with col1:
-        member = st.selectbox(
-            "Select a member:", members, format_func=lambda member: member.name
-        )
+        member = entity_picker("Select a member:", member_index, key="ensemble_member")
 
     view.update_view_model(member)
+    if selected_ensemble is not None and member is not None:
+        prefetch_members(
+            manifest.version,
+            run_id,
+            selected_ensemble.name,
+            members,
+            member_index.position(member.name) or 0,
+        )
 
     st.write("")
     view.member_status_element = st.empty()
     st.write("Path: " + (member.path if member else ""))
-    st.write("")
-    with st.expander(label="Executable Arguments"):
-        arguments = member.exe_args if member is not None else []
-        render_dataframe(pd.DataFrame(arguments, columns=["All Arguments"]))
-
-    st.write("")
-    with st.expander(label="Batch and Run Settings"):
-        col1, col2 = st.columns([4, 4])
-        build_dataframe_generic(
-            column=col1,
-            title="Batch Settings",
-            dict_name="batch_settings",
-            entity=member.dict() if member else {},
-            df_columns=["Name", "Value"],
-        )
-        build_dataframe_generic(
-            column=col2,
-            title="Run Settings",
-            dict_name="run_settings",
-            entity=member.dict() if member else {},
-            df_columns=["Name", "Value"],
+    render_application_tables(
+        get_application_tables(
+            manifest.version,
+            run_id,
+            f"{selected_ensemble.name}/{member.name}",
+            member,
         )
-
-    st.write("")
-    with st.expander(label="Parameters and Generator Files"):
-        col1, col2 = st.columns([4, 4])
-        build_dataframe_generic(
-            column=col1,
-            title="Parameters",
-            dict_name="params",
-            entity=member.dict() if member else {},
-            df_columns=["Name", "Value"],
-        )
-        build_dataframe_generic(
-            column=col2,
-            title="Files",
-            dict_name="files",
-            entity=member.dict() if member else {},
-            df_columns=["Type", "File"],
-        )
-
-    st.write("")
-    with st.expander(label="Colocated Database"):
-        with st.container():
-            col1, col2 = st.columns([6, 6])
-            mem_colocated_db: t.Optional[t.Dict[str, t.Any]] = (
-                member.colocated_db if member is not None else {}
-            )
-            build_dataframe_generic(
-                column=col1,
-                title="Summary",
-                dict_name="settings",
-                entity=mem_colocated_db,
-                df_columns=["Name", "Value"],
-            )
-            build_dataframe_loaded_entities(
-                column=col2,
-                title="Loaded Scripts and Models",
-                entity=member,
-            )
+        if selected_ensemble is not None and member is not None
+        else build_application_tables(None)
+    )
 
     st.write("")
     with st.expander(label="Logs"):
@@ -412,12 +413,16 @@ def ens_builder(manifest: Manifest) -> EnsembleView:
     return view
 
 
+@timed_function()
 def overview_builder(manifest: Manifest) -> OverviewView:
     """Experiment Overview page to be rendered
 
     This function organizes all of the above views
     into their respective tabs inside the dashboard.
 
+    Tabs are selected on the server, so only the views of the
+    selected tab are built and updated.
+
     :param manifest: Manifest to get dashboard info from
     :type manifest: Manifest
     :return: View of the entire Overview page
@@ -426,29 +431,32 @@ def overview_builder(manifest: Manifest) -> OverviewView:
     st.header("Experiment Overview: " + manifest.experiment.name)
     st.write("")
 
-    experiment, application, orchestrators, ensembles = st.tabs(
-        ["Experiment", "Applications", "Orchestrators", "Ensembles"]
+    selected_tab = st.radio(
+        "Overview tab",
+        OVERVIEW_TABS,
+        horizontal=True,
+        key="overview_tab",
+        label_visibility="collapsed",
     )
-
-    ### Experiment ###
-    with experiment:
-        exp_view = exp_builder(manifest)
+    st.write("")
 
     ### Applications ###
-    with application:
-        app_view = app_builder(manifest)
+    if selected_tab == "Applications":
+        return OverviewView(app_view=app_builder(manifest))
 
     ### Orchestrator ###
-    with orchestrators:
-        orc_view = orc_builder(manifest)
+    if selected_tab == "Orchestrators":
+        return OverviewView(orc_view=orc_builder(manifest))
 
     ### Ensembles ###
-    with ensembles:
-        ens_view = ens_builder(manifest)
+    if selected_tab == "Ensembles":
+        return OverviewView(ens_view=ens_builder(manifest))
 
-    return OverviewView(exp_view, app_view, orc_view, ens_view)
+    ### Experiment ###
+    return OverviewView(exp_view=exp_builder(manifest))
 
 
+@timed_function()
 def db_telem_builder(manifest: Manifest) -> DatabaseTelemetryView:
     """Database Telemetry page to be rendered
 
@@ -466,10 +474,11 @@ def db_telem_builder(manifest: Manifest) -> DatabaseTelemetryView:
 
     col1, _ = st.columns([6, 6])
     with col1:
-        selected_orchestrator_context = st.selectbox(
+        selected_orchestrator_context = remembered_selectbox(
             "Select an orchestrator:",
             manifest.orcs_with_run_ctx,
             format_func=lambda context: f"{context.entity.name}: Run {context.run_id}",
+            key="telemetry_orchestrator",
         )
 
     st.write("")
@@ -477,7 +486,7 @@ def db_telem_builder(manifest: Manifest) -> DatabaseTelemetryView:
     if selected_orchestrator_context is not None:
         run_id = selected_orchestrator_context.run_id
         selected_orchestrator = selected_orchestrator_context.entity
-        shards = selected_orchestrator.shards
+        shards: t.Sequence[Shard] = selected_orchestrator.shards
         st.subheader(f"{selected_orchestrator.name}: Run {run_id} Telemetry")
     else:
         run_id, selected_orchestrator = None, None
@@ -501,11 +510,12 @@ def db_telem_builder(manifest: Manifest) -> DatabaseTelemetryView:
     return DatabaseTelemetryView(orc_summary_view, memory_view, client_view)
 
 
-def memory_view_builder(shards: t.List[Shard]) -> MemoryView:
+@timed_function()
+def memory_view_builder(shards: t.Sequence[Shard]) -> MemoryView:
     """Memory section of Database Telemetry page to be rendered
 
     :param shards: Shards of the selected Orchestrator
-    :type shards: t.List[Shard]
+    :type shards: t.Sequence[Shard]
     :return: View of the memory portion of the DB Telemetry page
     :rtype: MemoryView
     """
@@ -513,12 +523,14 @@ def memory_view_builder(shards: t.List[Shard]) -> MemoryView:
     with st.expander(label="Memory"):
         col1, col2 = st.columns([0.4, 0.5])
         with col1:
-            shard = st.selectbox(
+            shard = entity_picker(
                 "Select a shard:",
-                shards,
-                format_func=lambda shard: shard.name,
+                cached_index(
+                    "memory_shard", shards, lambda: EntityIndex.for_entities(shards)
+                ),
                 key="memory_shard",
             )
+            window = window_picker(key="memory_window")
             memory_table_element = st.empty()
         with col2:
             st.write("")
@@ -529,14 +541,21 @@ def memory_view_builder(shards: t.List[Shard]) -> MemoryView:
             with colb:
                 export_button = st.empty()
 
-    return MemoryView(shard, memory_table_element, memory_graph_element, export_button)
+    return MemoryView(
+        shard,
+        memory_table_element,
+        memory_graph_element,
+        export_button,
+        window_minutes=window,
+    )
 
 
-def client_view_builder(shards: t.List[Shard]) -> ClientView:
+@timed_function()
+def client_view_builder(shards: t.Sequence[Shard]) -> ClientView:
     """Client section of Database Telemetry page to be rendered
 
     :param shards: Shards of the selected Orchestrator
-    :type shards: t.List[Shard]
+    :type shards: t.Sequence[Shard]
     :return: View of the client portion of the DB Telemetry page
     :rtype: ClientView
     """
@@ -544,12 +563,14 @@ def client_view_builder(shards: t.List[Shard]) -> ClientView:
     with st.expander(label="Clients"):
         col1, col2 = st.columns([0.4, 0.5])
         with col1:
-            shard = st.selectbox(
+            shard = entity_picker(
                 "Select a shard:",
-                shards,
-                format_func=lambda shard: shard.name,
+                cached_index(
+                    "client_shard", shards, lambda: EntityIndex.for_entities(shards)
+                ),
                 key="client_shard",
             )
+            window = window_picker(key="client_window")
             client_table_element = st.empty()
         with col2:
             st.write("")
@@ -559,10 +580,25 @@ def client_view_builder(shards: t.List[Shard]) -> ClientView:
             _, colb = st.columns([0.85, 0.15])
             with colb:
                 export_button = st.empty()
+            churn_element = st.empty()
+            timeline_element = st.empty()
 
-    return ClientView(shard, client_table_element, client_graph_element, export_button)
+    timeline_view = (
+        ClientTimelineView(shard.client_file, timeline_element, churn_element)
+        if shard is not None
+        else None
+    )
+    return ClientView(
+        shard,
+        client_table_element,
+        client_graph_element,
+        export_button,
+        window_minutes=window,
+        timeline_view=timeline_view,
+    )
 
 
+@timed_function()
 def orc_summary_builder(
     selected_orchestrator: t.Optional[Orchestrator],
 ) -> OrchestratorSummaryView:
@@ -596,3 +632,40 @@ def orc_summary_builder(
         render_dataframe(pd.DataFrame(data, columns=["Hosts"]))
 
     return view
+
+
+def diagnostics_builder(timings: Timings) -> DiagnosticsView:
+    """Diagnostics view to be rendered
+
+    :param timings: Timings to summarize
+    :type timings: Timings
+    :return: A diagnostics view
+    :rtype: DiagnosticsView
+    """
+    st.header("Diagnostics")
+    if not timings.enabled:
+        st.info(
+            "Timings are not being recorded. Start the dashboard with "
+            "`smart-dash --diagnostics` to record them."
+        )
+
+    st.subheader("Timings")
+    st.caption(
+        f"Durations of the last {timings.maxlen} timed sections, with the bytes "
+        "read and file operations of each call, including nested sections."
+    )
+    table_element = st.empty()
+    st.download_button(
+        "Download Chrome trace",
+        data=json.dumps(timings.chrome_trace()),
+        file_name="smartdashboard_trace.json",
+        mime="application/json",
+        help="Trace of the sections recorded when this page was loaded. "
+        "Open it in chrome://tracing or https://ui.perfetto.dev.",
+    )
+
+    st.subheader("Element updates")
+    st.caption("Updates sent to the browser and skipped as unchanged.")
+    updates_element = st.empty()
+
+    return DiagnosticsView(timings, table_element, updates_element)
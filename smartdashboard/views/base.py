@@ -0,0 +1,141 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import typing as t
+from abc import ABC, abstractmethod
+
+from streamlit.delta_generator import DeltaGenerator
+
+from smartdashboard.schemas.base import HasOutErrFiles
+from smartdashboard.utils.deltas import DeltaFilter
+from smartdashboard.utils.LogReader import get_logs
+from smartdashboard.utils.timing import timed_method
+
+_T = t.TypeVar("_T", bound=HasOutErrFiles)
+
+
+class ViewBase(ABC):
+    """Base class for Views. Views are groupings of UI elements
+    that are displayed in the dashboard and are a representation
+    of a SmartSim entity.
+
+    Views update on a timestep of the event loop that renders
+    elements in the dashboard. Each update, and each chart update of
+    the telemetry views, is timed while timings are enabled.
+    """
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for method in ("update", "_update_graph"):
+            if method in cls.__dict__:
+                setattr(cls, method, timed_method(cls.__dict__[method]))
+
+    @abstractmethod
+    def update(self) -> None:
+        """Abstract method to update elements in a view"""
+
+
+class EntityView(t.Generic[_T], ViewBase):
+    """View class for entities. Entities include
+    Applications, Orchestrators, Shards, Ensembles, and Members.
+
+    EntityViews are a collection of UI elements and have logs and
+    statuses that update.
+    """
+
+    def __init__(self, view_model: t.Optional[_T]) -> None:
+        """Initialize an EntityView
+
+        :param view_model: Selected entity view
+        :type view_model: Optional[_T]
+        """
+        self.view_model = view_model
+        self.out_logs_element = DeltaGenerator()
+        self.err_logs_element = DeltaGenerator()
+        self.deltas = DeltaFilter()
+
+    @property
+    def err_logs(self) -> str:
+        """Get error logs from selected entity view
+
+        :return: Error logs
+        :rtype: str
+        """
+        return get_logs(
+            file=self.view_model.err_file if self.view_model is not None else ""
+        )
+
+    @property
+    def out_logs(self) -> str:
+        """Get output logs from selected entity view
+
+        :return: Output logs
+        :rtype: str
+        """
+        return get_logs(
+            file=self.view_model.out_file if self.view_model is not None else ""
+        )
+
+    def update(self) -> None:
+        """Update logs and status elements in the selected entity view"""
+        self.update_logs()
+        self._update_status()
+
+    def update_logs(self) -> None:
+        """Update error and output log elements in the selected entity view"""
+        out_logs = self.out_logs
+        if self.deltas.changed("out_logs", out_logs):
+            self.out_logs_element.code(out_logs, language="log")
+
+        err_logs = self.err_logs
+        if self.deltas.changed("err_logs", err_logs):
+            self.err_logs_element.code(err_logs, language="log")
+
+    @abstractmethod
+    def _update_status(self) -> None:
+        """Abstract method to update an entity's status"""
+
+    def update_view_model(self, new_view_model: t.Optional[_T]) -> None:
+        """Update view_model
+
+        This is called after a new entity is selected
+        in the dashboard to keep displayed data in sync.
+
+        :param new_view_model: Selected entity view
+        :type new_view_model: Optional[_T]
+        """
+        if new_view_model is not None:
+            self.view_model = new_view_model
+
+
+class ErrorView(ViewBase):
+    """View class for errors
+
+    Contains UI elements for static display of unexpected exception
+    information.
+    """
+
+    def update(self) -> None: ...
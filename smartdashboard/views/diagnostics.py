@@ -0,0 +1,90 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pandas as pd
+from streamlit.delta_generator import DeltaGenerator
+
+from smartdashboard.utils.deltas import DeltaFilter, get_delta_counters
+from smartdashboard.utils.timing import Timings
+
+from .base import ViewBase
+
+
+class DiagnosticsView(ViewBase):
+    """View class for the timings table of the Diagnostics page"""
+
+    def __init__(
+        self,
+        timings: Timings,
+        table_element: DeltaGenerator,
+        updates_element: DeltaGenerator,
+    ) -> None:
+        """Initialize a DiagnosticsView
+
+        :param timings: Timings to summarize
+        :type timings: Timings
+        :param table_element: Element the timings table is rendered in
+        :type table_element: DeltaGenerator
+        :param updates_element: Element the element update counts are
+                                rendered in
+        :type updates_element: DeltaGenerator
+        """
+        self.timings = timings
+        self.table_element = table_element
+        self.updates_element = updates_element
+        self.deltas = DeltaFilter()
+
+    def update(self) -> None:
+        """Update the summaries of the recorded timings and element updates"""
+        summary = pd.DataFrame(
+            self.timings.summarize(),
+            columns=[
+                "component",
+                "calls",
+                "p50_ms",
+                "p95_ms",
+                "max_ms",
+                "bytes_per_call",
+                "file_ops_per_call",
+            ],
+        )
+        if self.deltas.changed("table", summary):
+            self.table_element.dataframe(
+                summary, use_container_width=True, hide_index=True
+            )
+
+        counters = get_delta_counters()
+        updates = pd.DataFrame(
+            [
+                (slot, counters.emitted.get(slot, 0), counters.suppressed.get(slot, 0))
+                for slot in sorted(counters.emitted.keys() | counters.suppressed.keys())
+            ],
+            columns=["element", "sent", "skipped"],
+        )
+        if self.deltas.changed("updates", updates):
+            self.updates_element.dataframe(
+                updates, use_container_width=True, hide_index=True
+            )
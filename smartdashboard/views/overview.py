@@ -0,0 +1,309 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import typing as t
+
+import numpy as np
+from streamlit.delta_generator import DeltaGenerator
+
+from smartdashboard.schemas.application import Application
+from smartdashboard.schemas.ensemble import Ensemble
+from smartdashboard.schemas.experiment import Experiment
+from smartdashboard.schemas.orchestrator import Orchestrator
+from smartdashboard.schemas.run import Run
+from smartdashboard.schemas.shard import Shard
+from smartdashboard.utils.helpers import status_heatmap
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import (
+    StatusData,
+    format_status,
+    format_status_counts,
+    get_ensemble_status_summary,
+    get_experiment_status_summary,
+    get_orchestrator_status_summary,
+    get_status,
+    get_status_scanner,
+)
+
+from .base import EntityView, ViewBase
+
+
+class ExperimentView(EntityView[Experiment]):
+    """View class for experiments"""
+
+    def __init__(
+        self,
+        experiment: t.Optional[Experiment],
+        runs: t.List[Run],
+    ) -> None:
+        """Initialize an ExperimentView
+
+        :param experiment: The experiment to display
+        :type experiment: Optional[Experiment]
+        :param runs: Runs within an experiment
+        :type runs: List[Run]
+        """
+        self.status_element = DeltaGenerator()
+        self.runs = runs
+        super().__init__(view_model=experiment)
+
+    @property
+    def status(self) -> str:
+        """Get experiment status
+
+        :return: Experiment status
+        :rtype: str
+        """
+        return get_experiment_status_summary(self.runs)
+
+    def _update_status(self) -> None:
+        """Update status element in ExperimentView"""
+        status = self.status
+        if self.deltas.changed("status", status):
+            self.status_element.write(status)
+
+
+class ApplicationView(EntityView[Application]):
+    """View class for applications"""
+
+    def __init__(self, application: t.Optional[Application]) -> None:
+        """Initialize an ApplicationView
+
+        :param application: Selected application to display
+        :type application: Optional[Application]
+        """
+        self.status_element = DeltaGenerator()
+        super().__init__(view_model=application)
+
+    @property
+    def application(self) -> t.Optional[Application]:
+        """Get application associated with the view model
+
+        :return: Selected application
+        :rtype: Optional[Application]
+        """
+        return self.view_model
+
+    @property
+    def status(self) -> str:
+        """Get application status
+
+        :return: Status
+        :rtype: str
+        """
+        if self.application is not None:
+            try:
+                status = get_status(self.application.telemetry_metadata["status_dir"])
+            except KeyError:
+                status = StatusData(StatusEnum.MALFORMED, None)
+            return format_status(status)
+        return "Status: "
+
+    def _update_status(self) -> None:
+        """Update status element in ApplicationView"""
+        status = self.status
+        if self.deltas.changed("status", status):
+            self.status_element.write(status)
+
+
+class OrchestratorView(EntityView[Shard]):
+    """View class for orchestrators"""
+
+    def __init__(
+        self,
+        orchestrator: t.Optional[Orchestrator],
+        shard: t.Optional[Shard],
+    ) -> None:
+        """Initialize an OrchestratorView
+
+        :param orchestrator: Selected orchestrator to display
+        :type orchestrator: Optional[Orchestrator]
+        :param shard: Selected shard within the selected orchestrator
+        :type shard: Optional[Shard]
+        """
+        self.orchestrator = orchestrator
+        self.status_element = DeltaGenerator()
+        super().__init__(view_model=shard)
+
+    @property
+    def shard(self) -> t.Optional[Shard]:
+        """Get shard associated with the view model
+
+        :return: Selected shard
+        :rtype: Optional[Shard]
+        """
+        return self.view_model
+
+    @property
+    def status(self) -> str:
+        """Get orchestrator status summary
+
+        :return: Status summary
+        :rtype: str
+        """
+        return get_orchestrator_status_summary(self.orchestrator)
+
+    def _update_status(self) -> None:
+        """Update status element in OrchestratorView"""
+        status = self.status
+        if self.deltas.changed("status", status):
+            self.status_element.write(status)
+
+
+class EnsembleView(EntityView[Application]):
+    """View class for ensembles"""
+
+    def __init__(
+        self,
+        ensemble: t.Optional[Ensemble],
+        member: t.Optional[Application],
+    ) -> None:
+        """Initialize an EnsembleView
+
+        :param ensemble: Selected ensemble to display
+        :type ensemble: Optional[Ensemble]
+        :param member: Selected member to display
+        :type member: Optional[Application]
+        """
+        self.ensemble = ensemble
+        self.scanner = get_status_scanner(ensemble.models) if ensemble else None
+        self.status_element = DeltaGenerator()
+        self.member_status_element = DeltaGenerator()
+        self.heatmap_element = DeltaGenerator()
+        super().__init__(view_model=member)
+
+    @property
+    def member(self) -> t.Optional[Application]:
+        """Get member associated with the view model
+
+        :return: Selected member
+        :rtype: Optional[Application]
+        """
+        return self.view_model
+
+    @property
+    def status(self) -> str:
+        """Get ensemble status summary
+
+        :return: Status summary
+        :rtype: str
+        """
+        if self.scanner is None:
+            return get_ensemble_status_summary(self.ensemble)
+
+        self.scanner.scan()
+        return format_status_counts(self.scanner.counts())
+
+    @property
+    def heatmap(self) -> t.Optional["np.ndarray[t.Any, t.Any]"]:
+        """Get the status heatmap of the ensemble members
+
+        :return: RGB image with one cell per member, or None
+                 if the ensemble has no members
+        :rtype: Optional[numpy.ndarray]
+        """
+        if self.scanner is None or len(self.scanner) == 0:
+            return None
+
+        self.scanner.scan()
+        return status_heatmap(self.scanner.codes)
+
+    @property
+    def member_status(self) -> str:
+        """Get member status
+
+        :return: Status
+        :rtype: str
+        """
+        if self.member is not None:
+            try:
+                status = get_status(self.member.telemetry_metadata["status_dir"])
+            except KeyError:
+                status = StatusData(StatusEnum.MALFORMED, None)
+            return format_status(status)
+        return "Status: "
+
+    def _update_status(self) -> None:
+        """Update ensemble, heatmap and member status elements in EnsembleView"""
+        status = self.status
+        if self.deltas.changed("status", status):
+            self.status_element.write(status)
+        member_status = self.member_status
+        if self.deltas.changed("member_status", member_status):
+            self.member_status_element.write(member_status)
+
+        heatmap = self.heatmap
+        if heatmap is not None and self.deltas.changed("heatmap", heatmap):
+            self.heatmap_element.image(heatmap)
+
+
+class OverviewView(ViewBase):
+    """View class for the collection of Experiment Overview views
+
+    Only the tab that is being displayed is built, so views of the
+    other tabs are None and are not updated.
+    """
+
+    def __init__(
+        self,
+        exp_view: t.Optional[ExperimentView] = None,
+        app_view: t.Optional[ApplicationView] = None,
+        orc_view: t.Optional[OrchestratorView] = None,
+        ens_view: t.Optional[EnsembleView] = None,
+    ) -> None:
+        """Initialize an OverviewView
+
+        :param exp_view: Experiment view rendered in the dashboard
+        :type exp_view: Optional[ExperimentView]
+        :param app_view: Application view rendered in the dashboard
+        :type app_view: Optional[ApplicationView]
+        :param orc_view: Orchestrator view rendered in the dashboard
+        :type orc_view: Optional[OrchestratorView]
+        :param ens_view: Ensemble view rendered in the dashboard
+        :type ens_view: Optional[EnsembleView]
+        """
+        self.exp_view = exp_view
+        self.app_view = app_view
+        self.ens_view = ens_view
+        self.orc_view = orc_view
+
+    @property
+    def views(self) -> t.List[ViewBase]:
+        """Get the views that have been built
+
+        :return: Built views
+        :rtype: List[ViewBase]
+        """
+        return [
+            view
+            for view in (self.exp_view, self.app_view, self.ens_view, self.orc_view)
+            if view is not None
+        ]
+
+    def update(self) -> None:
+        """Update the built views within the OverviewView"""
+        for view in self.views:
+            view.update()
@@ -0,0 +1,761 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import typing as t
+from abc import abstractmethod
+from dataclasses import dataclass
+
+import pandas as pd
+from streamlit.delta_generator import DeltaGenerator
+
+from smartdashboard.schemas.orchestrator import Orchestrator
+from smartdashboard.schemas.shard import Shard
+from smartdashboard.utils.clients import ClientTimeline
+from smartdashboard.utils.deltas import DeltaFilter
+from smartdashboard.utils.StatusReader import get_orchestrator_status_summary
+from smartdashboard.utils.storage import get_storage
+from smartdashboard.utils.TelemetryReader import (
+    TELEMETRY_BUDGET,
+    TelemetryStore,
+    TelemetryTailer,
+    get_telemetry_dtypes,
+    read_latest_snapshot,
+    read_telemetry,
+)
+from smartdashboard.utils.timing import timed_method
+
+from .base import ViewBase
+
+if t.TYPE_CHECKING:
+    import altair as alt
+
+
+@dataclass(frozen=True)
+class Files:
+    graph_file: str
+    table_file: str
+
+    def is_valid(self) -> bool:
+        """Check that paths are not empty strings and exist"""
+        if any(file_path == "" for file_path in (self.graph_file, self.table_file)):
+            return False
+
+        storage = get_storage()
+        return all(
+            storage.exists(file_path)
+            for file_path in (self.graph_file, self.table_file)
+        )
+
+
+class DatabaseDataView(ViewBase):
+    """Base class for Telemetry Views that have table and chart elements"""
+
+    def __init__(
+        self,
+        shard: t.Optional[Shard],
+        table_element: DeltaGenerator,
+        graph_element: DeltaGenerator,
+        export_button: DeltaGenerator,
+        *,
+        memory_budget: int = TELEMETRY_BUDGET,
+        window_minutes: t.Optional[float] = None,
+    ):
+        """Initialize a DatabaseDataView
+
+        :param shard: Selected shard
+        :type shard: Optional[Shard]
+        :param table_element: Element the table is rendered in
+        :type table_element: DeltaGenerator
+        :param graph_element: Element the chart is rendered in
+        :type graph_element: DeltaGenerator
+        :param export_button: Element the export button is rendered in
+        :type export_button: DeltaGenerator
+        :param memory_budget: Bytes of telemetry rows to keep before the
+                              oldest rows are rolled up
+        :type memory_budget: int
+        :param window_minutes: Minutes of the newest telemetry to chart in
+                               full, with the rest of the run downsampled,
+                               None to chart the whole run alike
+        :type window_minutes: Optional[float]
+        """
+        self.shard = shard
+        self.table_element = table_element
+        self.graph_element = graph_element
+        self.export_button = export_button
+        self.deltas = DeltaFilter()
+        self.window_size = 10000
+        self.window_minutes = window_minutes
+        self.store = TelemetryStore(self.columns, memory_budget)
+        self.timestamp_min = 0
+        self.sampling = False
+        self.chart: t.Optional["alt.Chart"] = None
+        self.tailer = TelemetryTailer(
+            self.files.graph_file, get_telemetry_dtypes(self.kind)
+        )
+
+        if self.telemetry:
+            graph_delta_df = self._load_data_update()
+            self.store.append(graph_delta_df)
+            self.timestamp_min = graph_delta_df["timestamp"].min()
+            self._handle_data(graph_delta_df=graph_delta_df)
+            self.enable_export_button()
+
+        # info message should pop up
+        elif self.shard is not None:
+            self.table_element.info(self.message)
+            self.deltas.forget("table")
+
+    @property
+    def telemetry_df(self) -> pd.DataFrame:
+        """Returns every stored telemetry row, rollups first"""
+        return self.store.frame()
+
+    @property
+    def telemetry(self) -> bool:
+        """Returns True if telemetry is being collected"""
+        return self.shard is not None and self.files.is_valid()
+
+    @property
+    @abstractmethod
+    def files(self) -> Files:
+        """Returns a tuple of the files used for telemetry"""
+
+    @property
+    @abstractmethod
+    def message(self) -> str:
+        """Returns the error message if files cannot be found"""
+
+    @property
+    @abstractmethod
+    def columns(self) -> t.List[str]:
+        """Returns columns for the graph dataframe"""
+
+    @property
+    @abstractmethod
+    def kind(self) -> str:
+        """Returns the kind of telemetry in the graph file"""
+
+    @abstractmethod
+    def enable_export_button(self) -> None:
+        """Create an export data button"""
+
+    @abstractmethod
+    def _handle_data(self, graph_delta_df: pd.DataFrame) -> None:
+        """Updates the table and graph with appropriate dataframes"""
+
+    def _sample_graph(self) -> t.Optional[pd.DataFrame]:
+        """Get the stored rows to redraw the graph with, when the graph
+        cannot be extended with the new rows alone
+
+        :return: Rows to chart, None to add the new rows to the graph
+        :rtype: Optional[pandas.DataFrame]
+        """
+        if self.window_minutes is not None:
+            self.sampling = True
+            return self.store.window(
+                self.window_minutes * 60_000, self.window_size, self.window_size // 10
+            )
+        if len(self.store) >= self.window_size:
+            self.sampling = True
+            return self.store.downsample(self.window_size)
+        return None
+
+    def update(self) -> None:
+        """Checks for new data and calls to update the table
+        and graph if there is new data"""
+        if self.telemetry:
+            graph_delta_df = self._load_data_update()
+            if self.tailer.truncated:
+                # the telemetry file was replaced, so its rows are read again
+                self.store.reset()
+                self.store.append(graph_delta_df)
+                self.chart = None
+                if not graph_delta_df.empty:
+                    self.timestamp_min = graph_delta_df["timestamp"].min()
+                    self._handle_data(graph_delta_df)
+            elif not graph_delta_df.empty:
+                self.store.append(graph_delta_df)
+                self._handle_data(graph_delta_df)
+
+    def _load_data_update(self) -> pd.DataFrame:
+        """Load the rows appended to the telemetry file since the last load
+
+        :return: Data to be appended
+        :rtype: pandas.DataFrame
+        """
+        if self.telemetry:
+            try:
+                return self.tailer.read()
+            except FileNotFoundError:
+                self.table_element.info(self.message)
+                self.deltas.forget("table")
+                return pd.DataFrame()
+        return pd.DataFrame(columns=self.columns)
+
+    def _get_data_file(self) -> str:
+        """On click event to return csv data for the export button
+
+        :return: CSV data
+        :rtype: str
+        """
+        if self.telemetry:
+            try:
+                return read_telemetry(self.files.graph_file).to_csv()
+            except FileNotFoundError:
+                self.table_element.info(self.message)
+                self.deltas.forget("table")
+                self.export_button.empty()
+        return ""
+
+
+class MemoryView(DatabaseDataView):
+    """View class for memory section of the Database Telemetry page"""
+
+    @property
+    def files(self) -> Files:
+        """Returns a tuple of the files used for telemetry"""
+        if self.shard is not None:
+            return Files(self.shard.memory_file, self.shard.memory_file)
+
+        return Files("", "")
+
+    @property
+    def message(self) -> str:
+        """Returns the error message if files cannot be found"""
+        if self.shard is not None:
+            return f"Memory information could not be found for {self.shard.name}"
+
+        return ""
+
+    @property
+    def columns(self) -> t.List[str]:
+        """Returns columns for the graph dataframe"""
+        return ["timestamp", "used_memory", "used_memory_peak", "total_system_memory"]
+
+    @property
+    def kind(self) -> str:
+        """Returns the kind of telemetry in the graph file"""
+        return "memory"
+
+    def enable_export_button(self) -> None:
+        """Create an export data button"""
+        if self.shard is not None and self.telemetry:
+            self.export_button.download_button(
+                label="Export Data",
+                data=self._get_data_file(),
+                file_name=f"{self.shard.name}-memory.csv",
+                mime="text/csv",
+                key="memory",
+            )
+        else:
+            self.export_button.empty()
+
+    def _handle_data(self, graph_delta_df: pd.DataFrame) -> None:
+        """Updates the table and graph with appropriate dataframes"""
+        graph_df = self._sample_graph()
+        if graph_df is None:
+            graph_df = graph_delta_df
+        self._update_graph(self.process_dataframe(graph_df))
+        self._update_table(self.process_dataframe(self.store.tail()))
+
+    def process_dataframe(self, dframe: pd.DataFrame) -> pd.DataFrame:
+        """Processes the dataframe by changing the headers,
+        converting to GB, and adjusting the timestamp
+
+        :param dframe: Dataframe to be processed
+        :type dframe: pandas.DataFrame
+        :return: Processed dataframe
+        :rtype: pandas.DataFrame
+        """
+        gb_columns = [
+            "used_memory",
+            "used_memory_peak",
+            "total_system_memory",
+        ]
+        dframe = dframe.assign(
+            timestamp=(dframe["timestamp"] - self.timestamp_min) / 1000,
+            **{column: dframe[column] / 1024**3 for column in gb_columns},
+        )
+        return dframe.rename(
+            columns={
+                "used_memory": "Used Memory (GB)",
+                "used_memory_peak": "Used Memory Peak (GB)",
+                "total_system_memory": "Total System Memory (GB)",
+            }
+        )
+
+    def _update_graph(self, dframe: pd.DataFrame) -> None:
+        """Update memory graph for selected shard
+
+        :param dframe: DataFrame with memory data
+        :type dframe: pandas.DataFrame
+        """
+
+        dframe = dframe.drop(columns=["Total System Memory (GB)"]).melt(
+            "timestamp", var_name="Metric", value_name="Memory (GB)"
+        )
+
+        if self.chart is None or self.sampling:
+            # pylint: disable-next=import-outside-toplevel
+            import altair as alt
+
+            chart = (
+                alt.Chart(dframe)
+                .mark_line()
+                .encode(
+                    x=alt.X(
+                        "timestamp:Q",
+                        axis=alt.Axis(title="Timestep in seconds", labelAngle=0),
+                    ),
+                    y=alt.Y("Memory (GB):Q", axis=alt.Axis(title="Memory in GB")),
+                    color=alt.Color(  # type: ignore[no-untyped-call]
+                        "Metric:N", scale=alt.Scale(scheme="category10"), title="Legend"
+                    ),
+                    tooltip=["timestamp:Q", "Metric:N", "Memory (GB):Q"],
+                )
+                .interactive()
+                .properties(
+                    height=500, title=alt.TitleParams("Memory Usage", anchor="middle")
+                )
+                .configure_legend(orient="bottom")
+            )
+
+            self.graph_element.altair_chart(
+                chart, use_container_width=True, theme="streamlit"
+            )
+            self.chart = chart
+
+        else:
+            self.graph_element.add_rows(dframe)
+
+    def _update_table(self, dframe: pd.DataFrame) -> None:
+        """Update memory table for selected shard
+
+        :param dframe: DataFrame with memory data
+        :type dframe: pandas.DataFrame
+        """
+
+        dframe = dframe.drop(columns=["timestamp"]).tail(1)
+        if self.deltas.changed("table", dframe):
+            self.table_element.dataframe(
+                dframe, use_container_width=True, hide_index=True
+            )
+
+
+class ClientTimelineView:
+    """Client sessions and churn of one shard on the Database Telemetry page
+
+    The client file is tailed on every update, independently of the client
+    count file the rest of the client section is drawn from.
+    """
+
+    def __init__(
+        self,
+        client_file: str,
+        timeline_element: t.Optional[DeltaGenerator],
+        churn_element: t.Optional[DeltaGenerator],
+        *,
+        memory_budget: int = TELEMETRY_BUDGET,
+        max_points: int = 10000,
+    ) -> None:
+        """Initialize a ClientTimelineView
+
+        :param client_file: Path to the client file of the shard
+        :type client_file: str
+        :param timeline_element: Element the client sessions are rendered in,
+                                 None to not render them
+        :type timeline_element: Optional[DeltaGenerator]
+        :param churn_element: Element the client churn is rendered in,
+                              None to not render it
+        :type churn_element: Optional[DeltaGenerator]
+        :param memory_budget: Bytes of the churn series to keep before its
+                              oldest samples are rolled up
+        :type memory_budget: int
+        :param max_points: Number of churn samples to chart
+        :type max_points: int
+        """
+        self.timeline_element = timeline_element
+        self.churn_element = churn_element
+        self.max_points = max_points
+        self.deltas = DeltaFilter()
+        self.timeline = ClientTimeline(budget=memory_budget)
+        self.tailer = TelemetryTailer(
+            client_file,
+            {
+                column: dtype
+                for column, dtype in get_telemetry_dtypes("clients").items()
+                if column != "address"
+            },
+            columns=["timestamp", "client_id"],
+        )
+
+    @timed_method
+    def update(self, timestamp_min: float = 0) -> None:
+        """Add the rows appended to the client file to the client sessions
+        and churn, and update their charts
+
+        :param timestamp_min: Timestamp charted as the start of the run
+        :type timestamp_min: float
+        """
+        try:
+            rows = self.tailer.read()
+        except FileNotFoundError:
+            return
+        if self.tailer.truncated:
+            self.timeline.reset()
+        if not self.timeline.update(rows) and not self.tailer.truncated:
+            return
+
+        if self.timeline_element is not None:
+            sessions = self.timeline.sessions()
+            if self.deltas.changed("timeline", sessions):
+                self.timeline_element.altair_chart(
+                    timeline_chart(sessions, timestamp_min), use_container_width=True
+                )
+        if self.churn_element is not None:
+            churn = self.timeline.churn.downsample(self.max_points)
+            if self.deltas.changed("churn", churn):
+                self.churn_element.altair_chart(
+                    churn_chart(churn, timestamp_min), use_container_width=True
+                )
+
+
+class ClientView(DatabaseDataView):
+    """View class for client section of the Database Telemetry page"""
+
+    def __init__(
+        self,
+        shard: t.Optional[Shard],
+        table_element: DeltaGenerator,
+        graph_element: DeltaGenerator,
+        export_button: DeltaGenerator,
+        *,
+        memory_budget: int = TELEMETRY_BUDGET,
+        window_minutes: t.Optional[float] = None,
+        timeline_view: t.Optional[ClientTimelineView] = None,
+    ):
+        """Initialize a ClientView
+
+        :param shard: Selected shard
+        :type shard: Optional[Shard]
+        :param table_element: Element the table is rendered in
+        :type table_element: DeltaGenerator
+        :param graph_element: Element the chart is rendered in
+        :type graph_element: DeltaGenerator
+        :param export_button: Element the export button is rendered in
+        :type export_button: DeltaGenerator
+        :param memory_budget: Bytes of telemetry rows to keep before the
+                              oldest rows are rolled up
+        :type memory_budget: int
+        :param window_minutes: Minutes of the newest telemetry to chart in
+                               full, with the rest of the run downsampled,
+                               None to chart the whole run alike
+        :type window_minutes: Optional[float]
+        :param timeline_view: Client sessions and churn of the shard, None
+                              to not analyze client sessions
+        :type timeline_view: Optional[ClientTimelineView]
+        """
+        super().__init__(
+            shard,
+            table_element,
+            graph_element,
+            export_button,
+            memory_budget=memory_budget,
+            window_minutes=window_minutes,
+        )
+        self.timeline_view = timeline_view
+        self._update_timeline()
+
+    def update(self) -> None:
+        """Checks for new data and calls to update the table, graph,
+        client sessions and churn if there is new data"""
+        super().update()
+        self._update_timeline()
+
+    def _update_timeline(self) -> None:
+        """Tail the client file into the client sessions and churn"""
+        if self.timeline_view is not None and self.telemetry:
+            self.timeline_view.update(self.timestamp_min)
+
+    @property
+    def files(self) -> Files:
+        """Returns a tuple of the files used for telemetry"""
+        if self.shard is not None:
+            return Files(self.shard.client_count_file, self.shard.client_file)
+
+        return Files("", "")
+
+    @property
+    def message(self) -> str:
+        """Returns the error message if files cannot be found"""
+        if self.shard is not None:
+            return f"Client information could not be found for {self.shard.name}"
+
+        return ""
+
+    @property
+    def columns(self) -> t.List[str]:
+        """Returns columns for the graph dataframe"""
+        return ["timestamp", "num_clients"]
+
+    @property
+    def kind(self) -> str:
+        """Returns the kind of telemetry in the graph file"""
+        return "client_count"
+
+    def enable_export_button(self) -> None:
+        """Create an export data button"""
+        if self.shard is not None and self.telemetry:
+            self.export_button.download_button(
+                label="Export Data",
+                data=self._get_data_file(),
+                file_name=f"{self.shard.name}-clients.csv",
+                mime="text/csv",
+                key="clients",
+            )
+        else:
+            self.export_button.empty()
+
+    def _handle_data(self, graph_delta_df: pd.DataFrame) -> None:
+        """Updates the table and graph with appropriate dataframes"""
+        try:
+            self._update_table(
+                read_latest_snapshot(
+                    self.files.table_file, dtypes=get_telemetry_dtypes("clients")
+                )
+            )
+        except FileNotFoundError:
+            self.table_element.info(self.message)
+            self.deltas.forget("table")
+        graph_df = self._sample_graph()
+        self._update_graph(graph_delta_df if graph_df is None else graph_df)
+
+    def _update_table(self, dframe: pd.DataFrame) -> None:
+        """Update client table for selected shard
+
+        :param dframe: DataFrame with client data
+        :type dframe: pandas.DataFrame
+        """
+        dframe = dframe.loc[dframe["timestamp"] == dframe["timestamp"].max()]
+        dframe = dframe.drop(columns=["timestamp"])
+        dframe = dframe.sort_values(by="client_id")
+        dframe = dframe.rename(
+            columns={
+                "client_id": "Client ID",
+                "address": "Address",
+            }
+        )
+
+        if self.deltas.changed("table", dframe):
+            self.table_element.dataframe(
+                dframe, use_container_width=True, hide_index=True
+            )
+
+    def _update_graph(self, dframe: pd.DataFrame) -> None:
+        """Update client graph for selected shard
+
+        :param dframe: DataFrame with client data
+        :type dframe: pandas.DataFrame
+        """
+
+        dframe = dframe.assign(
+            timestamp=(dframe["timestamp"] - self.timestamp_min) / 1000
+        )
+
+        if self.chart is None or self.sampling:
+            self.chart = client_count_chart(dframe)
+            self.graph_element.altair_chart(self.chart, use_container_width=True)
+
+        else:
+            self.graph_element.add_rows(dframe)
+
+
+class OrchestratorSummaryView(ViewBase):
+    """View class for orchestrator summary section of the Database Telemetry page"""
+
+    def __init__(self, orchestrator: t.Optional[Orchestrator]) -> None:
+        """Initialize an OrchestratorSummaryView
+
+        :param orchestrator: Selected orchestrator
+        :type orchestrator: t.Optional[Orchestrator]
+        """
+        self.orchestrator = orchestrator
+        self.status_element = DeltaGenerator()
+        self.deltas = DeltaFilter()
+
+    @property
+    def status(self) -> str:
+        """Get orchestrator status summary
+
+        :return: Status summary
+        :rtype: str
+        """
+        return get_orchestrator_status_summary(self.orchestrator)
+
+    def update(self) -> None:
+        """Update status element in OrchestratorView"""
+        status = self.status
+        if self.deltas.changed("status", status):
+            self.status_element.write(status)
+
+
+class DatabaseTelemetryView(ViewBase):
+    """View class for the collection of Database Telemetry views"""
+
+    def __init__(
+        self,
+        orc_summary_view: OrchestratorSummaryView,
+        memory_view: MemoryView,
+        client_view: ClientView,
+    ) -> None:
+        """Initialize a TelemetryView
+
+        :param orc_summary_view: OrchestratorSummaryView rendered in the dashboard
+        :type orc_summary_view: OrchestratorSummaryView
+        :param memory_view: MemoryView rendered in the dashboard
+        :type memory_view: MemoryView
+        :param client_view: ClientView view rendered in the dashboard
+        :type client_view: ClientView
+        """
+        self.orc_summary_view = orc_summary_view
+        self.memory_view = memory_view
+        self.client_view = client_view
+
+    def update(self) -> None:
+        """Update all views within the TelemetryView"""
+        self.orc_summary_view.update()
+        self.memory_view.update()
+        self.client_view.update()
+
+
+def client_count_chart(client_counts: pd.DataFrame) -> "alt.Chart":
+    """Build the chart of the number of connected clients
+
+    :param client_counts: Client counts with timestamps in seconds
+    :type client_counts: pandas.DataFrame
+    :return: Chart with a line for the client count
+    :rtype: altair.Chart
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import altair as alt
+
+    chart: "alt.Chart" = (
+        alt.Chart(client_counts)
+        .mark_line()
+        .encode(
+            x=alt.X("timestamp:Q", axis=alt.Axis(title="Timestep in seconds")),
+            y=alt.Y("num_clients:Q", axis=alt.Axis(title="Client Count")),
+            tooltip=["timestamp:Q", "num_clients:Q"],
+        )
+        .interactive()
+        .properties(
+            height=500,
+            title=alt.TitleParams("Total Client Count", anchor="middle"),
+        )
+    )
+    return chart
+
+
+def timeline_chart(sessions: pd.DataFrame, timestamp_min: float = 0) -> "alt.Chart":
+    """Build the chart of client sessions
+
+    :param sessions: Sessions of a ClientTimeline
+    :type sessions: pandas.DataFrame
+    :param timestamp_min: Timestamp charted as the start of the run
+    :type timestamp_min: float
+    :return: Chart with a bar from the connect to the disconnect of
+             each session
+    :rtype: altair.Chart
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import altair as alt
+
+    sessions = sessions.assign(
+        connected=(sessions["connected"] - timestamp_min) / 1000,
+        disconnected=(sessions["disconnected"] - timestamp_min) / 1000,
+        duration=(sessions["disconnected"] - sessions["connected"]) / 1000,
+        open=sessions["open"].map({True: "Connected", False: "Disconnected"}),
+    )
+    chart: "alt.Chart" = (
+        alt.Chart(sessions)
+        .mark_bar()
+        .encode(
+            x=alt.X("connected:Q", axis=alt.Axis(title="Timestep in seconds")),
+            x2="disconnected:Q",
+            y=alt.Y("client_id:N", axis=alt.Axis(title="Client ID")),
+            color=alt.Color("open:N", title="State"),
+            tooltip=[
+                "client_id:N",
+                "connected:Q",
+                "disconnected:Q",
+                alt.Tooltip("duration:Q", title="duration (s)"),
+            ],
+        )
+        .interactive()
+        .properties(
+            height=500,
+            title=alt.TitleParams("Client Connections", anchor="middle"),
+        )
+    )
+    return chart
+
+
+def churn_chart(churn: pd.DataFrame, timestamp_min: float = 0) -> "alt.Chart":
+    """Build the chart of client connects and disconnects per sample
+
+    :param churn: Churn series of a ClientTimeline
+    :type churn: pandas.DataFrame
+    :param timestamp_min: Timestamp charted as the start of the run
+    :type timestamp_min: float
+    :return: Chart with a line for connects and one for disconnects
+    :rtype: altair.Chart
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import altair as alt
+
+    churn = (
+        churn.assign(timestamp=(churn["timestamp"] - timestamp_min) / 1000)
+        .rename(columns={"connects": "Connects", "disconnects": "Disconnects"})
+        .melt(
+            "timestamp",
+            value_vars=["Connects", "Disconnects"],
+            var_name="Event",
+            value_name="Clients",
+        )
+    )
+    chart: "alt.Chart" = (
+        alt.Chart(churn)
+        .mark_line()
+        .encode(
+            x=alt.X("timestamp:Q", axis=alt.Axis(title="Timestep in seconds")),
+            y=alt.Y("Clients:Q", axis=alt.Axis(title="Clients per sample")),
+            color=alt.Color("Event:N", title="Legend"),
+            tooltip=["timestamp:Q", "Event:N", "Clients:Q"],
+        )
+        .interactive()
+        .properties(height=300, title=alt.TitleParams("Client Churn", anchor="middle"))
+    )
+    return chart
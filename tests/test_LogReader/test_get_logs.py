@@ -26,7 +26,7 @@
 
 import pytest
 
-from smartdashboard.utils.LogReader import get_logs
+from smartdashboard.utils.LogReader import get_log_tail, get_logs
 
 from ..utils.test_entities import *
 
@@ -53,3 +53,17 @@ def test_load_log_data(entity, expected_output_log, expected_error_log):
     error_logs = get_logs(error_log_path)
     assert output_logs == expected_output_log
     assert error_logs == expected_error_log
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 64 * 1024])
+@pytest.mark.parametrize("lines", [0, 1, 3, 100])
+def test_get_log_tail(tmp_path, block_size, lines):
+    log_file = tmp_path / "model.out"
+    text = "".join(f"line {i}\n" for i in range(20)) + "partial"
+    log_file.write_text(text, encoding="utf-8")
+    expected = text.splitlines()[-lines:] if lines else []
+    assert get_log_tail(str(log_file), lines, block_size) == expected
+
+
+def test_get_log_tail_missing_file(tmp_path):
+    assert get_log_tail(str(tmp_path / "missing.out"), 10) == []
@@ -0,0 +1,108 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import time
+
+import pytest
+
+from smartdashboard.utils import LogReader
+from smartdashboard.utils.LogReader import LogCache
+from smartdashboard.utils.storage import get_storage
+
+
+@pytest.fixture
+def settled_log(tmp_path):
+    path = tmp_path / "model.out"
+    path.write_text("line 1\n", encoding="utf-8")
+    settled = time.time() - 60
+    os.utime(path, (settled, settled))
+    return path
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    opened = []
+    storage = get_storage()
+    open_binary = storage.open_binary
+
+    def counting_open(path):
+        opened.append(path)
+        return open_binary(path)
+
+    monkeypatch.setattr(storage, "open_binary", counting_open)
+    return opened
+
+
+def test_cached_until_modified(settled_log, reads):
+    cache = LogCache()
+    assert cache.read(str(settled_log)) == "line 1\n"
+    assert cache.read(str(settled_log)) == "line 1\n"
+    assert len(reads) == 1
+
+    settled_log.write_text("line 1\nline 2\n", encoding="utf-8")
+    settled = time.time() - 30
+    os.utime(settled_log, (settled, settled))
+    assert cache.read(str(settled_log)) == "line 1\nline 2\n"
+    assert len(reads) == 2
+
+
+def test_recently_modified_not_cached(tmp_path, reads):
+    path = tmp_path / "model.out"
+    path.write_text("running\n", encoding="utf-8")
+
+    cache = LogCache()
+    assert cache.read(str(path)) == "running\n"
+    assert cache.read(str(path)) == "running\n"
+    assert len(reads) == 2
+    assert len(cache) == 0
+
+
+def test_budget(tmp_path):
+    settled = time.time() - 60
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"model_{i}.out"
+        path.write_text("x" * 10, encoding="utf-8")
+        os.utime(path, (settled, settled))
+        paths.append(str(path))
+    big = tmp_path / "big.out"
+    big.write_text("x" * 100, encoding="utf-8")
+    os.utime(big, (settled, settled))
+
+    cache = LogCache(max_chars=25)
+    for path in paths:
+        cache.read(path)
+    assert len(cache) == 2
+    assert cache.size == 20
+
+    cache.read(str(big))
+    assert len(cache) == 2
+
+
+def test_get_logs_missing_file():
+    assert LogReader.get_logs("") == ""
+    assert LogReader.get_logs("tests/utils/log_files/missing.out") == ""
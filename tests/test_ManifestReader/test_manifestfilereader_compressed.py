@@ -0,0 +1,100 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import pathlib
+
+import pytest
+
+from smartdashboard.utils.errors import ManifestError
+from smartdashboard.utils.ManifestReader import (
+    ManifestFileReader,
+    create_filereader,
+    get_manifest_path,
+)
+
+MANIFEST = pathlib.Path("tests/utils/manifest_files/manifesttest.json")
+
+
+def compress_gzip(data: bytes) -> bytes:
+    return gzip.compress(data)
+
+
+def compress_zstd(data: bytes) -> bytes:
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdCompressor().compress(data)
+
+
+@pytest.mark.parametrize(
+    "file_name, compress",
+    [
+        pytest.param("manifest.json.gz", compress_gzip, id="gzip"),
+        pytest.param("manifest.json.zst", compress_zstd, id="zstandard"),
+    ],
+)
+def test_compressed_manifest(tmp_path, file_name, compress):
+    telemetry_dir = tmp_path / ".smartsim/telemetry"
+    telemetry_dir.mkdir(parents=True)
+    (telemetry_dir / file_name).write_bytes(compress(MANIFEST.read_bytes()))
+
+    manifest_path = get_manifest_path(tmp_path)
+    assert manifest_path == (telemetry_dir / file_name).resolve()
+
+    manifest_reader = create_filereader(manifest_path)
+    assert manifest_reader.get_manifest() == ManifestFileReader(MANIFEST).get_manifest()
+    assert manifest_reader.has_changed == False
+
+
+def test_uncompressed_manifest_preferred(tmp_path):
+    telemetry_dir = tmp_path / ".smartsim/telemetry"
+    telemetry_dir.mkdir(parents=True)
+    (telemetry_dir / "manifest.json.gz").write_bytes(gzip.compress(b"{}"))
+    (telemetry_dir / "manifest.json").write_bytes(MANIFEST.read_bytes())
+
+    assert get_manifest_path(tmp_path) == (telemetry_dir / "manifest.json").resolve()
+
+
+def test_missing_manifest_path(tmp_path):
+    assert (
+        get_manifest_path(tmp_path)
+        == (tmp_path / ".smartsim/telemetry/manifest.json").resolve()
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b"not gzip data", id="not gzip"),
+        pytest.param(gzip.compress(MANIFEST.read_bytes())[:100], id="truncated"),
+        pytest.param(gzip.compress(b'{"schema info": '), id="undecodable"),
+    ],
+)
+def test_corrupt_compressed_manifest(tmp_path, data):
+    manifest_path = tmp_path / "manifest.json.gz"
+    manifest_path.write_bytes(data)
+
+    with pytest.raises(ManifestError):
+        create_filereader(manifest_path)
@@ -0,0 +1,128 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import pathlib
+import shutil
+import time
+
+import pytest
+
+from smartdashboard.utils.errors import ManifestError
+from smartdashboard.utils.ManifestLoader import ManifestLoader
+
+MANIFEST_FILES = pathlib.Path("tests/utils/manifest_files")
+
+
+def replace_manifest(source: pathlib.Path, target: pathlib.Path) -> None:
+    mtime = os.path.getmtime(target)
+    shutil.copyfile(source, target)
+    os.utime(target, (mtime + 1, mtime + 1))
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    path = tmp_path / "manifest.json"
+    shutil.copyfile(MANIFEST_FILES / "manifesttest.json", path)
+    return path
+
+
+def test_initial_snapshot(manifest_path):
+    loader = ManifestLoader(manifest_path)
+    assert loader.snapshot.version == 0
+    assert len(list(loader.snapshot.manifest.orcs_with_run_ctx)) > 0
+    assert loader.poll() == False
+
+
+def test_initial_load_error(tmp_path):
+    with pytest.raises(ManifestError):
+        ManifestLoader(tmp_path / "manifest.json")
+
+
+def test_poll_publishes_new_snapshot(manifest_path):
+    loader = ManifestLoader(manifest_path)
+    snapshot = loader.snapshot
+
+    replace_manifest(MANIFEST_FILES / "no_orchestrator_manifest.json", manifest_path)
+
+    assert loader.poll() == True
+    assert loader.snapshot is not snapshot
+    assert loader.snapshot.version == 1
+    assert len(list(loader.snapshot.manifest.orcs_with_run_ctx)) == 0
+    assert loader.error is None
+
+
+def test_poll_keeps_last_good_snapshot(manifest_path):
+    loader = ManifestLoader(manifest_path)
+    snapshot = loader.snapshot
+
+    replace_manifest(MANIFEST_FILES / "JSONDecodererror.json", manifest_path)
+
+    assert loader.poll() == False
+    assert loader.snapshot is snapshot
+    assert isinstance(loader.error, ManifestError)
+
+    replace_manifest(MANIFEST_FILES / "no_apps_manifest.json", manifest_path)
+
+    assert loader.poll() == True
+    assert loader.snapshot.version == 1
+    assert loader.error is None
+
+
+def test_background_thread(manifest_path):
+    loader = ManifestLoader(manifest_path, interval=0.01)
+    loader.start()
+    try:
+        replace_manifest(MANIFEST_FILES / "no_apps_manifest.json", manifest_path)
+        deadline = time.monotonic() + 5
+        while loader.snapshot.version == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert loader.snapshot.version == 1
+    finally:
+        loader.stop()
+
+
+def test_background_thread_survives_unexpected_error(manifest_path, monkeypatch):
+    loader = ManifestLoader(manifest_path, interval=0.01)
+    calls = []
+
+    def poll():
+        calls.append(None)
+        if len(calls) == 1:
+            raise RuntimeError("unexpected")
+        return False
+
+    monkeypatch.setattr(loader, "poll", poll)
+    loader.start()
+    try:
+        deadline = time.monotonic() + 5
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(calls) >= 2
+        assert isinstance(loader.error, ManifestError)
+        assert isinstance(loader.error.exception, RuntimeError)
+    finally:
+        loader.stop()
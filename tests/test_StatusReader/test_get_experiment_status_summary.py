@@ -28,9 +28,16 @@ import typing as t
 
 import pytest
 
+from smartdashboard.schemas.run import Run
 from smartdashboard.utils.ManifestReader import ManifestFileReader
 from smartdashboard.utils.status import GREEN_RUNNING, StatusEnum
-from smartdashboard.utils.StatusReader import get_experiment_status_summary
+from smartdashboard.utils.StatusReader import (
+    get_experiment_status,
+    get_experiment_status_summary,
+)
+from tests.utils.test_entities import application_1, application_3, ensemble_3
+
+no_status_dir = application_1.copy(update={"telemetry_metadata": {}})
 
 
 @pytest.mark.parametrize(
@@ -55,3 +62,40 @@ def test_get_experiment_status_summary(json_file, expected_status):
     manifest = manifest_file_reader.get_manifest()
     status = get_experiment_status_summary(manifest.runs)
     assert status == expected_status
+
+
+def _malformed_stop(tmp_path):
+    status_dir = tmp_path / "status"
+    status_dir.mkdir()
+    (status_dir / "start.json").write_text("{}", encoding="utf-8")
+    (status_dir / "stop.json").write_text("{", encoding="utf-8")
+    return application_1.copy(
+        update={"telemetry_metadata": {"status_dir": str(status_dir)}}
+    )
+
+
+def test_malformed_stop_file_is_inactive(tmp_path):
+    runs = [Run(run_id="0", model=[application_1, _malformed_stop(tmp_path)])]
+    assert get_experiment_status(runs) == StatusEnum.INACTIVE
+    assert get_experiment_status_summary(runs) == (
+        f"Status: {StatusEnum.INACTIVE.value}"
+    )
+
+
+@pytest.mark.parametrize(
+    "models, expected",
+    [
+        pytest.param([application_3, no_status_dir], StatusEnum.RUNNING),
+        pytest.param([no_status_dir, application_3], StatusEnum.MALFORMED),
+    ],
+)
+def test_first_running_or_malformed_entity_wins(models, expected):
+    assert get_experiment_status([Run(run_id="0", model=models)]) == expected
+
+
+def test_applications_are_checked_before_members():
+    runs = [
+        Run(run_id="0", ensemble=[ensemble_3]),
+        Run(run_id="1", model=[no_status_dir]),
+    ]
+    assert get_experiment_status(runs) == StatusEnum.MALFORMED
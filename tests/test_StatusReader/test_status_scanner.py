@@ -0,0 +1,140 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+
+from smartdashboard.schemas.run import Run
+from smartdashboard.utils import StatusReader
+from smartdashboard.utils.cache import SourceCache
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import (
+    STATUS_CODES,
+    StatusData,
+    StatusScanner,
+    get_experiment_status_summary,
+    get_status_scanner,
+)
+from tests.utils.test_entities import application_1, ensemble_1, ensemble_4
+
+STATUS_DIRS = [
+    "tests/utils/status_files/model_0",
+    "tests/utils/status_files/model_1",
+    "tests/utils/status_files/model_3",
+    "tests/utils/status_files/missing",
+    None,
+]
+
+
+def test_scan():
+    scanner = StatusScanner(STATUS_DIRS)
+    scanner.scan()
+
+    assert len(scanner) == len(STATUS_DIRS)
+    assert [STATUS_CODES[code] for code in scanner.codes] == [
+        StatusEnum.COMPLETED,
+        StatusEnum.FAILED,
+        StatusEnum.RUNNING,
+        StatusEnum.UNKNOWN,
+        StatusEnum.MALFORMED,
+    ]
+    assert scanner.status(0) == StatusData(StatusEnum.COMPLETED, 0)
+    assert scanner.status(1) == StatusData(StatusEnum.FAILED, 1)
+    assert scanner.status(2) == StatusData(StatusEnum.RUNNING, None)
+    assert scanner.counts() == {
+        StatusEnum.RUNNING: 1,
+        StatusEnum.COMPLETED: 1,
+        StatusEnum.FAILED: 1,
+        StatusEnum.UNKNOWN: 1,
+        StatusEnum.MALFORMED: 1,
+    }
+
+
+def test_scan_skips_finished(monkeypatch):
+    read = []
+    get_status = StatusReader.get_status
+
+    def counting_get_status(status_dir):
+        read.append(status_dir)
+        return get_status(status_dir)
+
+    monkeypatch.setattr(StatusReader, "get_status", counting_get_status)
+    scanner = StatusScanner(STATUS_DIRS, min_interval=0)
+    scanner.scan()
+    assert read == STATUS_DIRS[:4]
+
+    read.clear()
+    scanner.scan()
+    assert read == STATUS_DIRS[2:4]
+
+
+def test_scan_min_interval(monkeypatch):
+    scanner = StatusScanner(STATUS_DIRS, min_interval=60)
+    scanner.scan()
+
+    monkeypatch.setattr(
+        StatusReader, "get_status", lambda status_dir: pytest.fail("scanned again")
+    )
+    scanner.scan()
+
+
+def test_get_status_scanner_is_shared():
+    scanner = get_status_scanner(ensemble_1.models)
+    assert get_status_scanner(ensemble_1.models) is scanner
+    assert get_status_scanner(ensemble_4.models) is not scanner
+    assert len(scanner) == len(ensemble_1.models)
+
+
+def test_experiment_summary_keeps_every_scanner(monkeypatch):
+    cache: SourceCache[StatusScanner] = SourceCache(maxsize=1)
+    monkeypatch.setattr(StatusReader, "_scanners", cache)
+    runs = [Run(run_id=str(run_id), model=[application_1]) for run_id in range(3)]
+    get_experiment_status_summary(runs)
+    scanners = [get_status_scanner(run.model) for run in runs]
+    get_experiment_status_summary(runs)
+    assert all(
+        get_status_scanner(run.model) is scanner for run, scanner in zip(runs, scanners)
+    )
+
+
+def test_finished_statuses_are_cached(tmp_path):
+    status_dir = tmp_path / "status"
+    status_dir.mkdir()
+    (status_dir / "start.json").write_text("{}", encoding="utf-8")
+    (status_dir / "stop.json").write_text('{"return_code": 0}', encoding="utf-8")
+    assert StatusReader.get_status(str(status_dir)).status == StatusEnum.COMPLETED
+
+    (status_dir / "stop.json").unlink()
+    assert StatusReader.get_status(str(status_dir)).status == StatusEnum.COMPLETED
+
+
+def test_running_statuses_are_not_cached(tmp_path):
+    status_dir = tmp_path / "status"
+    status_dir.mkdir()
+    (status_dir / "start.json").write_text("{}", encoding="utf-8")
+    assert StatusReader.get_status(str(status_dir)).status == StatusEnum.RUNNING
+
+    (status_dir / "stop.json").write_text('{"return_code": 3}', encoding="utf-8")
+    assert StatusReader.get_status(str(status_dir)) == StatusData(StatusEnum.FAILED, 3)
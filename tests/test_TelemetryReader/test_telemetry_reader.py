@@ -0,0 +1,355 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from smartdashboard.utils import timing
+from smartdashboard.utils.TelemetryReader import (
+    TelemetryStore,
+    TelemetryTailer,
+    _last_line_end,
+    get_telemetry_dtypes,
+    get_telemetry_file,
+    read_latest_snapshot,
+    read_telemetry,
+    slice_telemetry,
+)
+from tests.utils.test_entities import pending_shard
+
+MEMORY_FILE = "tests/utils/memory/memory.csv"
+CLIENT_FILE = "tests/utils/clients/client.csv"
+
+
+def test_read_telemetry():
+    assert read_telemetry(MEMORY_FILE).shape == (30, 4)
+    assert read_telemetry(MEMORY_FILE, skiprows=5).shape == (26, 4)
+
+
+def test_read_telemetry_missing_file():
+    with pytest.raises(FileNotFoundError):
+        read_telemetry("tests/utils/memory/missing.csv")
+
+
+@pytest.mark.parametrize(
+    "arrow, expected",
+    [
+        pytest.param(False, ["int64", "float32", "float32", "float32"], id="numpy"),
+        pytest.param(
+            True,
+            ["int64[pyarrow]", "float[pyarrow]", "float[pyarrow]", "float[pyarrow]"],
+            id="arrow",
+        ),
+    ],
+)
+def test_read_telemetry_dtypes(arrow, expected):
+    dtypes = get_telemetry_dtypes("memory", arrow=arrow)
+    dframe = read_telemetry(MEMORY_FILE, dtypes=dtypes)
+    assert [str(dtype) for dtype in dframe.dtypes] == expected
+
+    inferred = read_telemetry(MEMORY_FILE)
+    assert np.allclose(dframe["used_memory"].to_numpy(float), inferred["used_memory"])
+    assert dframe.memory_usage(deep=True).sum() < inferred.memory_usage(deep=True).sum()
+
+
+def test_read_telemetry_dtypes_fallback(tmp_path):
+    telemetry_file = tmp_path / "client_count.csv"
+    telemetry_file.write_text("timestamp,num_clients\n1,2\n2,\n", encoding="utf-8")
+    dtypes = get_telemetry_dtypes("client_count")
+
+    dframe = read_telemetry(str(telemetry_file), dtypes=dtypes)
+    assert dframe.shape == (2, 2)
+    assert dframe["num_clients"].isna().iloc[1]
+
+
+@pytest.mark.parametrize("block_size", [1, 16, 64 * 1024])
+def test_read_latest_snapshot(block_size):
+    clients = read_telemetry(CLIENT_FILE)
+    expected = clients.loc[clients["timestamp"] == clients["timestamp"].max()]
+
+    snapshot = read_latest_snapshot(CLIENT_FILE, block_size=block_size)
+    pd.testing.assert_frame_equal(snapshot, expected.reset_index(drop=True))
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        pytest.param("", [], id="header only"),
+        pytest.param("1,0,a\n1,1,b\n", [0, 1], id="single snapshot"),
+        pytest.param("1,0,a\n10,1,b\n10,2,c\n", [1, 2], id="prefix timestamp"),
+        pytest.param("1,0,a\n2,1,b\n2,2,", [1], id="partial line"),
+    ],
+)
+def test_read_latest_snapshot_edges(tmp_path, body, expected):
+    client_file = tmp_path / "client.csv"
+    client_file.write_text("timestamp,client_id,address\n" + body, encoding="utf-8")
+    snapshot = read_latest_snapshot(str(client_file), block_size=4)
+    assert snapshot["client_id"].tolist() == expected
+    assert list(snapshot.columns) == ["timestamp", "client_id", "address"]
+
+
+def test_read_latest_snapshot_reads_the_end(tmp_path, monkeypatch):
+    recorder = timing.Timings()
+    recorder.enabled = True
+    monkeypatch.setattr(timing, "_timings", recorder)
+    client_file = tmp_path / "client.csv"
+    rows = "".join(
+        f"{sample},{client},addr\n" for sample in range(1000) for client in range(4)
+    )
+    client_file.write_text("timestamp,client_id,address\n" + rows, encoding="utf-8")
+
+    snapshot = read_latest_snapshot(str(client_file), block_size=64)
+    assert snapshot["timestamp"].tolist() == [999] * 4
+    (span,) = recorder.spans()
+    assert span.bytes_read < client_file.stat().st_size // 100
+
+
+def test_read_latest_snapshot_missing_file():
+    with pytest.raises(FileNotFoundError):
+        read_latest_snapshot("tests/utils/clients/missing.csv")
+
+
+def test_get_telemetry_dtypes():
+    assert get_telemetry_dtypes("clients")["address"] == "category"
+    assert get_telemetry_dtypes("clients", arrow=True)["address"] == "string[pyarrow]"
+    with pytest.raises(KeyError):
+        get_telemetry_dtypes("cpu")
+
+
+def test_get_telemetry_file():
+    assert get_telemetry_file(pending_shard, "memory") == pending_shard.memory_file
+    with pytest.raises(KeyError):
+        get_telemetry_file(pending_shard, "cpu")
+
+
+@pytest.mark.parametrize(
+    "start, end, max_points, expected",
+    [
+        pytest.param(None, None, None, list(range(10)), id="all"),
+        pytest.param(3, 6, None, [3, 4, 5, 6], id="range"),
+        pytest.param(None, None, 4, [0, 3, 6, 9], id="downsample"),
+        pytest.param(None, None, 3, [0, 4, 9], id="keeps last"),
+        pytest.param(2, None, 20, list(range(2, 10)), id="under limit"),
+    ],
+)
+def test_slice_telemetry(start, end, max_points, expected):
+    dframe = pd.DataFrame({"timestamp": range(10), "value": range(10)})
+    sliced = slice_telemetry(dframe, start, end, max_points)
+    assert list(sliced["timestamp"]) == expected
+
+
+def test_tailer_reads_appended_rows(tmp_path):
+    telemetry_file = tmp_path / "telemetry.csv"
+    telemetry_file.write_text("timestamp,value\n1,10\n2,", encoding="utf-8")
+    tailer = TelemetryTailer(str(telemetry_file))
+
+    assert list(tailer.read()["value"]) == [10]
+
+    with open(telemetry_file, "a", encoding="utf-8") as file:
+        file.write("20\n3,30\n")
+    assert list(tailer.read()["timestamp"]) == [2, 3]
+    assert tailer.read().empty
+    assert not tailer.truncated
+
+
+def test_tailer_dtypes(tmp_path):
+    telemetry_file = tmp_path / "client_count.csv"
+    telemetry_file.write_text("timestamp,num_clients\n1,2\n", encoding="utf-8")
+    tailer = TelemetryTailer(str(telemetry_file), get_telemetry_dtypes("client_count"))
+    assert str(tailer.read()["num_clients"].dtype) == "int32"
+
+    with open(telemetry_file, "a", encoding="utf-8") as file:
+        file.write("2,3\n")
+    assert str(tailer.read()["num_clients"].dtype) == "int32"
+
+
+@pytest.mark.parametrize(
+    "replacement",
+    [
+        pytest.param("timestamp,value\n9,90\n", id="shorter"),
+        pytest.param("timestamp,other\n9,90\n8,80\n7,70\n6,60\n", id="new header"),
+    ],
+)
+def test_tailer_rereads_truncated_file(tmp_path, replacement):
+    telemetry_file = tmp_path / "telemetry.csv"
+    telemetry_file.write_text("timestamp,value\n1,10\n2,20\n", encoding="utf-8")
+    tailer = TelemetryTailer(str(telemetry_file))
+    tailer.read()
+
+    telemetry_file.write_text(replacement, encoding="utf-8")
+    rows = tailer.read()
+    assert tailer.truncated
+    assert rows.iloc[0]["timestamp"] == 9
+
+
+def test_tailer_waits_for_header(tmp_path):
+    telemetry_file = tmp_path / "telemetry.csv"
+    telemetry_file.write_text("timestamp,val", encoding="utf-8")
+    tailer = TelemetryTailer(str(telemetry_file))
+    assert tailer.read().empty
+
+    with open(telemetry_file, "a", encoding="utf-8") as file:
+        file.write("ue\n1,10\n")
+    assert list(tailer.read().columns) == ["timestamp", "value"]
+
+
+def test_tailer_skip(tmp_path):
+    telemetry_file = tmp_path / "telemetry.csv"
+    telemetry_file.write_text("timestamp,val", encoding="utf-8")
+    tailer = TelemetryTailer(str(telemetry_file))
+    assert not tailer.skip()
+
+    with open(telemetry_file, "a", encoding="utf-8") as file:
+        file.write("ue\n1,10\n2,")
+    assert tailer.skip()
+    with open(telemetry_file, "a", encoding="utf-8") as file:
+        file.write("20\n")
+    assert list(tailer.read()["value"]) == [20]
+
+
+def _rows(start, stop):
+    return pd.DataFrame(
+        {"timestamp": np.arange(start, stop) * 1000, "value": np.arange(start, stop)}
+    )
+
+
+def test_store_appends_without_rollups():
+    store = TelemetryStore(["timestamp", "value"])
+    for start in range(0, 100, 10):
+        store.append(_rows(start, start + 10))
+    store.append(_rows(100, 100).iloc[:0])
+
+    assert len(store) == 100
+    assert store.rollup_rows == 0
+    assert store.capacity < 200
+    pd.testing.assert_frame_equal(store.frame(), _rows(0, 100))
+    pd.testing.assert_frame_equal(store.tail().reset_index(drop=True), _rows(99, 100))
+
+
+def test_store_rolls_up_oldest_rows():
+    budget = _rows(0, 1000).memory_usage(index=True, deep=True).sum()
+    store = TelemetryStore(["timestamp", "value"], budget=budget, rollup_ms=10_000)
+    for start in range(0, 3000, 100):
+        store.append(_rows(start, start + 100))
+
+    assert store.raw_bytes <= budget
+    assert store.nbytes <= budget * 1.5
+    assert store.rollup_rows > 0
+    frame = store.frame()
+    assert frame["timestamp"].is_monotonic_increasing
+    # every raw row is still at the end, and rollups hold bucket means
+    assert frame["value"].iloc[-1] == 2999
+    first_bucket = store.rollup_ms // 1000
+    assert frame["value"].iloc[0] == pytest.approx((first_bucket - 1) / 2)
+    total = store._rollup_counts.sum() + store.raw_rows
+    assert total == 3000
+
+
+def test_store_rolls_up_a_large_first_load():
+    budget = _rows(0, 100).memory_usage(index=True, deep=True).sum()
+    store = TelemetryStore(["timestamp", "value"], budget=budget)
+    store.append(_rows(0, 10_000))
+
+    assert store.raw_bytes <= budget
+    assert store.rollup_rows > 0
+    assert store.tail()["value"].iloc[0] == 9999
+
+
+def test_store_reset():
+    store = TelemetryStore(["timestamp", "value"], budget=1000)
+    store.append(_rows(0, 1000))
+    store.reset()
+    assert len(store) == 0
+    assert list(store.frame().columns) == ["timestamp", "value"]
+
+
+def test_store_downsample():
+    store = TelemetryStore(["timestamp", "value"])
+    for start in range(0, 1000, 7):
+        store.append(_rows(start, min(start + 7, 1000)))
+
+    sample = store.downsample(10)
+    assert len(sample) == 10
+    assert sample["value"].iloc[0] == 0
+    assert sample["value"].iloc[-1] == 999
+    assert sample["value"].is_monotonic_increasing
+    assert len(store.downsample(2000)) == 1000
+
+
+def test_store_ring_wraps():
+    budget = 16 * 100
+    store = TelemetryStore(["timestamp", "value"], budget=budget)
+    for start in range(0, 1000, 30):
+        store.append(_rows(start, min(start + 30, 1000)))
+        assert store.capacity <= store.max_rows
+        assert store.raw_rows <= store.max_rows
+
+    assert store.max_rows == 100
+    assert store._start > 0
+    raw = store.frame().iloc[store.rollup_rows :].reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        raw, _rows(1000 - store.raw_rows, 1000), check_dtype=False
+    )
+    assert store.tail(3)["value"].tolist() == [997, 998, 999]
+
+
+def test_store_widens_dtypes():
+    store = TelemetryStore(["timestamp", "value"])
+    store.append(_rows(0, 3).astype({"value": "int32"}))
+    store.append(pd.DataFrame({"timestamp": [3000], "value": [np.nan]}))
+
+    frame = store.frame()
+    assert frame["value"].dtype == np.float64
+    assert frame["value"].iloc[:3].tolist() == [0, 1, 2]
+    assert np.isnan(frame["value"].iloc[3])
+
+
+def test_store_window():
+    budget = 16 * 1000
+    store = TelemetryStore(["timestamp", "value"], budget=budget, rollup_ms=10_000)
+    for start in range(0, 5000, 100):
+        store.append(_rows(start, start + 100))
+
+    recent = store.window(span_ms=60_000, max_points=1000, history_points=10)
+    assert recent["timestamp"].is_monotonic_increasing
+    assert recent["value"].iloc[-61:].tolist() == list(range(4939, 5000))
+    assert len(recent) <= 61 + 10
+    assert recent["timestamp"].iloc[0] < 60_000
+
+    assert len(store.window(span_ms=60_000, max_points=20, history_points=5)) == 25
+    assert store.window(span_ms=10**9, max_points=10, history_points=5).shape[0] == 10
+    assert TelemetryStore(["timestamp", "value"]).window(1000, 10, 10).empty
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 1024])
+def test_last_line_end(tmp_path, block_size):
+    telemetry_file = tmp_path / "telemetry.csv"
+    telemetry_file.write_bytes(b"timestamp,value\n1,10\n2,20\n3,3000000")
+    with open(telemetry_file, "rb") as file:
+        assert _last_line_end(file, 0, 34, block_size) == 26
+        assert _last_line_end(file, 26, 34, block_size) == 26
+        assert _last_line_end(file, 0, 16, block_size) == 16
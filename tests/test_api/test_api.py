@@ -0,0 +1,204 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import pathlib
+import threading
+import urllib.error
+import urllib.request
+from http import HTTPStatus
+
+import pytest
+
+from smartdashboard.utils import StatusReader
+from smartdashboard.utils import api as api_module
+from smartdashboard.utils.api import ApiServer, DashboardApi
+from smartdashboard.utils.ManifestLoader import ManifestLoader
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import get_status_scanner
+
+MANIFEST = pathlib.Path(
+    "tests/utils/manifest_files/fauxexp/.smartsim/telemetry/manifest.json"
+)
+
+
+@pytest.fixture
+def api():
+    return DashboardApi(ManifestLoader(MANIFEST))
+
+
+def get_json(api, url):
+    response = api.get(url)
+    return response.status, json.loads(response.body)
+
+
+def test_manifest(api):
+    status, body = get_json(api, "/api/manifest")
+    assert status == HTTPStatus.OK
+    assert body["experiment"]["name"] == "my-experiment"
+    assert [run["run_id"] for run in body["runs"]] == ["1", "2"]
+    assert body["runs"][1]["ensembles"][1] == {"name": "ensemble_3", "members": 2}
+
+
+def test_status(api):
+    status, body = get_json(api, "/api/status")
+    assert status == HTTPStatus.OK
+    assert body["experiment"]["status"] == "Running"
+
+
+def test_status_skips_finished_entities(api, monkeypatch):
+    get_json(api, "/api/status")
+    runs = api.manifest.runs
+    groups = [run.model for run in runs]
+    groups.extend(ens.models for run in runs for ens in run.ensemble)
+    groups.extend(orc.shards for run in runs for orc in run.orchestrator)
+    for entities in groups:
+        get_status_scanner(entities).min_interval = 0.0
+
+    read = []
+    get_status = StatusReader.get_status
+
+    def counted(status_dir):
+        read.append(status_dir)
+        return get_status(status_dir)
+
+    monkeypatch.setattr(StatusReader, "get_status", counted)
+    get_json(api, "/api/status")
+    assert read
+    assert all(
+        get_status(status_dir).status not in (StatusEnum.COMPLETED, StatusEnum.FAILED)
+        for status_dir in read
+    )
+
+
+@pytest.mark.parametrize(
+    "url, names",
+    [
+        pytest.param(
+            "/api/ensembles/2/ensemble_3/status",
+            ["ensemble_3_member_1", "ensemble_3_member_2"],
+            id="members",
+        ),
+        pytest.param(
+            "/api/orchestrators/1/orchestrator_1/status?offset=1&limit=5",
+            ["shard 2"],
+            id="shards",
+        ),
+    ],
+)
+def test_group_status(api, url, names):
+    status, body = get_json(api, url)
+    assert status == HTTPStatus.OK
+    assert body["total"] == 2
+    assert [entity["name"] for entity in body["entities"]] == names
+
+
+def test_entity(api):
+    status, body = get_json(api, "/api/orchestrators/1/orchestrator_1")
+    assert status == HTTPStatus.OK
+    assert body["shards"] == ["shard 1", "shard 2"]
+
+
+def test_logs(api):
+    status, body = get_json(
+        api, "/api/logs/orchestrators/1/orchestrator_1/shard%201?lines=1"
+    )
+    assert status == HTTPStatus.OK
+    assert body["lines"] == ["Number of messages = 100"]
+
+
+def test_telemetry(api):
+    status, body = get_json(
+        api, "/api/telemetry/1/orchestrator_1/shard%201/memory?max_points=3"
+    )
+    assert status == HTTPStatus.OK
+    assert body["columns"][0] == "timestamp"
+    assert len(body["rows"]) == 3
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        pytest.param("/api/unknown", HTTPStatus.NOT_FOUND, id="route"),
+        pytest.param("/api/applications/9/app1", HTTPStatus.NOT_FOUND, id="run"),
+        pytest.param("/api/logs/applications/1/nope", HTTPStatus.NOT_FOUND, id="app"),
+        pytest.param("/api/logs/experiment?lines=x", HTTPStatus.BAD_REQUEST, id="int"),
+        pytest.param(
+            "/api/logs/experiment?stream=in", HTTPStatus.BAD_REQUEST, id="stream"
+        ),
+    ],
+)
+def test_errors(api, url, expected):
+    status, body = get_json(api, url)
+    assert status == expected
+    assert "error" in body
+
+
+def test_not_modified(api):
+    response = api.get("/api/status")
+    assert response.etag
+
+    assert api.get("/api/status", response.etag).status == HTTPStatus.NOT_MODIFIED
+    assert api.get("/api/status", f"W/{response.etag}").status == (
+        HTTPStatus.NOT_MODIFIED
+    )
+    assert api.get("/api/status", '"stale"').status == HTTPStatus.OK
+
+
+def test_unchanged_files_are_not_read(api, monkeypatch):
+    reads = []
+    read_telemetry = api_module.read_telemetry
+
+    def counting_read(file_path):
+        reads.append(file_path)
+        return read_telemetry(file_path)
+
+    monkeypatch.setattr(api_module, "read_telemetry", counting_read)
+    url = "/api/telemetry/1/orchestrator_1/shard%201/clients"
+    first = api.get(url)
+    second = api.get(url, first.etag)
+
+    assert second.status == HTTPStatus.NOT_MODIFIED
+    assert len(reads) == 1
+
+
+def test_server(api):
+    server = ApiServer(("127.0.0.1", 0), api)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/manifest"
+    try:
+        with urllib.request.urlopen(url) as response:
+            etag = response.headers["ETag"]
+            assert json.load(response)["experiment"]["name"] == "my-experiment"
+
+        request = urllib.request.Request(url, headers={"If-None-Match": etag})
+        with pytest.raises(urllib.error.HTTPError) as ex:
+            urllib.request.urlopen(request)
+        assert ex.value.code == HTTPStatus.NOT_MODIFIED
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -25,9 +25,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import pytest
+import streamlit as st
 
 from smartdashboard.utils.errors import *
 from smartdashboard.utils.ManifestReader import ManifestFileReader
+from smartdashboard.utils.timing import Timings
 from smartdashboard.view_builders import *
 from smartdashboard.views import *
 from tests.utils.test_entities import *
@@ -144,3 +146,34 @@ def test_orc_summary_builder(orc):
 )
 def test_error_builder(error):
     assert type(error_builder(error)) == ErrorView
+
+
+@pytest.mark.parametrize(
+    "tab, built_view",
+    [
+        pytest.param("Experiment", "exp_view"),
+        pytest.param("Applications", "app_view"),
+        pytest.param("Orchestrators", "orc_view"),
+        pytest.param("Ensembles", "ens_view"),
+    ],
+)
+def test_overview_builder_builds_selected_tab(monkeypatch, tab, built_view):
+    monkeypatch.setattr(st, "radio", lambda *args, **kwargs: tab)
+    manifest_file_reader = ManifestFileReader(
+        "tests/utils/manifest_files/manifesttest.json"
+    )
+    overview = overview_builder(manifest_file_reader.get_manifest())
+
+    assert overview.views == [getattr(overview, built_view)]
+    for view in ("exp_view", "app_view", "orc_view", "ens_view"):
+        if view != built_view:
+            assert getattr(overview, view) is None
+
+
+def test_diagnostics_builder():
+    timings = Timings()
+    with timings.timed("section"):
+        pass
+    view = diagnostics_builder(timings)
+    assert type(view) == DiagnosticsView
+    view.update()
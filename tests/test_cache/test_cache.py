@@ -0,0 +1,68 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from smartdashboard.utils.cache import LRUCache, SourceCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[str] = LRUCache(maxsize=2)
+    cache.get("a", lambda: "A")
+    cache.get("b", lambda: "B")
+    assert cache.lookup("a") == "A"
+
+    cache.get("c", lambda: "C")
+    assert len(cache) == 2
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") == "A"
+    assert cache.lookup("c") == "C"
+
+
+def test_lru_cache_builds_once():
+    cache: LRUCache[int] = LRUCache()
+    built = []
+    for _ in range(3):
+        cache.get("key", lambda: built.append(1) or len(built))
+    assert built == [1]
+
+
+def test_lru_cache_reserve():
+    cache: LRUCache[int] = LRUCache(maxsize=2)
+    cache.reserve(3)
+    for key in range(3):
+        cache.get(key, lambda: 0)
+    assert len(cache) == 3
+
+    cache.reserve(1)
+    assert cache.maxsize == 3
+
+
+def test_source_cache_keys_by_identity():
+    cache: SourceCache[str] = SourceCache()
+    first, second = [1], [1]
+    assert cache.get("key", first, lambda: "first") == "first"
+    assert cache.get("key", first, lambda: "rebuilt") == "first"
+    assert cache.get("key", second, lambda: "second") == "second"
+    assert cache.get("other", first, lambda: "other") == "other"
@@ -73,3 +73,12 @@ def test_cli_args_all():
 
     assert args.port == exp_port
     assert args.directory == exp_dir
+
+
+def test_cli_command_ports():
+    """ensure each command has its own default port"""
+    parser = expo.get_parser()
+    assert parser.parse_args([]).port == 8501
+    assert parser.parse_args(["api"]).port == 8502
+    assert parser.parse_args(["metrics"]).port == 9108
+    assert parser.parse_args(["api", "-p", "1234"]).port == 1234
@@ -0,0 +1,92 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import subprocess
+import sys
+
+import pytest
+from streamlit.web import bootstrap
+
+from smartdashboard import Experiment_Overview as expo
+
+
+def imported_modules(statement, modules):
+    script = (
+        "import sys\n"
+        f"{statement}\n"
+        f"print(','.join(m for m in {modules!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.mark.parametrize(
+    "statement, modules",
+    [
+        pytest.param(
+            "import smartdashboard.Experiment_Overview",
+            ("pandas", "altair", "smartdashboard.views"),
+            id="entry point",
+        ),
+        pytest.param("import smartdashboard.views", ("altair",), id="views"),
+    ],
+)
+def test_heavy_modules_are_deferred(statement, modules):
+    assert imported_modules(statement, modules) == ""
+
+
+def test_run_dash_app_in_process(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        bootstrap,
+        "load_config_options",
+        lambda flag_options: calls.append(flag_options),
+    )
+    monkeypatch.setattr(bootstrap, "run", lambda **kwargs: calls.append(kwargs))
+
+    with pytest.raises(SystemExit):
+        expo.run_dash_app("/foo/bar", 1234)
+
+    flag_options, run_kwargs = calls
+    assert flag_options["server.port"] == 1234
+    assert run_kwargs["flag_options"] is flag_options
+    assert run_kwargs["main_script_path"] == expo.__file__
+    assert not run_kwargs["is_hello"]
+    assert run_kwargs["args"] == ["-d", "/foo/bar"]
+
+
+def test_run_dash_app_diagnostics(monkeypatch):
+    calls = []
+    monkeypatch.setattr(bootstrap, "load_config_options", lambda flag_options: None)
+    monkeypatch.setattr(bootstrap, "run", lambda **kwargs: calls.append(kwargs))
+
+    with pytest.raises(SystemExit):
+        expo.run_dash_app("/foo/bar", 1234, diagnostics=True)
+
+    (run_kwargs,) = calls
+    assert run_kwargs["args"] == ["-d", "/foo/bar", "--diagnostics"]
@@ -0,0 +1,116 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import io
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from smartdashboard.utils.argparser import get_parser
+from smartdashboard.utils.ManifestReader import create_filereader
+from smartdashboard.utils.summary import format_summary, run_status, summarize_manifest
+
+EXP_DIR = "tests/utils/manifest_files/fauxexp"
+
+
+@pytest.mark.parametrize(
+    "args, directory, as_json",
+    [
+        pytest.param(["status"], None, False, id="defaults"),
+        pytest.param(["status", "-d", EXP_DIR, "--json"], EXP_DIR, True, id="after"),
+        pytest.param(["-d", EXP_DIR, "status"], EXP_DIR, False, id="before"),
+    ],
+)
+def test_status_args(args, directory, as_json):
+    parsed = get_parser().parse_args(args)
+    assert parsed.command == "status"
+    assert parsed.directory == directory
+    assert parsed.json == as_json
+
+
+def test_dashboard_args_have_no_command():
+    assert get_parser().parse_args(["-p", "1234"]).command is None
+
+
+def test_summarize_manifest():
+    manifest = create_filereader(
+        pathlib.Path(EXP_DIR) / ".smartsim/telemetry/manifest.json"
+    ).get_manifest()
+    summary = summarize_manifest(manifest)
+
+    assert summary["experiment"]["name"] == "my-experiment"
+    assert summary["experiment"]["status"] == "Running"
+    assert summary["experiment"]["counts"]["Failed"] == 5
+    assert [app["name"] for app in summary["applications"]] == [
+        "app1",
+        "app2",
+        "app3",
+        "app4",
+    ]
+    assert summary["applications"][1]["return_code"] == 1
+    assert summary["ensembles"][2]["members"] == 2
+    assert summary["ensembles"][2]["counts"]["Running"] == 1
+    assert summary["orchestrators"][0]["status"] == "Unstable"
+
+    text = format_summary(summary)
+    assert "Experiment: my-experiment" in text
+    assert "[run 1] orchestrator_1 (2 shards): Unstable (1 Running, 1 Failed)" in text
+
+
+def test_run_status_json():
+    stream = io.StringIO()
+    assert run_status(EXP_DIR, as_json=True, stream=stream) == 0
+    summary = json.loads(stream.getvalue())
+    assert len(summary["orchestrators"]) == 3
+
+
+def test_run_status_missing_manifest(tmp_path, capsys):
+    stream = io.StringIO()
+    assert run_status(str(tmp_path), stream=stream) == 1
+    assert stream.getvalue() == ""
+    assert "Manifest file does not exist" in capsys.readouterr().err
+
+
+def test_status_command_is_headless():
+    script = (
+        "import sys\n"
+        "from smartdashboard.__main__ import main\n"
+        f"sys.argv = ['smart-dash', 'status', '-d', '{EXP_DIR}', '--json']\n"
+        "code = main()\n"
+        "heavy = [m for m in ('streamlit', 'altair', 'pandas') if m in sys.modules]\n"
+        "print(heavy, file=sys.stderr)\n"
+        "sys.exit(code)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 0
+    assert result.stderr.strip() == "[]"
+    assert json.loads(result.stdout)["experiment"]["name"] == "my-experiment"
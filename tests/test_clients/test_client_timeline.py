@@ -0,0 +1,123 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from smartdashboard.utils.clients import SESSION_COLUMNS, ClientTimeline
+
+
+def _presence(samples, clients, seed):
+    rng = np.random.default_rng(seed)
+    present = rng.random((samples, clients)) < 0.6
+    timestamps, client_ids = np.nonzero(present)
+    return present, pd.DataFrame(
+        {"timestamp": timestamps * 1000 + 5000, "client_id": client_ids}
+    )
+
+
+def _expected_sessions(present):
+    sessions = []
+    samples, clients = present.shape
+    for client in range(clients):
+        start = None
+        for sample in range(samples):
+            if present[sample, client] and start is None:
+                start = sample
+            elif not present[sample, client] and start is not None:
+                sessions.append((client, start, sample))
+                start = None
+    return sorted(sessions)
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 1000])
+def test_timeline_matches_row_by_row(chunk):
+    present, rows = _presence(40, 6, seed=chunk)
+    timeline = ClientTimeline(max_sessions=10_000)
+    for start in range(0, len(rows), chunk):
+        timeline.update(rows.iloc[start : start + chunk])
+
+    sessions = timeline.sessions()
+    assert list(sessions.columns) == SESSION_COLUMNS
+    closed = sessions.loc[~sessions["open"]]
+    found = sorted(
+        zip(
+            closed["client_id"],
+            (closed["connected"] - 5000) // 1000,
+            (closed["disconnected"] - 5000) // 1000,
+        )
+    )
+    # the newest sample is held back, so sessions closed by it are not known
+    complete = present[: rows["timestamp"].nunique() - 1]
+    assert found == _expected_sessions(complete)
+
+    churn = timeline.churn.frame()
+    assert churn["clients"].tolist() == complete.sum(axis=1).tolist()
+    assert churn["disconnects"].sum() == len(found)
+    assert churn["connects"].sum() == len(found) + sessions["open"].sum()
+
+
+def test_timeline_holds_back_newest_sample():
+    timeline = ClientTimeline()
+    rows = pd.DataFrame({"timestamp": [1, 1, 2], "client_id": [0, 1, 0]})
+
+    assert not timeline.update(rows.iloc[:2])
+    assert timeline.samples == 0
+    assert timeline.update(rows.iloc[2:])
+    assert timeline.samples == 1
+    assert timeline.last_timestamp == 1
+    assert not timeline.update(rows.iloc[:0])
+
+
+def test_timeline_durations_and_limit():
+    timeline = ClientTimeline(max_sessions=3)
+    # client 0 reconnects every other sample, client 1 stays connected
+    rows = pd.DataFrame(
+        {
+            "timestamp": [ts for ts in range(20) for _ in range(1 + ts % 2)],
+            "client_id": [client for ts in range(20) for client in range(1 + ts % 2)],
+        }
+    )
+    rows = rows.assign(client_id=1 - rows["client_id"])
+    timeline.update(rows)
+
+    assert timeline.closed_sessions == 9
+    assert timeline.mean_duration_ms == 1
+    sessions = timeline.sessions()
+    assert (~sessions["open"]).sum() == 3
+    assert sessions.loc[sessions["open"], "client_id"].tolist() == [1]
+
+
+def test_timeline_reset():
+    timeline = ClientTimeline()
+    timeline.update(pd.DataFrame({"timestamp": [1, 2, 3], "client_id": [0, 1, 0]}))
+    timeline.reset()
+
+    assert timeline.samples == 0
+    assert timeline.sessions().empty
+    assert timeline.churn.frame().empty
+    assert timeline.mean_duration_ms is None
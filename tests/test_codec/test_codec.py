@@ -0,0 +1,98 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gc
+
+import pytest
+
+from smartdashboard.utils import codec
+from smartdashboard.utils.ManifestReader import ManifestFileReader
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import StatusData, get_status
+
+
+@pytest.fixture(params=list(codec.available_codecs()))
+def codec_name(request):
+    previous = codec.get_codec().name
+    codec.set_codec(request.param)
+    yield request.param
+    codec.set_codec(previous)
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        pytest.param(b'{"return_code": 0}', {"return_code": 0}),
+        pytest.param('{"return_code": 1}', {"return_code": 1}),
+        pytest.param(b'[1, "two", null]', [1, "two", None]),
+    ],
+)
+def test_loads(codec_name, data, expected):
+    assert codec.get_codec().name == codec_name
+    assert codec.loads(data) == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b'{"return_code": }'),
+        pytest.param(b""),
+    ],
+)
+def test_loads_decode_error(codec_name, data):
+    with pytest.raises(codec.JSONDecodeError):
+        codec.loads(data)
+
+
+def test_codecs_read_same_manifest(codec_name):
+    reader = ManifestFileReader("tests/utils/manifest_files/manifesttest.json")
+    codec.set_codec("json")
+    expected = ManifestFileReader("tests/utils/manifest_files/manifesttest.json")
+    assert reader._data == expected._data
+
+
+def test_codecs_read_status(codec_name):
+    status = get_status("tests/utils/status_files/model_1")
+    assert status == StatusData(StatusEnum.FAILED, 1)
+
+
+def test_set_unavailable_codec():
+    with pytest.raises(ValueError):
+        codec.set_codec("not_a_codec")
+
+
+def test_gc_paused_overlaps():
+    assert gc.isenabled()
+    with codec.gc_paused():
+        with codec.gc_paused():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+
+def test_loads_leaves_gc_alone(monkeypatch):
+    monkeypatch.setattr(gc, "disable", pytest.fail)
+    assert codec.loads(b'{"return_code": 0}') == {"return_code": 0}
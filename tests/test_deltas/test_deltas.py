@@ -0,0 +1,111 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from smartdashboard.utils.deltas import (
+    DeltaFilter,
+    get_delta_counters,
+    payload_digest,
+    reset_delta_counters,
+)
+from smartdashboard.views import ApplicationView
+from tests.utils.test_entities import application_1
+
+
+@pytest.fixture(autouse=True)
+def counters():
+    reset_delta_counters()
+    yield
+    reset_delta_counters()
+
+
+def test_filter_skips_identical_payloads():
+    deltas = DeltaFilter()
+    assert deltas.changed("status", "Status: Running")
+    assert not deltas.changed("status", "Status: Running")
+    assert deltas.changed("logs", "Status: Running")
+    assert deltas.changed("status", "Status: Completed")
+
+    counters = get_delta_counters()
+    assert counters.emitted == {"status": 2, "logs": 1}
+    assert counters.suppressed == {"status": 1}
+    assert counters.total_emitted == 3
+    assert counters.total_suppressed == 1
+
+
+def test_filter_forget():
+    deltas = DeltaFilter()
+    assert deltas.changed("table", "payload")
+    deltas.forget("table")
+    assert deltas.changed("table", "payload")
+
+
+@pytest.mark.parametrize(
+    "first, same, different",
+    [
+        pytest.param("text", "text", "other"),
+        pytest.param(b"bytes", b"bytes", b"other"),
+        pytest.param(
+            pd.DataFrame({"a": [1, 2]}),
+            pd.DataFrame({"a": [1, 2]}),
+            pd.DataFrame({"b": [1, 2]}),
+        ),
+        pytest.param(
+            pd.DataFrame({"a": [1, 2]}),
+            pd.DataFrame({"a": [1, 2]}),
+            pd.DataFrame({"a": [1, 3]}),
+        ),
+        pytest.param(
+            np.zeros((2, 3), dtype=np.uint8),
+            np.zeros((2, 3), dtype=np.uint8),
+            np.zeros((3, 2), dtype=np.uint8),
+        ),
+        pytest.param(("a", 1), ("a", 1), ("a", 2)),
+    ],
+)
+def test_payload_digest(first, same, different):
+    assert payload_digest(first) == payload_digest(same)
+    assert payload_digest(first) != payload_digest(different)
+
+
+def test_view_suppresses_redundant_updates():
+    view = ApplicationView(application_1)
+    view.status_element = mock.MagicMock()
+    view.out_logs_element = mock.MagicMock()
+    view.err_logs_element = mock.MagicMock()
+
+    view.update()
+    view.update()
+
+    view.status_element.write.assert_called_once()
+    view.out_logs_element.code.assert_called_once()
+    view.err_logs_element.code.assert_called_once()
+    assert get_delta_counters().total_suppressed == 3
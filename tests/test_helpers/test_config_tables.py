@@ -0,0 +1,95 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pandas as pd
+
+from smartdashboard.utils import config_tables
+from smartdashboard.utils.config_tables import (
+    build_application_tables,
+    build_ensemble_tables,
+    get_application_tables,
+    get_ensemble_tables,
+)
+from smartdashboard.utils.helpers import flatten_nested_keyvalue_containers
+from tests.utils.test_entities import application_1, ensemble_1
+
+
+def test_build_application_tables():
+    tables = build_application_tables(application_1)
+    entity = application_1.dict()
+
+    assert list(tables.exe_args["All Arguments"]) == application_1.exe_args
+    assert list(tables.run_settings.itertuples(index=False, name=None)) == (
+        flatten_nested_keyvalue_containers("run_settings", entity)
+    )
+    assert list(tables.files.columns) == ["Type", "File"]
+    assert list(tables.colocated_db.itertuples(index=False, name=None)) == (
+        flatten_nested_keyvalue_containers("settings", application_1.colocated_db)
+    )
+    pd.testing.assert_frame_equal(
+        tables.loaded_entities, pd.DataFrame(application_1.loaded_entities)
+    )
+
+
+def test_build_empty_tables():
+    tables = build_application_tables(None)
+    assert tables.params.empty
+    assert list(tables.loaded_entities.columns) == ["Name", "Type", "Backend", "Device"]
+
+    ensemble_tables = build_ensemble_tables(None)
+    assert ensemble_tables.batch_settings.empty
+    assert ensemble_tables.params.empty
+
+
+def test_application_tables_cached_by_version(monkeypatch):
+    built = []
+    build = config_tables.build_application_tables
+
+    def counting_build(application):
+        built.append(application)
+        return build(application)
+
+    monkeypatch.setattr(config_tables, "build_application_tables", counting_build)
+    config_tables._tables.clear()
+
+    first = get_application_tables("v1", "1", "app1", application_1)
+    assert get_application_tables("v1", "1", "app1", application_1) is first
+    assert get_application_tables("v2", "1", "app1", application_1) is not first
+    assert get_application_tables("v1", "2", "app1", application_1) is not first
+    assert len(built) == 3
+
+    # manifests without a version are never cached
+    get_application_tables("", "1", "app1", application_1)
+    get_application_tables("", "1", "app1", application_1)
+    assert len(built) == 5
+
+
+def test_ensemble_tables_cached_by_version():
+    config_tables._tables.clear()
+    first = get_ensemble_tables("v1", "1", ensemble_1)
+    assert get_ensemble_tables("v1", "1", ensemble_1) is first
+    assert get_ensemble_tables("v2", "1", ensemble_1) is not first
+    assert list(first.params["Name"]) == list(ensemble_1.params)
@@ -0,0 +1,69 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import numpy as np
+import pytest
+
+from smartdashboard.utils.helpers import heatmap_columns, status_heatmap
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import STATUS_CODES
+
+
+@pytest.mark.parametrize(
+    "count, expected",
+    [
+        pytest.param(0, 1),
+        pytest.param(3, 3),
+        pytest.param(50, 50),
+        pytest.param(500, 50),
+        pytest.param(50_000, 317),
+    ],
+)
+def test_heatmap_columns(count, expected):
+    assert heatmap_columns(count) == expected
+
+
+def test_status_heatmap_layout():
+    codes = np.arange(len(STATUS_CODES), dtype=np.uint8)
+    image = status_heatmap(codes)
+    cell = 16
+
+    assert image.dtype == np.uint8
+    assert image.shape == (cell, cell * len(codes), 3)
+    for i in range(len(codes)):
+        block = image[:, i * cell : (i + 1) * cell]
+        assert (block == block[0, 0]).all()
+
+    running = STATUS_CODES.index(StatusEnum.RUNNING)
+    failed = STATUS_CODES.index(StatusEnum.FAILED)
+    assert not (image[0, running * cell] == image[0, failed * cell]).all()
+
+
+def test_status_heatmap_pads_last_row():
+    image = status_heatmap(np.zeros(51, dtype=np.uint8))
+    cell = image.shape[1] // 50
+    assert image.shape[0] == 2 * cell
+    assert not (image[cell, cell] == image[0, 0]).all()
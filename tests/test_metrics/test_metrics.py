@@ -0,0 +1,159 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pathlib
+import shutil
+import threading
+import urllib.error
+import urllib.request
+from http import HTTPStatus
+
+import pytest
+
+from smartdashboard.utils import TelemetryReader
+from smartdashboard.utils.ManifestLoader import ManifestLoader
+from smartdashboard.utils.metrics import (
+    CONTENT_TYPE,
+    MetricFamily,
+    MetricsPoller,
+    MetricsServer,
+)
+
+MANIFEST = pathlib.Path(
+    "tests/utils/manifest_files/fauxexp/.smartsim/telemetry/manifest.json"
+)
+
+
+@pytest.fixture
+def poller():
+    return MetricsPoller(ManifestLoader(MANIFEST))
+
+
+def sample(body, line_start):
+    for line in body.decode().splitlines():
+        if line.startswith(line_start):
+            return line.rsplit(" ", 1)[1]
+    return None
+
+
+def test_metric_family_render():
+    family = MetricFamily("smartdashboard_test", "Test metric")
+    family.add(1.5, name='say "hi"\\now')
+    family.add(3.0)
+
+    assert family.render() == (
+        "# HELP smartdashboard_test Test metric\n"
+        "# TYPE smartdashboard_test gauge\n"
+        'smartdashboard_test{name="say \\"hi\\"\\\\now"} 1.5\n'
+        "smartdashboard_test 3\n"
+    )
+
+
+def test_poll(poller):
+    assert poller.body == b""
+    poller.poll()
+
+    assert (
+        sample(
+            poller.body,
+            'smartdashboard_entities{kind="application",run_id="1",name="",'
+            'status="Failed"}',
+        )
+        == "1"
+    )
+    assert (
+        sample(
+            poller.body,
+            'smartdashboard_orchestrator_status{run_id="1",name="orchestrator_1",'
+            'status="Unstable"}',
+        )
+        == "1"
+    )
+    assert (
+        sample(
+            poller.body,
+            'smartdashboard_shard_clients{run_id="1",orchestrator="orchestrator_1",'
+            'shard="shard 1"}',
+        )
+        == "3"
+    )
+    assert sample(poller.body, "smartdashboard_polls_total") == "1"
+
+
+def test_poll_tails_telemetry(poller, tmp_path, monkeypatch):
+    counts = tmp_path / "client_counts.csv"
+    shutil.copy("tests/utils/clients/client_counts.csv", counts)
+    manifest = poller.loader.snapshot.manifest
+    shards = manifest.runs[0].orchestrator[0].shards
+    shard = shards[0].copy(update={"client_count_file": str(counts)})
+    monkeypatch.setattr(
+        manifest.runs[0].orchestrator[0], "shards", [shard], raising=False
+    )
+
+    key = (
+        'smartdashboard_shard_clients{run_id="1",orchestrator="orchestrator_1",'
+        'shard="shard 1"}'
+    )
+    poller.poll()
+    assert sample(poller.body, key) == "3"
+
+    with open(counts, "a", encoding="utf-8") as file:
+        file.write("1712602553863,7\n1712602558863,")
+    poller.poll()
+    assert sample(poller.body, key) == "7"
+    assert poller._tailers[str(counts)].offset < counts.stat().st_size
+
+
+def test_server(poller):
+    poller.poll()
+    server = MetricsServer(("127.0.0.1", 0), poller)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{base}/metrics") as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert response.read() == poller.body
+
+        with pytest.raises(urllib.error.HTTPError) as ex:
+            urllib.request.urlopen(f"{base}/other")
+        assert ex.value.code == HTTPStatus.NOT_FOUND
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_first_poll_reads_latest_row(poller, tmp_path, monkeypatch):
+    counts = tmp_path / "client_counts.csv"
+    shutil.copy("tests/utils/clients/client_counts.csv", counts)
+    monkeypatch.setattr(
+        TelemetryReader.TelemetryTailer,
+        "read",
+        lambda self: pytest.fail("tailed the whole file"),
+    )
+
+    assert poller._latest_row(str(counts))["num_clients"] == 3
+    assert poller._tailers[str(counts)].offset == counts.stat().st_size
@@ -0,0 +1,199 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+import streamlit as st
+
+from smartdashboard.schemas.run import RunContext
+from smartdashboard.schemas.table import ApplicationTable
+from smartdashboard.utils import StatusReader
+from smartdashboard.utils.picker import (
+    EntityIndex,
+    cached_index,
+    entity_picker,
+    heatmap_cell_selector,
+)
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import StatusScanner, get_status_scanner
+from tests.utils.test_entities import application_1
+
+NAMES = ["member_1", "member_10", "member_2", "big_member_1", "other"]
+STATUS_DIRS = [
+    "tests/utils/status_files/model_0",
+    "tests/utils/status_files/model_1",
+    "tests/utils/status_files/model_3",
+    None,
+    "tests/utils/status_files/missing",
+]
+
+
+@pytest.fixture
+def index():
+    return EntityIndex(list(range(len(NAMES))), NAMES, StatusScanner(STATUS_DIRS))
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        pytest.param("", [0, 1, 2, 3, 4]),
+        pytest.param("member_1", [0, 1, 3]),
+        pytest.param("MEMBER_1", [0, 1, 3]),
+        pytest.param(" other ", [4]),
+        pytest.param("_2", [2]),
+        pytest.param("nothing", []),
+    ],
+)
+def test_search(index, query, expected):
+    assert index.search(query) == expected
+
+
+def test_position(index):
+    assert index.position("member_2") == 2
+    assert index.position("missing") is None
+    assert index.position(None) is None
+
+
+@pytest.mark.parametrize(
+    "status, expected",
+    [
+        pytest.param(StatusEnum.COMPLETED, [0]),
+        pytest.param(StatusEnum.FAILED, [1]),
+        pytest.param(StatusEnum.RUNNING, [2]),
+        pytest.param(StatusEnum.MALFORMED, [3]),
+        pytest.param(StatusEnum.UNKNOWN, [4]),
+    ],
+)
+def test_filter_status(index, status, expected):
+    assert index.filter_status(range(len(index)), status) == expected
+
+
+def test_for_entities_table():
+    members = ApplicationTable(
+        [application_1, application_1.copy(update={"name": "b"})]
+    )
+    index = EntityIndex.for_entities(members)
+    assert list(index.labels) == [application_1.name, "b"]
+    assert index.scanner is get_status_scanner(members)
+    assert index.options is members
+
+
+def test_for_run_contexts():
+    contexts = (RunContext("0", application_1), RunContext("1", application_1))
+    index = EntityIndex.for_run_contexts(iter(contexts))
+    assert index.labels == [
+        f"{application_1.name}: Run 0",
+        f"{application_1.name}: Run 1",
+    ]
+    assert index.options == contexts
+
+
+def test_cached_index():
+    source = [application_1]
+    built = []
+
+    def build():
+        built.append(1)
+        return EntityIndex.for_entities(source)
+
+    first = cached_index("test", source, build)
+    assert cached_index("test", source, build) is first
+    assert cached_index("other", source, build) is not first
+    assert cached_index("test", list(source), build) is not first
+    assert len(built) == 3
+
+
+def test_entity_picker_short_list(index):
+    assert entity_picker("Select:", index, key="test") == 0
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        pytest.param("", 0),
+        pytest.param("member_2", 2),
+        pytest.param("other", 4),
+        pytest.param("nothing", None),
+    ],
+)
+def test_entity_picker_long_list(monkeypatch, index, query, expected):
+    monkeypatch.setattr(st, "text_input", lambda *args, **kwargs: query)
+    assert entity_picker("Select:", index, key="test", page_size=2) == expected
+
+
+def test_entity_picker_status_filter(monkeypatch, index):
+    monkeypatch.setattr(
+        st,
+        "selectbox",
+        lambda label, options, **kwargs: "Failed" if label == "Status:" else options[0],
+    )
+    assert entity_picker("Select:", index, key="test", page_size=2) == 1
+
+
+def test_entity_picker_status_options(monkeypatch, index):
+    offered = []
+
+    def selectbox(label, options, **kwargs):
+        if label == "Status:":
+            offered.extend(options)
+        return options[0]
+
+    monkeypatch.setattr(st, "selectbox", selectbox)
+    entity_picker("Select:", index, key="test", page_size=2)
+    assert offered == [
+        "All",
+        StatusEnum.RUNNING.value,
+        StatusEnum.COMPLETED.value,
+        StatusEnum.FAILED.value,
+        StatusEnum.UNKNOWN.value,
+        StatusEnum.MALFORMED.value,
+    ]
+
+
+def test_filter_status_reuses_scan(monkeypatch, index):
+    assert index.filter_status(range(len(index)), StatusEnum.COMPLETED) == [0]
+
+    read = []
+    get_status = StatusReader.get_status
+
+    def counted(status_dir):
+        read.append(status_dir)
+        return get_status(status_dir)
+
+    monkeypatch.setattr(StatusReader, "get_status", counted)
+    index.scanner.min_interval = 0.0
+    assert index.filter_status([4, 3, 1], StatusEnum.FAILED) == [1]
+    # finished entities are not read again
+    assert sorted(read) == [
+        "tests/utils/status_files/missing",
+        "tests/utils/status_files/model_3",
+    ]
+
+
+def test_heatmap_cell_selector_return_code(monkeypatch, index):
+    captions = []
+    monkeypatch.setattr(st, "caption", captions.append)
+    heatmap_cell_selector(NAMES[1:], key="test", scanner=StatusScanner(STATUS_DIRS[1:]))
+    assert captions == ["member_10: Failed, return code 1"]
@@ -0,0 +1,129 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+
+import pytest
+
+from smartdashboard.utils import config_tables, prefetch
+from smartdashboard.utils.prefetch import (
+    Prefetcher,
+    neighbors,
+    prefetch_members,
+    prefetch_shards,
+    warm_entity,
+)
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import StatusData
+from tests.utils.test_entities import ensemble_4, orchestrator_1
+
+
+@pytest.mark.parametrize(
+    "position, count, radius, expected",
+    [
+        pytest.param(0, 5, 1, [1]),
+        pytest.param(2, 5, 1, [3, 1]),
+        pytest.param(2, 5, 2, [3, 1, 4, 0]),
+        pytest.param(4, 5, 1, [3]),
+        pytest.param(0, 1, 3, []),
+    ],
+)
+def test_neighbors(position, count, radius, expected):
+    assert neighbors(position, count, radius) == expected
+
+
+def test_prefetcher_dedupes_pending_tasks():
+    prefetcher = Prefetcher(max_pending=2)
+    release = threading.Event()
+    ran = []
+
+    assert prefetcher.submit("a", lambda: release.wait(5) and ran.append("a"))
+    assert not prefetcher.submit("a", lambda: ran.append("again"))
+    assert prefetcher.submit("b", lambda: ran.append("b"))
+    assert not prefetcher.submit("c", lambda: ran.append("c"))
+
+    release.set()
+    prefetcher.join()
+    assert ran == ["a", "b"]
+    assert prefetcher.submit("a", lambda: ran.append("a"))
+    prefetcher.join()
+
+
+def test_prefetcher_ignores_failures():
+    prefetcher = Prefetcher()
+    prefetcher.submit("fail", lambda: 1 / 0)
+    prefetcher.join()
+    ran = []
+    prefetcher.submit("ok", lambda: ran.append(1))
+    prefetcher.join()
+    assert ran == [1]
+
+
+def test_prefetch_members_warms_config_tables(monkeypatch):
+    monkeypatch.setattr(prefetch, "_prefetcher", Prefetcher())
+    config_tables._tables.clear()
+
+    prefetch_members("v1", "1", ensemble_4.name, ensemble_4.models, 0)
+    prefetch.get_prefetcher().join()
+
+    neighbor = ensemble_4.models[1]
+    assert (
+        config_tables._tables.lookup(
+            ("application", "v1", "1", f"{ensemble_4.name}/{neighbor.name}")
+        )
+        is not None
+    )
+
+
+def test_prefetch_shards(monkeypatch):
+    warmed = []
+    monkeypatch.setattr(prefetch, "_prefetcher", Prefetcher())
+    monkeypatch.setattr(prefetch, "warm_entity", warmed.append)
+
+    prefetch_shards(orchestrator_1.shards, 0)
+    prefetch.get_prefetcher().join()
+    assert warmed == list(orchestrator_1.shards[1:9])
+
+
+@pytest.mark.parametrize(
+    "status, expected",
+    [
+        pytest.param(StatusEnum.COMPLETED, True),
+        pytest.param(StatusEnum.FAILED, True),
+        pytest.param(StatusEnum.RUNNING, False),
+        pytest.param(StatusEnum.UNKNOWN, False),
+    ],
+)
+def test_warm_entity_reads_finished_logs(monkeypatch, status, expected):
+    read = []
+    monkeypatch.setattr(
+        prefetch, "get_entity_status", lambda entity: StatusData(status, None)
+    )
+    monkeypatch.setattr(prefetch, "get_logs", read.append)
+
+    shard = orchestrator_1.shards[0]
+    warm_entity(shard)
+    assert read == ([shard.out_file, shard.err_file] if expected else [])
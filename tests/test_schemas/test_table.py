@@ -0,0 +1,109 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import copy
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from smartdashboard.schemas.ensemble import Ensemble
+from smartdashboard.schemas.table import ApplicationTable, ShardTable
+from tests.utils.test_entities import *
+
+
+@pytest.mark.parametrize(
+    "ensemble",
+    [
+        pytest.param(ensemble_1),
+        pytest.param(ensemble_3),
+        pytest.param(ensemble_4),
+    ],
+)
+def test_table_materializes_members(ensemble: Ensemble):
+    members = ensemble.models
+    assert isinstance(members, ApplicationTable)
+    assert list(members.names) == [member.name for member in members]
+    for index, member in enumerate(members):
+        assert isinstance(member, Application)
+        assert member == Application.parse_obj(member.dict())
+        assert members[index - len(members)] == member
+
+
+def test_table_shares_settings():
+    member = ensemble_1.models[0].dict()
+    rows = [dict(member, name=f"member_{i}") for i in range(10)]
+    table = ApplicationTable(rows)
+
+    assert len(table) == 10
+    assert table[3].name == "member_3"
+    assert table[2].run_settings is table[7].run_settings
+    assert table[2].batch_settings is table[7].batch_settings
+    assert table[2].files is table[7].files
+    assert table[-1].name == "member_9"
+    assert [member.name for member in table[8:]] == ["member_8", "member_9"]
+    with pytest.raises(IndexError):
+        table[10]
+
+
+def test_table_column():
+    shards = orchestrator_1.shards
+    assert isinstance(shards, ShardTable)
+    assert list(shards.column("hostname")) == [shard.hostname for shard in shards]
+    assert list(shards.column("port")) == [shard.port for shard in shards]
+
+
+def test_table_copies_are_shared():
+    shards = orchestrator_1.shards
+    assert copy.copy(shards) is shards
+    assert copy.deepcopy(shards) is shards
+
+
+@pytest.mark.parametrize(
+    "models",
+    [
+        pytest.param("not a list"),
+        pytest.param([{"name": "missing_required_fields"}]),
+    ],
+)
+def test_table_validation_errors(models):
+    with pytest.raises(ValidationError):
+        Ensemble(name="ensemble", params={}, batch_settings={}, models=models)
+
+
+def test_table_serialization():
+    data = ensemble_1.dict()
+    assert data["models"] == [member.dict() for member in ensemble_1.models]
+    assert Ensemble.parse_raw(ensemble_1.json()) == ensemble_1
+
+    shards = orchestrator_1.dict()["shards"]
+    assert shards == [shard.dict() for shard in orchestrator_1.shards]
+    assert json.loads(orchestrator_1.json())["shards"] == shards
+
+
+def test_table_is_unhashable():
+    with pytest.raises(TypeError):
+        hash(ensemble_1.models)
@@ -0,0 +1,111 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pandas as pd
+import pytest
+
+from smartdashboard.utils import storage
+from smartdashboard.utils.LogReader import LogCache
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import get_status
+from smartdashboard.utils.TelemetryReader import read_telemetry
+from tests.utils.slow_storage import (
+    Latency,
+    SlowStorage,
+    uniform_latencies,
+    use_slow_storage,
+)
+
+
+class Sleeps(list):
+    def __call__(self, seconds):
+        self.append(seconds)
+
+
+def test_slow_storage_delays_metadata(tmp_path):
+    sleeps = Sleeps()
+    path = tmp_path / "file.txt"
+    path.write_text("data")
+
+    with use_slow_storage(uniform_latencies(0.01), sleep=sleeps) as slow:
+        assert storage.get_storage() is slow
+        assert storage.get_storage().exists(str(path))
+        storage.get_storage().getmtime(str(path))
+
+    assert not isinstance(storage.get_storage(), SlowStorage)
+    assert sleeps == [0.01, 0.01]
+    assert slow.calls == {"exists": 1, "getmtime": 1}
+
+
+def test_slow_storage_delays_reads(tmp_path):
+    sleeps = Sleeps()
+    path = tmp_path / "memory.csv"
+    path.write_text("timestamp,used_memory\n1,2\n3,4\n")
+
+    with use_slow_storage(uniform_latencies(0.0, read=0.5), sleep=sleeps) as slow:
+        dframe = read_telemetry(str(path))
+
+    pd.testing.assert_frame_equal(
+        dframe, pd.DataFrame({"timestamp": [1, 3], "used_memory": [2, 4]})
+    )
+    assert slow.calls["open"] == 1
+    assert slow.calls["read"] >= 1
+    assert sleeps == [0.5] * slow.calls["read"]
+
+
+def test_slow_storage_jitter_and_hangs():
+    sleeps = Sleeps()
+    slow = SlowStorage(
+        storage.LocalStorage(),
+        {"exists": Latency(0.01, jitter=0.01, hang_probability=1.0, hang_seconds=5)},
+        sleep=sleeps,
+    )
+    for _ in range(20):
+        slow.exists("/nonexistent")
+
+    assert slow.hangs == 20
+    assert all(5.01 <= seconds <= 5.02 for seconds in sleeps)
+    assert slow.delayed == pytest.approx(sum(sleeps))
+
+
+def test_slow_storage_rejects_unknown_operations():
+    with pytest.raises(ValueError):
+        SlowStorage(latencies={"stat": Latency(0.01)})
+
+
+def test_slow_storage_used_by_readers(tmp_path):
+    sleeps = Sleeps()
+    (tmp_path / "start.json").write_text("{}")
+    log_file = tmp_path / "out.log"
+    log_file.write_text("log line\n")
+
+    with use_slow_storage(uniform_latencies(0.01), sleep=sleeps) as slow:
+        assert get_status(str(tmp_path)).status == StatusEnum.RUNNING
+        assert LogCache().read(str(log_file)) == "log line\n"
+
+    assert slow.calls["exists"] == 2
+    assert slow.calls["getmtime"] == 1
+    assert slow.calls["open"] == 1
@@ -0,0 +1,182 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import io
+import pathlib
+import tarfile
+import zipfile
+
+import pytest
+
+from smartdashboard.utils import storage
+from smartdashboard.utils.LogReader import get_logs
+from smartdashboard.utils.ManifestReader import create_filereader, get_manifest_path
+from smartdashboard.utils.status import StatusEnum
+from smartdashboard.utils.StatusReader import StatusData, get_status
+
+ORIGIN = "/nonexistent/origin/exp"
+
+FILES = {
+    "exp/.smartsim/telemetry/manifest.json": "tests/utils/manifest_files/manifesttest.json",
+    "exp/status/model_1/start.json": "tests/utils/status_files/model_1/start.json",
+    "exp/status/model_1/stop.json": "tests/utils/status_files/model_1/stop.json",
+    "exp/logs/model_0.out": "tests/utils/log_files/model_0.out",
+}
+
+
+def _write_tar(path: pathlib.Path, mode: str) -> None:
+    with tarfile.open(path, mode) as tar:
+        for arcname, source in FILES.items():
+            tar.add(source, arcname=arcname)
+
+
+def _write_zip(path: pathlib.Path) -> None:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for arcname, source in FILES.items():
+            zf.write(source, arcname=arcname)
+
+
+@pytest.fixture(params=["exp.tar", "exp.tar.gz", "exp.zip"])
+def archive(request, tmp_path):
+    path = tmp_path / request.param
+    if request.param == "exp.tar":
+        _write_tar(path, "w")
+    elif request.param == "exp.tar.gz":
+        _write_tar(path, "w:gz")
+    else:
+        _write_zip(path)
+
+    previous = storage.get_storage()
+    storage.use_experiment_storage(path)
+    yield path
+    storage.set_storage(previous)
+
+
+def test_archive_storage_selected(archive):
+    assert isinstance(storage.get_storage(), storage.ArchiveStorage)
+    assert storage.get_storage().experiment_roots == ["exp"]
+
+
+def test_local_storage_for_directories(tmp_path):
+    previous = storage.get_storage()
+    storage.use_experiment_storage(tmp_path)
+    assert storage.get_storage() is previous
+
+
+def test_manifest_from_archive(archive):
+    manifest_path = get_manifest_path(archive)
+    assert manifest_path == archive.resolve() / ".smartsim/telemetry/manifest.json"
+
+    reader = create_filereader(manifest_path)
+    expected = create_filereader("tests/utils/manifest_files/manifesttest.json")
+    assert reader.get_manifest() == expected.get_manifest()
+    assert not reader.has_changed
+
+
+def test_status_from_archive(archive):
+    assert get_status(f"{ORIGIN}/status/model_1") == StatusData(StatusEnum.FAILED, 1)
+    assert get_status(f"{ORIGIN}/status/missing") == StatusData(
+        StatusEnum.UNKNOWN, None
+    )
+
+
+def test_logs_from_archive(archive):
+    with open("tests/utils/log_files/model_0.out", "r", encoding="utf-8") as file:
+        expected = file.read()
+    assert get_logs(f"{ORIGIN}/logs/model_0.out") == expected
+    assert get_logs(f"{ORIGIN}/logs/missing.out") == ""
+
+
+def test_missing_archive_member(archive):
+    missing = str(archive / "logs/missing.out")
+    assert not storage.get_storage().exists(missing)
+    with pytest.raises(FileNotFoundError):
+        storage.get_storage().getmtime(missing)
+    with pytest.raises(FileNotFoundError):
+        storage.get_storage().open_binary(missing)
+
+
+def test_local_files_outside_archive(archive):
+    local = "tests/utils/log_files/model_1.err"
+    assert storage.get_storage().exists(local)
+    assert storage.get_storage().read_bytes(local) == pathlib.Path(local).read_bytes()
+
+
+def test_uncompressed_tar_member_seek(tmp_path):
+    path = tmp_path / "exp.tar"
+    _write_tar(path, "w")
+    archive_storage = storage.TarStorage(path)
+    expected = pathlib.Path("tests/utils/log_files/model_0.out").read_bytes()
+
+    with archive_storage.open_binary(f"{ORIGIN}/logs/model_0.out") as file:
+        assert file.read() == expected
+        file.seek(-4, 2)
+        assert file.read() == expected[-4:]
+        file.seek(1)
+        assert file.read(3) == expected[1:4]
+
+
+def test_suffix_must_start_at_experiment_directory(archive):
+    archive_storage = storage.get_storage()
+    assert archive_storage.exists(f"{ORIGIN}/logs/model_0.out")
+    # a different experiment directory with the same member names
+    assert not archive_storage.exists("/nonexistent/origin/other/logs/model_0.out")
+    assert not archive_storage.exists("/nonexistent/origin/model_0.out")
+
+
+def test_archive_of_directory_contents(tmp_path):
+    path = tmp_path / "exp.tar"
+    with tarfile.open(path, "w") as tar:
+        for arcname, source in FILES.items():
+            tar.add(source, arcname=arcname.removeprefix("exp/"))
+    archive_storage = storage.TarStorage(path)
+
+    assert archive_storage.experiment_roots == [""]
+    assert archive_storage.exists(f"{ORIGIN}/logs/model_0.out")
+    assert not archive_storage.exists("/nonexistent/origin/other/logs/model_0.out")
+
+
+def test_resolved_paths_are_bounded(archive):
+    archive_storage = storage.get_storage()
+    archive_storage._resolved.maxsize = 4
+    for i in range(10):
+        archive_storage.exists(f"{ORIGIN}/logs/missing_{i}.out")
+    assert len(archive_storage._resolved) == 4
+
+
+def test_compressed_tar_member_streams(tmp_path):
+    path = tmp_path / "exp.tar.gz"
+    _write_tar(path, "w:gz")
+    archive_storage = storage.TarStorage(path)
+    expected = pathlib.Path("tests/utils/log_files/model_0.out").read_bytes()
+
+    first = archive_storage.open_binary(f"{ORIGIN}/logs/model_0.out")
+    second = archive_storage.open_binary(f"{ORIGIN}/logs/model_0.out")
+    with first, second:
+        assert not isinstance(first, io.BytesIO)
+        assert first.read(4) == expected[:4]
+        assert second.read() == expected
+        assert first.read() == expected[4:]
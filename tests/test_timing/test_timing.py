@@ -0,0 +1,134 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+
+import pytest
+
+from smartdashboard.utils import timing
+from smartdashboard.utils.LogReader import LogCache
+from smartdashboard.utils.timing import Timings
+from smartdashboard.views import ViewBase
+
+
+@pytest.fixture
+def timings(monkeypatch):
+    recorder = Timings(maxlen=5)
+    recorder.enabled = True
+    monkeypatch.setattr(timing, "_timings", recorder)
+    return recorder
+
+
+def test_disabled_timings_record_nothing():
+    recorder = Timings()
+    with recorder.timed("section"):
+        recorder.add_io(10)
+    assert len(recorder) == 0
+
+
+def test_nested_spans_add_io_to_parent(timings):
+    with timing.timed("outer"):
+        timing.add_io(100)
+        with timing.timed("inner"):
+            timing.add_io(20, 3)
+
+    inner, outer = timings.spans()
+    assert (inner.name, inner.bytes_read, inner.file_ops) == ("inner", 20, 3)
+    assert (outer.name, outer.bytes_read, outer.file_ops) == ("outer", 120, 4)
+    assert outer.duration >= inner.duration
+
+
+def test_ring_buffer_keeps_latest_spans(timings):
+    for index in range(8):
+        with timing.timed(f"section_{index}"):
+            pass
+    assert [span.name for span in timings.spans()] == [
+        f"section_{index}" for index in range(3, 8)
+    ]
+
+
+def test_summarize_percentiles(timings):
+    for duration in (0.001, 0.002, 0.003, 0.004, 0.010):
+        span = timing.Span("component", 0.0, 1)
+        span.duration = duration
+        span.bytes_read = 10
+        timings._spans.append(span)
+
+    (row,) = timings.summarize()
+    assert row["component"] == "component"
+    assert row["calls"] == 5
+    assert row["p50_ms"] == pytest.approx(3.0)
+    assert row["p95_ms"] == pytest.approx(10.0)
+    assert row["bytes_per_call"] == 10
+
+
+def test_chrome_trace(timings, tmp_path):
+    with timing.timed("section"):
+        timing.add_io(42)
+
+    trace_file = tmp_path / "trace.json"
+    timings.dump_chrome_trace(str(trace_file))
+    (event,) = json.loads(trace_file.read_text())["traceEvents"]
+    assert event["name"] == "section"
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0
+    assert event["args"] == {"bytes_read": 42, "file_ops": 1}
+
+
+def test_timed_function_names(timings):
+    @timing.timed_function()
+    def build():
+        return "built"
+
+    assert build() == "built"
+    assert timings.spans()[0].name == "build"
+
+
+def test_view_updates_are_timed(timings):
+    class SampleView(ViewBase):
+        def update(self):
+            timing.add_io(7)
+
+    class DerivedView(SampleView):
+        pass
+
+    SampleView().update()
+    DerivedView().update()
+    first, second = timings.spans()
+    assert first.name == "SampleView.update"
+    assert first.bytes_read == 7
+    assert second.name == "DerivedView.update"
+
+
+def test_log_reads_are_counted(timings, tmp_path):
+    log_file = tmp_path / "out.log"
+    log_file.write_text("hello\n")
+
+    with timing.timed("logs"):
+        LogCache().read(str(log_file))
+    (span,) = timings.spans()
+    assert span.bytes_read == 6
+    assert span.file_ops == 2
@@ -26,11 +26,10 @@
 
 import random
 
-import pandas as pd
 import pytest
 import streamlit as st
 
-from smartdashboard.views import ClientView, Files
+from smartdashboard.views import ClientTimelineView, ClientView, Files
 from tests.utils.test_entities import *
 
 
@@ -90,7 +89,8 @@ def test_load_data_client_view(shard, csv_length):
         graph_element=st.empty(),
         export_button=st.empty(),
     )
-    assert len(view._load_data_update(0)) == csv_length
+    assert len(view.telemetry_df) == csv_length
+    assert view._load_data_update().empty
 
 
 @pytest.mark.parametrize(
@@ -99,14 +99,92 @@ def test_load_data_client_view(shard, csv_length):
         pytest.param(orchestrator_2.shards[0], 30),
     ],
 )
-def test_load_data_update_client_view(shard, csv_length):
+def test_load_data_update_client_view(shard, csv_length, tmp_path):
+    with open(shard.client_count_file, encoding="utf-8") as file:
+        header, *rows = file.readlines()
+    first_chunk = random.randint(1, csv_length - 1)
+    telemetry_file = tmp_path / "telemetry.csv"
+    telemetry_file.write_text(header + "".join(rows[:first_chunk]), encoding="utf-8")
+
     view = ClientView(
-        shard,
+        shard.copy(update={"client_count_file": str(telemetry_file)}),
         table_element=st.empty(),
         graph_element=st.empty(),
         export_button=st.empty(),
     )
-    first_chunk = random.randint(1, csv_length - 1)
-    initial_df = pd.read_csv(view.files.graph_file, nrows=first_chunk)
-    df_delta = view._load_data_update(skiprows=initial_df.shape[0] + 1)
-    assert pd.concat((initial_df, df_delta), axis=0).shape[0] == csv_length
+    assert view.telemetry_df.shape[0] == first_chunk
+
+    with open(telemetry_file, "a", encoding="utf-8") as file:
+        file.write("".join(rows[first_chunk:]))
+    view.update()
+    assert view.telemetry_df.shape[0] == csv_length
+
+    view.update()
+    assert view.telemetry_df.shape[0] == csv_length
+
+
+def test_truncated_client_telemetry(tmp_path):
+    shard = orchestrator_2.shards[0]
+    with open(shard.client_count_file, encoding="utf-8") as file:
+        header, *rows = file.readlines()
+    telemetry_file = tmp_path / "telemetry.csv"
+    telemetry_file.write_text(header + "".join(rows), encoding="utf-8")
+
+    view = ClientView(
+        shard.copy(update={"client_count_file": str(telemetry_file)}),
+        table_element=st.empty(),
+        graph_element=st.empty(),
+        export_button=st.empty(),
+    )
+    telemetry_file.write_text(header + "".join(rows[:2]), encoding="utf-8")
+    view.update()
+    assert view.telemetry_df.shape[0] == 2
+
+
+def test_client_view_timeline(tmp_path):
+    shard = orchestrator_2.shards[0]
+    client_file = tmp_path / "client.csv"
+    client_file.write_text(
+        "timestamp,client_id,address\n1,0,a\n1,1,b\n2,0,a\n3,0,a\n3,2,c\n",
+        encoding="utf-8",
+    )
+    timeline_view = ClientTimelineView(str(client_file), st.empty(), st.empty())
+    view = ClientView(
+        shard.copy(update={"client_file": str(client_file)}),
+        table_element=st.empty(),
+        graph_element=st.empty(),
+        export_button=st.empty(),
+        timeline_view=timeline_view,
+    )
+    timeline = view.timeline_view.timeline
+    assert timeline.samples == 2
+    assert timeline.closed_sessions == 1
+    assert view.timeline_view.deltas.changed("timeline", timeline.sessions()) is False
+
+    client_file.write_text("timestamp,client_id,address\n9,4,d\n", encoding="utf-8")
+    view.update()
+    assert view.timeline_view.tailer.truncated
+    assert timeline.samples == 0
+
+
+def test_client_view_timeline_tails_on_update(tmp_path):
+    shard = orchestrator_2.shards[0]
+    client_file = tmp_path / "client.csv"
+    client_file.write_text(
+        "timestamp,client_id,address\n1,0,a\n1,1,b\n2,0,a\n", encoding="utf-8"
+    )
+    view = ClientView(
+        shard.copy(update={"client_file": str(client_file)}),
+        table_element=st.empty(),
+        graph_element=st.empty(),
+        export_button=st.empty(),
+        timeline_view=ClientTimelineView(str(client_file), st.empty(), st.empty()),
+    )
+    assert view.timeline_view.timeline.samples == 1
+    assert view.timeline_view.timeline.closed_sessions == 0
+
+    with open(client_file, "a", encoding="utf-8") as file:
+        file.write("3,0,a\n")
+    view.update()
+    assert view.timeline_view.timeline.samples == 2
+    assert view.timeline_view.timeline.closed_sessions == 1
@@ -68,3 +68,13 @@ def test_ensemble_view(
     assert view.status == status_string
     assert view.out_logs == out_logs
     assert view.err_logs == err_logs
+
+
+def test_ensemble_view_heatmap():
+    view = EnsembleView(ensemble_4, ensemble_4.models[0])
+    heatmap = view.heatmap
+    assert heatmap is not None
+    assert heatmap.shape == (16, 16 * len(ensemble_4.models), 3)
+
+    assert EnsembleView(ensemble_2, None).heatmap is None
+    assert EnsembleView(None, None).heatmap is None
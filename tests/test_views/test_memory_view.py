@@ -30,6 +30,7 @@ import pandas as pd
 import pytest
 import streamlit as st
 
+from smartdashboard.utils.TelemetryReader import get_telemetry_dtypes
 from smartdashboard.views import Files, MemoryView
 from tests.utils.test_entities import *
 
@@ -87,7 +88,7 @@ def test_memory_view(shard, csv_length, telem_bool, files_tuple):
             "Total System Memory (GB)",
         ]
         assert view._get_data_file() != ""
-        assert view._load_data_update(skiprows=view.telemetry_df.shape[0] + 1).empty
+        assert view._load_data_update().empty
     else:
         assert view._get_data_file() == ""
 
@@ -108,7 +109,8 @@ def test_load_data_memory_view(shard, csv_length):
         graph_element=st.empty(),
         export_button=st.empty(),
     )
-    assert len(view._load_data_update(0)) == csv_length
+    assert len(view.telemetry_df) == csv_length
+    assert view._load_data_update().empty
 
 
 @pytest.mark.parametrize(
@@ -118,14 +120,88 @@ def test_load_data_memory_view(shard, csv_length):
         pytest.param(orchestrator_2.shards[1], 10001),
     ],
 )
-def test_load_data_update_memory_view(shard, csv_length):
+def test_load_data_update_memory_view(shard, csv_length, tmp_path):
+    with open(shard.memory_file, encoding="utf-8") as file:
+        header, *rows = file.readlines()
+    first_chunk = random.randint(1, csv_length - 1)
+    telemetry_file = tmp_path / "telemetry.csv"
+    telemetry_file.write_text(header + "".join(rows[:first_chunk]), encoding="utf-8")
+
+    view = MemoryView(
+        shard.copy(update={"memory_file": str(telemetry_file)}),
+        table_element=st.empty(),
+        graph_element=st.empty(),
+        export_button=st.empty(),
+    )
+    assert view.telemetry_df.shape[0] == first_chunk
+
+    with open(telemetry_file, "a", encoding="utf-8") as file:
+        file.write("".join(rows[first_chunk:]))
+    view.update()
+    assert view.telemetry_df.shape[0] == csv_length
+
+    view.update()
+    assert view.telemetry_df.shape[0] == csv_length
+
+
+def test_truncated_memory_telemetry(tmp_path):
+    shard = orchestrator_2.shards[0]
+    with open(shard.memory_file, encoding="utf-8") as file:
+        header, *rows = file.readlines()
+    telemetry_file = tmp_path / "telemetry.csv"
+    telemetry_file.write_text(header + "".join(rows), encoding="utf-8")
+
+    view = MemoryView(
+        shard.copy(update={"memory_file": str(telemetry_file)}),
+        table_element=st.empty(),
+        graph_element=st.empty(),
+        export_button=st.empty(),
+    )
+    telemetry_file.write_text(header + "".join(rows[:2]), encoding="utf-8")
+    view.update()
+    assert view.telemetry_df.shape[0] == 2
+
+
+def test_memory_view_budget(tmp_path):
+    memory_file = tmp_path / "memory.csv"
+    with open("tests/utils/memory/memory_2.csv", encoding="utf-8") as file:
+        memory_file.write_text(file.read())
+    shard = orchestrator_2.shards[1].copy(update={"memory_file": str(memory_file)})
+
     view = MemoryView(
         shard,
         table_element=st.empty(),
         graph_element=st.empty(),
         export_button=st.empty(),
+        memory_budget=64 * 1024,
     )
-    first_chunk = random.randint(1, csv_length - 1)
-    initial_df = pd.read_csv(view.files.graph_file, nrows=first_chunk)
-    df_delta = view._load_data_update(skiprows=initial_df.shape[0] + 1)
-    assert pd.concat((initial_df, df_delta), axis=0).shape[0] == csv_length
+    assert view.store.raw_bytes <= 64 * 1024
+    assert view.store.rollup_rows > 0
+    stored = view.telemetry_df.copy()
+
+    view.process_dataframe(view.telemetry_df)
+    pd.testing.assert_frame_equal(view.telemetry_df, stored)
+
+
+def test_memory_view_dtypes():
+    view = MemoryView(
+        orchestrator_2.shards[0],
+        table_element=st.empty(),
+        graph_element=st.empty(),
+        export_button=st.empty(),
+    )
+    assert view.telemetry_df.dtypes.to_dict() == get_telemetry_dtypes("memory")
+
+
+def test_memory_view_window():
+    shard = orchestrator_2.shards[0]
+    view = MemoryView(
+        shard,
+        table_element=st.empty(),
+        graph_element=st.empty(),
+        export_button=st.empty(),
+        window_minutes=5,
+    )
+    assert view.sampling
+    assert view.chart is not None
+    assert len(view.store.window(5 * 60_000, 10, 1)) <= 11
@@ -0,0 +1,208 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""Storage that delays file operations like a slow parallel file system"""
+
+import collections
+import contextlib
+import io
+import random
+import threading
+import time
+import typing as t
+from dataclasses import dataclass
+
+from smartdashboard.utils import storage
+from smartdashboard.utils.storage import Storage
+
+OPERATIONS = ("exists", "getmtime", "open", "read")
+"""Operations that can be delayed; reads are delayed per read call on an
+opened file, which is how pandas.read_csv consumes a file"""
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Data class describing the delay of a file operation
+
+    :param seconds: Delay of every call
+    :type seconds: float
+    :param jitter: Upper bound of a uniformly random delay added to each call
+    :type jitter: float
+    :param hang_probability: Probability of a call hanging
+    :type hang_probability: float
+    :param hang_seconds: Delay added to a call that hangs
+    :type hang_seconds: float
+    """
+
+    seconds: float = 0.0
+    jitter: float = 0.0
+    hang_probability: float = 0.0
+    hang_seconds: float = 1.0
+
+
+class _SlowReader(io.RawIOBase):
+    """Read-only file wrapper delaying each read"""
+
+    def __init__(self, file: t.BinaryIO, owner: "SlowStorage") -> None:
+        super().__init__()
+        self._file = file
+        self._owner = owner
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._file.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def readinto(self, buffer: t.Any) -> int:
+        self._owner.delay("read")
+        data = self._file.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+class SlowStorage(Storage):
+    """Storage wrapper delaying each file operation
+
+    Every file the dashboard reads goes through the active Storage, so
+    wrapping it delays the status, log, manifest and telemetry readers.
+    """
+
+    def __init__(
+        self,
+        inner: t.Optional[Storage] = None,
+        latencies: t.Optional[t.Mapping[str, Latency]] = None,
+        seed: int = 0,
+        sleep: t.Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize a SlowStorage
+
+        :param inner: Storage to delay, the active storage by default
+        :type inner: Optional[Storage]
+        :param latencies: Latency of each operation in OPERATIONS, operations
+                          without one are not delayed
+        :type latencies: Optional[Mapping[str, Latency]]
+        :param seed: Seed of the jitter and hangs
+        :type seed: int
+        :param sleep: Function used to wait
+        :type sleep: Callable[[float], None]
+        """
+        unknown = set(latencies or {}) - set(OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown operations: {', '.join(sorted(unknown))}")
+
+        self.inner = inner if inner is not None else storage.get_storage()
+        self.latencies = dict(latencies or {})
+        self.calls: t.Counter[str] = collections.Counter()
+        self.delayed = 0.0
+        self.hangs = 0
+        self._sleep = sleep
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self, operation: str) -> None:
+        """Wait for the latency of an operation
+
+        :param operation: Name of the operation
+        :type operation: str
+        """
+        latency = self.latencies.get(operation)
+        with self._lock:
+            self.calls[operation] += 1
+            if latency is None:
+                return
+            seconds = latency.seconds + self._random.uniform(0, latency.jitter)
+            if self._random.random() < latency.hang_probability:
+                seconds += latency.hang_seconds
+                self.hangs += 1
+            self.delayed += seconds
+        if seconds > 0:
+            self._sleep(seconds)
+
+    def exists(self, path: str) -> bool:
+        self.delay("exists")
+        return self.inner.exists(path)
+
+    def getmtime(self, path: str) -> float:
+        self.delay("getmtime")
+        return self.inner.getmtime(path)
+
+    def open_binary(self, path: str) -> t.BinaryIO:
+        self.delay("open")
+        file = self.inner.open_binary(path)
+        return t.cast(t.BinaryIO, io.BufferedReader(_SlowReader(file, self)))
+
+
+def uniform_latencies(
+    metadata: float, read: float = 0.0, jitter: float = 0.0
+) -> t.Dict[str, Latency]:
+    """Build latencies delaying metadata operations and reads alike
+
+    :param metadata: Delay of exists, getmtime and open calls
+    :type metadata: float
+    :param read: Delay of each read call
+    :type read: float
+    :param jitter: Random delay added to every call
+    :type jitter: float
+    :return: Latency of each operation
+    :rtype: Dict[str, Latency]
+    """
+    latencies = {
+        operation: Latency(metadata, jitter)
+        for operation in ("exists", "getmtime", "open")
+    }
+    latencies["read"] = Latency(read, jitter)
+    return latencies
+
+
+@contextlib.contextmanager
+def use_slow_storage(
+    latencies: t.Mapping[str, Latency], **kwargs: t.Any
+) -> t.Iterator[SlowStorage]:
+    """Delay the active storage within a block
+
+    :param latencies: Latency of each operation
+    :type latencies: Mapping[str, Latency]
+    :return: The slow storage, for its call counts
+    :rtype: Iterator[SlowStorage]
+    """
+    previous = storage.get_storage()
+    slow = SlowStorage(previous, latencies, **kwargs)
+    storage.set_storage(slow)
+    try:
+        yield slow
+    finally:
+        storage.set_storage(previous)